@@ -0,0 +1,93 @@
+"""
+프레임 해시 벤치마크
+
+번들 스크린샷(screenshots/**/*.png)에 대해 imagehash(phash + average_hash + dhash)와
+FrameHasher(단일/일괄)의 해시 계산 시간을 비교하고, 결과 일치율을 출력한다.
+
+실행 방법:
+    python benchmark_frame_hashing.py
+    python benchmark_frame_hashing.py --repeat 5 --pattern "screenshots/sr-point-play-test-001/*.png"
+"""
+
+import argparse
+import glob
+import time
+from typing import Callable, List
+
+import imagehash
+from PIL import Image
+
+from src.frame_hasher import default_hasher, hex_hamming_distance
+
+
+def load_frames(pattern: str) -> List[Image.Image]:
+    """스크린샷을 메모리에 로드 (디코딩 시간은 측정에서 제외)"""
+    frames = []
+    for path in sorted(glob.glob(pattern, recursive=True)):
+        with Image.open(path) as image:
+            image.load()
+            frames.append(image.copy())
+    return frames
+
+
+def measure(func: Callable[[], object], repeat: int) -> float:
+    """최소 실행 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FrameHasher vs imagehash 벤치마크")
+    parser.add_argument("--pattern", default="screenshots/**/*.png", help="스크린샷 glob 패턴")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최소 시간 사용)")
+    args = parser.parse_args()
+
+    frames = load_frames(args.pattern)
+    if not frames:
+        print(f"스크린샷이 없습니다: {args.pattern}")
+        return
+
+    print(f"프레임 수: {len(frames)} ({frames[0].size[0]}x{frames[0].size[1]})")
+
+    def run_imagehash():
+        return [(imagehash.phash(f), imagehash.average_hash(f), imagehash.dhash(f)) for f in frames]
+
+    def run_single():
+        return [default_hasher.hash_image(f) for f in frames]
+
+    def run_batch():
+        return default_hasher.hash_batch(frames)
+
+    results = [
+        ("imagehash (phash+ahash+dhash)", measure(run_imagehash, args.repeat)),
+        ("FrameHasher.hash_image", measure(run_single, args.repeat)),
+        ("FrameHasher.hash_batch", measure(run_batch, args.repeat)),
+    ]
+
+    baseline = results[0][1]
+    print()
+    print(f"{'방식':<32} {'전체(ms)':>10} {'프레임당(ms)':>12} {'배율':>8}")
+    print("-" * 66)
+    for name, elapsed in results:
+        print(f"{name:<32} {elapsed * 1000:>10.1f} {elapsed * 1000 / len(frames):>12.2f} "
+              f"{baseline / elapsed:>7.2f}x")
+
+    # 결과 비교
+    reference = run_imagehash()
+    hashes = run_batch()
+    phash_equal = sum(1 for (p, _, _), h in zip(reference, hashes) if str(p) == h.phash_hex)
+    ahash_diff = [hex_hamming_distance(str(a), h.ahash_hex) for (_, a, _), h in zip(reference, hashes)]
+    dhash_diff = [hex_hamming_distance(str(d), h.dhash_hex) for (_, _, d), h in zip(reference, hashes)]
+
+    print()
+    print(f"pHash 일치: {phash_equal}/{len(frames)}")
+    print(f"aHash 비트 차이: 평균 {sum(ahash_diff) / len(frames):.2f}, 최대 {max(ahash_diff)}")
+    print(f"dHash 비트 차이: 평균 {sum(dhash_diff) / len(frames):.2f}, 최대 {max(dhash_diff)}")
+
+
+if __name__ == "__main__":
+    main()
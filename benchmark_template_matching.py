@@ -0,0 +1,127 @@
+"""
+클릭 영역 템플릿 매칭 벤치마크
+
+번들 녹화(test_cases/*.json)의 클릭마다 클릭 전 스크린샷에서 클릭 좌표 주변 크롭을 만들고,
+TemplateMatcher로 같은 화면 / 이동한 화면 / 배율이 바뀐 화면에서 클릭 위치를 다시 찾는
+시간과 적중률을 출력한다. 적중은 임계값 이상 점수로 찾은 위치가 기대 위치와 2px 이내인 경우다.
+
+실행 방법:
+    python benchmark_template_matching.py
+    python benchmark_template_matching.py --pattern "test_cases/sr-point-play-test-001.json" --shift 40 20
+"""
+
+import argparse
+import glob
+import json
+import statistics
+from typing import Callable, List, Tuple
+
+from PIL import Image
+
+from src.replay_manifest import resolve_frame_path
+from src.template_matcher import TemplateMatcher, click_crop_origin, click_offset, crop_click_region
+
+
+Case = Tuple[Image.Image, int, int]  # (클릭 전 화면, x, y)
+
+
+def load_cases(pattern: str) -> List[Case]:
+    """녹화된 클릭과 클릭 전 스크린샷 로드 (크롭이 빈 화면 밖 클릭은 제외)"""
+    cases = []
+    frames = {}
+    for json_path in sorted(glob.glob(pattern)):
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for action in data.get('actions', []):
+            path = action.get('screenshot_before_path')
+            if action.get('action_type') != 'click' or not path:
+                continue
+            path = resolve_frame_path(path)
+            if path not in frames:
+                try:
+                    with Image.open(path) as image:
+                        image.load()
+                        frames[path] = image.convert('RGB')
+                except OSError:
+                    frames[path] = None
+            frame = frames[path]
+            x, y = int(action['x']), int(action['y'])
+            if frame is not None and 0 <= x < frame.width and 0 <= y < frame.height:
+                cases.append((frame, x, y))
+    return cases
+
+
+def shifted(frame: Image.Image, dx: int, dy: int) -> Image.Image:
+    """화면 내용을 (dx, dy)만큼 이동 (레이아웃 이동 시뮬레이션)"""
+    moved = Image.new(frame.mode, frame.size)
+    moved.paste(frame, (dx, dy))
+    return moved
+
+
+def scaled(frame: Image.Image, scale: float) -> Image.Image:
+    """화면 전체를 scale배로 변경하고 원래 크기 캔버스 좌상단에 배치 (UI 스케일 변경 시뮬레이션)"""
+    resized = frame.resize((int(round(frame.width * scale)), int(round(frame.height * scale))), Image.BILINEAR)
+    canvas = Image.new(frame.mode, frame.size)
+    canvas.paste(resized, (0, 0))
+    return canvas
+
+
+def run(matcher: TemplateMatcher, cases: List[Case],
+        transform: Callable[[Image.Image], Image.Image],
+        expected: Callable[[int, int], Tuple[int, int]]) -> Tuple[int, List[float]]:
+    """시나리오 하나 실행 → (적중 수, 클릭별 매칭 시간 ms)"""
+    hits = 0
+    times = []
+    transformed = {}
+    for frame, x, y in cases:
+        if id(frame) not in transformed:
+            transformed[id(frame)] = transform(frame)
+        template = crop_click_region(frame, x, y).convert('L')
+        match = matcher.match(transformed[id(frame)], template, click_crop_origin(x, y))
+        if match is None:
+            continue
+        times.append(match.elapsed_ms)
+        found = match.point(click_offset(x, y))
+        target = expected(x, y)
+        if match.score >= matcher.threshold and max(abs(found[0] - target[0]), abs(found[1] - target[1])) <= 2:
+            hits += 1
+    return hits, times
+
+
+def main():
+    parser = argparse.ArgumentParser(description="클릭 영역 템플릿 매칭 벤치마크")
+    parser.add_argument("--pattern", default="test_cases/sr-point-play-test-*.json", help="녹화 JSON glob 패턴")
+    parser.add_argument("--shift", type=int, nargs=2, default=(37, 23), metavar=("DX", "DY"),
+                        help="이동 시나리오의 화면 이동량 (px)")
+    parser.add_argument("--scale", type=float, default=0.9, help="배율 시나리오의 화면 배율")
+    args = parser.parse_args()
+
+    cases = load_cases(args.pattern)
+    if not cases:
+        print(f"클릭 액션이 있는 녹화가 없습니다: {args.pattern}")
+        return
+
+    matcher = TemplateMatcher()
+    dx, dy = args.shift
+    scale = args.scale
+    print(f"클릭 수: {len(cases)} ({cases[0][0].size[0]}x{cases[0][0].size[1]}), 임계값 {matcher.threshold}")
+
+    scenarios = [
+        ("변경 없음", lambda f: f, lambda x, y: (x, y)),
+        (f"이동 ({dx}, {dy})", lambda f: shifted(f, dx, dy), lambda x, y: (x + dx, y + dy)),
+        (f"배율 {scale}", lambda f: scaled(f, scale), lambda x, y: (round(x * scale), round(y * scale))),
+    ]
+
+    print()
+    print(f"{'시나리오':<16} {'적중':>10} {'적중률':>8} {'평균(ms)':>10} {'중앙값(ms)':>11} {'최대(ms)':>10}")
+    print("-" * 70)
+    for name, transform, expected in scenarios:
+        hits, times = run(matcher, cases, transform, expected)
+        mean = statistics.mean(times) if times else 0.0
+        median = statistics.median(times) if times else 0.0
+        print(f"{name:<16} {hits:>5}/{len(cases):<4} {hits / len(cases):>8.1%} "
+              f"{mean:>10.1f} {median:>11.1f} {max(times, default=0.0):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,726 @@
+"""
+AccuracyStore - 정확도 추적 데이터의 SQLite 저장소
+
+AccuracyTracker의 JSON 백엔드는 세션마다 결과/통계 파일 두 개를 쓰고,
+액션 이력/액션별 실패율/세션 목록 조회마다 디렉토리의 모든 파일을 파싱한다.
+이 저장소는 모든 테스트 케이스의 세션과 액션 결과를 SQLite 파일 하나에 저장하고
+(테스트 케이스, 세션, 액션 ID, 시각) 인덱스로 조회한다.
+
+- sessions: 세션별 요약 통계 (목록 조회는 인덱스 범위 조회)
+- results: 액션 결과 (원본 dict는 JSON으로 보관, 조회 키는 인덱스 컬럼)
+- rollup_test_case / rollup_daily / rollup_action: 테스트 케이스별, 날짜별, 액션별 누적 집계
+  세션을 저장할 때 같은 트랜잭션에서 갱신하므로(같은 세션을 다시 저장하면 이전 기여분을 빼고 더함)
+  통계 요약/날짜별 추이 조회는 이력 크기와 관계없이 집계 행만 읽는다.
+- flaky_action: 액션별 불안정성 지수 (세션 간 성공↔실패 전환 횟수, 지수 감쇠 실패 점수/전환 점수)
+  세션별 기여분(flaky_observation)을 보관하므로 같은 세션이나 오래된 세션을 다시 저장해도 두 번 세지 않는다.
+
+JSON 백엔드 세션(<data_dir>/<테스트_케이스>/<세션>_results.json)은 저장소를 처음 열 때 한 번 가져오고
+meta 테이블에 기록한다. 이후 JSON 백엔드로 저장한 세션은 import_json_sessions를 직접 호출하면
+새로 생기거나 수정된(파일 mtime 기준) 세션만 가져온다.
+
+저장 위치: <data_dir>/accuracy.sqlite
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+ACCURACY_DB_FILENAME = "accuracy.sqlite"
+ACCURACY_BACKENDS = ("json", "sqlite")
+DEFAULT_ACCURACY_BACKEND = "sqlite"  # 설정(automation.accuracy_backend) 기본값
+ROLLUP_VERSION = "3"
+DEFAULT_FLAKY_ALPHA = 0.3  # 불안정성 지수 감쇠 계수 (최근 세션 가중치)
+DEFAULT_FLAKY_MIN_OBSERVATIONS = 3  # 불안정성 순위에 포함할 최소 세션 수
+
+# 세션 하나가 테스트 케이스/날짜 집계에 더하는 값
+_ROLLUP_COUNTERS = ("sessions", "total_actions", "success_count", "failure_count", "direct_count",
+                    "semantic_count", "success_rate_sum", "semantic_match_rate_sum")
+# 관측이 없는 액션의 불안정성 상태 (observations, transitions, failure_score, flakiness, last_failed)
+_FLAKY_EMPTY = (0, 0, 0.0, 0.0, None)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS sessions (
+    test_case TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    resume_count INTEGER NOT NULL DEFAULT 0,
+    total_actions INTEGER NOT NULL,
+    success_count INTEGER NOT NULL,
+    failure_count INTEGER NOT NULL,
+    success_rate REAL NOT NULL,
+    semantic_match_rate REAL NOT NULL,
+    statistics TEXT NOT NULL,
+    PRIMARY KEY (test_case, session_id)
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_time ON sessions (test_case, timestamp);
+CREATE TABLE IF NOT EXISTS results (
+    test_case TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    action_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    success INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (test_case, session_id, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_results_action ON results (test_case, action_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_time ON results (test_case, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_session ON results (session_id);
+CREATE TABLE IF NOT EXISTS rollup_test_case (
+    test_case TEXT PRIMARY KEY,
+    sessions INTEGER NOT NULL,
+    total_actions INTEGER NOT NULL,
+    success_count INTEGER NOT NULL,
+    failure_count INTEGER NOT NULL,
+    direct_count INTEGER NOT NULL,
+    semantic_count INTEGER NOT NULL,
+    success_rate_sum REAL NOT NULL,
+    semantic_match_rate_sum REAL NOT NULL,
+    latest_session_id TEXT NOT NULL,
+    latest_timestamp TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rollup_daily (
+    day TEXT NOT NULL,
+    test_case TEXT NOT NULL,
+    sessions INTEGER NOT NULL,
+    total_actions INTEGER NOT NULL,
+    success_count INTEGER NOT NULL,
+    failure_count INTEGER NOT NULL,
+    direct_count INTEGER NOT NULL,
+    semantic_count INTEGER NOT NULL,
+    success_rate_sum REAL NOT NULL,
+    semantic_match_rate_sum REAL NOT NULL,
+    PRIMARY KEY (day, test_case)
+);
+CREATE TABLE IF NOT EXISTS rollup_action (
+    test_case TEXT NOT NULL,
+    action_id TEXT NOT NULL,
+    executions INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    last_timestamp TEXT NOT NULL,
+    PRIMARY KEY (test_case, action_id)
+);
+CREATE TABLE IF NOT EXISTS flaky_action (
+    test_case TEXT NOT NULL,
+    action_id TEXT NOT NULL,
+    observations INTEGER NOT NULL,
+    transitions INTEGER NOT NULL,
+    failure_score REAL NOT NULL,
+    flakiness REAL NOT NULL,
+    last_failed INTEGER,
+    last_session_id TEXT NOT NULL,
+    prev_observations INTEGER NOT NULL,
+    prev_transitions INTEGER NOT NULL,
+    prev_failure_score REAL NOT NULL,
+    prev_flakiness REAL NOT NULL,
+    prev_last_failed INTEGER,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (test_case, action_id)
+);
+CREATE INDEX IF NOT EXISTS idx_flaky_rank ON flaky_action (flakiness);
+CREATE INDEX IF NOT EXISTS idx_flaky_test_case ON flaky_action (test_case, flakiness);
+CREATE INDEX IF NOT EXISTS idx_flaky_session ON flaky_action (test_case, last_session_id);
+CREATE TABLE IF NOT EXISTS flaky_observation (
+    test_case TEXT NOT NULL,
+    action_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    executions INTEGER NOT NULL,
+    failures INTEGER NOT NULL,
+    PRIMARY KEY (test_case, action_id, session_id)
+);
+CREATE INDEX IF NOT EXISTS idx_flaky_observation_time ON flaky_observation (test_case, timestamp);
+CREATE INDEX IF NOT EXISTS idx_flaky_observation_session ON flaky_observation (test_case, session_id);
+CREATE TABLE IF NOT EXISTS json_sessions (
+    test_case TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    PRIMARY KEY (test_case, session_id)
+);
+"""
+
+
+def get_accuracy_db_path(data_dir: str) -> str:
+    """정확도 SQLite 파일 경로"""
+    return os.path.join(data_dir, ACCURACY_DB_FILENAME)
+
+
+def _count_statistics(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """통계 파일이 없는 JSON 세션의 기본 통계"""
+    total = len(results)
+    success = sum(1 for result in results if result.get("success"))
+    return {
+        "total_actions": total,
+        "success_count": success,
+        "failure_count": total - success,
+        "success_rate": success / total if total else 0.0
+    }
+
+
+class AccuracyStore:
+    """정확도 세션/액션 결과 SQLite 저장소"""
+
+    def __init__(self, path: str, flaky_alpha: float = DEFAULT_FLAKY_ALPHA):
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:" 가능)
+            flaky_alpha: 불안정성 지수 감쇠 계수 (0~1, 클수록 최근 세션 비중이 큼)
+        """
+        self.path = path
+        self.flaky_alpha = flaky_alpha
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.executescript(_SCHEMA)
+        if self._get_meta("rollup_version") != ROLLUP_VERSION:
+            self.rebuild_rollups()
+
+    @classmethod
+    def for_data_dir(cls, data_dir: str, import_json: bool = True) -> 'AccuracyStore':
+        """데이터 디렉토리의 저장소 열기 (처음 열 때 기존 JSON 세션 가져오기)"""
+        store = cls(get_accuracy_db_path(data_dir))
+        if import_json and store._get_meta("json_imported") is None:
+            imported = store.import_json_sessions(data_dir)
+            if imported:
+                logger.info(f"JSON 세션 {imported}개를 정확도 저장소로 가져옴: {store.path}")
+        return store
+
+    def close(self):
+        self._conn.close()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    # ----- 저장 -----
+
+    def save_session(self, test_case: str, session_id: str, timestamp: str,
+                     results: List[Dict[str, Any]], statistics: Dict[str, Any],
+                     resume_count: int = 0):
+        """세션 저장 (같은 세션의 기존 결과는 교체)
+
+        Args:
+            test_case: 테스트 케이스 이름
+            session_id: 세션 ID
+            timestamp: 저장 시각 (ISO 형식)
+            results: ActionExecutionResult.to_dict() 리스트 (실행 순서)
+            statistics: AccuracyStatistics.to_dict()
+            resume_count: 체크포인트에서 이어서 실행한 횟수
+        """
+        with self._conn:
+            self._write_session(test_case, session_id, timestamp, results, statistics, resume_count)
+
+    def _write_session(self, test_case: str, session_id: str, timestamp: str,
+                       results: List[Dict[str, Any]], statistics: Dict[str, Any], resume_count: int):
+        previous = self._stored_contribution(test_case, session_id)
+        if previous is not None:
+            self._apply_rollups(test_case, session_id, *previous, sign=-1)
+        actions = _action_counts((r.get("action_id", ""), bool(r.get("success")), r.get("timestamp", ""))
+                                 for r in results)
+        self._apply_rollups(test_case, session_id, timestamp, _session_counters(statistics), actions)
+        self._update_flaky(test_case, session_id, timestamp, actions)
+
+        self._conn.execute("DELETE FROM results WHERE test_case = ? AND session_id = ?", (test_case, session_id))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sessions (test_case, session_id, timestamp, resume_count, total_actions, "
+            "success_count, failure_count, success_rate, semantic_match_rate, statistics) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (test_case, session_id, timestamp, resume_count,
+             statistics.get("total_actions", 0), statistics.get("success_count", 0),
+             statistics.get("failure_count", 0), statistics.get("success_rate", 0.0),
+             statistics.get("semantic_match_rate", 0.0), json.dumps(statistics, ensure_ascii=False))
+        )
+        self._conn.executemany(
+            "INSERT INTO results (test_case, session_id, seq, action_id, timestamp, success, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [(test_case, session_id, seq, result.get("action_id", ""), result.get("timestamp", ""),
+              1 if result.get("success") else 0, json.dumps(result, ensure_ascii=False))
+             for seq, result in enumerate(results)]
+        )
+
+    # ----- 조회 -----
+
+    def load_session(self, test_case: str, session_id: str) -> Optional[Tuple[int, List[Dict[str, Any]]]]:
+        """세션 로드
+
+        Returns:
+            (resume_count, 결과 dict 리스트) 또는 None (세션 없음)
+        """
+        row = self._conn.execute(
+            "SELECT resume_count FROM sessions WHERE test_case = ? AND session_id = ?", (test_case, session_id)
+        ).fetchone()
+        if row is None:
+            return None
+        results = [
+            json.loads(data) for (data,) in self._conn.execute(
+                "SELECT data FROM results WHERE test_case = ? AND session_id = ? ORDER BY seq",
+                (test_case, session_id)
+            )
+        ]
+        return row[0], results
+
+    def list_sessions(self, test_case: str) -> List[Dict[str, Any]]:
+        """세션 목록 (최신순, AccuracyTracker.list_sessions와 같은 형식)"""
+        rows = self._conn.execute(
+            "SELECT session_id, timestamp, total_actions, success_rate, success_count, failure_count, "
+            "semantic_match_rate FROM sessions WHERE test_case = ? ORDER BY timestamp DESC",
+            (test_case,)
+        )
+        return [
+            {
+                "session_id": session_id,
+                "timestamp": timestamp,
+                "total_actions": total_actions,
+                "success_rate": success_rate,
+                "success_count": success_count,
+                "failure_count": failure_count,
+                "semantic_match_rate": semantic_match_rate
+            }
+            for session_id, timestamp, total_actions, success_rate, success_count, failure_count,
+            semantic_match_rate in rows
+        ]
+
+    def action_history(self, test_case: str, action_id: str) -> List[Dict[str, Any]]:
+        """특정 액션의 실행 결과 dict 리스트 (실행 시각순)"""
+        return [
+            json.loads(data) for (data,) in self._conn.execute(
+                "SELECT data FROM results WHERE test_case = ? AND action_id = ? ORDER BY timestamp, session_id",
+                (test_case, action_id)
+            )
+        ]
+
+    def failure_rate_by_action(self, test_case: str) -> Dict[str, float]:
+        """{action_id: 실패율} (액션별 집계에서 조회)"""
+        return {action_id: rollup["failure_rate"] for action_id, rollup in self.action_rollups(test_case).items()}
+
+    # ----- 집계 -----
+
+    def _stored_contribution(self, test_case: str, session_id: str):
+        """저장된 세션이 집계에 더한 값 (timestamp, 카운터, 액션별 횟수) 또는 None"""
+        row = self._conn.execute(
+            "SELECT timestamp, statistics FROM sessions WHERE test_case = ? AND session_id = ?",
+            (test_case, session_id)
+        ).fetchone()
+        if row is None:
+            return None
+        timestamp, statistics = row
+        actions = _action_counts(
+            (action_id, bool(success), result_timestamp) for action_id, success, result_timestamp in self._conn.execute(
+                "SELECT action_id, success, timestamp FROM results WHERE test_case = ? AND session_id = ?",
+                (test_case, session_id)
+            )
+        )
+        return timestamp, _session_counters(json.loads(statistics)), actions
+
+    def _apply_rollups(self, test_case: str, session_id: str, timestamp: str, counters: Dict[str, float],
+                       actions: Dict[str, Tuple[int, int, str]], sign: int = 1):
+        """세션 하나의 기여분을 집계에 더하기 (sign=-1이면 빼기)"""
+        values = [sign * counters[name] for name in _ROLLUP_COUNTERS]
+        columns = ", ".join(_ROLLUP_COUNTERS)
+        placeholders = ", ".join("?" for _ in _ROLLUP_COUNTERS)
+        updates = ", ".join(f"{name} = {name} + excluded.{name}" for name in _ROLLUP_COUNTERS)
+
+        # 빼는 경우 최근 세션 정보는 그대로 두고, 더하는 경우 더 최근이면 교체
+        latest_id, latest_time = (session_id, timestamp) if sign > 0 else ("", "")
+        self._conn.execute(
+            f"INSERT INTO rollup_test_case (test_case, {columns}, latest_session_id, latest_timestamp) "
+            f"VALUES (?, {placeholders}, ?, ?) ON CONFLICT (test_case) DO UPDATE SET {updates}, "
+            "latest_session_id = CASE WHEN excluded.latest_timestamp >= latest_timestamp "
+            "THEN excluded.latest_session_id ELSE latest_session_id END, "
+            "latest_timestamp = MAX(latest_timestamp, excluded.latest_timestamp)",
+            (test_case, *values, latest_id, latest_time)
+        )
+        self._conn.execute(
+            f"INSERT INTO rollup_daily (day, test_case, {columns}) VALUES (?, ?, {placeholders}) "
+            f"ON CONFLICT (day, test_case) DO UPDATE SET {updates}",
+            (timestamp[:10], test_case, *values)
+        )
+        self._conn.executemany(
+            "INSERT INTO rollup_action (test_case, action_id, executions, failures, last_timestamp) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT (test_case, action_id) DO UPDATE SET "
+            "executions = executions + excluded.executions, failures = failures + excluded.failures, "
+            "last_timestamp = MAX(last_timestamp, excluded.last_timestamp)",
+            [(test_case, action_id, sign * executions, sign * failures, last if sign > 0 else "")
+             for action_id, (executions, failures, last) in actions.items()]
+        )
+
+    def rebuild_rollups(self):
+        """저장된 모든 세션으로 집계를 다시 만들기 (집계 도입 전 저장소 또는 집계 형식 변경 시)"""
+        with self._conn:
+            for table in ("rollup_test_case", "rollup_daily", "rollup_action", "flaky_action", "flaky_observation"):
+                self._conn.execute(f"DELETE FROM {table}")
+            # 불안정성 지수는 세션 순서에 따라 달라지므로 시각순으로 반영
+            sessions = self._conn.execute(
+                "SELECT test_case, session_id FROM sessions ORDER BY timestamp, session_id").fetchall()
+            for test_case, session_id in sessions:
+                timestamp, counters, actions = self._stored_contribution(test_case, session_id)
+                self._apply_rollups(test_case, session_id, timestamp, counters, actions)
+                self._update_flaky(test_case, session_id, timestamp, actions)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('rollup_version', ?)", (ROLLUP_VERSION,)
+            )
+
+    def execution_summary(self, test_case: str) -> Dict[str, Any]:
+        """테스트 케이스 실행 통계 요약 (QAAutomationController.get_execution_statistics와 같은 형식)"""
+        row = self._conn.execute(
+            "SELECT sessions, failure_count, success_rate_sum, semantic_match_rate_sum, latest_session_id "
+            "FROM rollup_test_case WHERE test_case = ?", (test_case,)
+        ).fetchone()
+        if row is None or row[0] <= 0:
+            return {
+                "test_case_name": test_case,
+                "total_executions": 0,
+                "avg_success_rate": 0.0,
+                "total_errors": 0,
+                "avg_semantic_match_rate": 0.0,
+                "latest_execution": None
+            }
+        sessions, failures, success_rate_sum, semantic_rate_sum, latest_session_id = row
+        return {
+            "test_case_name": test_case,
+            "total_executions": sessions,
+            "avg_success_rate": success_rate_sum / sessions,
+            "total_errors": failures,
+            "avg_semantic_match_rate": semantic_rate_sum / sessions,
+            "latest_execution": self._session_summary(test_case, latest_session_id)
+        }
+
+    def _session_summary(self, test_case: str, session_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT session_id, timestamp, total_actions, success_rate, success_count, failure_count, "
+            "semantic_match_rate FROM sessions WHERE test_case = ? AND session_id = ?", (test_case, session_id)
+        ).fetchone()
+        if row is None:
+            return None
+        keys = ("session_id", "timestamp", "total_actions", "success_rate", "success_count",
+                "failure_count", "semantic_match_rate")
+        return dict(zip(keys, row))
+
+    def daily_rollups(self, test_case: Optional[str] = None, days: Optional[int] = None) -> List[Dict[str, Any]]:
+        """날짜별 실행 통계 (최신 날짜순)
+
+        Args:
+            test_case: 테스트 케이스 이름 (None이면 모든 테스트 케이스 합산)
+            days: 오늘을 포함한 최근 며칠(달력 기준, 실행이 없는 날도 셈)만 (None이면 전체)
+
+        Returns:
+            [{day, sessions, total_actions, success_count, failure_count, success_rate,
+              semantic_match_rate, avg_success_rate, avg_semantic_match_rate, test_cases}, ...]
+            success_rate/semantic_match_rate는 액션 기준, avg_*는 세션 평균
+        """
+        conditions, params = [], []
+        if test_case is not None:
+            conditions.append("test_case = ?")
+            params.append(test_case)
+        if days is not None:
+            # 세션 시각은 로컬 시각(datetime.now())으로 저장되므로 로컬 날짜 기준
+            conditions.append("day >= date('now', 'localtime', ?)")
+            params.append(f"-{max(days, 1) - 1} days")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = (
+            "SELECT day, SUM(sessions), SUM(total_actions), SUM(success_count), SUM(failure_count), "
+            "SUM(semantic_count), SUM(success_rate_sum), SUM(semantic_match_rate_sum), "
+            f"SUM(sessions > 0) FROM rollup_daily {where} GROUP BY day HAVING SUM(sessions) > 0 ORDER BY day DESC"
+        )
+        rows = self._conn.execute(query, params)
+        rollups = []
+        for day, sessions, total, success, failure, semantic, rate_sum, semantic_rate_sum, test_cases in rows:
+            rollups.append({
+                "day": day,
+                "sessions": sessions,
+                "test_cases": test_cases,
+                "total_actions": total,
+                "success_count": success,
+                "failure_count": failure,
+                "success_rate": success / total if total else 0.0,
+                "semantic_match_rate": semantic / success if success else 0.0,
+                "avg_success_rate": rate_sum / sessions,
+                "avg_semantic_match_rate": semantic_rate_sum / sessions
+            })
+        return rollups
+
+    def action_rollups(self, test_case: str) -> Dict[str, Dict[str, Any]]:
+        """{action_id: {executions, failures, failure_rate, last_timestamp}}"""
+        return {
+            action_id: {
+                "executions": executions,
+                "failures": failures,
+                "failure_rate": failures / executions,
+                "last_timestamp": last_timestamp
+            }
+            for action_id, executions, failures, last_timestamp in self._conn.execute(
+                "SELECT action_id, executions, failures, last_timestamp FROM rollup_action "
+                "WHERE test_case = ? AND executions > 0", (test_case,)
+            )
+        }
+
+    # ----- 불안정 액션 -----
+
+    def _update_flaky(self, test_case: str, session_id: str, timestamp: str,
+                      actions: Dict[str, Tuple[int, int, str]]):
+        """세션의 액션별 성공/실패를 불안정성 지수에 반영
+
+        세션마다 액션이 한 번이라도 실패했으면 실패로 보고
+        - transitions: 직전 세션과 성공/실패가 바뀐 횟수
+        - failure_score: 실패 비율의 지수 이동 평균
+        - flakiness: 전환 여부(0/1)의 지수 이동 평균 (계속 실패하는 액션은 0에 가까워짐)
+        을 세션 시각순으로 갱신한다.
+
+        세션별 기여분은 flaky_observation에 보관한다. 이 세션이 액션의 가장 최근 관측이면 증분 갱신하고
+        (같은 세션을 다시 저장하면 반영 전 값 prev_*에서), 더 최근 세션이 이미 반영되어 있으면
+        (이어서 실행, JSON 다시 가져오기로 오래된 세션을 다시 저장한 경우) 관측 기록에서 다시 계산한다.
+        """
+        previous = {row[0] for row in self._conn.execute(
+            "SELECT action_id FROM flaky_observation WHERE test_case = ? AND session_id = ?", (test_case, session_id)
+        )}
+        self._conn.execute("DELETE FROM flaky_observation WHERE test_case = ? AND session_id = ?",
+                           (test_case, session_id))
+        self._conn.executemany(
+            "INSERT INTO flaky_observation (test_case, action_id, session_id, timestamp, executions, failures) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(test_case, action_id, session_id, timestamp, executions, failures)
+             for action_id, (executions, failures, _) in actions.items()]
+        )
+
+        # 이 세션보다 나중 세션이 이미 관측된 액션과 이번 저장에서 빠진 액션은 다시 계산
+        recompute = {row[0] for row in self._conn.execute(
+            "SELECT DISTINCT action_id FROM flaky_observation WHERE test_case = ? AND session_id != ? "
+            "AND (timestamp > ? OR (timestamp = ? AND session_id > ?))",
+            (test_case, session_id, timestamp, timestamp, session_id)
+        ) if row[0] in actions}
+        recompute |= previous - set(actions)
+
+        rows = {
+            row[0]: row[1:] for row in self._conn.execute(
+                "SELECT action_id, observations, transitions, failure_score, flakiness, last_failed, "
+                "last_session_id, prev_observations, prev_transitions, prev_failure_score, prev_flakiness, "
+                "prev_last_failed FROM flaky_action WHERE test_case = ? AND action_id IN "
+                f"({', '.join('?' for _ in actions) or 'NULL'})",
+                (test_case, *actions)
+            )
+        }
+
+        updates = []
+        for action_id, (executions, failures, _) in actions.items():
+            if action_id in recompute:
+                continue
+            row = rows.get(action_id)
+            if row is None:
+                base = _FLAKY_EMPTY
+            elif row[5] == session_id:
+                base = row[6:]  # 같은 세션 재저장 - 반영 전 값에서 다시 계산
+            elif action_id in previous:
+                # 이전에 반영했지만 마지막 세션이 아니었음 - 현재 값에 이미 포함되어 있으므로 다시 계산
+                recompute.add(action_id)
+                continue
+            else:
+                base = row[:5]
+            updates.append((test_case, action_id, *self._flaky_step(base, executions, failures),
+                            session_id, *base, timestamp))
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO flaky_action (test_case, action_id, observations, transitions, failure_score, "
+            "flakiness, last_failed, last_session_id, prev_observations, prev_transitions, prev_failure_score, "
+            "prev_flakiness, prev_last_failed, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            updates
+        )
+        self._recompute_flaky(test_case, recompute)
+
+    def _flaky_step(self, state: Tuple, executions: int, failures: int) -> Tuple:
+        """불안정성 상태 (observations, transitions, failure_score, flakiness, last_failed)에 세션 하나 반영"""
+        observations, transitions, failure_score, flakiness, last_failed = state
+        failed = failures > 0
+        flipped = last_failed is not None and bool(last_failed) != failed
+        if observations == 0:
+            failure_score, flakiness = failures / executions, 0.0
+        else:
+            failure_score += self.flaky_alpha * (failures / executions - failure_score)
+            flakiness += self.flaky_alpha * ((1.0 if flipped else 0.0) - flakiness)
+        return observations + 1, transitions + (1 if flipped else 0), failure_score, flakiness, int(failed)
+
+    def _recompute_flaky(self, test_case: str, action_ids: Iterable[str]):
+        """flaky_observation의 세션별 기여분을 시각순으로 다시 반영 (관측이 없으면 삭제)"""
+        for action_id in action_ids:
+            history = self._conn.execute(
+                "SELECT session_id, timestamp, executions, failures FROM flaky_observation "
+                "WHERE test_case = ? AND action_id = ? ORDER BY timestamp, session_id", (test_case, action_id)
+            ).fetchall()
+            if not history:
+                self._conn.execute("DELETE FROM flaky_action WHERE test_case = ? AND action_id = ?",
+                                   (test_case, action_id))
+                continue
+            state = _FLAKY_EMPTY
+            for _, _, executions, failures in history[:-1]:
+                state = self._flaky_step(state, executions, failures)
+            last_session, last_timestamp, executions, failures = history[-1]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO flaky_action (test_case, action_id, observations, transitions, "
+                "failure_score, flakiness, last_failed, last_session_id, prev_observations, prev_transitions, "
+                "prev_failure_score, prev_flakiness, prev_last_failed, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (test_case, action_id, *self._flaky_step(state, executions, failures), last_session,
+                 *state, last_timestamp)
+            )
+
+    def flaky_actions(self, test_case: Optional[str] = None, limit: int = 20,
+                      min_observations: int = DEFAULT_FLAKY_MIN_OBSERVATIONS) -> List[Dict[str, Any]]:
+        """불안정한 액션 순위 (flakiness 내림차순)
+
+        Args:
+            test_case: 테스트 케이스 이름 (None이면 모든 테스트 케이스)
+            limit: 최대 개수
+            min_observations: 포함할 최소 세션 수
+
+        Returns:
+            [{test_case, action_id, flakiness, failure_score, transitions, observations, last_failed}, ...]
+        """
+        where = "WHERE flakiness > 0 AND observations >= ?"
+        params: List[Any] = [min_observations]
+        if test_case is not None:
+            where += " AND test_case = ?"
+            params.append(test_case)
+        params.append(limit)
+        rows = self._conn.execute(
+            "SELECT test_case, action_id, flakiness, failure_score, transitions, observations, last_failed "
+            f"FROM flaky_action {where} ORDER BY flakiness DESC, failure_score DESC LIMIT ?", params
+        )
+        return [
+            {
+                "test_case": name,
+                "action_id": action_id,
+                "flakiness": flakiness,
+                "failure_score": failure_score,
+                "transitions": transitions,
+                "observations": observations,
+                "last_failed": bool(last_failed)
+            }
+            for name, action_id, flakiness, failure_score, transitions, observations, last_failed in rows
+        ]
+
+    def flaky_test_cases(self, limit: int = 20, threshold: float = 0.0,
+                         min_observations: int = DEFAULT_FLAKY_MIN_OBSERVATIONS) -> List[Dict[str, Any]]:
+        """불안정한 테스트 케이스 순위 (액션 flakiness 합 내림차순)
+
+        Returns:
+            [{test_case, flaky_actions, max_flakiness, total_flakiness}, ...]
+            flaky_actions는 flakiness가 threshold보다 큰 액션 수
+        """
+        rows = self._conn.execute(
+            "SELECT test_case, SUM(flakiness > ?), MAX(flakiness), SUM(flakiness) FROM flaky_action "
+            "WHERE flakiness > 0 AND observations >= ? GROUP BY test_case "
+            "ORDER BY SUM(flakiness) DESC LIMIT ?",
+            (threshold, min_observations, limit)
+        )
+        return [
+            {"test_case": name, "flaky_actions": count, "max_flakiness": peak, "total_flakiness": total}
+            for name, count, peak, total in rows
+        ]
+
+    def action_flakiness(self, test_case: str, threshold: float,
+                         min_observations: int = DEFAULT_FLAKY_MIN_OBSERVATIONS) -> Dict[str, float]:
+        """flakiness가 threshold 이상인 액션 {action_id: flakiness} (재실행 시 대기/재시도 강화용)"""
+        return dict(self._conn.execute(
+            "SELECT action_id, flakiness FROM flaky_action "
+            "WHERE test_case = ? AND flakiness >= ? AND flakiness > 0 AND observations >= ?",
+            (test_case, threshold, min_observations)
+        ))
+
+    # ----- JSON 가져오기 -----
+
+    def import_json_sessions(self, data_dir: str) -> int:
+        """JSON 백엔드 세션 파일을 가져오기 (가져온 뒤 파일이 바뀌지 않은 세션은 건너뜀)
+
+        세션별로 결과/통계 파일의 최신 mtime을 기록해 두고, 달라진 세션만 다시 가져온다
+        (이어서 실행 등으로 JSON 백엔드가 같은 세션을 다시 저장한 경우 포함).
+        가져온 시각을 meta(json_imported)에 기록하므로 for_data_dir는 다시 가져오지 않는다.
+
+        Args:
+            data_dir: AccuracyTracker JSON 데이터 디렉토리
+
+        Returns:
+            가져온 세션 수
+        """
+        imported = 0
+        with self._conn:
+            if os.path.isdir(data_dir):
+                for test_case in sorted(os.listdir(data_dir)):
+                    test_case_dir = os.path.join(data_dir, test_case)
+                    if os.path.isdir(test_case_dir):
+                        imported += self._import_test_case_dir(test_case, test_case_dir)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported', ?)",
+                (datetime.now().isoformat(),)
+            )
+        return imported
+
+    def _import_test_case_dir(self, test_case: str, test_case_dir: str) -> int:
+        """테스트 케이스 디렉토리의 세션 가져오기 (결과/통계 파일 중 하나만 있어도 가져옴)"""
+        mtimes: Dict[str, int] = {}
+        with os.scandir(test_case_dir) as entries:
+            for entry in entries:
+                for suffix in ("_results.json", "_stats.json"):
+                    if entry.name.endswith(suffix):
+                        session_id = entry.name[:-len(suffix)]
+                        mtimes[session_id] = max(mtimes.get(session_id, 0), entry.stat().st_mtime_ns)
+        known = dict(self._conn.execute(
+            "SELECT session_id, mtime_ns FROM json_sessions WHERE test_case = ?", (test_case,)
+        ))
+
+        imported = 0
+        for session_id in sorted(mtimes):
+            if known.get(session_id) == mtimes[session_id]:
+                continue
+            try:
+                results_data = _read_json(os.path.join(test_case_dir, f"{session_id}_results.json"))
+                stats_data = _read_json(os.path.join(test_case_dir, f"{session_id}_stats.json"))
+            except (OSError, ValueError) as e:
+                logger.warning(f"JSON 세션 가져오기 실패: {test_case}/{session_id}, {e}")
+                continue
+            results = results_data.get("results", [])
+            statistics = stats_data.get("statistics") or _count_statistics(results)
+            timestamp = stats_data.get("timestamp") or results_data.get("timestamp", "")
+            self._write_session(test_case, session_id, timestamp, results, statistics,
+                                results_data.get("resume_count", 0))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO json_sessions (test_case, session_id, mtime_ns) VALUES (?, ?, ?)",
+                (test_case, session_id, mtimes[session_id])
+            )
+            imported += 1
+        return imported
+
+
+def _session_counters(statistics: Dict[str, Any]) -> Dict[str, float]:
+    """세션 통계에서 집계 카운터 추출"""
+    return {
+        "sessions": 1,
+        "total_actions": statistics.get("total_actions", 0),
+        "success_count": statistics.get("success_count", 0),
+        "failure_count": statistics.get("failure_count", 0),
+        "direct_count": statistics.get("direct_match_count", 0),
+        "semantic_count": statistics.get("semantic_match_count", 0),
+        "success_rate_sum": statistics.get("success_rate", 0.0),
+        "semantic_match_rate_sum": statistics.get("semantic_match_rate", 0.0)
+    }
+
+
+def _action_counts(results) -> Dict[str, Tuple[int, int, str]]:
+    """(action_id, success, timestamp) 목록을 {action_id: (실행 수, 실패 수, 마지막 시각)}으로 집계"""
+    counts: Dict[str, Tuple[int, int, str]] = {}
+    for action_id, success, timestamp in results:
+        executions, failures, last = counts.get(action_id, (0, 0, ""))
+        counts[action_id] = (executions + 1, failures + (0 if success else 1), max(last, timestamp or ""))
+    return counts
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    """JSON 파일 읽기 (없으면 빈 dict)"""
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
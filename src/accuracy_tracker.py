@@ -11,6 +11,11 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple
 
+from src.accuracy_store import (
+    ACCURACY_BACKENDS, DEFAULT_ACCURACY_BACKEND, DEFAULT_FLAKY_MIN_OBSERVATIONS, AccuracyStore
+)
+from src.streaming_stats import RunningMoments, StreamingPercentiles
+
 logger = logging.getLogger(__name__)
 
 
@@ -96,6 +101,10 @@ class AccuracyStatistics:
         failure_reasons: 실패 원인 분포
         transition_match_count: 화면 전환 일치 횟수
         transition_mismatch_count: 화면 전환 불일치 횟수
+        execution_time_std: 실행 시간 표준편차
+        execution_time_p50: 실행 시간 중앙값 (P² 추정)
+        execution_time_p95: 실행 시간 95 백분위 (P² 추정)
+        execution_time_p99: 실행 시간 99 백분위 (P² 추정)
     """
     total_actions: int = 0
     success_count: int = 0
@@ -111,6 +120,10 @@ class AccuracyStatistics:
     failure_reasons: Dict[str, int] = field(default_factory=dict)
     transition_match_count: int = 0
     transition_mismatch_count: int = 0
+    execution_time_std: float = 0.0
+    execution_time_p50: float = 0.0
+    execution_time_p95: float = 0.0
+    execution_time_p99: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
         """딕셔너리로 변환"""
@@ -128,10 +141,88 @@ class AccuracyStatistics:
             "avg_execution_time": self.avg_execution_time,
             "failure_reasons": self.failure_reasons,
             "transition_match_count": self.transition_match_count,
-            "transition_mismatch_count": self.transition_mismatch_count
+            "transition_mismatch_count": self.transition_mismatch_count,
+            "execution_time_std": self.execution_time_std,
+            "execution_time_p50": self.execution_time_p50,
+            "execution_time_p95": self.execution_time_p95,
+            "execution_time_p99": self.execution_time_p99
         }
 
 
+class AccuracyAggregator:
+    """실행 결과 누적 집계
+    
+    결과가 기록될 때마다 카운터, 합계, 실행 시간 Welford 분산과 P² 백분위를 갱신하여
+    통계를 O(1)로 만든다. 카운터와 평균은 전체 결과를 다시 순회한 값과 같다.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.success_count = 0
+        self.method_counts: Dict[str, int] = {}
+        self.failure_reasons: Dict[str, int] = {}
+        self.transition_match_count = 0
+        self._coordinate_change_sum = 0
+        self._coordinate_change_count = 0
+        self._execution_time_sum = 0
+        self._execution_time = RunningMoments()
+        self._execution_time_percentiles = StreamingPercentiles((50, 95, 99))
+    
+    def add(self, result: ActionExecutionResult):
+        """실행 결과 하나 반영"""
+        self.count += 1
+        if result.success:
+            self.success_count += 1
+        elif result.failure_reason:
+            self.failure_reasons[result.failure_reason] = self.failure_reasons.get(result.failure_reason, 0) + 1
+        self.method_counts[result.method] = self.method_counts.get(result.method, 0) + 1
+        if result.screen_transition_matched:
+            self.transition_match_count += 1
+        
+        if result.coordinate_change is not None:
+            dx, dy = result.coordinate_change
+            self._coordinate_change_sum += (dx**2 + dy**2) ** 0.5
+            self._coordinate_change_count += 1
+        
+        if result.execution_time > 0:
+            self._execution_time_sum += result.execution_time
+            self._execution_time.add(result.execution_time)
+            self._execution_time_percentiles.add(result.execution_time)
+    
+    def to_statistics(self) -> 'AccuracyStatistics':
+        """누적 값으로 AccuracyStatistics 생성"""
+        stats = AccuracyStatistics()
+        if self.count == 0:
+            return stats
+        
+        stats.total_actions = self.count
+        stats.success_count = self.success_count
+        stats.failure_count = self.count - self.success_count
+        stats.success_rate = self.success_count / self.count
+        
+        stats.direct_match_count = self.method_counts.get('direct', 0)
+        stats.semantic_match_count = self.method_counts.get('semantic', 0)
+        stats.manual_match_count = self.method_counts.get('manual', 0)
+        if stats.success_count > 0:
+            stats.direct_match_rate = stats.direct_match_count / stats.success_count
+            stats.semantic_match_rate = stats.semantic_match_count / stats.success_count
+        
+        if self._coordinate_change_count:
+            stats.avg_coordinate_change = self._coordinate_change_sum / self._coordinate_change_count
+        if self._execution_time.count:
+            stats.avg_execution_time = self._execution_time_sum / self._execution_time.count
+            stats.execution_time_std = self._execution_time.std
+            percentiles = self._execution_time_percentiles.values()
+            stats.execution_time_p50 = percentiles[50]
+            stats.execution_time_p95 = percentiles[95]
+            stats.execution_time_p99 = percentiles[99]
+        
+        stats.failure_reasons = dict(self.failure_reasons)
+        stats.transition_match_count = self.transition_match_count
+        stats.transition_mismatch_count = self.count - self.transition_match_count
+        return stats
+
+
 class AccuracyTracker:
     """정확도 추적기
     
@@ -140,25 +231,52 @@ class AccuracyTracker:
     Requirements: 13.1, 13.2, 13.3, 13.4, 13.5, 13.6
     """
     
-    def __init__(self, test_case_name: str, data_dir: str = "accuracy_data"):
+    def __init__(self, test_case_name: str, data_dir: str = "accuracy_data", backend: str = "json"):
         """
         Args:
             test_case_name: 테스트 케이스 이름
             data_dir: 정확도 데이터 저장 디렉토리
+            backend: 저장 방식 ('json': 세션마다 JSON 파일, 'sqlite': <data_dir>/accuracy.sqlite)
+                (설정을 따르려면 for_config 사용, 설정 기본값은 'sqlite')
         """
+        if backend not in ACCURACY_BACKENDS:
+            raise ValueError(f"알 수 없는 정확도 저장 방식: {backend}")
         self.test_case_name = test_case_name
         self.data_dir = data_dir
+        self.backend = backend
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         self.results: List[ActionExecutionResult] = []
+        self._aggregator = AccuracyAggregator()  # 기록할 때마다 갱신되는 통계
         self._action_counter = 0
+        self.resume_count = 0  # 체크포인트에서 이어서 실행한 횟수
         
         # 데이터 디렉토리 생성
         self._ensure_data_dir()
+        # SQLite 저장소 (처음 열 때 기존 JSON 세션을 가져옴)
+        self._store: Optional[AccuracyStore] = AccuracyStore.for_data_dir(data_dir) if backend == "sqlite" else None
         
         logger.info(f"AccuracyTracker 초기화: test_case={test_case_name}, session={self.session_id}")
     
+    @classmethod
+    def for_config(cls, test_case_name: str, config) -> 'AccuracyTracker':
+        """설정(automation.accuracy_data_dir, automation.accuracy_backend)으로 생성"""
+        return cls(
+            test_case_name,
+            data_dir=config.get('automation.accuracy_data_dir', 'accuracy_data'),
+            backend=config.get('automation.accuracy_backend', DEFAULT_ACCURACY_BACKEND)
+        )
+    
+    def close(self):
+        """SQLite 저장소 연결 닫기"""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+    
     def _ensure_data_dir(self):
         """데이터 디렉토리 생성"""
+        if self.backend == "sqlite":
+            os.makedirs(self.data_dir, exist_ok=True)
+            return
         test_case_dir = os.path.join(self.data_dir, self.test_case_name)
         os.makedirs(test_case_dir, exist_ok=True)
     
@@ -171,11 +289,36 @@ class AccuracyTracker:
             세션 ID
         """
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        self.results = []
+        self._set_results([])
         self._action_counter = 0
+        self.resume_count = 0
         logger.info(f"새 세션 시작: {self.session_id}")
         return self.session_id
     
+    def resume_session(self, session_id: str, completed_actions: int) -> bool:
+        """중단된 세션을 이어서 기록
+        
+        저장된 세션을 로드한 뒤 완료된 액션 수만큼만 결과를 남긴다.
+        (체크포인트 이후에 기록되었지만 다시 실행할 액션의 결과는 버림)
+        이후 기록과 save_session()은 같은 세션 파일에 합쳐진다.
+        
+        Args:
+            session_id: 이어서 기록할 세션 ID
+            completed_actions: 체크포인트까지 완료된 액션 수
+            
+        Returns:
+            성공 여부 (세션 파일이 없으면 같은 ID로 빈 세션 시작)
+        """
+        loaded = self.load_session(session_id)
+        if not loaded:
+            self.session_id = session_id
+            self.results = []
+        self._set_results(self.results[:completed_actions])
+        self._action_counter = len(self.results)
+        self.resume_count += 1
+        logger.info(f"세션 이어서 기록: {session_id}, 완료 {len(self.results)}개")
+        return loaded
+    
     def record_success(self, action_id: str, method: str,
                       original_coords: Tuple[int, int],
                       actual_coords: Optional[Tuple[int, int]] = None,
@@ -219,7 +362,7 @@ class AccuracyTracker:
             screen_transition_matched=screen_transition_matched
         )
         
-        self.results.append(result)
+        self._append_result(result)
         logger.debug(f"성공 기록: {result.action_id}, method={method}")
         
         return result
@@ -255,70 +398,38 @@ class AccuracyTracker:
             screen_transition_matched=False
         )
         
-        self.results.append(result)
+        self._append_result(result)
         logger.debug(f"실패 기록: {result.action_id}, reason={reason}")
         
         return result
 
     
+    def _append_result(self, result: ActionExecutionResult):
+        self.results.append(result)
+        self._aggregator.add(result)
+    
+    def _set_results(self, results: List[ActionExecutionResult]):
+        """결과 목록 교체 (누적 통계 재계산)"""
+        self.results = results
+        self._aggregator = AccuracyAggregator()
+        for result in results:
+            self._aggregator.add(result)
+    
     def calculate_statistics(self) -> AccuracyStatistics:
         """통계 계산
         
         Requirements: 13.5, 13.6
         
+        기록할 때마다 갱신한 누적 값을 사용하므로 결과 수와 관계없이 O(1)이다.
+        (results를 직접 수정한 경우에는 다시 집계)
+        
         Returns:
-            AccuracyStatistics 객체 (성공률, 매칭 방법 비율, 평균 좌표 변경 거리 등)
+            AccuracyStatistics 객체 (성공률, 매칭 방법 비율, 평균 좌표 변경 거리,
+            실행 시간 백분위 등)
         """
-        stats = AccuracyStatistics()
-        
-        if not self.results:
-            return stats
-        
-        total = len(self.results)
-        stats.total_actions = total
-        
-        # 성공/실패 카운트
-        stats.success_count = sum(1 for r in self.results if r.success)
-        stats.failure_count = total - stats.success_count
-        stats.success_rate = stats.success_count / total if total > 0 else 0.0
-        
-        # 매칭 방법별 카운트
-        stats.direct_match_count = sum(1 for r in self.results if r.method == 'direct')
-        stats.semantic_match_count = sum(1 for r in self.results if r.method == 'semantic')
-        stats.manual_match_count = sum(1 for r in self.results if r.method == 'manual')
-        
-        # 매칭 방법 비율 (성공한 것 중에서)
-        if stats.success_count > 0:
-            stats.direct_match_rate = stats.direct_match_count / stats.success_count
-            stats.semantic_match_rate = stats.semantic_match_count / stats.success_count
-        
-        # 평균 좌표 변경 거리 (의미론적 매칭에서만)
-        coord_changes = []
-        for r in self.results:
-            if r.coordinate_change is not None:
-                dx, dy = r.coordinate_change
-                distance = (dx**2 + dy**2) ** 0.5
-                coord_changes.append(distance)
-        
-        stats.avg_coordinate_change = sum(coord_changes) / len(coord_changes) if coord_changes else 0.0
-        
-        # 평균 실행 시간
-        execution_times = [r.execution_time for r in self.results if r.execution_time > 0]
-        stats.avg_execution_time = sum(execution_times) / len(execution_times) if execution_times else 0.0
-        
-        # 실패 원인 분포
-        failure_reasons: Dict[str, int] = {}
-        for r in self.results:
-            if not r.success and r.failure_reason:
-                reason = r.failure_reason
-                failure_reasons[reason] = failure_reasons.get(reason, 0) + 1
-        stats.failure_reasons = failure_reasons
-        
-        # 화면 전환 일치/불일치 카운트
-        stats.transition_match_count = sum(1 for r in self.results if r.screen_transition_matched)
-        stats.transition_mismatch_count = total - stats.transition_match_count
-        
-        return stats
+        if self._aggregator.count != len(self.results):
+            self._set_results(self.results)
+        return self._aggregator.to_statistics()
     
     def get_results(self) -> List[ActionExecutionResult]:
         """실행 결과 목록 반환
@@ -344,6 +455,15 @@ class AccuracyTracker:
         Returns:
             저장된 파일 경로
         """
+        if self._store is not None:
+            self._store.save_session(
+                self.test_case_name, self.session_id, datetime.now().isoformat(),
+                [r.to_dict() for r in self.results], self.calculate_statistics().to_dict(),
+                resume_count=self.resume_count
+            )
+            logger.info(f"세션 데이터 저장: {self._store.path} ({self.session_id})")
+            return self._store.path
+        
         test_case_dir = os.path.join(self.data_dir, self.test_case_name)
         os.makedirs(test_case_dir, exist_ok=True)
         
@@ -353,6 +473,7 @@ class AccuracyTracker:
             "test_case_name": self.test_case_name,
             "session_id": self.session_id,
             "timestamp": datetime.now().isoformat(),
+            "resume_count": self.resume_count,
             "results": [r.to_dict() for r in self.results]
         }
         
@@ -385,6 +506,17 @@ class AccuracyTracker:
         Returns:
             성공 여부
         """
+        if self._store is not None:
+            loaded = self._store.load_session(self.test_case_name, session_id)
+            if loaded is None:
+                logger.warning(f"세션을 찾을 수 없음: {session_id}")
+                return False
+            self.session_id = session_id
+            self.resume_count, results = loaded
+            self._set_results([ActionExecutionResult.from_dict(r) for r in results])
+            logger.info(f"세션 로드 완료: {session_id}, {len(self.results)}개 결과")
+            return True
+        
         test_case_dir = os.path.join(self.data_dir, self.test_case_name)
         results_path = os.path.join(test_case_dir, f"{session_id}_results.json")
         
@@ -397,10 +529,11 @@ class AccuracyTracker:
                 data = json.load(f)
             
             self.session_id = data.get("session_id", session_id)
-            self.results = [
+            self.resume_count = data.get("resume_count", 0)
+            self._set_results([
                 ActionExecutionResult.from_dict(r) 
                 for r in data.get("results", [])
-            ]
+            ])
             
             logger.info(f"세션 로드 완료: {session_id}, {len(self.results)}개 결과")
             return True
@@ -415,6 +548,9 @@ class AccuracyTracker:
         Returns:
             세션 정보 리스트 [{session_id, timestamp, total_actions, success_rate}, ...]
         """
+        if self._store is not None:
+            return self._store.list_sessions(self.test_case_name)
+        
         test_case_dir = os.path.join(self.data_dir, self.test_case_name)
         
         if not os.path.exists(test_case_dir):
@@ -447,6 +583,44 @@ class AccuracyTracker:
         
         return sessions
     
+    def get_execution_summary(self) -> Dict[str, Any]:
+        """실행 통계 요약 (실행 횟수, 평균 성공률, 총 오류 수, 평균 의미론적 매칭률, 최근 실행)
+        
+        SQLite 백엔드는 세션 저장 시 갱신한 집계를 읽으므로 이력 크기와 관계없이 일정한 시간이 걸린다.
+        
+        Returns:
+            통계 요약 딕셔너리
+        """
+        if self._store is not None:
+            return self._store.execution_summary(self.test_case_name)
+        
+        sessions = self.list_sessions()
+        total_executions = len(sessions)
+        return {
+            "test_case_name": self.test_case_name,
+            "total_executions": total_executions,
+            "avg_success_rate": (sum(s.get("success_rate", 0.0) for s in sessions) / total_executions
+                                 if total_executions > 0 else 0.0),
+            "total_errors": sum(s.get("failure_count", 0) for s in sessions),
+            "avg_semantic_match_rate": (sum(s.get("semantic_match_rate", 0.0) for s in sessions) / total_executions
+                                        if total_executions > 0 else 0.0),
+            "latest_execution": sessions[0] if sessions else None
+        }
+    
+    def get_flaky_actions(self, threshold: float = 0.0,
+                          min_observations: int = DEFAULT_FLAKY_MIN_OBSERVATIONS) -> Dict[str, float]:
+        """불안정 액션 {action_id: flakiness} (세션 간 성공/실패 전환의 지수 감쇠 점수)
+        
+        불안정성 지수는 SQLite 백엔드가 세션 저장 시 갱신하므로 JSON 백엔드는 빈 딕셔너리를 반환한다.
+        
+        Args:
+            threshold: 포함할 최소 flakiness
+            min_observations: 포함할 최소 세션 수
+        """
+        if self._store is None:
+            return {}
+        return self._store.action_flakiness(self.test_case_name, threshold, min_observations)
+    
     def get_action_history(self, action_id: str) -> List[ActionExecutionResult]:
         """특정 액션의 실행 이력 조회
         
@@ -456,6 +630,10 @@ class AccuracyTracker:
         Returns:
             해당 액션의 실행 결과 리스트
         """
+        if self._store is not None:
+            return [ActionExecutionResult.from_dict(r)
+                    for r in self._store.action_history(self.test_case_name, action_id)]
+        
         test_case_dir = os.path.join(self.data_dir, self.test_case_name)
         
         if not os.path.exists(test_case_dir):
@@ -485,6 +663,9 @@ class AccuracyTracker:
         Returns:
             {action_id: failure_rate} 딕셔너리
         """
+        if self._store is not None:
+            return self._store.failure_rate_by_action(self.test_case_name)
+        
         test_case_dir = os.path.join(self.data_dir, self.test_case_name)
         
         if not os.path.exists(test_case_dir):
@@ -524,6 +705,6 @@ class AccuracyTracker:
     
     def clear_results(self):
         """현재 세션 결과 초기화"""
-        self.results = []
+        self._set_results([])
         self._action_counter = 0
         logger.debug("결과 초기화됨")
@@ -0,0 +1,162 @@
+"""
+BackgroundVerifier - replay 중 비차단 스크린샷 검증
+
+인라인 검증은 액션마다 스크린샷 비교(불일치 시 Vision LLM 호출 포함)가 끝나야
+다음 입력을 보내므로, 긴 테스트 케이스에서는 replay 시간 대부분이 검증 대기가 된다.
+
+- inline: 기존 방식. 액션 실행 → 캡처 → 검증 후 다음 액션
+- background: replay 스레드는 캡처만 하고 작업 스레드 풀이 동시에 검증
+- offline: replay 중에는 캡처만 하고, 입력이 모두 끝난 뒤 작업 스레드 풀로 검증
+
+검증 결과는 작업 완료 순서와 관계없이 액션 순서대로 ReplayVerifier 세션에 추가되므로
+보고서(ReplayReport)와 변동 영역 학습은 인라인 검증과 동일하게 동작한다.
+"""
+
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from PIL import Image
+
+from src.replay_verifier import ReplayVerifier, VerificationResult
+
+logger = logging.getLogger(__name__)
+
+
+MODE_INLINE = "inline"
+MODE_BACKGROUND = "background"
+MODE_OFFLINE = "offline"
+VERIFICATION_MODES = [MODE_INLINE, MODE_BACKGROUND, MODE_OFFLINE]
+
+DEFAULT_WORKERS = 2
+
+
+def resolve_mode(value: Optional[str]) -> str:
+    """검증 모드 문자열 정규화 (알 수 없는 값은 inline)"""
+    mode = str(value or MODE_INLINE).strip().lower()
+    if mode not in VERIFICATION_MODES:
+        logger.warning(f"알 수 없는 검증 모드 '{value}', inline으로 실행")
+        return MODE_INLINE
+    return mode
+
+
+def error_result(action_index: int, action: Dict[str, Any], error: Exception) -> VerificationResult:
+    """액션 실행/검증 중 예외를 실패 결과로 변환"""
+    return VerificationResult(
+        action_index=action_index,
+        action_description=action.get('description', f'액션 {action_index}'),
+        screenshot_match=False,
+        screenshot_similarity=0.0,
+        final_result="fail",
+        details={"error": str(error)}
+    )
+
+
+# 대기 중 항목: 검증 작업(Future), 확정된 결과, 또는 offline 모드의 (액션, 캡처 이미지)
+_Pending = Union[Future, VerificationResult, Tuple[Dict[str, Any], Image.Image]]
+
+
+class BackgroundVerifier:
+    """캡처된 프레임을 작업 스레드에서 검증하고 액션 순서대로 결과를 합치는 큐"""
+
+    def __init__(self, verifier: ReplayVerifier, mode: str = MODE_BACKGROUND,
+                 workers: int = DEFAULT_WORKERS):
+        """
+        Args:
+            verifier: 검증 세션이 시작된 ReplayVerifier
+            mode: background 또는 offline
+            workers: 검증 작업 스레드 수
+        """
+        if mode not in (MODE_BACKGROUND, MODE_OFFLINE):
+            raise ValueError(f"백그라운드 검증 모드가 아님: {mode}")
+        self.verifier = verifier
+        self.mode = mode
+        self.workers = max(1, int(workers))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._entries: List[Tuple[int, Dict[str, Any], _Pending]] = []
+        if mode == MODE_BACKGROUND:
+            self._executor = self._create_executor()
+
+    @classmethod
+    def from_config(cls, verifier: ReplayVerifier, config, mode: str) -> 'BackgroundVerifier':
+        """설정(automation.verification_workers)에서 작업 스레드 수 로드"""
+        return cls(verifier, mode, config.get('automation.verification_workers', DEFAULT_WORKERS))
+
+    def _create_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="replay-verify")
+
+    def _verify(self, action_index: int, action: Dict[str, Any], image: Image.Image) -> VerificationResult:
+        return self.verifier.verify_captured_frame(action_index, action, image, record=False)
+
+    def submit(self, action_index: int, action: Dict[str, Any], image: Image.Image):
+        """캡처된 프레임을 검증 대기열에 추가 (replay 스레드는 대기하지 않음)"""
+        if self._executor is not None:
+            pending = self._executor.submit(self._verify, action_index, action, image)
+        else:
+            pending = (action, image)
+        self._entries.append((action_index, action, pending))
+
+    def add_result(self, action_index: int, result: VerificationResult):
+        """이미 확정된 결과 추가 (액션 실행 실패 등)"""
+        self._entries.append((action_index, {}, result))
+
+    @property
+    def pending_count(self) -> int:
+        """아직 검증이 끝나지 않은 프레임 수"""
+        return sum(1 for _, _, p in self._entries
+                   if isinstance(p, tuple) or (isinstance(p, Future) and not p.done()))
+
+    def first_failure(self) -> Optional[VerificationResult]:
+        """지금까지 확정된 결과 중 가장 앞선 실패 (조기 중단 판단용, 대기하지 않음)"""
+        for action_index, action, pending in self._entries:
+            if isinstance(pending, VerificationResult):
+                result = pending
+            elif isinstance(pending, Future) and pending.done():
+                try:
+                    result = pending.result()
+                except Exception as e:
+                    result = error_result(action_index, action, e)
+            else:
+                continue
+            if result.final_result == "fail":
+                return result
+        return None
+
+    def join(self) -> List[VerificationResult]:
+        """모든 검증이 끝날 때까지 대기하고 액션 순서대로 세션에 추가
+
+        offline 모드는 이 시점에 작업 스레드 풀을 만들어 캡처된 프레임을 검증한다.
+
+        Returns:
+            액션 순서의 VerificationResult 목록
+        """
+        if self.mode == MODE_OFFLINE and self._executor is None:
+            self._executor = self._create_executor()
+            self._entries = [
+                (i, action, self._executor.submit(self._verify, i, *p) if isinstance(p, tuple) else p)
+                for i, action, p in self._entries
+            ]
+
+        results = []
+        try:
+            for action_index, action, pending in self._entries:
+                if isinstance(pending, Future):
+                    try:
+                        result = pending.result()
+                    except Exception as e:
+                        logger.error(f"[{action_index}] 백그라운드 검증 실패: {e}")
+                        result = error_result(action_index, action, e)
+                else:
+                    result = pending
+                self.verifier.record_result(action_index, result)
+                results.append(result)
+        finally:
+            self.shutdown()
+        self._entries = []
+        return results
+
+    def shutdown(self):
+        """작업 스레드 풀 종료 (시작되지 않은 검증은 취소)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
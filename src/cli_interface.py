@@ -6,6 +6,7 @@ CLIInterface - 커맨드라인 인터페이스
 Requirements: 4.1, 4.2, 4.3, 4.4, 4.6, 4.9, 4.10, 4.11, 15.1, 15.2
 """
 
+import os
 from typing import List, Optional
 
 
@@ -64,8 +65,30 @@ class CLIInterface:
   replay [options]   - 로드된 테스트 케이스 재실행
                        --verify: 검증 모드 활성화
                        --report-dir <dir>: 보고서 저장 디렉토리 (기본: reports)
+                       --mode <inline|background|offline>: 검증 실행 방식
+                       --abort-on-fail: 실패 확정 시 재실행 중단
+                       --timeline: 녹화 시각에 맞춰 재실행 (action_delay 대신)
+                       --speed <배속>: 타임라인 재생 배속 (기본: 1.0)
   enrich <name>      - 기존 테스트 케이스에 의미론적 정보 추가
+  compile <name>     - replay 매니페스트 생성 (예상 프레임 해시/썸네일 사전 계산)
+  analyze <name>     - 예상 프레임 UI 분석 결과 생성/갱신 (--force: 전체 재분석)
+  mask <name> [...]  - 변동 영역 마스크 조회/편집
+                       add <액션|*> <x> <y> <w> <h>: 영역 추가 (프레임 대비 비율 0~1)
+                       clear [액션|*] [--learned]: 마스크 초기화
+  report <path> [name] - 스트리밍 보고서(JSONL) 마무리/합산
+                       <파일.jsonl>: 중단된 실행을 JSON/TXT 보고서로 저장
+                       <디렉토리> [name]: 여러 실행 결과 합산
+  recover [log] [name] - 녹화 로그(.qarec)를 테스트 케이스로 복구 (인자 없으면 목록 표시)
+  graph [--force]    - 녹화 기록으로 화면 상태 그래프 갱신 (--force: 전체 재구성)
+  parallel [name...] - 여러 게임 창에서 테스트 케이스 동시 재실행 (이름 없으면 전체)
+                       --simulate <N>: 실제 창 대신 가상 창 N개 사용
+  semantic <name> [options] - 의미론적 재실행 (액션마다 체크포인트 저장)
+                       --resume: 중단된 재실행을 체크포인트부터 이어서 실행
+                       --force: 화면이 체크포인트와 달라도 이어서 실행
   stats [name]       - 테스트 케이스 실행 이력 및 통계 표시
+                       --daily [N]: 오늘을 포함한 최근 N일(달력 기준) 날짜별 통계 (이름 없으면 전체 테스트 케이스)
+  flaky [name]       - 성공/실패가 자주 바뀌는 불안정 액션 순위 (이름 없으면 전체)
+                       --limit <N>: 표시할 개수 (기본: 20)
   help               - 도움말 표시
   quit               - 종료
 """
@@ -99,8 +122,26 @@ class CLIInterface:
             return self._handle_replay_with_args(args)
         elif cmd == "enrich":
             self._handle_enrich(args)
+        elif cmd == "compile":
+            self._handle_compile(args)
+        elif cmd == "analyze":
+            self._handle_analyze(args)
+        elif cmd == "mask":
+            self._handle_mask(args)
+        elif cmd == "report":
+            self._handle_report(args)
+        elif cmd == "recover":
+            self._handle_recover(args)
+        elif cmd == "graph":
+            self._handle_graph(args)
+        elif cmd == "parallel":
+            self._handle_parallel(args)
+        elif cmd == "semantic":
+            self._handle_semantic(args)
         elif cmd == "stats":
             self._handle_stats(args)
+        elif cmd == "flaky":
+            self._handle_flaky(args)
         elif cmd == "help":
             self.display_help()
         elif cmd == "quit" or cmd == "exit":
@@ -208,14 +249,17 @@ class CLIInterface:
         except Exception as e:
             print(f"❌ 테스트 케이스 저장 중 오류 발생: {e}")
     
-    def _handle_replay(self):
+    def _handle_replay(self, timing_options: Optional[dict] = None):
         """replay 명령어 처리 (Requirements 4.9)
         
         로드된 테스트 케이스를 재실행한다.
+        
+        Args:
+            timing_options: 재실행 타이밍 옵션 (timing, speed)
         """
         try:
             print("테스트 케이스를 재실행합니다...")
-            self.controller.replay_test_case()
+            self.controller.replay_test_case(**(timing_options or {}))
             print("✓ 재실행이 완료되었습니다.")
             
             # 매칭 통계 출력 (Requirements 4.1, 4.3, 4.4)
@@ -232,9 +276,12 @@ class CLIInterface:
         
         --verify 옵션으로 검증 모드를 활성화하고,
         --report-dir 옵션으로 보고서 저장 디렉토리를 지정할 수 있다.
+        --mode 옵션으로 검증 실행 방식(inline/background/offline)을,
+        --abort-on-fail 옵션으로 실패 확정 시 조기 중단을 지정한다.
+        --timeline 옵션으로 녹화 시각 기준 재실행을, --speed 옵션으로 재생 배속을 지정한다.
         
         Args:
-            args: 명령어 인자 (--verify, --report-dir 등)
+            args: 명령어 인자 (--verify, --report-dir, --mode, --abort-on-fail, --timeline, --speed 등)
             
         Returns:
             계속 실행 여부 (항상 True)
@@ -242,6 +289,7 @@ class CLIInterface:
         # 인자 파싱
         verify = False
         report_dir = "reports"
+        replay_options = {}  # 지정된 경우에만 전달 (미지정 시 설정 파일 값 사용)
         
         i = 0
         while i < len(args):
@@ -255,11 +303,34 @@ class CLIInterface:
                 else:
                     print("❌ --report-dir 옵션에 디렉토리 경로가 필요합니다.")
                     return True
+            elif arg == "--mode":
+                from src.background_verification import VERIFICATION_MODES
+                if i + 1 < len(args) and args[i + 1].lower() in VERIFICATION_MODES:
+                    replay_options["verification_mode"] = args[i + 1].lower()
+                    i += 1
+                else:
+                    print(f"❌ --mode 옵션에 검증 방식이 필요합니다: {', '.join(VERIFICATION_MODES)}")
+                    return True
+            elif arg == "--abort-on-fail":
+                replay_options["abort_on_failure"] = True
+            elif arg == "--timeline":
+                replay_options["timing"] = "timeline"
+            elif arg == "--speed":
+                try:
+                    speed = float(args[i + 1]) if i + 1 < len(args) else 0.0
+                except ValueError:
+                    speed = 0.0
+                if speed <= 0:
+                    print("❌ --speed 옵션에 0보다 큰 배속이 필요합니다.")
+                    return True
+                replay_options["speed"] = speed
+                i += 1
             i += 1
         
         # 검증 모드가 아니면 기존 방식으로 실행
         if not verify:
-            self._handle_replay()
+            self._handle_replay({key: value for key, value in replay_options.items()
+                                 if key in ("timing", "speed")})
             return True
         
         # 검증 모드로 실행 (Requirements 5.1)
@@ -276,7 +347,8 @@ class CLIInterface:
             test_passed, report = self.controller.script_generator.replay_with_verification(
                 self.controller.current_test_case,
                 verify=True,
-                report_dir=report_dir
+                report_dir=report_dir,
+                **replay_options
             )
             
             # 테스트 결과 요약 출력 (Requirements 5.2)
@@ -483,14 +555,292 @@ class CLIInterface:
         except Exception as e:
             print(f"❌ 보강 중 오류 발생: {e}")
     
+    def _handle_compile(self, args: List[str]):
+        """compile 명령어 처리
+        
+        테스트 케이스의 replay 매니페스트를 생성한다.
+        
+        Args:
+            args: 명령어 인자 (테스트 케이스 이름)
+        """
+        if not args:
+            print("❌ 사용법: compile <테스트_케이스_이름>")
+            print("  예: compile login_test")
+            return
+        
+        name = args[0]
+        
+        try:
+            manifest = self.controller.compile_test_case(name)
+            frame_count = sum(1 for entry in manifest.entries if entry.expected_frame)
+            print(f"✓ 테스트 케이스 '{name}'의 매니페스트를 생성했습니다.")
+            print(f"  액션: {len(manifest.entries)}개, 예상 프레임: {frame_count}개")
+        except FileNotFoundError:
+            print(f"❌ 테스트 케이스를 찾을 수 없습니다: {name}")
+        except Exception as e:
+            print(f"❌ 매니페스트 생성 중 오류 발생: {e}")
+    
+    def _handle_analyze(self, args: List[str]):
+        """analyze 명령어 처리
+        
+        테스트 케이스의 예상 프레임을 Vision LLM으로 미리 분석하여 저장한다.
+        
+        Args:
+            args: 명령어 인자 (테스트 케이스 이름, --force)
+        """
+        names = [arg for arg in args if not arg.startswith("--")]
+        if not names:
+            print("❌ 사용법: analyze <테스트_케이스_이름> [--force]")
+            print("  예: analyze login_test")
+            return
+        
+        name = names[0]
+        force = "--force" in args
+        
+        def on_progress(done: int, total: int, frame_path: str):
+            print(f"  [{done}/{total}] {frame_path}")
+        
+        try:
+            print(f"테스트 케이스 '{name}'의 예상 프레임을 분석합니다...")
+            counts = self.controller.analyze_expected_frames(
+                name, force=force, progress_callback=on_progress
+            )
+            print(f"✓ 예상 프레임 분석 완료: 전체 {counts['total']}개")
+            print(f"  새로 분석: {counts['analyzed']}개, 기존 결과 사용: {counts['cached']}개")
+            if counts['missing'] or counts['failed']:
+                print(f"  ⚠ 파일 없음: {counts['missing']}개, 분석 실패: {counts['failed']}개")
+        except FileNotFoundError:
+            print(f"❌ 테스트 케이스를 찾을 수 없습니다: {name}")
+        except Exception as e:
+            print(f"❌ 예상 프레임 분석 중 오류 발생: {e}")
+    
+    def _handle_mask(self, args: List[str]):
+        """mask 명령어 처리
+        
+        테스트 케이스의 변동 영역 마스크(시계, 애니메이션 등)를 조회하거나 편집한다.
+        
+        Args:
+            args: 명령어 인자 (테스트 케이스 이름, 하위 명령어)
+        """
+        if not args:
+            print("❌ 사용법: mask <테스트_케이스_이름> [add <액션|*> <x> <y> <w> <h> | clear [액션|*] [--learned]]")
+            print("  예: mask login_test add * 0.85 0.0 0.15 0.1")
+            return
+        
+        name = args[0]
+        sub_args = args[1:]
+        
+        try:
+            store = self.controller.get_region_masks(name)
+        except FileNotFoundError:
+            print(f"❌ 테스트 케이스를 찾을 수 없습니다: {name}")
+            return
+        except Exception as e:
+            print(f"❌ 마스크 로드 중 오류 발생: {e}")
+            return
+        
+        def parse_target(value: str):
+            return None if value == "*" else int(value)
+        
+        try:
+            if sub_args and sub_args[0] == "add":
+                if len(sub_args) != 6:
+                    print("❌ 사용법: mask <이름> add <액션|*> <x> <y> <w> <h>")
+                    return
+                target = parse_target(sub_args[1])
+                x, y, w, h = (float(v) for v in sub_args[2:6])
+                tiles = store.add_region(target, x, y, w, h)
+                store.save()
+                print(f"✓ 마스크 영역 추가: {sub_args[1]} (타일 {len(tiles)}개)")
+            elif sub_args and sub_args[0] == "clear":
+                targets = [a for a in sub_args[1:] if not a.startswith("--")]
+                target = parse_target(targets[0]) if targets else None
+                store.clear(target, learned_only="--learned" in sub_args)
+                store.save()
+                print(f"✓ 마스크 초기화: {targets[0] if targets else '전체'}")
+            elif sub_args:
+                print(f"❌ 알 수 없는 mask 명령어: {sub_args[0]}")
+            else:
+                summary = store.summary()
+                if not summary:
+                    print(f"테스트 케이스 '{name}'에 변동 영역 마스크가 없습니다.")
+                    return
+                print(f"테스트 케이스 '{name}' 변동 영역 마스크 (격자 {store.grid}x{store.grid}):")
+                for key, info in summary.items():
+                    label = "공통" if key == "*" else f"액션 {key}"
+                    print(f"  [{label}] 수동 {len(info['manual'])}개, 학습 {len(info['learned'])}개"
+                          f" (관측 {info['observations']}회)")
+        except ValueError:
+            print("❌ 액션 번호와 좌표는 숫자여야 합니다.")
+        except Exception as e:
+            print(f"❌ 마스크 처리 중 오류 발생: {e}")
+    
+    def _handle_report(self, args: List[str]):
+        """report 명령어 처리
+        
+        JSONL 파일이면 (중단된 실행 포함) 기존 JSON/TXT 보고서로 마무리하고,
+        디렉토리면 여러 실행의 결과를 합산하여 출력한다.
+        
+        Args:
+            args: 명령어 인자 (JSONL 파일 또는 디렉토리, 테스트 케이스 이름)
+        """
+        from src.report_stream import aggregate_report_streams, find_report_streams, finalize_report_stream
+        
+        if not args:
+            print("❌ 사용법: report <보고서.jsonl | 보고서_디렉토리> [테스트_케이스_이름]")
+            return
+        
+        path = args[0]
+        try:
+            if os.path.isfile(path):
+                report, json_path = finalize_report_stream(path)
+                print(report.summary)
+                print(f"✓ 보고서 저장: {json_path}")
+                return
+            
+            streams = find_report_streams(path, args[1] if len(args) > 1 else None)
+            if not streams:
+                print(f"❌ 스트리밍 보고서를 찾을 수 없습니다: {path}")
+                return
+            
+            aggregate = aggregate_report_streams(streams)
+            totals = aggregate["totals"]
+            print(f"실행 {len(aggregate['runs'])}회 (완료 {aggregate['finished_runs']}, 중단 {aggregate['interrupted_runs']})")
+            for run in aggregate["runs"]:
+                status = "완료" if run["finished"] else "중단"
+                print(f"  {run['test_case_name']} {run['session_id']} [{status}] "
+                      f"{run['total']}건: ✓{run['passed']} ⚠{run['warning']} ✗{run['failed']}")
+            print(f"합계 {totals['total']}건: ✓{totals['passed']} ⚠{totals['warning']} ✗{totals['failed']}")
+            if aggregate["failed_actions"]:
+                failed = ", ".join(f"[{k}] {v}회" for k, v in aggregate["failed_actions"].items())
+                print(f"실패한 액션: {failed}")
+        except Exception as e:
+            print(f"❌ 보고서 처리 중 오류 발생: {e}")
+    
+    def _handle_recover(self, args: List[str]):
+        """recover 명령어 처리
+        
+        인자가 없으면 저장되지 않은 녹화 로그 목록을 표시하고,
+        로그 경로가 주어지면 테스트 케이스로 복구하여 저장한다.
+        
+        Args:
+            args: 명령어 인자 (녹화 로그 경로, 테스트 케이스 이름)
+        """
+        try:
+            if not args:
+                logs = self.controller.list_recording_logs()
+                if not logs:
+                    print("저장되지 않은 녹화 로그가 없습니다.")
+                    return
+                print(f"저장되지 않은 녹화 로그 {len(logs)}개:")
+                for log in logs:
+                    status = " (끝부분 손상)" if log["truncated"] else ""
+                    print(f"  {log['path']} - {log['name'] or '(이름 없음)'}, "
+                          f"{log['created_at']}, 액션 {log['action_count']}개{status}")
+                print("  'recover <로그 경로> [이름]' 명령으로 테스트 케이스로 저장하세요.")
+                return
+            
+            test_case = self.controller.recover_recording(args[0], args[1] if len(args) > 1 else None)
+            print(f"✓ 테스트 케이스 '{test_case['name']}'을(를) 복구했습니다. "
+                  f"({len(test_case['actions'])}개 액션)")
+            print(f"  스크립트: {test_case['script_path']}")
+            print(f"  데이터: {test_case['json_path']}")
+        except Exception as e:
+            print(f"❌ 녹화 로그 복구 중 오류 발생: {e}")
+    
+    def _handle_graph(self, args: List[str]):
+        """graph 명령어 처리
+        
+        테스트 케이스 녹화 기록으로 화면 상태 그래프를 갱신하고 요약을 표시한다.
+        
+        Args:
+            args: 명령어 인자 (--force)
+        """
+        try:
+            stats = self.controller.update_state_graph(force="--force" in args)
+            print(f"✓ 화면 상태 그래프 갱신: 테스트 케이스 {stats['updated']}개 반영, "
+                  f"{stats['skipped']}개 변경 없음")
+            if stats['failed']:
+                print(f"  ⚠ 로드 실패 {stats['failed']}개")
+            print(f"  상태 {stats['states']}개, 전환 {stats['transitions']}개")
+        except Exception as e:
+            print(f"❌ 화면 상태 그래프 갱신 중 오류 발생: {e}")
+    
+    def _handle_parallel(self, args: List[str]):
+        """parallel 명령어 처리
+        
+        여러 게임 인스턴스에서 테스트 케이스를 동시에 재실행하고 통합 보고서를 저장한다.
+        
+        Args:
+            args: 명령어 인자 (테스트 케이스 이름들, --simulate <N>)
+        """
+        names = []
+        simulate = 0
+        i = 0
+        while i < len(args):
+            if args[i] == "--simulate" and i + 1 < len(args):
+                try:
+                    simulate = int(args[i + 1])
+                except ValueError:
+                    print(f"❌ 가상 창 수는 정수여야 합니다: {args[i + 1]}")
+                    return
+                i += 2
+            else:
+                names.append(args[i])
+                i += 1
+        
+        try:
+            report, report_path = self.controller.replay_parallel(names or None, simulate=simulate)
+            summary = report.summary()
+            print(f"✓ 병렬 재실행 완료: 테스트 케이스 {summary['test_cases']}개 "
+                  f"(성공 {summary['passed']}, 실패 {summary['failed']})")
+            print(f"  소요 시간: {summary['wall_seconds']:.1f}초 "
+                  f"(순차 합계 {summary['serial_seconds']:.1f}초, {summary['speedup']:.1f}배)")
+            for name, info in summary['instances'].items():
+                print(f"  [{name}] 테스트 케이스 {info['test_cases']}개, 사용률 {info['utilization']:.0%}")
+            print(f"  보고서: {report_path}")
+        except Exception as e:
+            print(f"❌ 병렬 재실행 중 오류 발생: {e}")
+    
+    def _handle_semantic(self, args: List[str]):
+        """semantic 명령어 처리
+        
+        테스트 케이스를 의미론적 재실행하며 액션마다 체크포인트를 남긴다.
+        
+        Args:
+            args: 명령어 인자 (테스트 케이스 이름, --resume, --force)
+        """
+        names = [arg for arg in args if not arg.startswith("--")]
+        if not names:
+            print("❌ 테스트 케이스 이름을 지정하세요: semantic <name> [--resume] [--force]")
+            return
+        resume = "--resume" in args
+        force = "--force" in args
+        
+        from src.replay_checkpoint import CheckpointMismatchError
+        
+        try:
+            results, stats = self.controller.replay_semantic(names[0], resume=resume, force=force)
+            print(f"✓ 의미론적 재실행 완료: 액션 {stats['total_actions']}개 "
+                  f"(성공 {stats['success_count']}, 실패 {stats['failure_count']})")
+        except CheckpointMismatchError as e:
+            print(f"❌ {e}")
+            print("  게임 화면을 체크포인트 시점으로 맞추거나 --force로 이어서 실행하세요.")
+        except Exception as e:
+            print(f"❌ 의미론적 재실행 중 오류 발생: {e}")
+    
     def _handle_stats(self, args: List[str]):
         """stats 명령어 처리 (Requirements 15.1, 15.2)
         
         테스트 케이스의 실행 이력과 통계를 표시한다.
         
         Args:
-            args: 명령어 인자 (테스트 케이스 이름, 선택사항)
+            args: 명령어 인자 (테스트 케이스 이름, 선택사항 / --daily [일수])
         """
+        if "--daily" in args:
+            self._handle_daily_stats(args)
+            return
+        
         try:
             # 테스트 케이스 이름 결정
             test_case_name = args[0] if args else None
@@ -575,6 +925,90 @@ class CLIInterface:
             print("  테스트 케이스 이름을 지정하거나, 먼저 'load <이름>' 명령으로 테스트 케이스를 로드하세요.")
         except Exception as e:
             print(f"❌ 통계 조회 중 오류 발생: {e}")
+    
+    def _handle_daily_stats(self, args: List[str]):
+        """stats --daily 명령어 처리
+        
+        날짜별 실행 통계를 표시한다. (테스트 케이스 이름이 없으면 모든 테스트 케이스 합산)
+        
+        Args:
+            args: 명령어 인자 ([테스트_케이스_이름] --daily [일수])
+        """
+        index = args.index("--daily")
+        days = 14
+        rest = args[:index] + args[index + 1:]
+        if index + 1 < len(args) and args[index + 1].isdigit():
+            days = int(args[index + 1])
+            rest = args[:index] + args[index + 2:]
+        test_case_name = rest[0] if rest else None
+        
+        try:
+            rollups = self.controller.get_daily_statistics(test_case_name, days)
+        except Exception as e:
+            print(f"❌ 날짜별 통계 조회 중 오류 발생: {e}")
+            return
+        
+        print()
+        print("=" * 60)
+        print(f"  날짜별 통계: {test_case_name or '전체 테스트 케이스'} (최근 {days}일)")
+        print("=" * 60)
+        if not rollups:
+            print("\n  실행 이력이 없습니다.")
+            return
+        
+        print(f"{'날짜':<12} {'실행':>6} {'액션':>8} {'성공률':>8} {'오류':>6} {'의미론적 매칭':>12}")
+        print("-" * 60)
+        for rollup in rollups:
+            print(f"{rollup['day']:<12} {rollup['sessions']:>6} {rollup['total_actions']:>8} "
+                  f"{rollup['success_rate'] * 100:>7.1f}% {rollup['failure_count']:>6} "
+                  f"{rollup['semantic_match_rate'] * 100:>11.1f}%")
+        print()
+    
+    def _handle_flaky(self, args: List[str]):
+        """flaky 명령어 처리
+        
+        세션 간 성공/실패가 자주 바뀌는 액션과 테스트 케이스 순위를 표시한다.
+        
+        Args:
+            args: 명령어 인자 ([테스트_케이스_이름] [--limit 개수])
+        """
+        limit = 20
+        rest = list(args)
+        if "--limit" in rest:
+            index = rest.index("--limit")
+            if index + 1 >= len(rest) or not rest[index + 1].isdigit():
+                print("❌ 사용법: flaky [테스트_케이스_이름] [--limit 개수]")
+                return
+            limit = int(rest[index + 1])
+            del rest[index:index + 2]
+        test_case_name = rest[0] if rest else None
+        
+        try:
+            report = self.controller.get_flaky_report(test_case_name, limit)
+        except Exception as e:
+            print(f"❌ 불안정 액션 조회 중 오류 발생: {e}")
+            return
+        
+        print()
+        print("=" * 60)
+        print(f"  불안정 액션: {test_case_name or '전체 테스트 케이스'}")
+        print("=" * 60)
+        if report["test_cases"]:
+            print(f"{'테스트 케이스':<24} {'불안정 액션':>10} {'최대 지수':>10}")
+            print("-" * 60)
+            for entry in report["test_cases"]:
+                print(f"{entry['test_case']:<24} {entry['flaky_actions']:>10} {entry['max_flakiness']:>10.2f}")
+            print()
+        if not report["actions"]:
+            print("\n  불안정한 액션이 없습니다.")
+            return
+        
+        print(f"{'테스트 케이스':<20} {'액션':<14} {'지수':>6} {'실패 점수':>9} {'전환':>5} {'실행':>5}")
+        print("-" * 60)
+        for entry in report["actions"]:
+            print(f"{entry['test_case']:<20} {entry['action_id']:<14} {entry['flakiness']:>6.2f} "
+                  f"{entry['failure_score']:>9.2f} {entry['transitions']:>5} {entry['observations']:>5}")
+        print()
 
 
 if __name__ == '__main__':
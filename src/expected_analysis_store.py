@@ -0,0 +1,277 @@
+"""
+ExpectedAnalysisStore - 예상 프레임 UI 분석 결과 저장소
+
+녹화된 예상 스크린샷은 replay마다 바뀌지 않으므로 Vision LLM 분석을
+한 번만 수행하고 테스트 케이스 옆에 저장해 둔다.
+검증 시에는 실제 캡처 화면만 분석하면 된다.
+
+각 분석 결과에는 모델 ID와 프롬프트 버전이 기록되며,
+모델/프롬프트가 바뀌거나 예상 프레임 파일이 변경되면
+오래된(stale) 결과로 판단하여 자동으로 다시 분석한다.
+
+저장 위치: <test_cases_dir>/<테스트_케이스_이름>/expected_analysis.json
+"""
+
+import os
+import json
+import logging
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from dataclasses import dataclass, field
+
+from PIL import Image
+
+from src.replay_manifest import get_artifact_dir, get_project_root, resolve_frame_path
+
+logger = logging.getLogger(__name__)
+
+
+ANALYSIS_FILENAME = "expected_analysis.json"
+
+
+def get_analysis_path(test_cases_dir: str, test_case_name: str) -> str:
+    """예상 프레임 분석 파일 경로"""
+    return os.path.join(get_artifact_dir(test_cases_dir, test_case_name), ANALYSIS_FILENAME)
+
+
+def frame_key(path: str) -> str:
+    """프레임 경로를 저장소 키로 변환
+
+    프로젝트 루트 기준 상대 경로를 '/' 구분자로 정규화하여
+    Windows에서 녹화한 테스트 케이스도 같은 키를 갖도록 한다.
+    """
+    resolved = resolve_frame_path(path)
+    root = get_project_root()
+    try:
+        if os.path.commonpath([resolved, root]) == root:
+            resolved = os.path.relpath(resolved, root)
+    except ValueError:
+        pass
+    return resolved.replace('\\', '/')
+
+
+@dataclass
+class ExpectedFrameAnalysis:
+    """예상 프레임 하나의 UI 분석 결과"""
+    frame_path: str
+    file_size: int
+    file_mtime: float
+    model_id: str
+    prompt_version: str
+    analyzed_at: str
+    ui_data: Dict[str, Any] = field(default_factory=dict)
+
+    def is_stale(self, signature: Dict[str, str]) -> bool:
+        """재분석이 필요한지 확인
+
+        Args:
+            signature: 현재 분석기의 {"model_id", "prompt_version"}
+        """
+        if self.model_id != signature.get("model_id") or \
+                self.prompt_version != signature.get("prompt_version"):
+            return True
+        try:
+            stat = os.stat(resolve_frame_path(self.frame_path))
+        except OSError:
+            return True
+        return stat.st_size != self.file_size or stat.st_mtime != self.file_mtime
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "frame_path": self.frame_path,
+            "file_size": self.file_size,
+            "file_mtime": self.file_mtime,
+            "model_id": self.model_id,
+            "prompt_version": self.prompt_version,
+            "analyzed_at": self.analyzed_at,
+            "ui_data": self.ui_data
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ExpectedFrameAnalysis':
+        return cls(
+            frame_path=data.get("frame_path", ""),
+            file_size=data.get("file_size", 0),
+            file_mtime=data.get("file_mtime", 0.0),
+            model_id=data.get("model_id", ""),
+            prompt_version=data.get("prompt_version", ""),
+            analyzed_at=data.get("analyzed_at", ""),
+            ui_data=data.get("ui_data", {})
+        )
+
+
+class ExpectedAnalysisStore:
+    """테스트 케이스별 예상 프레임 UI 분석 저장소"""
+
+    def __init__(self, path: str, ui_analyzer, retry_count: int = 2):
+        """
+        Args:
+            path: 분석 결과 JSON 파일 경로
+            ui_analyzer: UIAnalyzer 인스턴스
+            retry_count: Vision LLM 분석 재시도 횟수
+        """
+        self.path = path
+        self.ui_analyzer = ui_analyzer
+        self.retry_count = retry_count
+        self._entries: Dict[str, ExpectedFrameAnalysis] = {}
+        # 백그라운드 검증 작업 스레드가 동시에 분석/저장할 수 있으므로 _entries 변경과 저장을 직렬화
+        self._lock = threading.RLock()
+        self.load()
+
+    @classmethod
+    def for_test_case(cls, config, test_case_name: str, ui_analyzer) -> 'ExpectedAnalysisStore':
+        """테스트 케이스의 분석 저장소 생성"""
+        test_cases_dir = config.get('test_cases.directory', 'test_cases')
+        return cls(get_analysis_path(test_cases_dir, test_case_name), ui_analyzer)
+
+    def load(self):
+        """저장된 분석 결과 로드 (파일이 없거나 손상되었으면 빈 저장소)"""
+        entries = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                for key, entry in data.get("frames", {}).items():
+                    entries[key] = ExpectedFrameAnalysis.from_dict(entry)
+            except (OSError, ValueError) as e:
+                logger.warning(f"예상 프레임 분석 파일 로드 실패, 무시: {self.path} ({e})")
+        with self._lock:
+            self._entries = entries
+
+    def save(self):
+        """분석 결과 저장 (고유한 임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            data = {"frames": {key: entry.to_dict() for key, entry in self._entries.items()}}
+            fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(self.path) + ".",
+                                            suffix=".tmp", dir=directory or None)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+    def _get_signature(self) -> Dict[str, str]:
+        return self.ui_analyzer.get_analysis_signature()
+
+    def get(self, frame_path: str) -> Optional[ExpectedFrameAnalysis]:
+        """유효한(오래되지 않은) 분석 결과 조회"""
+        with self._lock:
+            entry = self._entries.get(frame_key(frame_path))
+        if entry is None or entry.is_stale(self._get_signature()):
+            return None
+        return entry
+
+    def is_fresh(self, frame_path: str) -> bool:
+        """유효한 분석 결과가 있는지 확인"""
+        return self.get(frame_path) is not None
+
+    def get_or_analyze(self, frame_path: str, persist: bool = True) -> Dict[str, Any]:
+        """예상 프레임의 UI 분석 결과 반환
+
+        유효한 분석 결과가 있으면 그대로 반환하고,
+        없거나 오래되었으면 Vision LLM으로 분석하여 저장한다.
+        (Vision LLM 성공 결과만 저장, OCR 폴백/실패 결과는 다음에 다시 분석)
+
+        Args:
+            frame_path: 예상 프레임 경로
+            persist: 새 분석 결과를 파일에 저장할지 여부
+
+        Returns:
+            UI 분석 결과 딕셔너리 (cached 필드로 캐시 사용 여부 표시)
+        """
+        cached = self.get(frame_path)
+        if cached is not None:
+            ui_data = dict(cached.ui_data)
+            ui_data["cached"] = True
+            return ui_data
+
+        resolved = resolve_frame_path(frame_path)
+        with Image.open(resolved) as image:
+            image.load()
+            ui_data = self.ui_analyzer.analyze_with_retry(image, retry_count=self.retry_count)
+
+        if ui_data.get("source") == "vision_llm":
+            signature = self._get_signature()
+            stat = os.stat(resolved)
+            entry = ExpectedFrameAnalysis(
+                frame_path=frame_key(frame_path),
+                file_size=stat.st_size,
+                file_mtime=stat.st_mtime,
+                model_id=signature.get("model_id", ""),
+                prompt_version=signature.get("prompt_version", ""),
+                analyzed_at=datetime.now().isoformat(),
+                ui_data={k: v for k, v in ui_data.items() if k != "cached"}
+            )
+            with self._lock:
+                self._entries[entry.frame_path] = entry
+            if persist:
+                try:
+                    self.save()
+                except (OSError, TypeError, ValueError) as e:
+                    logger.warning(f"예상 프레임 분석 결과 저장 실패: {e}")
+
+        ui_data = dict(ui_data)
+        ui_data["cached"] = False
+        return ui_data
+
+    def analyze_test_case(
+        self,
+        test_case: Dict[str, Any],
+        force: bool = False,
+        progress_callback: Optional[Callable[[int, int, str], None]] = None
+    ) -> Dict[str, int]:
+        """테스트 케이스의 모든 예상 프레임을 분석하여 저장 (일괄 처리)
+
+        Args:
+            test_case: 테스트 케이스 데이터 (actions 필드 포함)
+            force: True면 유효한 결과가 있어도 다시 분석
+            progress_callback: 진행 콜백 (완료 수, 전체 수, 프레임 경로)
+
+        Returns:
+            {"total", "analyzed", "cached", "missing", "failed"} 카운트
+        """
+        frame_paths: List[str] = []
+        for action in test_case.get("actions", []):
+            path = action.get("screenshot_path") if isinstance(action, dict) else getattr(action, "screenshot_path", None)
+            if path and path not in frame_paths:
+                frame_paths.append(path)
+
+        counts = {"total": len(frame_paths), "analyzed": 0, "cached": 0, "missing": 0, "failed": 0}
+        if force:
+            with self._lock:
+                for path in frame_paths:
+                    self._entries.pop(frame_key(path), None)
+
+        for done, path in enumerate(frame_paths, 1):
+            if not os.path.exists(resolve_frame_path(path)):
+                counts["missing"] += 1
+            elif self.is_fresh(path):
+                counts["cached"] += 1
+            else:
+                try:
+                    ui_data = self.get_or_analyze(path, persist=False)
+                    if ui_data.get("source") == "vision_llm":
+                        counts["analyzed"] += 1
+                    else:
+                        counts["failed"] += 1
+                except Exception as e:
+                    logger.warning(f"예상 프레임 분석 실패: {path} ({e})")
+                    counts["failed"] += 1
+
+            if progress_callback:
+                progress_callback(done, len(frame_paths), path)
+
+        if counts["analyzed"] > 0 or force:
+            self.save()
+
+        return counts
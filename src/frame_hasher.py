@@ -0,0 +1,175 @@
+"""
+FrameHasher - NumPy 기반 다중 perceptual hash 엔진
+
+프레임을 32x32 그레이스케일로 한 번만 다운샘플링한 뒤
+aHash, dHash, pHash(DCT)를 한 번에 계산한다.
+여러 프레임을 하나의 배열로 쌓아 벡터 연산으로 일괄 처리하는 API도 제공한다.
+
+- pHash: imagehash.phash와 같은 전처리/DCT(비정규화 DCT-II)를 사용하므로 같은 값을 낸다.
+- aHash/dHash: 32x32 픽셀의 영역 평균으로 8x8, 8x9 격자를 만들어 계산한다.
+  (imagehash는 원본에서 직접 리샘플링하므로 일부 비트가 다를 수 있다)
+- average_hash: 녹화에 저장되는 ui_state_hash_before/after용 aHash.
+  기존 녹화와 비교할 수 있도록 imagehash.average_hash와 같은 값을 낸다.
+
+해시 값은 64비트 정수이며, 16진수 문자열은 imagehash와 같은 형식
+(행 우선, 첫 비트가 최상위 비트)이다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+import numpy as np
+from PIL import Image
+
+
+# 해시 엔진 식별자 (replay 매니페스트 등 저장된 해시의 호환성 확인용)
+HASH_ENGINE = "frame_hasher-v1"
+
+HASH_SIZE = 8
+HASH_BITS = HASH_SIZE * HASH_SIZE
+
+
+def hamming_distance(hash1: int, hash2: int) -> int:
+    """두 64비트 해시의 해밍 거리"""
+    return (hash1 ^ hash2).bit_count()
+
+
+def hex_hamming_distance(hex1: str, hex2: str) -> int:
+    """16진수 문자열 해시의 해밍 거리"""
+    return hamming_distance(int(hex1, 16), int(hex2, 16))
+
+
+def hash_to_hex(value: int) -> str:
+    """64비트 해시를 16자리 16진수 문자열로 변환"""
+    return f"{value:0{HASH_BITS // 4}x}"
+
+
+@dataclass(frozen=True)
+class FrameHashes:
+    """한 프레임의 해시 값 묶음"""
+    ahash: int
+    dhash: int
+    phash: int
+
+    @property
+    def ahash_hex(self) -> str:
+        return hash_to_hex(self.ahash)
+
+    @property
+    def dhash_hex(self) -> str:
+        return hash_to_hex(self.dhash)
+
+    @property
+    def phash_hex(self) -> str:
+        return hash_to_hex(self.phash)
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"ahash": self.ahash_hex, "dhash": self.dhash_hex, "phash": self.phash_hex}
+
+
+def _area_matrix(n_out: int, n_in: int) -> np.ndarray:
+    """n_in 픽셀을 n_out 구간으로 영역 평균하는 (n_out, n_in) 가중치 행렬"""
+    matrix = np.zeros((n_out, n_in), dtype=np.float64)
+    scale = n_in / n_out
+    for j in range(n_out):
+        start, end = j * scale, (j + 1) * scale
+        for i in range(int(np.floor(start)), int(np.ceil(end))):
+            overlap = min(end, i + 1) - max(start, i)
+            if overlap > 0:
+                matrix[j, i] = overlap / scale
+    return matrix
+
+
+def _dct_matrix(n: int) -> np.ndarray:
+    """비정규화 DCT-II 행렬 (scipy.fftpack.dct 기본값과 동일)"""
+    k = np.arange(n)[:, None]
+    x = np.arange(n)[None, :]
+    return 2.0 * np.cos(np.pi * k * (2 * x + 1) / (2 * n))
+
+
+def _pack_bits(bits: np.ndarray) -> List[int]:
+    """(N, 64) bool 배열을 64비트 정수 리스트로 변환 (첫 비트가 최상위 비트)"""
+    packed = np.packbits(bits, axis=1)
+    return [int(v) for v in packed.view('>u8').ravel()]
+
+
+def average_hash(image: Image.Image) -> int:
+    """imagehash.average_hash와 같은 aHash (녹화의 ui_state_hash 형식)
+
+    FrameHashes.ahash는 32x32 격자에서 계산하므로 값이 다르다.
+    녹화에 저장되거나 저장된 ui_state_hash와 비교하는 해시는 이 함수로 계산한다.
+    """
+    small = image.convert('L').resize((HASH_SIZE, HASH_SIZE), Image.Resampling.LANCZOS)
+    pixels = np.asarray(small, dtype=np.float64)
+    return _pack_bits((pixels > pixels.mean()).reshape(1, HASH_BITS))[0]
+
+
+def average_hash_hex(image: Image.Image) -> str:
+    """average_hash의 16진수 문자열 (str(imagehash.average_hash(image))와 동일)"""
+    return hash_to_hex(average_hash(image))
+
+
+class FrameHasher:
+    """NumPy 기반 다중 해시 계산기"""
+
+    def __init__(self, highfreq_factor: int = 4):
+        """
+        Args:
+            highfreq_factor: pHash DCT 입력 크기 배율 (입력 크기 = 8 * highfreq_factor)
+        """
+        self.img_size = HASH_SIZE * highfreq_factor
+        self._dct_low = _dct_matrix(self.img_size)[:HASH_SIZE]
+        self._avg_rows = _area_matrix(HASH_SIZE, self.img_size)
+        self._diff_cols = _area_matrix(HASH_SIZE + 1, self.img_size)
+
+    def prepare(self, image: Image.Image) -> np.ndarray:
+        """프레임을 (img_size, img_size) 그레이스케일 배열로 다운샘플링 (프레임당 1회)"""
+        small = image.convert('L').resize((self.img_size, self.img_size), Image.Resampling.LANCZOS)
+        return np.asarray(small, dtype=np.float64)
+
+    def hash_pixels(self, pixels: np.ndarray) -> List[FrameHashes]:
+        """다운샘플링된 프레임 배열의 해시를 일괄 계산
+
+        Args:
+            pixels: (N, img_size, img_size) 또는 (img_size, img_size) 배열
+
+        Returns:
+            FrameHashes 리스트 (N개)
+        """
+        stack = np.asarray(pixels, dtype=np.float64)
+        if stack.ndim == 2:
+            stack = stack[None]
+        count = stack.shape[0]
+        if count == 0:
+            return []
+
+        # pHash: 저주파 8x8 DCT 계수와 중앙값 비교
+        low = (self._dct_low @ stack @ self._dct_low.T).reshape(count, HASH_BITS)
+        p_bits = low > np.median(low, axis=1, keepdims=True)
+
+        # aHash: 8x8 영역 평균과 전체 평균 비교
+        small = (self._avg_rows @ stack @ self._avg_rows.T).reshape(count, HASH_BITS)
+        a_bits = small > small.mean(axis=1, keepdims=True)
+
+        # dHash: 8x9 영역 평균에서 좌우 인접 픽셀 비교
+        grid = self._avg_rows @ stack @ self._diff_cols.T
+        d_bits = (grid[:, :, 1:] > grid[:, :, :-1]).reshape(count, HASH_BITS)
+
+        return [
+            FrameHashes(ahash=a, dhash=d, phash=p)
+            for a, d, p in zip(_pack_bits(a_bits), _pack_bits(d_bits), _pack_bits(p_bits))
+        ]
+
+    def hash_image(self, image: Image.Image) -> FrameHashes:
+        """단일 프레임의 aHash/dHash/pHash 계산"""
+        return self.hash_pixels(self.prepare(image))[0]
+
+    def hash_batch(self, images: Sequence[Image.Image]) -> List[FrameHashes]:
+        """여러 프레임의 해시를 벡터 연산으로 일괄 계산"""
+        if not images:
+            return []
+        return self.hash_pixels(np.stack([self.prepare(image) for image in images]))
+
+
+# 모듈 공용 인스턴스 (DCT/평균 행렬을 한 번만 만든다)
+default_hasher = FrameHasher()
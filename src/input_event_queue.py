@@ -0,0 +1,222 @@
+"""
+InputEventQueue - 입력 이벤트 큐 (pynput 콜백과 기록 작업 분리)
+
+pynput 리스너 스레드에서 ActionRecorder.record_action을 직접 호출하면
+capture_delay 대기(기본 2초)와 PNG 저장이 리스너 스레드를 막아
+그동안의 사용자 입력이 지연되거나 뭉쳐서 전달된다.
+
+- 콜백: 이벤트 시각을 기록하고 큐에 넣기만 한다
+- 작업 스레드: 좌표 변환, wait 액션 삽입, 스크린샷 캡처를 수행한다
+
+큐는 크기가 제한되어 있으며(automation.input_queue_size), 가득 차면 콜백이
+put_timeout 동안 대기(backpressure)한 뒤에도 자리가 없으면 이벤트를 버리고 통계에 남긴다.
+순서 번호는 큐에 넣을 때 잠금 안에서 부여되고 작업 스레드는 하나이므로
+이벤트는 항상 넣은 순서대로 처리된다.
+
+idle_handler를 주면 작업 스레드가 이벤트 처리 후와 대기 시간이 끝났을 때 호출한다.
+반환값(초)만큼 새 이벤트가 없으면 다시 호출하므로, 다음 입력을 기다리지 않고
+시간이 지나면 확정해야 하는 작업(진행 중인 텍스트 입력 등)을 처리할 수 있다.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_QUEUE_SIZE = 64
+DEFAULT_PUT_TIMEOUT = 1.0
+
+EVENT_CLICK = "click"
+EVENT_SCROLL = "scroll"
+EVENT_KEY_PRESS = "key_press"
+EVENT_DRAG = "drag"
+EVENT_MOVE = "move"
+EVENT_KEY_RELEASE = "key_release"
+EVENT_FLUSH = "flush"  # 진행 중인 텍스트 입력 확정 요청
+
+
+@dataclass
+class RawInputEvent:
+    """콜백에서 받은 가공 전 입력 이벤트 (좌표는 전체 화면 기준)"""
+    kind: str  # 'click', 'scroll', 'key_press', 'key_release', 'drag', 'move', 'flush'
+    time: datetime
+    time_ns: int = 0  # time.monotonic_ns()
+    x: int = 0
+    y: int = 0
+    button: Optional[str] = None
+    key: Any = None  # pynput Key/KeyCode
+    dx: int = 0
+    dy: int = 0
+    before_image: Any = None  # 클릭 시점 화면 (PIL Image, 저장은 작업 스레드에서)
+    path: Optional[List[Tuple[int, int, int]]] = None  # 드래그/이동 경로 (monotonic ns, x, y)
+    seq: int = -1
+    enqueued_at: float = field(default=0.0, repr=False)  # time.monotonic()
+
+
+@dataclass
+class InputQueueStats:
+    """큐 처리 통계"""
+    enqueued: int = 0
+    processed: int = 0
+    dropped: int = 0  # put_timeout 동안 자리가 나지 않아 버린 이벤트
+    blocked: int = 0  # 큐가 가득 차서 콜백이 대기한 횟수
+    errors: int = 0  # 처리 중 예외가 발생한 이벤트
+    max_depth: int = 0
+    max_latency_ms: float = 0.0  # 큐에 넣은 뒤 처리 완료까지
+    total_latency_ms: float = 0.0
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.total_latency_ms / self.processed if self.processed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "blocked": self.blocked,
+            "errors": self.errors,
+            "max_depth": self.max_depth,
+            "max_latency_ms": round(self.max_latency_ms, 1),
+            "avg_latency_ms": round(self.avg_latency_ms, 1)
+        }
+
+
+class InputEventQueue:
+    """크기가 제한된 입력 이벤트 큐와 단일 작업 스레드"""
+
+    def __init__(self, handler: Callable[[RawInputEvent], None],
+                 maxsize: int = DEFAULT_QUEUE_SIZE, put_timeout: float = DEFAULT_PUT_TIMEOUT,
+                 idle_handler: Optional[Callable[[], Optional[float]]] = None):
+        """
+        Args:
+            handler: 작업 스레드에서 이벤트마다 호출할 함수
+            maxsize: 큐 최대 크기 (클릭 전 화면 이미지를 포함하므로 메모리 상한이 됨)
+            put_timeout: 큐가 가득 찼을 때 콜백이 대기할 최대 시간 (초)
+            idle_handler: 이벤트 처리 후와 대기 시간 만료 시 작업 스레드에서 호출할 함수
+                (다음 호출까지 기다릴 시간(초) 반환, None이면 다음 이벤트까지 대기)
+        """
+        self.handler = handler
+        self.idle_handler = idle_handler
+        self.maxsize = max(1, int(maxsize))
+        self.put_timeout = max(0.0, float(put_timeout))
+        self.stats = InputQueueStats()
+        self._queue: "queue.Queue[Optional[RawInputEvent]]" = queue.Queue(maxsize=self.maxsize)
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._worker: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(cls, handler: Callable[[RawInputEvent], None], config,
+                    idle_handler: Optional[Callable[[], Optional[float]]] = None) -> 'InputEventQueue':
+        """설정(automation.input_queue_size, automation.input_queue_timeout)에서 생성"""
+        return cls(
+            handler,
+            config.get('automation.input_queue_size', DEFAULT_QUEUE_SIZE),
+            config.get('automation.input_queue_timeout', DEFAULT_PUT_TIMEOUT),
+            idle_handler
+        )
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None and self._worker.is_alive()
+
+    @property
+    def depth(self) -> int:
+        """처리 대기 중인 이벤트 수"""
+        return self._queue.qsize()
+
+    def start(self):
+        """작업 스레드 시작 (이미 실행 중이면 무시)"""
+        if self.is_running:
+            return
+        self.stats = InputQueueStats()
+        self._worker = threading.Thread(target=self._run, name="input-recorder", daemon=True)
+        self._worker.start()
+
+    def put(self, event: RawInputEvent) -> bool:
+        """이벤트를 큐에 추가 (콜백 스레드에서 호출)
+
+        Returns:
+            추가 여부 (큐 포화로 버려지면 False)
+        """
+        with self._lock:
+            event.seq = self._seq
+            event.enqueued_at = time.monotonic()
+            try:
+                self._queue.put_nowait(event)
+            except queue.Full:
+                self.stats.blocked += 1
+                try:
+                    self._queue.put(event, timeout=self.put_timeout)
+                except queue.Full:
+                    self.stats.dropped += 1
+                    logger.warning(f"입력 큐 포화로 이벤트 누락: {event.kind} #{event.seq}")
+                    return False
+            self._seq += 1
+            self.stats.enqueued += 1
+            self.stats.max_depth = max(self.stats.max_depth, self._queue.qsize())
+        return True
+
+    def flush(self):
+        """지금까지 넣은 이벤트가 모두 처리될 때까지 대기"""
+        if self.is_running:
+            self._queue.join()
+
+    def stop(self, timeout: Optional[float] = None):
+        """남은 이벤트를 모두 처리한 뒤 작업 스레드 종료
+
+        Args:
+            timeout: 작업 스레드 종료 대기 시간 (None이면 끝날 때까지)
+        """
+        if not self.is_running:
+            return
+        self._queue.put(None)
+        self._worker.join(timeout)
+        if self._worker.is_alive():
+            logger.warning(f"입력 큐 작업 스레드가 종료되지 않음 (남은 이벤트 {self.depth}개)")
+            return
+        self._worker = None
+        logger.info(f"입력 큐 통계: {self.stats.to_dict()}")
+
+    def _idle(self) -> Optional[float]:
+        """idle_handler 호출 (다음 호출까지 대기 시간, 없으면 None)"""
+        if self.idle_handler is None:
+            return None
+        try:
+            timeout = self.idle_handler()
+        except Exception as e:
+            self.stats.errors += 1
+            logger.error(f"입력 큐 대기 처리 실패: {e}")
+            return None
+        return max(0.0, timeout) if timeout is not None else None
+
+    def _run(self):
+        timeout = None
+        while True:
+            try:
+                event = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                timeout = self._idle()
+                continue
+            try:
+                if event is None:
+                    return
+                try:
+                    self.handler(event)
+                except Exception as e:
+                    self.stats.errors += 1
+                    logger.error(f"입력 이벤트 처리 실패: {event.kind} #{event.seq}: {e}")
+                latency_ms = (time.monotonic() - event.enqueued_at) * 1000
+                self.stats.processed += 1
+                self.stats.total_latency_ms += latency_ms
+                self.stats.max_latency_ms = max(self.stats.max_latency_ms, latency_ms)
+                timeout = self._idle()
+            finally:
+                self._queue.task_done()
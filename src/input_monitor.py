@@ -6,20 +6,32 @@ pynput을 사용하여 사용자의 마우스와 키보드 입력을 실시간
 
 import time
 import os
-from datetime import datetime
-from typing import List, Optional
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
 from dataclasses import dataclass, field
 from pynput import mouse, keyboard
 import pyautogui
 
 from src.window_capture import WindowCapture
+from src.input_event_queue import (
+    InputEventQueue, InputQueueStats, RawInputEvent,
+    EVENT_CLICK, EVENT_SCROLL, EVENT_KEY_PRESS, EVENT_KEY_RELEASE, EVENT_DRAG, EVENT_MOVE, EVENT_FLUSH
+)
+from src.keystroke_coalescer import DEFAULT_COALESCE_GAP, KeyOutput, KeystrokeCoalescer, is_modifier
+from src.input_timeline import (
+    DEFAULT_DRAG_THRESHOLD, DEFAULT_PATH_EPSILON, now_ns, path_distance, simplify_path, to_relative_path
+)
+from src.recording_log import RecordingLogWriter
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class Action:
     """액션 데이터 클래스"""
     timestamp: str
-    action_type: str  # 'click', 'key_press', 'scroll', 'wait'
+    action_type: str  # 'click', 'key_press', 'type_text', 'hotkey', 'scroll', 'wait', 'drag', 'move'
     x: int
     y: int
     description: str
@@ -29,6 +41,54 @@ class Action:
     key: Optional[str] = None
     scroll_dx: Optional[int] = None
     scroll_dy: Optional[int] = None
+    timestamp_ns: Optional[int] = None  # 입력 시각 (time.monotonic_ns, 녹화 세션 내 비교용)
+    path: Optional[List[List[int]]] = None  # drag/move 경로 [[시작 기준 경과 ns, x, y], ...]
+    text: Optional[str] = None  # type_text 액션의 입력 문자열
+    
+    @property
+    def duration_ns(self) -> int:
+        """경로 재생 시간 (drag/move 외에는 0)"""
+        return self.path[-1][0] if self.path else 0
+
+
+def action_to_dict(action: Action) -> dict:
+    """Action 객체를 테스트 케이스 JSON 형식의 딕셔너리로 변환 (값이 없는 선택 필드 제외)
+    
+    Args:
+        action: Action 객체
+        
+    Returns:
+        딕셔너리
+    """
+    result = {
+        "timestamp": action.timestamp,
+        "action_type": action.action_type,
+        "x": action.x,
+        "y": action.y,
+        "description": action.description
+    }
+    
+    # 선택적 필드 추가
+    if action.screenshot_path:
+        result["screenshot_path"] = action.screenshot_path
+    if action.screenshot_before_path:
+        result["screenshot_before_path"] = action.screenshot_before_path
+    if action.button:
+        result["button"] = action.button
+    if action.key:
+        result["key"] = action.key
+    if action.scroll_dx is not None:
+        result["scroll_dx"] = action.scroll_dx
+    if action.scroll_dy is not None:
+        result["scroll_dy"] = action.scroll_dy
+    if action.timestamp_ns is not None:
+        result["timestamp_ns"] = action.timestamp_ns
+    if action.path:
+        result["path"] = action.path
+    if action.text:
+        result["text"] = action.text
+    
+    return result
 
 
 class ActionRecorder:
@@ -46,6 +106,7 @@ class ActionRecorder:
         self._screenshot_counter = 0
         self._pending_before_screenshot: Optional[str] = None  # 클릭 전 스크린샷 경로
         self._test_case_name = test_case_name
+        self._log: Optional[RecordingLogWriter] = None  # 녹화 로그 (start_log로 시작)
         
         # 게임 윈도우 캡처 설정
         window_title = config.get('game.window_title', '')
@@ -81,6 +142,38 @@ class ActionRecorder:
         """
         return self._capture_delay
     
+    def start_log(self, writer: RecordingLogWriter):
+        """녹화 로그 시작 (이후 기록되는 액션을 즉시 로그에 추가)
+        
+        Args:
+            writer: 녹화 로그 기록기 (첫 액션 기록 시 파일 생성)
+        """
+        self.close_log()
+        self._log = writer
+    
+    def close_log(self) -> Optional[str]:
+        """녹화 로그 종료
+        
+        Returns:
+            기록된 로그 파일 경로 (로그가 없거나 기록된 액션이 없으면 None)
+        """
+        writer, self._log = self._log, None
+        if writer is None or not writer.is_open:
+            return None
+        writer.close()
+        return writer.path
+    
+    def _append_action(self, action: Action):
+        """액션 목록과 녹화 로그에 추가 (로그 기록 실패는 녹화를 중단하지 않음)"""
+        self.actions.append(action)
+        if self._log is None:
+            return
+        try:
+            self._log.append(action_to_dict(action))
+        except OSError as e:
+            logger.error(f"녹화 로그 기록 실패, 이후 액션은 메모리에만 기록: {self._log.path}: {e}")
+            self._log = None
+    
     def _find_game_window(self):
         """게임 윈도우 찾기 (최초 1회)"""
         if self._window_capture and not self._window_capture._hwnd:
@@ -132,37 +225,64 @@ class ActionRecorder:
     def capture_before_screenshot(self) -> Optional[str]:
         """클릭 전 스크린샷 캡처 (클릭 시점의 화면 상태)
         
-        InputMonitor에서 클릭 이벤트 발생 시 호출하여
-        클릭 직전의 화면 상태를 캡처한다.
+        클릭 직전의 화면 상태를 캡처하여 저장한다.
         
         Returns:
             저장된 스크린샷 경로 또는 None
         """
+        screenshot = self.grab_before_frame()
+        if screenshot:
+            return self.save_before_screenshot(screenshot)
+        
+        return None
+    
+    def grab_before_frame(self) -> Optional[any]:
+        """클릭 전 화면을 메모리로만 캡처 (파일 저장 없음)
+        
+        InputMonitor의 클릭 콜백에서 호출한다. 클릭 시점의 화면이어야 하므로
+        캡처는 콜백에서 하고 PNG 저장은 작업 스레드의 save_before_screenshot()에서 한다.
+        
+        Returns:
+            PIL Image 또는 None (screenshot_on_action 비활성)
+        """
         if not self.config.get('automation.screenshot_on_action', False):
             return None
         
-        screenshot_path = f"{self._screenshot_dir}/action_{self._screenshot_counter:04d}_before.png"
-        
-        screenshot = self._capture_game_screenshot()
-        if screenshot:
-            screenshot.save(screenshot_path)
-            self._pending_before_screenshot = screenshot_path
-            return screenshot_path
+        return self._capture_game_screenshot()
+    
+    def save_before_screenshot(self, screenshot) -> str:
+        """클릭 전 화면 저장 (다음 record_action에서 액션에 연결)
         
-        return None
+        Args:
+            screenshot: grab_before_frame()으로 캡처한 이미지
+            
+        Returns:
+            저장된 스크린샷 경로
+        """
+        screenshot_path = f"{self._screenshot_dir}/action_{self._screenshot_counter:04d}_before.png"
+        screenshot.save(screenshot_path)
+        self._pending_before_screenshot = screenshot_path
+        return screenshot_path
     
-    def record_action(self, action: Action):
+    def record_action(self, action: Action, event_time: Optional[datetime] = None,
+                      end_time: Optional[datetime] = None):
         """액션 기록
         
         스크린샷은 액션 실행 후 일정 시간 대기 후 캡처한다.
         (화면 전환이 완료된 상태를 캡처하기 위함)
         클릭 전 스크린샷은 capture_before_screenshot()에서 미리 캡처된 것을 사용한다.
         
+        event_time이 주어지면 (입력 큐에서 늦게 처리되는 경우) 처리 시각 대신
+        입력 시각 기준으로 wait 액션을 계산하고, 입력 후 capture_delay가 지난 시점에 캡처한다.
+        drag/move 액션은 경로가 끝난 시각을 기준으로 캡처하며, move 액션은 캡처하지 않는다.
+        
         Args:
             action: 기록할 액션
+            event_time: 입력이 발생한 시각 (None이면 현재 시각)
+            end_time: 입력이 끝난 시각 (type_text의 마지막 키 등, None이면 경로 길이로 계산)
         """
         # 이전 액션과의 시간 차이 계산 (스크린샷 캡처 전에 수행)
-        current_time = datetime.now()
+        current_time = event_time or datetime.now()
         if self.last_action_time:
             time_diff = (current_time - self.last_action_time).total_seconds()
             if time_diff > 0.5:  # 0.5초 이상 차이나면 wait 액션 추가
@@ -173,7 +293,7 @@ class ActionRecorder:
                     y=0,
                     description=f'{time_diff:.1f}초 대기'
                 )
-                self.actions.append(wait_action)
+                self._append_action(wait_action)
         
         # 클릭 전 스크린샷 설정 (미리 캡처된 것이 있으면)
         if self._pending_before_screenshot:
@@ -182,10 +302,19 @@ class ActionRecorder:
         
         # 스크린샷 캡처 (설정에 따라) - 액션 후 스크린샷
         # 클릭/키 입력 후 화면 전환 시간을 위해 대기 후 캡처
-        if self.config.get('automation.screenshot_on_action', False):
-            # 캡처 전 대기 (화면 전환 완료 대기)
-            if self._capture_delay > 0:
-                time.sleep(self._capture_delay)
+        if event_time:
+            event_time = end_time or event_time + timedelta(microseconds=action.duration_ns // 1000)
+        screenshot_on_action = (
+            self.config.get('automation.screenshot_on_action', False) and action.action_type != 'move'
+        )
+        if screenshot_on_action:
+            # 캡처 전 대기 (화면 전환 완료 대기) - 입력 시각 기준으로 남은 시간만
+            delay = self._capture_delay
+            if event_time and delay > 0:
+                capture_at = event_time + timedelta(seconds=delay)
+                delay = (capture_at - datetime.now()).total_seconds()
+            if delay > 0:
+                time.sleep(delay)
             
             screenshot_path = f"{self._screenshot_dir}/action_{self._screenshot_counter:04d}.png"
             
@@ -196,8 +325,13 @@ class ActionRecorder:
                 action.screenshot_path = screenshot_path
                 self._screenshot_counter += 1
         
-        self.actions.append(action)
-        self.last_action_time = datetime.now()  # 스크린샷 캡처 후 시간 갱신
+        self._append_action(action)
+        if event_time is None:
+            self.last_action_time = datetime.now()  # 스크린샷 캡처 후 시간 갱신
+        elif screenshot_on_action:
+            self.last_action_time = event_time + timedelta(seconds=self._capture_delay)
+        else:
+            self.last_action_time = event_time
     
     def get_actions(self) -> List[Action]:
         """기록된 액션 목록 반환
@@ -209,17 +343,18 @@ class ActionRecorder:
             액션 리스트
         """
         actions = self.actions.copy()
-        actions = self._remove_trailing_stop_pattern(actions)
+        actions = self.remove_trailing_stop_pattern(actions)
         return actions
     
-    def _remove_trailing_stop_pattern(self, actions: List[Action]) -> List[Action]:
+    def remove_trailing_stop_pattern(self, actions: List[Action]) -> List[Action]:
         """마지막 터미널 입력 패턴 제거
         
         녹화 중단을 위해 터미널에 입력한 내용을 제거한다.
-        패턴 1: [click] + [wait?] + [key_press...] + [Enter] (Enter까지 입력된 경우)
-        패턴 2: [click] + [wait?] + [key_press...] (Enter 전에 녹화 중단된 경우)
+        패턴 1: [click] + [wait?] + [key_press/type_text...] + [Enter] (Enter까지 입력된 경우)
+        패턴 2: [click] + [wait?] + [key_press/type_text...] (Enter 전에 녹화 중단된 경우)
         
-        마지막 key_press가 's', 't', 'o', 'p' 중 하나이거나 'Key.enter'이면
+        마지막 key_press가 's', 't', 'o', 'p' 중 하나이거나 'Key.enter'이면,
+        또는 마지막 type_text가 'stop'의 앞부분이면
         stop 명령 입력으로 간주하고 해당 시퀀스와 직전 click을 제거한다.
         
         Args:
@@ -237,10 +372,10 @@ class ActionRecorder:
         # stop 명령의 일부인지 확인 (s, t, o, p, Key.enter)
         stop_chars = {'s', 't', 'o', 'p', 'Key.enter'}
         
-        if last_action.action_type != 'key_press':
-            return actions
-        
-        if last_action.key not in stop_chars:
+        if last_action.action_type == 'type_text':
+            if not last_action.text or not 'stop'.startswith(last_action.text):
+                return actions
+        elif last_action.action_type != 'key_press' or last_action.key not in stop_chars:
             return actions
         
         # stop 패턴으로 판단, 뒤에서부터 제거 대상 찾기
@@ -248,7 +383,7 @@ class ActionRecorder:
         
         for i in range(len(actions) - 1, -1, -1):
             action = actions[i]
-            if action.action_type == 'key_press':
+            if action.action_type in ('key_press', 'type_text'):
                 cut_index = i
             elif action.action_type == 'wait':
                 cut_index = i
@@ -276,6 +411,17 @@ class InputMonitor:
     """입력 모니터
     
     pynput을 사용하여 마우스와 키보드 입력을 실시간으로 모니터링한다.
+    
+    리스너 콜백은 입력 시각과 원시 좌표/키만 입력 큐에 넣고,
+    좌표 변환, wait 삽입, 스크린샷 캡처는 큐의 작업 스레드에서 입력 순서대로 처리한다.
+    
+    마우스 버튼을 누른 채 움직인 경로는 버튼을 뗄 때 drag 액션으로 기록하고
+    (drag_threshold 미만으로 움직였으면 click), automation.record_mouse_moves가 켜져 있으면
+    버튼을 누르지 않은 이동 경로도 다음 클릭/스크롤 직전에 move 액션으로 기록한다.
+    
+    연속된 문자 키 입력은 type_text 액션으로, Ctrl/Alt/Win 조합은 hotkey 액션으로 병합한다.
+    (KeystrokeCoalescer, 작업 스레드에서 사용) 텍스트 입력은 마지막 키 후 coalesce_gap이 지나면
+    다음 입력을 기다리지 않고 확정하여 입력 직후 화면을 기록한다.
     """
     
     def __init__(self, action_recorder: ActionRecorder):
@@ -287,61 +433,137 @@ class InputMonitor:
         self.mouse_listener: Optional[mouse.Listener] = None
         self.keyboard_listener: Optional[keyboard.Listener] = None
         self.is_recording = False
+        
+        config = action_recorder.config
+        self.event_queue = InputEventQueue.from_config(self._process_event, config, self._expire_keystrokes)
+        self._record_moves = config.get('automation.record_mouse_moves', False)
+        self._drag_threshold = config.get('automation.drag_threshold', DEFAULT_DRAG_THRESHOLD)
+        self._path_epsilon = config.get('automation.path_epsilon', DEFAULT_PATH_EPSILON)
+        self._keystrokes = KeystrokeCoalescer(config.get('automation.coalesce_gap', DEFAULT_COALESCE_GAP))
+        
+        # 마우스 리스너 스레드에서만 접근하는 경로 버퍼
+        self._press: Optional[RawInputEvent] = None  # 누르고 있는 버튼 (경로 포함)
+        self._hover_path: List[Tuple[int, int, int]] = []
     
     def start_monitoring(self):
         """입력 모니터링 시작"""
+        self._press = None
+        self._hover_path = []
+        self._keystrokes = KeystrokeCoalescer(self._keystrokes.gap)
+        self.event_queue.start()
         self.is_recording = True
         
         # 마우스 리스너 시작
         self.mouse_listener = mouse.Listener(
             on_click=self._on_mouse_click,
-            on_scroll=self._on_mouse_scroll
+            on_scroll=self._on_mouse_scroll,
+            on_move=self._on_mouse_move
         )
         self.mouse_listener.start()
         
         # 키보드 리스너 시작
         self.keyboard_listener = keyboard.Listener(
-            on_press=self._on_key_press
+            on_press=self._on_key_press,
+            on_release=self._on_key_release
         )
         self.keyboard_listener.start()
     
     def stop_monitoring(self):
-        """입력 모니터링 중지"""
+        """입력 모니터링 중지
+        
+        큐에 남은 이벤트(스크린샷 캡처 포함)를 모두 기록한 뒤 반환한다.
+        버튼을 누른 채로 중지되면 누른 위치의 클릭으로 기록한다.
+        """
         self.is_recording = False
         if self.mouse_listener:
             self.mouse_listener.stop()
         if self.keyboard_listener:
             self.keyboard_listener.stop()
+        if self._press is not None:
+            press, self._press = self._press, None
+            press.path = None
+            self.event_queue.put(press)
+        self._hover_path = []
+        self.event_queue.put(RawInputEvent(kind=EVENT_FLUSH, time=datetime.now()))
+        self.event_queue.stop()
+    
+    def flush(self):
+        """지금까지 받은 입력(진행 중인 텍스트 입력 포함)이 모두 기록될 때까지 대기"""
+        if self.event_queue.is_running:
+            self.event_queue.put(RawInputEvent(kind=EVENT_FLUSH, time=datetime.now()))
+            self.event_queue.flush()
+    
+    def get_queue_stats(self) -> InputQueueStats:
+        """입력 큐 통계 반환 (누락/대기 횟수, 처리 지연)"""
+        return self.event_queue.stats
     
     def _on_mouse_click(self, x, y, button, pressed):
         """마우스 클릭 이벤트 핸들러
         
+        버튼을 누를 때 위치와 클릭 전 화면을 잡아 두고, 뗄 때 이동 거리에 따라
+        click 또는 drag 이벤트로 큐에 넣는다.
+        
         Args:
             x: X 좌표 (전체 화면 기준)
             y: Y 좌표 (전체 화면 기준)
             button: 마우스 버튼
             pressed: 눌림/뗌 상태
         """
-        if pressed and self.is_recording:
-            # 클릭 전 스크린샷 캡처 (클릭 시점의 화면 상태)
+        if not self.is_recording:
+            return
+        
+        if pressed:
+            event_time, event_ns = datetime.now(), now_ns()
+            self._flush_hover_path()
+            
+            # 클릭 전 화면은 클릭 시점에 캡처해야 하므로 콜백에서 메모리로만 캡처
             # 예외 발생 시에도 액션 기록은 계속 진행
+            before_image = None
             try:
-                self.action_recorder.capture_before_screenshot()
+                before_image = self.action_recorder.grab_before_frame()
             except Exception:
                 pass  # 스크린샷 실패해도 액션 기록은 진행
             
-            # 전체 화면 좌표를 게임 윈도우 기준 상대 좌표로 변환
-            window_x, window_y = self.action_recorder.convert_to_window_coords(x, y)
-            
-            action = Action(
-                timestamp=datetime.now().isoformat(),
-                action_type='click',
-                x=window_x,
-                y=window_y,
-                description=f'클릭 ({window_x}, {window_y})',
-                button=button.name
+            self._press = RawInputEvent(
+                kind=EVENT_CLICK, time=event_time, time_ns=event_ns, x=x, y=y,
+                button=button.name, before_image=before_image, path=[(event_ns, x, y)]
             )
-            self.action_recorder.record_action(action)
+            return
+        
+        press = self._press
+        if press is None or press.button != button.name:
+            return
+        self._press = None
+        press.path.append((now_ns(), x, y))
+        if path_distance(press.path) >= self._drag_threshold:
+            press.kind = EVENT_DRAG
+        else:
+            press.path = None
+        self.event_queue.put(press)
+    
+    def _on_mouse_move(self, x, y):
+        """마우스 이동 이벤트 핸들러 (경로 버퍼에 추가만 함)
+        
+        Args:
+            x: X 좌표 (전체 화면 기준)
+            y: Y 좌표 (전체 화면 기준)
+        """
+        if not self.is_recording:
+            return
+        if self._press is not None:
+            self._press.path.append((now_ns(), x, y))
+        elif self._record_moves:
+            self._hover_path.append((now_ns(), x, y))
+    
+    def _flush_hover_path(self):
+        """버튼을 누르지 않은 이동 경로를 move 이벤트로 큐에 넣기"""
+        path, self._hover_path = self._hover_path, []
+        if len(path) >= 2 and path_distance(path) >= self._drag_threshold:
+            _, x, y = path[0]
+            self.event_queue.put(RawInputEvent(
+                kind=EVENT_MOVE, time=datetime.now() - timedelta(microseconds=(now_ns() - path[0][0]) // 1000),
+                time_ns=path[0][0], x=x, y=y, path=path
+            ))
     
     def _on_mouse_scroll(self, x, y, dx, dy):
         """마우스 스크롤 이벤트 핸들러
@@ -353,19 +575,11 @@ class InputMonitor:
             dy: 수직 스크롤 양
         """
         if self.is_recording:
-            # 전체 화면 좌표를 게임 윈도우 기준 상대 좌표로 변환
-            window_x, window_y = self.action_recorder.convert_to_window_coords(x, y)
-            
-            action = Action(
-                timestamp=datetime.now().isoformat(),
-                action_type='scroll',
-                x=window_x,
-                y=window_y,
-                description=f'스크롤 ({dx}, {dy})',
-                scroll_dx=dx,
-                scroll_dy=dy
-            )
-            self.action_recorder.record_action(action)
+            event_time, event_ns = datetime.now(), now_ns()
+            self._flush_hover_path()
+            self.event_queue.put(RawInputEvent(
+                kind=EVENT_SCROLL, time=event_time, time_ns=event_ns, x=x, y=y, dx=dx, dy=dy
+            ))
     
     def _on_key_press(self, key):
         """키보드 입력 이벤트 핸들러
@@ -374,17 +588,116 @@ class InputMonitor:
             key: 눌린 키
         """
         if self.is_recording:
-            try:
-                key_char = key.char
-            except AttributeError:
-                key_char = str(key)
+            self.event_queue.put(RawInputEvent(
+                kind=EVENT_KEY_PRESS, time=datetime.now(), time_ns=now_ns(), key=key
+            ))
+    
+    def _on_key_release(self, key):
+        """키보드 뗌 이벤트 핸들러 (보조 키만 큐에 추가)
+        
+        Args:
+            key: 뗀 키
+        """
+        if self.is_recording and is_modifier(key):
+            self.event_queue.put(RawInputEvent(
+                kind=EVENT_KEY_RELEASE, time=datetime.now(), time_ns=now_ns(), key=key
+            ))
+    
+    def _record_key_outputs(self, outputs: List[KeyOutput]):
+        """병합된 키 입력을 액션으로 기록
+        
+        Args:
+            outputs: KeystrokeCoalescer가 확정한 입력 (입력 순서)
+        """
+        for output in outputs:
+            if output.action_type == 'type_text':
+                description = f'텍스트 입력: {output.value}'
+            elif output.action_type == 'hotkey':
+                description = f'단축키: {output.value}'
+            else:
+                description = f'키 입력: {output.value}'
             
             action = Action(
-                timestamp=datetime.now().isoformat(),
-                action_type='key_press',
+                timestamp=output.time.isoformat(),
+                action_type=output.action_type,
                 x=0,
                 y=0,
-                description=f'키 입력: {key_char}',
-                key=key_char
+                description=description,
+                key=output.value if output.action_type != 'type_text' else None,
+                text=output.value if output.action_type == 'type_text' else None,
+                timestamp_ns=output.time_ns or None
+            )
+            self.action_recorder.record_action(action, event_time=output.time, end_time=output.end_time)
+    
+    def _expire_keystrokes(self) -> Optional[float]:
+        """입력 큐 작업 스레드: coalesce_gap 동안 키 입력이 없으면 진행 중인 텍스트 입력 확정
+        
+        Returns:
+            확정까지 남은 시간 (초, 진행 중인 입력이 없으면 None)
+        """
+        outputs, remaining = self._keystrokes.expire(now_ns())
+        self._record_key_outputs(outputs)
+        return remaining
+    
+    def _process_event(self, event: RawInputEvent):
+        """입력 큐 작업 스레드: 원시 이벤트를 액션으로 변환하여 기록
+        
+        Args:
+            event: 콜백에서 넣은 원시 이벤트
+        """
+        if event.kind == EVENT_KEY_PRESS:
+            self._record_key_outputs(self._keystrokes.press(event.key, event.time, event.time_ns))
+            return
+        if event.kind == EVENT_KEY_RELEASE:
+            self._record_key_outputs(self._keystrokes.release(event.key, event.time, event.time_ns))
+            return
+        
+        # 마우스 입력 전에 진행 중인 텍스트 입력 확정
+        self._record_key_outputs(self._keystrokes.flush())
+        if event.kind == EVENT_FLUSH:
+            return
+        
+        # 전체 화면 좌표를 게임 윈도우 기준 상대 좌표로 변환
+        window_x, window_y = self.action_recorder.convert_to_window_coords(event.x, event.y)
+        
+        if event.before_image is not None:
+            try:
+                self.action_recorder.save_before_screenshot(event.before_image)
+            except Exception:
+                pass  # 스크린샷 실패해도 액션 기록은 진행
+        
+        if event.kind == EVENT_CLICK:
+            action = Action(
+                timestamp=event.time.isoformat(),
+                action_type='click',
+                x=window_x,
+                y=window_y,
+                description=f'클릭 ({window_x}, {window_y})',
+                button=event.button
+            )
+        elif event.kind in (EVENT_DRAG, EVENT_MOVE):
+            offset_x, offset_y = event.x - window_x, event.y - window_y
+            path = to_relative_path(simplify_path(event.path, self._path_epsilon), offset_x, offset_y)
+            _, end_x, end_y = path[-1]
+            verb = '드래그' if event.kind == EVENT_DRAG else '마우스 이동'
+            action = Action(
+                timestamp=event.time.isoformat(),
+                action_type=event.kind,
+                x=window_x,
+                y=window_y,
+                description=f'{verb} ({window_x}, {window_y}) → ({end_x}, {end_y})',
+                button=event.button,
+                path=path
+            )
+        else:
+            action = Action(
+                timestamp=event.time.isoformat(),
+                action_type='scroll',
+                x=window_x,
+                y=window_y,
+                description=f'스크롤 ({event.dx}, {event.dy})',
+                scroll_dx=event.dx,
+                scroll_dy=event.dy
             )
-            self.action_recorder.record_action(action)
+        action.timestamp_ns = event.time_ns or None
+        self.action_recorder.record_action(action, event_time=event.time)
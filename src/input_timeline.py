@@ -0,0 +1,204 @@
+"""
+InputTimeline - 고해상도 입력 시각과 마우스 이동/드래그 경로
+
+녹화 시 입력 시각은 time.monotonic_ns() 기준 나노초로 기록한다.
+(시스템 시계 변경의 영향을 받지 않으며 datetime 문자열보다 정밀함)
+
+마우스 이동/드래그는 pynput on_move 이벤트를 경로로 모아 하나의 액션으로 저장한다.
+경로 점은 [시작 기준 경과 ns, x, y] 형식이며, 저장 전에 시간 동기 거리(SED)를 사용하는
+Douglas-Peucker 단순화로 줄인다. 같은 시각의 직선 보간 위치와 epsilon 픽셀 이상
+벗어나는 점만 남기므로, 경로 모양뿐 아니라 멈춤/속도 변화도 보존된다.
+
+재실행 시에는 남은 꼭짓점 사이를 일정 간격(step)으로 보간하여 기록된 시각에 맞춰 이동한다.
+"""
+
+import math
+import time
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+import pyautogui
+
+
+DEFAULT_DRAG_THRESHOLD = 5  # 이 거리(px) 이상 움직인 클릭은 드래그로 기록
+DEFAULT_PATH_EPSILON = 2.0  # 경로 단순화 허용 오차 (px)
+DEFAULT_STEP_NS = 8_000_000  # 재실행 시 보간 간격 (8ms, 약 120Hz)
+_SPIN_NS = 2_000_000  # 마감 직전에는 sleep 대신 대기 루프 (sleep 오차 보정)
+
+# (경과 ns, x, y)
+PathPoint = Tuple[int, int, int]
+
+
+def now_ns() -> int:
+    """입력 시각 (단조 증가 나노초)"""
+    return time.monotonic_ns()
+
+
+def path_distance(path: Sequence[PathPoint]) -> float:
+    """경로 시작점에서 가장 멀리 떨어진 점까지의 거리 (px)"""
+    if not path:
+        return 0.0
+    _, x0, y0 = path[0]
+    return max(math.hypot(x - x0, y - y0) for _, x, y in path)
+
+
+def simplify_path(path: Sequence[PathPoint], epsilon: float = DEFAULT_PATH_EPSILON) -> List[PathPoint]:
+    """시간 동기 거리 기반 Douglas-Peucker 경로 단순화
+
+    Args:
+        path: (시각 ns, x, y) 목록 (시각 오름차순)
+        epsilon: 허용 오차 (px). 0 이하이면 단순화하지 않음
+
+    Returns:
+        남은 점 목록 (첫 점과 마지막 점은 항상 포함)
+    """
+    points = list(path)
+    if len(points) <= 2 or epsilon <= 0:
+        return points
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        ts, xs, ys = points[start]
+        te, xe, ye = points[end]
+        span = te - ts
+        max_dist, max_index = 0.0, -1
+        for i in range(start + 1, end):
+            t, x, y = points[i]
+            ratio = (t - ts) / span if span > 0 else 0.0
+            dist = math.hypot(x - (xs + (xe - xs) * ratio), y - (ys + (ye - ys) * ratio))
+            if dist > max_dist:
+                max_dist, max_index = dist, i
+        if max_dist > epsilon:
+            keep[max_index] = True
+            stack.append((start, max_index))
+            stack.append((max_index, end))
+
+    return [p for p, k in zip(points, keep) if k]
+
+
+def to_relative_path(path: Sequence[PathPoint], offset_x: int = 0, offset_y: int = 0) -> List[List[int]]:
+    """절대 시각/화면 좌표 경로를 저장 형식으로 변환
+
+    Args:
+        path: (monotonic ns, 화면 x, 화면 y) 목록
+        offset_x, offset_y: 게임 윈도우 오프셋 (윈도우 기준 좌표로 변환)
+
+    Returns:
+        [[시작 기준 경과 ns, x, y], ...]
+    """
+    if not path:
+        return []
+    t0 = path[0][0]
+    return [[t - t0, x - offset_x, y - offset_y] for t, x, y in path]
+
+
+def interpolate_path(path: Sequence[Sequence[int]], step_ns: int = DEFAULT_STEP_NS) -> List[PathPoint]:
+    """꼭짓점 사이를 step_ns 간격으로 직선 보간
+
+    Args:
+        path: [[경과 ns, x, y], ...]
+        step_ns: 보간 간격
+
+    Returns:
+        (경과 ns, x, y) 목록 (같은 위치가 연속되면 하나로 합침)
+    """
+    points: List[PathPoint] = []
+    for i, (t, x, y) in enumerate(path):
+        if i > 0 and step_ns > 0:
+            pt, px, py = path[i - 1]
+            steps = int((t - pt) // step_ns)
+            for s in range(1, steps):
+                ratio = s * step_ns / (t - pt)
+                points.append((pt + s * step_ns, round(px + (x - px) * ratio), round(py + (y - py) * ratio)))
+        points.append((int(t), int(x), int(y)))
+
+    merged: List[PathPoint] = []
+    for point in points:
+        if merged and merged[-1][1:] == point[1:]:
+            continue
+        merged.append(point)
+    return merged
+
+
+def wait_until(deadline: int, clock: Callable[[], int] = time.perf_counter_ns,
+               sleep: Callable[[float], None] = time.sleep) -> int:
+    """마감 시각까지 대기 (마지막 2ms는 대기 루프로 sleep 오차 보정)
+
+    Args:
+        deadline: clock 기준 마감 시각 (ns)
+        clock: 나노초 시계 (테스트용)
+        sleep: 초 단위 sleep 함수 (테스트용)
+
+    Returns:
+        마감 시각보다 늦은 시간 (ns, 늦지 않았으면 0)
+    """
+    remaining = deadline - clock()
+    if remaining > _SPIN_NS:
+        sleep((remaining - _SPIN_NS) / 1e9)
+    while True:
+        now = clock()
+        if now >= deadline:
+            return now - deadline
+
+
+def play_path(path: Sequence[Sequence[int]], move: Callable[[int, int], None],
+              step_ns: int = DEFAULT_STEP_NS,
+              clock: Callable[[], int] = time.perf_counter_ns,
+              sleep: Callable[[float], None] = time.sleep) -> int:
+    """경로를 기록된 시각에 맞춰 재생
+
+    각 점의 마감 시각까지 sleep한 뒤 마지막 2ms는 대기 루프로 맞춘다.
+    이동이 늦어지면 다음 점은 밀리지 않고 원래 마감 시각 기준으로 계속한다.
+
+    Args:
+        path: [[경과 ns, x, y], ...]
+        move: 위치 이동 함수 (x, y)
+        step_ns: 보간 간격
+        clock: 나노초 시계 (테스트용)
+        sleep: 초 단위 sleep 함수 (테스트용)
+
+    Returns:
+        가장 크게 늦은 이동의 지연 (ns)
+    """
+    start = clock()
+    max_late = 0
+    for offset, x, y in interpolate_path(path, step_ns):
+        max_late = max(max_late, wait_until(start + offset, clock, sleep))
+        move(x, y)
+    return max_late
+
+
+def replay_pointer_path(path: Sequence[Sequence[int]], button: Optional[str] = None,
+                        offset: Tuple[int, int] = (0, 0), step_ns: int = DEFAULT_STEP_NS,
+                        driver: Any = None) -> int:
+    """기록된 마우스 경로 재실행 (button이 있으면 드래그)
+
+    Args:
+        path: [[경과 ns, 윈도우 x, 윈도우 y], ...]
+        button: 드래그 버튼 ('left' 등), None이면 이동만
+        offset: 게임 윈도우 스크린 오프셋
+        step_ns: 보간 간격
+        driver: 입력 장치 (moveTo/mouseDown/mouseUp 제공, None이면 pyautogui)
+
+    Returns:
+        가장 크게 늦은 이동의 지연 (ns)
+    """
+    if not path:
+        return 0
+    offset_x, offset_y = offset
+    driver = driver or pyautogui
+
+    def move(x: int, y: int):
+        driver.moveTo(x + offset_x, y + offset_y, _pause=False)
+
+    _, start_x, start_y = path[0]
+    move(start_x, start_y)
+    if button:
+        driver.mouseDown(button=button, _pause=False)
+    try:
+        return play_path(path, move, step_ns)
+    finally:
+        if button:
+            driver.mouseUp(button=button, _pause=False)
@@ -0,0 +1,225 @@
+"""
+KeystrokeCoalescer - 연속 키 입력을 텍스트 입력 액션으로 병합
+
+키 입력마다 액션을 만들면 20자 닉네임 입력이 20개 액션(각각 스크린샷, action_delay)이 된다.
+녹화 시 연속된 문자 키를 하나의 type_text 액션으로 묶고, 재실행 시 한 번의 호출로
+일정 간격(automation.type_interval)으로 입력한다.
+
+- 문자 키 / Space: 현재 텍스트 입력에 추가 (Shift로 입력된 대문자/기호는 문자 그대로)
+- Ctrl/Alt/Win + 키: hotkey 액션 (예: "ctrl+shift+s")
+- 그 외 특수 키 (Enter, Tab, 방향키 등): 텍스트 입력을 끊고 key_press 액션
+- 보조 키만 눌렀다 뗀 경우: key_press 액션 (예: "Key.alt")
+
+텍스트 입력은 특수 키/단축키/마우스 입력, 또는 키 사이 간격이 gap초를 넘으면 끝난다.
+마지막 키 후 gap초가 지나면 다음 입력을 기다리지 않고 expire()로 확정할 수 있다
+(다음 입력이 화면을 바꾸기 전에 입력 후 스크린샷을 찍기 위해).
+문자가 하나뿐이면 기존과 같은 key_press 액션으로 기록한다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DEFAULT_COALESCE_GAP = 0.5  # wait 액션 삽입 기준과 동일
+DEFAULT_TYPE_INTERVAL = 0.05
+
+# pynput Key 이름 → 보조 키 이름 (pyautogui 키 이름)
+MODIFIER_KEYS = {
+    'shift': 'shift', 'shift_l': 'shift', 'shift_r': 'shift',
+    'ctrl': 'ctrl', 'ctrl_l': 'ctrl', 'ctrl_r': 'ctrl',
+    'alt': 'alt', 'alt_l': 'alt', 'alt_r': 'alt', 'alt_gr': 'altgr',
+    'cmd': 'win', 'cmd_l': 'win', 'cmd_r': 'win',
+}
+# 단축키를 이루는 보조 키 (Shift/AltGr는 문자 입력에 포함)
+HOTKEY_MODIFIERS = ('ctrl', 'alt', 'win')
+_HOTKEY_ORDER = ('ctrl', 'alt', 'shift', 'win')
+
+# pynput Key 이름 → pyautogui 키 이름 (다른 것만)
+_PYAUTOGUI_KEY_NAMES = {
+    'page_up': 'pageup', 'page_down': 'pagedown', 'caps_lock': 'capslock',
+    'num_lock': 'numlock', 'scroll_lock': 'scrolllock', 'print_screen': 'printscreen',
+    'cmd': 'win', 'cmd_l': 'winleft', 'cmd_r': 'winright',
+    'ctrl_l': 'ctrlleft', 'ctrl_r': 'ctrlright', 'alt_l': 'altleft', 'alt_r': 'altright',
+    'shift_l': 'shiftleft', 'shift_r': 'shiftright', 'alt_gr': 'altright',
+}
+
+
+def special_key_name(key: Any) -> Optional[str]:
+    """pynput 특수 키(Key) 이름, 문자 키(KeyCode)면 None"""
+    name = getattr(key, 'name', None)
+    return name if isinstance(name, str) else None
+
+
+def is_modifier(key: Any) -> bool:
+    return special_key_name(key) in MODIFIER_KEYS
+
+
+def key_to_str(key: Any) -> str:
+    """기존 key_press 기록 형식 (문자 또는 'Key.enter' 형태)"""
+    char = getattr(key, 'char', None)
+    return char if char is not None else str(key)
+
+
+def typed_char(key: Any) -> Optional[str]:
+    """텍스트 입력에 들어가는 문자 (없으면 None)"""
+    if special_key_name(key) == 'space':
+        return ' '
+    char = getattr(key, 'char', None)
+    if isinstance(char, str) and len(char) == 1 and char.isprintable():
+        return char
+    return None
+
+
+def hotkey_key_name(key: Any) -> str:
+    """단축키의 주 키 이름 (pyautogui 형식)
+
+    Ctrl을 누른 채 입력된 문자는 제어 문자('\\x03')로 전달되므로 원래 문자로 복원한다.
+    """
+    name = special_key_name(key)
+    if name:
+        return _PYAUTOGUI_KEY_NAMES.get(name, name)
+    char = getattr(key, 'char', None)
+    if isinstance(char, str) and len(char) == 1:
+        if ord(char) < 32:
+            char = chr(ord(char) + 96)
+        return char.lower()
+    vk = getattr(key, 'vk', None)
+    if isinstance(vk, int) and (0x30 <= vk <= 0x39 or 0x41 <= vk <= 0x5A):
+        return chr(vk).lower()
+    return str(key)
+
+
+def parse_hotkey(combo: str) -> List[str]:
+    """"ctrl+shift+s" → ['ctrl', 'shift', 's'] ("ctrl++"처럼 주 키가 '+'여도 처리)"""
+    keys = []
+    rest = combo
+    while True:
+        head, sep, tail = rest.partition('+')
+        if sep and tail and head in _HOTKEY_ORDER:
+            keys.append(head)
+            rest = tail
+        else:
+            break
+    keys.append(rest)
+    return keys
+
+
+def key_press_args(key: str) -> Tuple[str, str]:
+    """key_press 액션의 재실행 방법 ('press', 키 이름) 또는 ('write', 문자)"""
+    if key.startswith('Key.'):
+        name = key[len('Key.'):]
+        return 'press', _PYAUTOGUI_KEY_NAMES.get(name, name)
+    return 'write', key
+
+
+@dataclass
+class KeyOutput:
+    """병합 결과 (액션 하나)"""
+    action_type: str  # 'type_text', 'hotkey', 'key_press'
+    value: str  # 텍스트, 단축키 조합, 또는 key_to_str() 형식의 키
+    time: datetime  # 첫 입력 시각
+    time_ns: int
+    end_time: datetime  # 마지막 입력 시각
+
+
+@dataclass
+class _Stroke:
+    value: str
+    key_str: str
+    time: datetime
+    time_ns: int
+
+
+class KeystrokeCoalescer:
+    """키 입력 순서대로 받아 병합된 액션 목록을 돌려주는 상태 기계 (스레드 하나에서 사용)"""
+
+    def __init__(self, gap: float = DEFAULT_COALESCE_GAP):
+        """
+        Args:
+            gap: 이 시간(초)보다 긴 간격이 있으면 텍스트 입력을 나눔
+        """
+        self.gap = gap
+        self._run: List[_Stroke] = []
+        self._held: Dict[str, _Stroke] = {}  # 누르고 있는 보조 키
+        self._used: Dict[str, bool] = {}  # 보조 키를 누른 동안 다른 키 입력 여부
+
+    @property
+    def pending(self) -> str:
+        """아직 확정되지 않은 텍스트"""
+        return "".join(s.value for s in self._run)
+
+    def press(self, key: Any, time: datetime, time_ns: int) -> List[KeyOutput]:
+        """키 누름 처리
+
+        Returns:
+            이번 입력으로 확정된 액션 목록 (입력 순서)
+        """
+        name = special_key_name(key)
+        if name in MODIFIER_KEYS:
+            modifier = MODIFIER_KEYS[name]
+            if modifier not in self._held:
+                self._held[modifier] = _Stroke(modifier, key_to_str(key), time, time_ns)
+                self._used[modifier] = False
+            return []
+
+        for modifier in self._used:
+            self._used[modifier] = True
+
+        if any(m in self._held for m in HOTKEY_MODIFIERS) and 'altgr' not in self._held:
+            outputs = self.flush()
+            combo = [m for m in _HOTKEY_ORDER if m in self._held] + [hotkey_key_name(key)]
+            outputs.append(KeyOutput('hotkey', '+'.join(combo), time, time_ns, time))
+            return outputs
+
+        char = typed_char(key)
+        if char is not None:
+            outputs = []
+            if self._run and (time_ns - self._run[-1].time_ns) / 1e9 > self.gap:
+                outputs = self.flush()
+            self._run.append(_Stroke(char, key_to_str(key), time, time_ns))
+            return outputs
+
+        outputs = self.flush()
+        outputs.append(KeyOutput('key_press', key_to_str(key), time, time_ns, time))
+        return outputs
+
+    def release(self, key: Any, time: datetime, time_ns: int) -> List[KeyOutput]:
+        """키 뗌 처리 (보조 키만 의미 있음)
+
+        보조 키를 다른 키 없이 눌렀다 떼면 해당 키의 key_press로 확정한다.
+        """
+        modifier = MODIFIER_KEYS.get(special_key_name(key))
+        stroke = self._held.pop(modifier, None) if modifier else None
+        if stroke is None or self._used.pop(modifier, True):
+            return []
+        outputs = self.flush()
+        outputs.append(KeyOutput('key_press', stroke.key_str, stroke.time, stroke.time_ns, stroke.time))
+        return outputs
+
+    def expire(self, now_ns: int) -> Tuple[List[KeyOutput], Optional[float]]:
+        """마지막 키 후 gap초가 지났으면 진행 중인 텍스트 입력 확정
+
+        Args:
+            now_ns: 현재 시각 (키 입력의 time_ns와 같은 monotonic 기준)
+
+        Returns:
+            (확정된 액션 목록, 확정까지 남은 시간(초) - 진행 중인 입력이 없으면 None)
+        """
+        if not self._run or not self._run[-1].time_ns:
+            return [], None
+        remaining = self.gap - (now_ns - self._run[-1].time_ns) / 1e9
+        if remaining > 0:
+            return [], remaining
+        return self.flush(), None
+
+    def flush(self) -> List[KeyOutput]:
+        """진행 중인 텍스트 입력 확정"""
+        run, self._run = self._run, []
+        if not run:
+            return []
+        first, last = run[0], run[-1]
+        if len(run) == 1:
+            return [KeyOutput('key_press', first.key_str, first.time, first.time_ns, first.time)]
+        text = "".join(s.value for s in run)
+        return [KeyOutput('type_text', text, first.time, first.time_ns, last.time)]
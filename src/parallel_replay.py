@@ -0,0 +1,574 @@
+"""
+ParallelReplayOrchestrator - 여러 게임 인스턴스에서 테스트 케이스를 동시에 재실행
+
+테스트 케이스 하나는 게임 창 하나를 순서대로 구동하므로, 같은 호스트에 게임을 N개 띄우고
+테스트 케이스를 N개씩 동시에 재실행하면 회귀 테스트 전체 시간이 줄어든다.
+
+- 인스턴스(ReplayInstance)마다 자체 WindowCapture/윈도우 오프셋/입력 경로를 가지며,
+  SemanticActionReplayer.instance로 지정하면 캡처와 입력이 그 창으로 라우팅된다.
+- 인스턴스마다 작업 큐를 두고 액션 수 기준으로 테스트 케이스를 나눠 담는다.
+  자기 큐가 비면 가장 많이 남은 큐의 뒤쪽에서 가져오고(work stealing),
+  창을 찾지 못한 인스턴스의 큐도 다른 인스턴스가 처리한다.
+- Vision LLM 분석기는 모든 인스턴스가 공유한다. 동시 호출 수를 제한하고(AnalyzerPool),
+  픽셀이 같은 프레임의 분석 결과는 인스턴스 사이에서도 재사용한다(FrameAnalysisCache).
+- 결과는 테스트 케이스별 실행 기록과 인스턴스별 사용률을 합친 보고서 하나로 저장한다.
+
+마우스/키보드는 호스트에 하나뿐이므로 실제 창(WindowInstance)은 입력하는 순간에만
+호스트 입력 잠금을 잡고 창을 전경으로 가져온다. 캡처, 분석, 화면 전환 대기는 동시에 진행된다.
+SimulatedWindowInstance는 녹화된 스크린샷을 화면으로 보여주는 가상 창으로,
+디스플레이 없이(Linux CI 등) 병렬 확장을 테스트할 때 사용한다.
+"""
+
+import json
+import logging
+from abc import ABC, abstractmethod
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image
+
+from src.pipelined_replay import FrameAnalysisCache
+from src.replay_manifest import resolve_frame_path
+from src.semantic_action_recorder import SemanticAction
+from src.semantic_action_replayer import ReplayResult, SemanticActionReplayer
+from src.window_capture import WindowCapture
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_ANALYZER_CONCURRENCY = 4
+DEFAULT_ANALYSIS_CACHE_SIZE = 32
+PARALLEL_REPORT_PREFIX = "parallel_replay"
+
+# 호스트의 마우스/키보드는 하나이므로 실제 창 인스턴스는 입력 순간을 직렬화
+_host_input_lock = threading.RLock()
+
+
+class ReplayInstance(ABC):
+    """병렬 replay에서 재실행기 하나가 구동하는 게임 인스턴스
+
+    pyautogui와 같은 이름의 입력 메서드(click/press/hotkey/write/scroll/moveTo/mouseDown/mouseUp,
+    스크린 좌표)와 화면 캡처(screenshot, 창 기준 이미지), 윈도우 오프셋을 제공한다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def find_window(self) -> bool:
+        """구동할 창이 준비되었는지 (재실행 시작 전 호출)"""
+        return True
+
+    def prepare(self, test_case_name: str, actions: Sequence[SemanticAction]):
+        """테스트 케이스 재실행 직전 호출"""
+
+    def window_offset(self) -> Tuple[int, int]:
+        """창 좌상단의 스크린 좌표"""
+        return (0, 0)
+
+    @contextmanager
+    def exclusive(self):
+        """입력 구간 (이 안에서 입력 메서드를 호출)"""
+        yield
+
+    @abstractmethod
+    def screenshot(self) -> Optional[Image.Image]:
+        """현재 창 화면 (창 기준 이미지, 캡처 실패 시 None)"""
+
+    @abstractmethod
+    def click(self, x: int, y: int, button: str = 'left', **kwargs):
+        """스크린 좌표 클릭"""
+
+    @abstractmethod
+    def press(self, key: str, **kwargs):
+        """키 입력"""
+
+    @abstractmethod
+    def hotkey(self, *keys: str, **kwargs):
+        """조합키 입력"""
+
+    @abstractmethod
+    def write(self, text: str, interval: float = 0.0, **kwargs):
+        """텍스트 입력"""
+
+    @abstractmethod
+    def scroll(self, clicks: int, x: Optional[int] = None, y: Optional[int] = None, **kwargs):
+        """스크롤 (x, y는 스크린 좌표)"""
+
+    @abstractmethod
+    def moveTo(self, x: int, y: int, **kwargs):
+        """마우스 이동 (스크린 좌표)"""
+
+    @abstractmethod
+    def mouseDown(self, button: str = 'left', **kwargs):
+        """마우스 버튼 누르기"""
+
+    @abstractmethod
+    def mouseUp(self, button: str = 'left', **kwargs):
+        """마우스 버튼 떼기"""
+
+
+class WindowInstance(ReplayInstance):
+    """제목으로 찾은 실제 게임 창 (Windows)
+
+    입력 구간에서는 호스트 입력 잠금을 잡고 창을 전경으로 가져온 뒤 pyautogui로 입력한다.
+    """
+
+    def __init__(self, window_title: str, name: Optional[str] = None):
+        """
+        Args:
+            window_title: 게임 창 제목 (부분 일치, 인스턴스마다 달라야 함)
+            name: 보고서에 표시할 인스턴스 이름 (기본: 창 제목)
+        """
+        super().__init__(name or window_title)
+        self.window_capture = WindowCapture(window_title)
+
+    def find_window(self) -> bool:
+        return self.window_capture.find_window() is not None
+
+    def window_offset(self) -> Tuple[int, int]:
+        rect = self.window_capture.get_window_rect()
+        return (rect[0], rect[1]) if rect else (0, 0)
+
+    @contextmanager
+    def exclusive(self):
+        with _host_input_lock:
+            self.window_capture.activate_window()
+            yield
+
+    def screenshot(self) -> Optional[Image.Image]:
+        return self.window_capture.capture_window()
+
+    @staticmethod
+    def _pyautogui():
+        import pyautogui
+        return pyautogui
+
+    def click(self, x, y, button='left', **kwargs):
+        self._pyautogui().click(x, y, button=button, **kwargs)
+
+    def press(self, key, **kwargs):
+        self._pyautogui().press(key, **kwargs)
+
+    def hotkey(self, *keys, **kwargs):
+        self._pyautogui().hotkey(*keys, **kwargs)
+
+    def write(self, text, interval=0.0, **kwargs):
+        self._pyautogui().write(text, interval=interval, **kwargs)
+
+    def scroll(self, clicks, x=None, y=None, **kwargs):
+        self._pyautogui().scroll(clicks, x=x, y=y, **kwargs)
+
+    def moveTo(self, x, y, **kwargs):
+        self._pyautogui().moveTo(x, y, **kwargs)
+
+    def mouseDown(self, button='left', **kwargs):
+        self._pyautogui().mouseDown(button=button, **kwargs)
+
+    def mouseUp(self, button='left', **kwargs):
+        self._pyautogui().mouseUp(button=button, **kwargs)
+
+
+class SimulatedWindowInstance(ReplayInstance):
+    """녹화된 스크린샷을 화면으로 보여주는 가상 게임 창
+
+    테스트 케이스를 시작하면 각 액션의 클릭 전 스크린샷(screenshot_before_path)을 화면 목록으로 읽고,
+    입력(클릭/키/스크롤/드래그 끝)마다 다음 화면으로 넘어간다. 받은 입력은 창 기준 좌표로 events에 기록한다.
+    """
+
+    def __init__(self, name: str, offset: Tuple[int, int] = (0, 0),
+                 frames: Optional[Sequence[Image.Image]] = None,
+                 size: Tuple[int, int] = (1280, 720), input_latency: float = 0.0):
+        """
+        Args:
+            name: 인스턴스 이름
+            offset: 가상 창의 스크린 오프셋 (입력 좌표 변환 확인용)
+            frames: 고정 화면 목록 (주면 테스트 케이스 스크린샷 대신 사용)
+            size: 스크린샷이 없을 때 보여줄 빈 화면 크기
+            input_latency: 입력마다 걸리는 시간 (초, 게임 반응 시간 시뮬레이션)
+        """
+        super().__init__(name)
+        self.offset = offset
+        self.size = size
+        self.input_latency = input_latency
+        self._fixed_frames = list(frames) if frames is not None else None
+        self._frames: List[Image.Image] = list(self._fixed_frames or [])
+        self._index = 0
+        self._lock = threading.Lock()
+        self.events: List[Tuple[Any, ...]] = []
+
+    def prepare(self, test_case_name: str, actions: Sequence[SemanticAction]):
+        if self._fixed_frames is None:
+            self._frames = self._load_frames(actions)
+        with self._lock:
+            self._index = 0
+
+    def _load_frames(self, actions: Sequence[SemanticAction]) -> List[Image.Image]:
+        """액션 순서대로 클릭 전 스크린샷 (없으면 직전 화면 유지)"""
+        frames = []
+        cache: Dict[str, Image.Image] = {}
+        current = Image.new('RGB', self.size)
+        for action in actions:
+            path = resolve_frame_path(action.screenshot_before_path)
+            if path and path not in cache:
+                try:
+                    with Image.open(path) as image:
+                        cache[path] = image.convert('RGB')
+                except OSError:
+                    logger.debug(f"[{self.name}] 스크린샷 없음: {path}")
+            current = cache.get(path, current)
+            frames.append(current)
+        return frames or [current]
+
+    def window_offset(self) -> Tuple[int, int]:
+        return self.offset
+
+    def screenshot(self) -> Optional[Image.Image]:
+        with self._lock:
+            if not self._frames:
+                return Image.new('RGB', self.size)
+            return self._frames[min(self._index, len(self._frames) - 1)]
+
+    def _input(self, kind: str, *args: Any, advance: bool = True):
+        if self.input_latency:
+            time.sleep(self.input_latency)
+        with self._lock:
+            self.events.append((kind,) + args)
+            if advance:
+                self._index += 1
+
+    def _to_window(self, x: Optional[int], y: Optional[int]) -> Tuple[Optional[int], Optional[int]]:
+        if x is None or y is None:
+            return (x, y)
+        return (x - self.offset[0], y - self.offset[1])
+
+    def click(self, x, y, button='left', **kwargs):
+        self._input('click', *self._to_window(x, y), button)
+
+    def press(self, key, **kwargs):
+        self._input('press', key)
+
+    def hotkey(self, *keys, **kwargs):
+        self._input('hotkey', '+'.join(keys))
+
+    def write(self, text, interval=0.0, **kwargs):
+        self._input('write', text)
+
+    def scroll(self, clicks, x=None, y=None, **kwargs):
+        self._input('scroll', *self._to_window(x, y), clicks)
+
+    def moveTo(self, x, y, **kwargs):
+        self._input('move', *self._to_window(x, y), advance=False)
+
+    def mouseDown(self, button='left', **kwargs):
+        self._input('mouse_down', button, advance=False)
+
+    def mouseUp(self, button='left', **kwargs):
+        self._input('mouse_up', button)
+
+
+class AnalyzerPool:
+    """여러 인스턴스가 공유하는 UI 분석기 (동시 Vision LLM 호출 수 제한)"""
+
+    def __init__(self, analyzer, max_concurrent: int = DEFAULT_ANALYZER_CONCURRENCY):
+        """
+        Args:
+            analyzer: 실제 분석기 (analyze_with_retry 제공)
+            max_concurrent: 동시에 실행할 최대 분석 수
+        """
+        self.analyzer = analyzer
+        self.max_concurrent = max(1, int(max_concurrent))
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.wait_seconds = 0.0  # 분석 슬롯을 기다린 누적 시간
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.analyzer, name)
+
+    def analyze_with_retry(self, image: Image.Image, *args, **kwargs) -> dict:
+        started = time.perf_counter()
+        with self._slots:
+            with self._lock:
+                self.calls += 1
+                self.wait_seconds += time.perf_counter() - started
+            return self.analyzer.analyze_with_retry(image, *args, **kwargs)
+
+
+@dataclass
+class TestCaseRun:
+    """테스트 케이스 하나의 병렬 재실행 결과"""
+    __test__ = False  # pytest 수집 대상 아님
+
+    name: str
+    instance: str
+    success: bool
+    results: List[ReplayResult] = field(default_factory=list)
+    statistics: Dict[str, Any] = field(default_factory=dict)
+    started_at: str = ""
+    wall_seconds: float = 0.0
+    error: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "instance": self.instance,
+            "success": self.success,
+            "started_at": self.started_at,
+            "wall_seconds": self.wall_seconds,
+            "error": self.error,
+            "statistics": self.statistics,
+            "failed_actions": [
+                {"action_id": r.action_id, "method": r.method, "error_message": r.error_message}
+                for r in self.results if not r.success
+            ],
+        }
+
+
+@dataclass
+class ParallelReplayReport:
+    """병렬 재실행 통합 보고서"""
+    runs: List[TestCaseRun]
+    instances: List[str]
+    wall_seconds: float = 0.0
+    analyzer_calls: int = 0
+    analysis_hits: int = 0
+    analyzer_wait_seconds: float = 0.0
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def summary(self) -> Dict[str, Any]:
+        """테스트 케이스/액션 합계와 인스턴스별 사용률"""
+        total_actions = sum(run.statistics.get("total_actions", 0) for run in self.runs)
+        success_actions = sum(run.statistics.get("success_count", 0) for run in self.runs)
+        method_counts: Dict[str, int] = {}
+        for run in self.runs:
+            for result in run.results:
+                method_counts[result.method] = method_counts.get(result.method, 0) + 1
+
+        per_instance = {}
+        for name in self.instances:
+            runs = [run for run in self.runs if run.instance == name]
+            busy = sum(run.wall_seconds for run in runs)
+            per_instance[name] = {
+                "test_cases": len(runs),
+                "busy_seconds": busy,
+                "utilization": busy / self.wall_seconds if self.wall_seconds > 0 else 0.0,
+            }
+
+        serial_seconds = sum(run.wall_seconds for run in self.runs)
+        passed = sum(1 for run in self.runs if run.success)
+        return {
+            "test_cases": len(self.runs),
+            "passed": passed,
+            "failed": len(self.runs) - passed,
+            "total_actions": total_actions,
+            "success_count": success_actions,
+            "success_rate": success_actions / total_actions if total_actions else 0.0,
+            "method_counts": method_counts,
+            "wall_seconds": self.wall_seconds,
+            "serial_seconds": serial_seconds,
+            "speedup": serial_seconds / self.wall_seconds if self.wall_seconds > 0 else 0.0,
+            "analyzer_calls": self.analyzer_calls,
+            "analysis_hits": self.analysis_hits,
+            "analyzer_wait_seconds": self.analyzer_wait_seconds,
+            "instances": per_instance,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "created_at": self.created_at,
+            "summary": self.summary(),
+            "runs": [run.to_dict() for run in self.runs],
+        }
+
+    def save(self, report_dir: str) -> str:
+        """보고서 JSON 저장 (<report_dir>/parallel_replay_<시각>.json)
+
+        Returns:
+            저장된 파일 경로
+        """
+        os.makedirs(report_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(report_dir, f"{PARALLEL_REPORT_PREFIX}_{stamp}.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return path
+
+
+def load_test_case_actions(json_path: str) -> Tuple[str, List[SemanticAction]]:
+    """테스트 케이스 JSON에서 (이름, SemanticAction 리스트) 로드"""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    name = data.get("name") or os.path.splitext(os.path.basename(json_path))[0]
+    return name, [SemanticAction.from_dict(action) for action in data.get("actions", [])]
+
+
+class ParallelReplayOrchestrator:
+    """여러 게임 인스턴스에서 테스트 케이스를 동시에 재실행"""
+
+    def __init__(self, config, instances: Sequence[ReplayInstance], ui_analyzer=None,
+                 analyzer_concurrency: Optional[int] = None):
+        """
+        Args:
+            config: 설정 관리자
+            instances: 구동할 게임 인스턴스 (이름이 서로 달라야 함)
+            ui_analyzer: 공유 UI 분석기 (없으면 UIAnalyzer 생성)
+            analyzer_concurrency: 동시 Vision LLM 호출 수
+                (None이면 automation.parallel_replay.analyzer_concurrency)
+        """
+        if not instances:
+            raise ValueError("병렬 재실행할 인스턴스가 없습니다")
+        names = [instance.name for instance in instances]
+        if len(set(names)) != len(names):
+            raise ValueError(f"인스턴스 이름이 중복됩니다: {names}")
+
+        self.config = config
+        self.instances = list(instances)
+        if ui_analyzer is None:
+            from src.ui_analyzer import UIAnalyzer
+            ui_analyzer = UIAnalyzer(config)
+        if analyzer_concurrency is None:
+            analyzer_concurrency = config.get('automation.parallel_replay.analyzer_concurrency',
+                                              DEFAULT_ANALYZER_CONCURRENCY)
+        self.analyzer_pool = AnalyzerPool(ui_analyzer, analyzer_concurrency)
+        self.analyzer = FrameAnalysisCache(self.analyzer_pool, DEFAULT_ANALYSIS_CACHE_SIZE)
+
+        self._queues: Dict[str, deque] = {}
+        self._queue_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config, ui_analyzer=None, simulate: int = 0) -> 'ParallelReplayOrchestrator':
+        """설정(automation.parallel_replay.windows)의 창 제목마다 인스턴스 생성
+
+        Args:
+            config: 설정 관리자
+            ui_analyzer: 공유 UI 분석기
+            simulate: 0보다 크면 실제 창 대신 가상 창 인스턴스 수
+        """
+        if simulate > 0:
+            instances = [SimulatedWindowInstance(f"sim-{i + 1}", offset=(i * 100, i * 50))
+                         for i in range(simulate)]
+        else:
+            titles = config.get('automation.parallel_replay.windows', []) or []
+            instances = [WindowInstance(title) for title in titles]
+        return cls(config, instances, ui_analyzer=ui_analyzer)
+
+    def run_files(self, json_paths: Sequence[str]) -> ParallelReplayReport:
+        """테스트 케이스 JSON 파일들을 병렬 재실행"""
+        return self.run([load_test_case_actions(path) for path in json_paths])
+
+    def run(self, test_cases: Sequence[Tuple[str, Sequence[SemanticAction]]]) -> ParallelReplayReport:
+        """테스트 케이스들을 인스턴스에 나눠 동시에 재실행
+
+        Args:
+            test_cases: (이름, 액션 리스트) 목록
+
+        Returns:
+            통합 보고서 (runs는 입력 순서)
+        """
+        self._distribute(test_cases)
+        runs: Dict[int, TestCaseRun] = {}
+        runs_lock = threading.Lock()
+        hits_before = self.analyzer.hits
+        calls_before = self.analyzer_pool.calls
+        wait_before = self.analyzer_pool.wait_seconds
+        started = time.perf_counter()
+
+        workers = [
+            threading.Thread(target=self._worker, args=(instance, runs, runs_lock),
+                             name=f"replay-{instance.name}", daemon=True)
+            for instance in self.instances
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        # 모든 인스턴스가 창을 찾지 못해 남은 테스트 케이스
+        for index, name, _ in self._drain():
+            runs[index] = TestCaseRun(name, "", False, error="사용 가능한 게임 인스턴스가 없습니다")
+
+        return ParallelReplayReport(
+            runs=[runs[index] for index in sorted(runs)],
+            instances=[instance.name for instance in self.instances],
+            wall_seconds=time.perf_counter() - started,
+            analyzer_calls=self.analyzer_pool.calls - calls_before,
+            analysis_hits=self.analyzer.hits - hits_before,
+            analyzer_wait_seconds=self.analyzer_pool.wait_seconds - wait_before,
+        )
+
+    def _distribute(self, test_cases: Sequence[Tuple[str, Sequence[SemanticAction]]]):
+        """액션이 많은 테스트 케이스부터 남은 액션 수가 가장 적은 인스턴스 큐에 배정"""
+        self._queues = {instance.name: deque() for instance in self.instances}
+        loads = {instance.name: 0 for instance in self.instances}
+        order = sorted(range(len(test_cases)), key=lambda i: (-len(test_cases[i][1]), i))
+        for index in order:
+            name, actions = test_cases[index]
+            target = min(loads, key=lambda instance: (loads[instance], list(loads).index(instance)))
+            self._queues[target].append((index, name, list(actions)))
+            loads[target] += len(actions)
+
+    def _next(self, instance_name: str) -> Optional[Tuple[int, str, List[SemanticAction]]]:
+        """자기 큐 앞에서 꺼내고, 비었으면 액션이 가장 많이 남은 큐 뒤에서 가져옴"""
+        with self._queue_lock:
+            own = self._queues[instance_name]
+            if own:
+                return own.popleft()
+            victims = [queue for queue in self._queues.values() if queue]
+            if not victims:
+                return None
+            victim = max(victims, key=lambda queue: sum(len(item[2]) for item in queue))
+            return victim.pop()
+
+    def _drain(self) -> List[Tuple[int, str, List[SemanticAction]]]:
+        with self._queue_lock:
+            items = [item for queue in self._queues.values() for item in queue]
+            for queue in self._queues.values():
+                queue.clear()
+        return items
+
+    def _worker(self, instance: ReplayInstance, runs: Dict[int, TestCaseRun], runs_lock: threading.Lock):
+        """인스턴스 하나를 구동하는 작업 스레드"""
+        try:
+            if not instance.find_window():
+                logger.warning(f"[{instance.name}] 게임 창을 찾지 못해 다른 인스턴스가 테스트 케이스를 처리합니다")
+                return
+            replayer = SemanticActionReplayer(self.config, ui_analyzer=self.analyzer)
+            replayer.instance = instance
+        except Exception as e:
+            logger.error(f"[{instance.name}] 인스턴스 준비 실패: {e}")
+            return
+
+        while True:
+            item = self._next(instance.name)
+            if item is None:
+                return
+            index, name, actions = item
+            run = self._replay_one(replayer, instance, name, actions)
+            with runs_lock:
+                runs[index] = run
+
+    def _replay_one(self, replayer: SemanticActionReplayer, instance: ReplayInstance,
+                    name: str, actions: List[SemanticAction]) -> TestCaseRun:
+        """테스트 케이스 하나 재실행"""
+        logger.info(f"[{instance.name}] 테스트 케이스 재실행 시작: {name} (액션 {len(actions)}개)")
+        run = TestCaseRun(name, instance.name, False, started_at=datetime.now().isoformat())
+        started = time.perf_counter()
+        try:
+            replayer.clear_results()
+            instance.prepare(name, actions)
+            run.results = replayer.replay_actions(actions)
+            run.statistics = replayer.get_statistics()
+            run.success = all(result.success for result in run.results)
+        except Exception as e:
+            run.error = str(e)
+            logger.error(f"[{instance.name}] 테스트 케이스 재실행 실패: {name} ({e})")
+        run.wall_seconds = time.perf_counter() - started
+        logger.info(f"[{instance.name}] 테스트 케이스 재실행 완료: {name} "
+                    f"({'성공' if run.success else '실패'}, {run.wall_seconds:.1f}초)")
+        return run
@@ -0,0 +1,267 @@
+"""
+PipelinedReplayEngine - 선행 분석을 겹쳐 실행하는 의미론적 replay 엔진
+
+SemanticActionReplayer.replay_actions는 캡처 → 분석 → 클릭 → 대기 → 캡처 → 해시를
+액션마다 차례로 실행하므로, 액션 N+1의 Vision LLM 분석은 액션 N의 전환 대기가
+모두 끝난 뒤에야 시작된다.
+
+이 엔진은 asyncio로 다음 작업을 겹쳐 실행한다.
+- 액션 N 실행(입력/대기/전환 검증)은 작업 스레드에서 기존 SemanticActionReplayer가 그대로 수행
+- 그동안 입력 직후부터 화면을 폴링하여 연속 두 프레임의 픽셀이 같아지면(화면 안정화),
+  다음 클릭 액션이 분석할 화면을 미리 Vision LLM으로 분석한다.
+  녹화 시 액션 N+1의 before 해시(ui_state_hash_before)와 비슷한 화면일 때만 분석하고,
+  해시 게이트(automation.hash_gate)를 통과해 분석 없이 클릭할 화면이면 분석하지 않는다.
+- 분석 결과는 프레임 픽셀 digest로 공유한다. 액션 N+1이 캡처한 화면이 안정화된 화면과 같으면
+  진행 중이거나 끝난 선행 분석을 재사용하고, 한 액션 안에서 같은 프레임을 두 번 분석하던
+  호출(요소 확인 → 의미론적 매칭)도 한 번으로 줄어든다.
+
+입력 순서·대기·캡처 시점은 순차 모드와 같고 분석 결과는 픽셀이 같은 프레임에만 재사용하므로,
+분석이 결정적이라면 재실행 결과는 순차 모드와 동일하다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from PIL import Image
+
+from src.frame_hasher import hex_hamming_distance
+from src.screen_state_graph import classify_transition
+from src.semantic_action_recorder import SemanticAction
+from src.semantic_action_replayer import ReplayResult, SemanticActionReplayer
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_POLL_INTERVAL = 0.1  # 화면 안정화 확인 간격 (초)
+DEFAULT_CACHE_SIZE = 8
+
+
+def frame_digest(image: Image.Image) -> str:
+    """프레임 픽셀 내용 digest (완전히 같은 화면 판정용)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image.mode}:{image.size}".encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+class FrameAnalysisCache:
+    """프레임별 UI 분석 결과 공유 (UIAnalyzer 대신 SemanticActionReplayer.ui_analyzer로 사용)
+
+    같은 프레임의 분석은 한 번만 실행하고, 진행 중이면 그 결과를 기다린다.
+    실패한 분석은 공유하지 않고 다음 호출에서 다시 분석한다.
+    """
+
+    def __init__(self, analyzer, max_entries: int = DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            analyzer: 실제 분석기 (analyze_with_retry 제공)
+            max_entries: 보관할 최근 프레임 분석 수
+        """
+        self.analyzer = analyzer
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # analyze_with_retry 외의 속성은 실제 분석기로 위임
+        return getattr(self.analyzer, name)
+
+    def _claim(self, digest: str) -> Tuple[Future, bool]:
+        """digest의 분석 Future와 실행 담당 여부 (실패한 분석은 새 Future로 교체)"""
+        with self._lock:
+            future = self._entries.get(digest)
+            if future is not None and not (future.done() and future.exception() is not None):
+                self._entries.move_to_end(digest)
+                return future, False
+            future = Future()
+            self._entries[digest] = future
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self.misses += 1
+            return future, True
+
+    def _run(self, future: Future, image: Image.Image, args: tuple = (), kwargs: Optional[dict] = None):
+        try:
+            future.set_result(self.analyzer.analyze_with_retry(image, *args, **(kwargs or {})))
+        except Exception as e:
+            future.set_exception(e)
+
+    def analyze_with_retry(self, image: Image.Image, *args, **kwargs) -> dict:
+        """UIAnalyzer.analyze_with_retry와 같은 결과 (같은 프레임의 분석은 재사용)"""
+        digest = frame_digest(image)
+        while True:
+            future, owner = self._claim(digest)
+            if owner:
+                self._run(future, image, args, kwargs)
+                return future.result()
+            try:
+                result = future.result()
+            except Exception:
+                continue  # 다른 호출의 분석 실패는 공유하지 않고 직접 다시 분석
+            with self._lock:
+                self.hits += 1
+            return result
+
+    def prefetch(self, image: Image.Image, executor: ThreadPoolExecutor, digest: Optional[str] = None) -> bool:
+        """작업 스레드에서 프레임을 미리 분석
+
+        Returns:
+            새로 분석을 시작했는지 여부 (이미 분석했거나 진행 중이면 False)
+        """
+        future, owner = self._claim(digest or frame_digest(image))
+        if owner:
+            executor.submit(self._run, future, image)
+        return owner
+
+
+@dataclass
+class PipelineStats:
+    """파이프라인 replay 통계"""
+    wall_seconds: float = 0.0
+    stage_seconds: Dict[str, float] = field(default_factory=dict)  # 단계별 합계 (capture/analyze/input/settle/verify)
+    action_timings: List[Dict[str, float]] = field(default_factory=list)  # 액션별 단계 시간
+    speculative_analyses: int = 0  # 화면 안정화 후 미리 시작한 분석 수
+    analysis_hits: int = 0  # 재사용된 분석 (선행 분석 + 같은 프레임 중복)
+    analysis_misses: int = 0  # 실제로 실행된 분석
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "wall_seconds": self.wall_seconds,
+            "stage_seconds": dict(self.stage_seconds),
+            "speculative_analyses": self.speculative_analyses,
+            "analysis_hits": self.analysis_hits,
+            "analysis_misses": self.analysis_misses,
+        }
+
+
+class PipelinedReplayEngine:
+    """다음 액션의 화면 분석을 현재 액션의 전환 대기와 겹쳐 실행하는 replay 엔진"""
+
+    def __init__(self, replayer: SemanticActionReplayer,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL, speculate: bool = True):
+        """
+        Args:
+            replayer: 액션을 실제로 실행할 SemanticActionReplayer
+            poll_interval: 화면 안정화 확인 간격 (초)
+            speculate: 화면 안정화 후 다음 액션 화면을 미리 분석할지 여부
+        """
+        self.replayer = replayer
+        self.poll_interval = max(0.01, float(poll_interval))
+        self.speculate = speculate
+        self.stats = PipelineStats()
+
+    @classmethod
+    def from_config(cls, replayer: SemanticActionReplayer, config) -> 'PipelinedReplayEngine':
+        """설정(automation.pipeline_poll_interval)으로 엔진 생성"""
+        return cls(replayer, config.get('automation.pipeline_poll_interval', DEFAULT_POLL_INTERVAL))
+
+    def replay_actions(self, actions: List[SemanticAction]) -> List[ReplayResult]:
+        """여러 액션 재실행 (실행 중인 이벤트 루프 밖에서 호출)"""
+        return asyncio.run(self.replay_actions_async(actions))
+
+    async def replay_actions_async(self, actions: List[SemanticAction]) -> List[ReplayResult]:
+        """여러 액션 재실행 (다음 액션 화면 분석을 현재 액션과 겹쳐 실행)
+
+        Args:
+            actions: 재실행할 액션 리스트
+
+        Returns:
+            ReplayResult 리스트 (순차 모드와 같은 순서)
+        """
+        self.stats = PipelineStats()
+        replayer = self.replayer
+        analyzer = replayer.ui_analyzer
+        cache = FrameAnalysisCache(analyzer)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="replay-prefetch")
+        replayer.ui_analyzer = cache
+        started = time.perf_counter()
+        results = []
+
+        try:
+            for i, action in enumerate(actions):
+                next_action = actions[i + 1] if i + 1 < len(actions) else None
+                logger.info(f"액션 {i+1}/{len(actions)} 재실행: {action.description}")
+
+                input_done = threading.Event()
+                if action.action_type == 'wait':
+                    input_done.set()  # 입력 없이 대기하는 동안에도 화면 안정화 확인
+                replayer.on_input = input_done.set
+
+                speculation = None
+                if self.speculate and self._needs_analysis(next_action):
+                    speculation = asyncio.create_task(self._speculate(next_action, input_done, cache, executor))
+
+                before = dict(replayer.stage_timings)
+                try:
+                    result = await asyncio.to_thread(replayer.replay_action, action)
+                finally:
+                    if speculation is not None:
+                        speculation.cancel()
+                        await asyncio.gather(speculation, return_exceptions=True)
+
+                results.append(result)
+                self.stats.action_timings.append({
+                    stage: seconds - before.get(stage, 0.0)
+                    for stage, seconds in replayer.stage_timings.items()
+                    if seconds > before.get(stage, 0.0)
+                })
+                if not result.success:
+                    logger.warning(f"액션 {i+1} 실패: {result.error_message}")
+        finally:
+            replayer.on_input = None
+            replayer.ui_analyzer = analyzer
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.stats.wall_seconds = time.perf_counter() - started
+            for timings in self.stats.action_timings:
+                for stage, seconds in timings.items():
+                    self.stats.stage_seconds[stage] = self.stats.stage_seconds.get(stage, 0.0) + seconds
+            self.stats.analysis_hits = cache.hits
+            self.stats.analysis_misses = cache.misses
+
+        return results
+
+    @staticmethod
+    def _needs_analysis(action: Optional[SemanticAction]) -> bool:
+        """재실행 시 현재 화면을 Vision LLM으로 분석하는 액션인지 (의미론적 정보가 있는 클릭)"""
+        return action is not None and action.action_type == 'click' and bool(action.semantic_info)
+
+    async def _speculate(self, action: SemanticAction, input_done: threading.Event,
+                         cache: FrameAnalysisCache, executor: ThreadPoolExecutor):
+        """입력 후 화면이 안정되면 다음 액션이 분석할 화면을 미리 분석"""
+        while not input_done.is_set():
+            await asyncio.sleep(self.poll_interval)
+
+        previous = None
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            frame = await asyncio.to_thread(self.replayer._capture_screenshot)
+            if frame is None:
+                continue
+            digest = await asyncio.to_thread(frame_digest, frame)
+            if digest != previous:
+                previous = digest
+                continue
+            if not await asyncio.to_thread(self._resembles_before, frame, action):
+                continue  # 멈춘 로딩 화면 등: 다음 화면을 기다림
+            if await asyncio.to_thread(self.replayer._hash_gate, action, frame) is not None:
+                return  # 녹화 화면과 같아 다음 액션은 분석 없이 원래 좌표를 클릭 (해시 게이트)
+            if cache.prefetch(frame, executor, digest):
+                self.stats.speculative_analyses += 1
+                logger.debug(f"화면 안정화, 다음 액션 화면 선행 분석 시작: {action.description}")
+            return
+
+    def _resembles_before(self, frame: Image.Image, action: SemanticAction) -> bool:
+        """안정된 화면이 녹화 시 액션 전 화면과 같은 화면으로 보이는지 (before 해시가 없으면 True)"""
+        if not action.ui_state_hash_before:
+            return True
+        distance = hex_hamming_distance(self.replayer._calculate_hash(frame), action.ui_state_hash_before)
+        return classify_transition(distance) in ('none', 'minor_change')
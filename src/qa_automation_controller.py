@@ -9,17 +9,33 @@ Requirements: 1.1, 3.1, 3.8, 5.1, 6.1, 15.1, 15.2
 
 import os
 import json
+import logging
 import subprocess
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
 from src.config_manager import ConfigManager
 from src.game_process_manager import GameProcessManager
-from src.input_monitor import InputMonitor, ActionRecorder, Action
+from src.input_monitor import InputMonitor, ActionRecorder, Action, action_to_dict
 from src.script_generator import ScriptGenerator
+from src.accuracy_store import DEFAULT_ACCURACY_BACKEND, DEFAULT_FLAKY_MIN_OBSERVATIONS, AccuracyStore
 from src.accuracy_tracker import AccuracyTracker, AccuracyStatistics
 from src.test_case_enricher import TestCaseEnricher, EnrichmentResult
 from src.ui_analyzer import UIAnalyzer
+from src.replay_manifest import ReplayManifest, ReplayManifestCompiler, get_manifest_path
+from src.expected_analysis_store import ExpectedAnalysisStore
+from src.region_mask import RegionMaskStore
+from src.screen_state_graph import ScreenStateGraph
+from src.parallel_replay import ParallelReplayOrchestrator, ParallelReplayReport, load_test_case_actions
+from src.replay_checkpoint import CheckpointedReplay
+from src.semantic_action_replayer import ReplayResult, SemanticActionReplayer
+from src.timeline_scheduler import DEFAULT_REPLAY_SPEED
+from src.recording_log import (
+    DEFAULT_FSYNC_INTERVAL, RecordingLogWriter, find_recording_logs, get_recording_log_path,
+    log_to_test_case, read_recording_log, recover_recording_log
+)
+
+logger = logging.getLogger(__name__)
 
 
 class QAAutomationController:
@@ -45,6 +61,7 @@ class QAAutomationController:
         self.current_test_case: Optional[dict] = None
         self._initialized = False
         self._recording_test_case_name: Optional[str] = None  # 녹화 중인 테스트 케이스 이름
+        self._recording_log_path: Optional[str] = None  # 마지막 녹화의 녹화 로그 (저장 후 삭제)
     
     def initialize(self) -> bool:
         """시스템 초기화
@@ -116,18 +133,39 @@ class QAAutomationController:
         if test_case_name:
             self.action_recorder.set_test_case_name(test_case_name)
         
+        # 녹화 로그 (녹화 도중 종료되어도 'recover' 명령으로 복구 가능)
+        self._recording_log_path = None
+        if self.config_manager.get('automation.recording_log', True):
+            test_cases_dir = self.config_manager.get('test_cases.directory', 'test_cases')
+            started_at = datetime.now()
+            self.action_recorder.start_log(RecordingLogWriter(
+                get_recording_log_path(test_cases_dir, test_case_name, started_at),
+                {
+                    "name": test_case_name,
+                    "created_at": started_at.isoformat(),
+                    "capture_delay": self.action_recorder.get_capture_delay()
+                },
+                self.config_manager.get('automation.recording_log_fsync_interval', DEFAULT_FSYNC_INTERVAL)
+            ))
+        
         self.input_monitor.start_monitoring()
     
     def stop_recording(self) -> Optional[str]:
         """입력 기록 중지 (Requirements 3.8)
         
-        입력 모니터링을 중지한다.
+        입력 모니터링을 중지한다. 입력 큐에 남은 이벤트는 모두 기록된 뒤 반환한다.
         
         Returns:
             녹화 중이던 테스트 케이스 이름 (없으면 None)
         """
         self._ensure_initialized()
         self.input_monitor.stop_monitoring()
+        self._recording_log_path = self.action_recorder.close_log()
+        
+        dropped = self.input_monitor.get_queue_stats().dropped
+        if dropped:
+            print(f"⚠ 입력 큐가 가득 차 {dropped}개의 입력이 기록되지 않았습니다. "
+                  f"(automation.input_queue_size 확인)")
         return self._recording_test_case_name
     
     def get_recording_test_case_name(self) -> Optional[str]:
@@ -165,6 +203,34 @@ class QAAutomationController:
         if not actions:
             raise ValueError("저장할 액션이 없습니다. 먼저 'record' 명령으로 액션을 기록하세요.")
         
+        # 녹화 시점의 capture_delay 값 가져오기
+        capture_delay = self.action_recorder.get_capture_delay()
+        
+        test_case_data = self._write_test_case(name, actions, capture_delay)
+        
+        # 저장된 녹화의 녹화 로그는 더 이상 필요 없음
+        if self._recording_log_path:
+            try:
+                os.remove(self._recording_log_path)
+            except OSError:
+                pass
+            self._recording_log_path = None
+        
+        return test_case_data
+    
+    def _write_test_case(self, name: str, actions: List[Action], capture_delay: float,
+                         created_at: Optional[str] = None) -> dict:
+        """테스트 케이스 JSON과 Replay Script 저장
+        
+        Args:
+            name: 테스트 케이스 이름
+            actions: 저장할 액션 목록
+            capture_delay: 녹화 시점의 capture_delay
+            created_at: 생성 시각 (None이면 현재 시각)
+            
+        Returns:
+            저장된 테스트 케이스 정보
+        """
         test_cases_dir = self.config_manager.get('test_cases.directory', 'test_cases')
         os.makedirs(test_cases_dir, exist_ok=True)
         
@@ -172,16 +238,13 @@ class QAAutomationController:
         script_path = os.path.join(test_cases_dir, f"{name}.py")
         json_path = os.path.join(test_cases_dir, f"{name}.json")
         
-        # 녹화 시점의 capture_delay 값 가져오기
-        capture_delay = self.action_recorder.get_capture_delay()
-        
         # Replay Script 생성 (capture_delay 포함)
         self.script_generator.generate_replay_script(actions, script_path, capture_delay=capture_delay)
         
         # 액션 데이터를 JSON으로 저장 (capture_delay 포함)
         test_case_data = {
             "name": name,
-            "created_at": datetime.now().isoformat(),
+            "created_at": created_at or datetime.now().isoformat(),
             "capture_delay": capture_delay,
             "script_path": script_path,
             "json_path": json_path,
@@ -191,9 +254,250 @@ class QAAutomationController:
         with open(json_path, 'w', encoding='utf-8') as f:
             json.dump(test_case_data, f, indent=2, ensure_ascii=False)
         
+        # replay 매니페스트 컴파일 (실패해도 replay 시 다시 시도하므로 저장은 계속)
+        try:
+            self.compile_test_case(name)
+        except Exception as e:
+            logger.warning(f"replay 매니페스트 컴파일 실패 (replay 시 다시 시도): {name}, {e}")
+        
+        # 녹화 시점 예상 프레임 분석 (설정 시에만, Vision LLM 호출 비용 발생)
+        if self.config_manager.get('automation.analyze_expected_frames', False):
+            try:
+                self.analyze_expected_frames(name)
+            except Exception as e:
+                logger.warning(f"예상 프레임 분석 실패 (검증 시 다시 분석): {name}, {e}")
+        
         self.current_test_case = test_case_data
         return test_case_data
     
+    def list_recording_logs(self) -> List[Dict[str, Any]]:
+        """저장되지 않은 녹화 로그 목록 (최근 순)
+        
+        Returns:
+            [{"path", "name", "created_at", "action_count", "truncated"}, ...]
+        """
+        self._ensure_initialized()
+        
+        test_cases_dir = self.config_manager.get('test_cases.directory', 'test_cases')
+        logs = []
+        for path in find_recording_logs(test_cases_dir):
+            try:
+                log = read_recording_log(path)
+            except (OSError, ValueError):
+                continue
+            logs.append({
+                "path": path,
+                "name": log.meta.get("name"),
+                "created_at": log.meta.get("created_at", ""),
+                "action_count": len(log.actions),
+                "truncated": log.truncated
+            })
+        return logs
+    
+    def recover_recording(self, log_path: str, name: Optional[str] = None) -> dict:
+        """녹화 로그를 테스트 케이스로 저장
+        
+        녹화 도중 프로세스가 종료된 경우 로그 끝의 손상된 레코드를 잘라내고
+        그 앞까지 기록된 액션으로 테스트 케이스 JSON과 Replay Script를 만든다.
+        
+        Args:
+            log_path: 녹화 로그(.qarec) 경로
+            name: 테스트 케이스 이름 (None이면 녹화 시 이름)
+            
+        Returns:
+            저장된 테스트 케이스 정보
+            
+        Raises:
+            FileNotFoundError: 로그 파일이 없을 때
+            ValueError: 로그 형식이 잘못되었거나 복구할 액션이 없을 때
+        """
+        self._ensure_initialized()
+        
+        if not os.path.exists(log_path):
+            raise FileNotFoundError(f"녹화 로그를 찾을 수 없습니다: {log_path}")
+        
+        test_case = log_to_test_case(recover_recording_log(log_path), name)
+        actions = [Action(**action) for action in test_case["actions"]]
+        actions = self.action_recorder.remove_trailing_stop_pattern(actions)
+        if not actions:
+            raise ValueError(f"복구할 액션이 없습니다: {log_path}")
+        
+        capture_delay = test_case["capture_delay"]
+        if capture_delay is None:
+            capture_delay = self.action_recorder.get_capture_delay()
+        return self._write_test_case(test_case["name"], actions, capture_delay, test_case["created_at"])
+    
+    def update_state_graph(self, force: bool = False) -> Dict[str, int]:
+        """테스트 케이스 녹화 기록으로 화면 상태 그래프 갱신
+        
+        마지막 갱신 이후 수정된 테스트 케이스만 다시 반영한다.
+        
+        Args:
+            force: True면 모든 테스트 케이스를 다시 반영
+            
+        Returns:
+            {"updated", "skipped", "failed", "states", "transitions"}
+        """
+        self._ensure_initialized()
+        
+        test_cases_dir = self.config_manager.get('test_cases.directory', 'test_cases')
+        graph = ScreenStateGraph.for_config(self.config_manager)
+        try:
+            return graph.update_from_directory(test_cases_dir, force=force)
+        finally:
+            graph.close()
+    
+    def replay_parallel(self, names: Optional[List[str]] = None, simulate: int = 0,
+                        report_dir: str = "reports") -> Tuple[ParallelReplayReport, str]:
+        """여러 게임 인스턴스에서 테스트 케이스를 동시에 의미론적 재실행
+        
+        인스턴스는 automation.parallel_replay.windows의 창 제목마다 하나씩 만든다.
+        
+        Args:
+            names: 재실행할 테스트 케이스 이름 (None이면 모든 테스트 케이스)
+            simulate: 0보다 크면 실제 창 대신 녹화 스크린샷을 보여주는 가상 창 수
+            report_dir: 통합 보고서 저장 디렉토리
+            
+        Returns:
+            (통합 보고서, 저장된 보고서 경로)
+            
+        Raises:
+            FileNotFoundError: 테스트 케이스가 없을 때
+            ValueError: 인스턴스가 설정되지 않았을 때
+        """
+        self._ensure_initialized()
+        
+        test_cases_dir = self.config_manager.get('test_cases.directory', 'test_cases')
+        if not names:
+            names = [test_case["name"] for test_case in self.list_test_cases()]
+        json_paths = []
+        for name in names:
+            json_path = os.path.join(test_cases_dir, f"{name}.json")
+            if not os.path.exists(json_path):
+                raise FileNotFoundError(f"테스트 케이스를 찾을 수 없습니다: {name}")
+            json_paths.append(json_path)
+        
+        orchestrator = ParallelReplayOrchestrator.from_config(
+            self.config_manager, ui_analyzer=self.ui_analyzer, simulate=simulate
+        )
+        report = orchestrator.run_files(json_paths)
+        return report, report.save(report_dir)
+
+    def replay_semantic(self, name: str, resume: bool = False,
+                        force: bool = False) -> Tuple[List[ReplayResult], Dict[str, Any]]:
+        """테스트 케이스를 의미론적 재실행 (액션마다 체크포인트 저장)
+
+        중단된 재실행은 resume으로 체크포인트 다음 액션부터 이어서 실행하며,
+        정확도 기록은 같은 세션에 합쳐진다.
+
+        Args:
+            name: 테스트 케이스 이름
+            resume: 체크포인트에서 이어서 실행
+            force: 현재 화면이 체크포인트 화면과 달라도 이어서 실행
+
+        Returns:
+            (전체 ReplayResult 리스트, 재실행 통계)
+
+        Raises:
+            FileNotFoundError: 테스트 케이스가 없을 때
+            CheckpointMismatchError: 현재 화면이 체크포인트 화면과 다를 때
+        """
+        self._ensure_initialized()
+
+        test_cases_dir = self.config_manager.get('test_cases.directory', 'test_cases')
+        json_path = os.path.join(test_cases_dir, f"{name}.json")
+        if not os.path.exists(json_path):
+            raise FileNotFoundError(f"테스트 케이스를 찾을 수 없습니다: {name}")
+        name, actions = load_test_case_actions(json_path)
+
+        replayer = SemanticActionReplayer(self.config_manager, ui_analyzer=self.ui_analyzer)
+        tracker = AccuracyTracker.for_config(name, self.config_manager)
+        # 이전 실행에서 불안정했던 액션만 대기/재시도 강화
+        replayer.flaky_actions = tracker.get_flaky_actions(
+            self.config_manager.get('automation.flaky.threshold', 0.3),
+            self.config_manager.get('automation.flaky.min_observations', DEFAULT_FLAKY_MIN_OBSERVATIONS)
+        )
+        replay = CheckpointedReplay.for_test_case(replayer, self.config_manager, name, tracker=tracker)
+        try:
+            results = replay.run(name, actions, resume=resume, force=force)
+        finally:
+            tracker.close()
+        return results, replayer.get_statistics()
+
+    def analyze_expected_frames(self, name: str, force: bool = False,
+                                progress_callback=None) -> Dict[str, int]:
+        """테스트 케이스의 예상 프레임을 Vision LLM으로 분석하여 저장
+        
+        저장된 분석 결과는 replay 검증 시 재사용되므로
+        검증 단계에서는 실제 캡처 화면만 분석한다.
+        모델/프롬프트가 바뀌었거나 프레임이 변경된 결과만 다시 분석한다.
+        
+        Args:
+            name: 테스트 케이스 이름
+            force: True면 유효한 결과도 다시 분석
+            progress_callback: 진행 콜백 (완료 수, 전체 수, 프레임 경로)
+            
+        Returns:
+            {"total", "analyzed", "cached", "missing", "failed"} 카운트
+            
+        Raises:
+            FileNotFoundError: 테스트 케이스가 없을 때
+        """
+        self._ensure_initialized()
+        
+        test_cases_dir = self.config_manager.get('test_cases.directory', 'test_cases')
+        json_path = os.path.join(test_cases_dir, f"{name}.json")
+        
+        if not os.path.exists(json_path):
+            raise FileNotFoundError(f"테스트 케이스를 찾을 수 없습니다: {name}")
+        
+        with open(json_path, 'r', encoding='utf-8') as f:
+            test_case = json.load(f)
+        
+        store = ExpectedAnalysisStore.for_test_case(self.config_manager, name, self.ui_analyzer)
+        return store.analyze_test_case(test_case, force=force, progress_callback=progress_callback)
+    
+    def compile_test_case(self, name: str) -> ReplayManifest:
+        """테스트 케이스를 replay 매니페스트로 컴파일
+        
+        예상 스크린샷의 해시, 썸네일, 액션 타이밍을 미리 계산하여
+        <test_cases_dir>/<name>/manifest.json에 저장한다.
+        
+        Args:
+            name: 테스트 케이스 이름
+            
+        Returns:
+            ReplayManifest 객체
+            
+        Raises:
+            FileNotFoundError: 테스트 케이스가 없을 때
+        """
+        test_cases_dir = self.config_manager.get('test_cases.directory', 'test_cases')
+        json_path = os.path.join(test_cases_dir, f"{name}.json")
+        
+        if not os.path.exists(json_path):
+            raise FileNotFoundError(f"테스트 케이스를 찾을 수 없습니다: {name}")
+        
+        compiler = ReplayManifestCompiler(self.config_manager)
+        return compiler.compile_file(json_path, get_manifest_path(test_cases_dir, name))
+    
+    def get_region_masks(self, name: str) -> RegionMaskStore:
+        """테스트 케이스의 변동 영역 마스크 저장소 조회
+        
+        Args:
+            name: 테스트 케이스 이름
+            
+        Returns:
+            RegionMaskStore 객체 (<test_cases_dir>/<name>/masks.json)
+            
+        Raises:
+            FileNotFoundError: 테스트 케이스가 없을 때
+        """
+        test_cases_dir = self.config_manager.get('test_cases.directory', 'test_cases')
+        if not os.path.exists(os.path.join(test_cases_dir, f"{name}.json")):
+            raise FileNotFoundError(f"테스트 케이스를 찾을 수 없습니다: {name}")
+        return RegionMaskStore.for_test_case(self.config_manager, name)
+    
     def _action_to_dict(self, action: Action) -> dict:
         """Action 객체를 딕셔너리로 변환
         
@@ -203,29 +507,7 @@ class QAAutomationController:
         Returns:
             딕셔너리
         """
-        result = {
-            "timestamp": action.timestamp,
-            "action_type": action.action_type,
-            "x": action.x,
-            "y": action.y,
-            "description": action.description
-        }
-        
-        # 선택적 필드 추가
-        if action.screenshot_path:
-            result["screenshot_path"] = action.screenshot_path
-        if action.screenshot_before_path:
-            result["screenshot_before_path"] = action.screenshot_before_path
-        if action.button:
-            result["button"] = action.button
-        if action.key:
-            result["key"] = action.key
-        if action.scroll_dx is not None:
-            result["scroll_dx"] = action.scroll_dx
-        if action.scroll_dy is not None:
-            result["scroll_dy"] = action.scroll_dy
-        
-        return result
+        return action_to_dict(action)
     
     def load_test_case(self, name: str) -> dict:
         """테스트 케이스 로드
@@ -252,13 +534,17 @@ class QAAutomationController:
         
         return self.current_test_case
     
-    def replay_test_case(self, verify: bool = False):
+    def replay_test_case(self, verify: bool = False, timing: Optional[str] = None,
+                         speed: Optional[float] = None):
         """테스트 케이스 재실행 (Requirements 6.1)
         
         로드된 테스트 케이스의 Replay Script를 실행한다.
+        timing이 'timeline'이면 녹화 시각에 맞춰 재실행한다 (--timeline --speed).
         
         Args:
             verify: 검증 모드 활성화 여부
+            timing: 재실행 타이밍 ('delay' 또는 'timeline', None이면 automation.replay_timing)
+            speed: 타임라인 재생 배속 (None이면 automation.replay_speed)
             
         Raises:
             ValueError: 로드된 테스트 케이스가 없을 때
@@ -276,6 +562,12 @@ class QAAutomationController:
         cmd = ['python', script_path]
         if verify:
             cmd.append('--verify')
+        if timing is None:
+            timing = self.config_manager.get('automation.replay_timing', 'delay')
+        if timing == 'timeline':
+            if speed is None:
+                speed = self.config_manager.get('automation.replay_speed', DEFAULT_REPLAY_SPEED)
+            cmd.extend(['--timeline', '--speed', str(speed)])
         
         print(f"Replay Script 실행: {script_path}")
         result = subprocess.run(cmd, capture_output=False)
@@ -336,8 +628,9 @@ class QAAutomationController:
                 raise ValueError("테스트 케이스가 지정되지 않았습니다. 먼저 테스트 케이스를 로드하거나 이름을 지정하세요.")
         
         # AccuracyTracker 생성 및 세션 목록 조회
-        tracker = AccuracyTracker(test_case_name)
+        tracker = AccuracyTracker.for_config(test_case_name, self.config_manager)
         sessions = tracker.list_sessions()
+        tracker.close()
         
         return sessions
     
@@ -375,6 +668,12 @@ class QAAutomationController:
         with open(json_path, 'w', encoding='utf-8') as f:
             json.dump(enriched_test_case, f, indent=2, ensure_ascii=False)
         
+        # 예상 프레임 분석도 함께 갱신 (이미 유효한 결과는 재사용)
+        try:
+            self.analyze_expected_frames(name)
+        except Exception as e:
+            logger.warning(f"예상 프레임 분석 갱신 실패: {name}, {e}")
+        
         self.current_test_case = enriched_test_case
         return enriched_test_case, result
     
@@ -410,33 +709,67 @@ class QAAutomationController:
             else:
                 raise ValueError("테스트 케이스가 지정되지 않았습니다.")
         
-        # 실행 이력 조회
-        sessions = self.get_execution_history(test_case_name)
+        tracker = AccuracyTracker.for_config(test_case_name, self.config_manager)
+        try:
+            return tracker.get_execution_summary()
+        finally:
+            tracker.close()
+    
+    def get_daily_statistics(self, test_case_name: Optional[str] = None,
+                             days: Optional[int] = None) -> List[Dict[str, Any]]:
+        """날짜별 실행 통계 (세션 저장 시 갱신되는 날짜별 집계 조회)
+        
+        Args:
+            test_case_name: 테스트 케이스 이름 (None이면 모든 테스트 케이스 합산)
+            days: 오늘을 포함한 최근 며칠(달력 기준)만 (None이면 전체)
+            
+        Returns:
+            날짜별 통계 리스트 (최신순, AccuracyStore.daily_rollups 참고)
+            
+        Raises:
+            ValueError: 정확도 기록이 SQLite 저장소에 있지 않을 때
+        """
+        self._ensure_initialized()
         
-        if not sessions:
+        if self.config_manager.get('automation.accuracy_backend', DEFAULT_ACCURACY_BACKEND) != 'sqlite':
+            raise ValueError("날짜별 통계는 automation.accuracy_backend가 'sqlite'일 때만 지원합니다.")
+        store = AccuracyStore.for_data_dir(self.config_manager.get('automation.accuracy_data_dir', 'accuracy_data'))
+        try:
+            return store.daily_rollups(test_case_name, days)
+        finally:
+            store.close()
+    
+    def get_flaky_report(self, test_case_name: Optional[str] = None,
+                         limit: int = 20) -> Dict[str, List[Dict[str, Any]]]:
+        """불안정 액션/테스트 케이스 순위 (세션 저장 시 갱신되는 불안정성 지수 조회)
+        
+        Args:
+            test_case_name: 테스트 케이스 이름 (None이면 모든 테스트 케이스)
+            limit: 최대 개수
+            
+        Returns:
+            {"actions": AccuracyStore.flaky_actions 결과,
+             "test_cases": AccuracyStore.flaky_test_cases 결과 (test_case_name이 없을 때만)}
+            
+        Raises:
+            ValueError: 정확도 기록이 SQLite 저장소에 있지 않을 때
+        """
+        self._ensure_initialized()
+        
+        if self.config_manager.get('automation.accuracy_backend', DEFAULT_ACCURACY_BACKEND) != 'sqlite':
+            raise ValueError("불안정 액션 조회는 automation.accuracy_backend가 'sqlite'일 때만 지원합니다.")
+        threshold = self.config_manager.get('automation.flaky.threshold', 0.3)
+        min_observations = self.config_manager.get('automation.flaky.min_observations',
+                                                   DEFAULT_FLAKY_MIN_OBSERVATIONS)
+        store = AccuracyStore.for_data_dir(self.config_manager.get('automation.accuracy_data_dir', 'accuracy_data'))
+        try:
             return {
-                "test_case_name": test_case_name,
-                "total_executions": 0,
-                "avg_success_rate": 0.0,
-                "total_errors": 0,
-                "avg_semantic_match_rate": 0.0,
-                "latest_execution": None
+                "actions": store.flaky_actions(test_case_name, limit, min_observations),
+                "test_cases": ([] if test_case_name is not None
+                               else store.flaky_test_cases(limit, threshold, min_observations))
             }
-        
-        # 통계 계산
-        total_executions = len(sessions)
-        total_success_rate = sum(s.get("success_rate", 0.0) for s in sessions)
-        total_errors = sum(s.get("failure_count", 0) for s in sessions)
-        total_semantic_rate = sum(s.get("semantic_match_rate", 0.0) for s in sessions)
-        
-        return {
-            "test_case_name": test_case_name,
-            "total_executions": total_executions,
-            "avg_success_rate": total_success_rate / total_executions if total_executions > 0 else 0.0,
-            "total_errors": total_errors,
-            "avg_semantic_match_rate": total_semantic_rate / total_executions if total_executions > 0 else 0.0,
-            "latest_execution": sessions[0] if sessions else None
-        }
+        finally:
+            store.close()
     
     def cleanup(self):
         """리소스 정리
@@ -445,6 +778,8 @@ class QAAutomationController:
         """
         if self.input_monitor and self.input_monitor.is_recording:
             self.input_monitor.stop_monitoring()
+        if self.action_recorder:
+            self.action_recorder.close_log()
         
         if self.game_manager and self.game_manager.is_game_running():
             self.game_manager.stop_game()
@@ -0,0 +1,325 @@
+"""
+RecordingLog - 녹화 중 액션을 즉시 기록하는 추가 전용(append-only) 바이너리 로그
+
+녹화된 액션은 save_test_case 전까지 메모리(ActionRecorder.actions)에만 있으므로
+긴 녹화 도중 프로세스가 종료되면 모두 잃는다. ActionRecorder는 액션을 기록할 때마다
+이 로그에 한 레코드씩 추가하고, 로그는 테스트 케이스 JSON으로 변환하여 복구할 수 있다.
+
+파일 형식:
+    헤더: b"QAREC" + 버전(1바이트)
+    레코드: [본문 길이 uint32][본문 CRC32 uint32][본문]
+        본문 첫 바이트가 종류: 1 = 메타데이터(JSON), 2 = 액션
+
+액션 본문은 null 필드를 저장하지 않는다:
+    [액션 종류 코드 uint8][x int32][y int32][선택 필드 비트마스크 uint16]
+    [timestamp][description] (길이 uint32 + UTF-8)
+    [선택 필드...] (_OPTIONAL_FIELDS 순서, 비트가 켜진 것만)
+
+레코드는 기록 즉시 OS에 전달(flush)되고, fsync는 fsync_interval초마다 수행한다.
+(프로세스 종료에는 모든 레코드가, 전원 차단에는 마지막 fsync 이전 레코드가 보존됨)
+마지막 레코드가 쓰다 만 상태이거나 CRC가 맞지 않으면 그 앞까지만 읽는다.
+"""
+
+import os
+import json
+import time
+import struct
+import logging
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+RECORDING_LOG_SUFFIX = ".qarec"
+RECORDING_LOG_DIRNAME = "recordings"
+DEFAULT_FSYNC_INTERVAL = 1.0
+
+LOG_MAGIC = b"QAREC"
+LOG_VERSION = 1
+
+RECORD_META = 1
+RECORD_ACTION = 2
+
+_FILE_HEADER = LOG_MAGIC + bytes([LOG_VERSION])
+_RECORD_HEADER = struct.Struct("<II")  # 본문 길이, CRC32
+_ACTION_HEAD = struct.Struct("<BiiH")  # 종류 코드, x, y, 선택 필드 비트마스크
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_I64 = struct.Struct("<q")
+_PATH_POINT = struct.Struct("<qii")
+
+# 액션 종류 코드 (목록에 없는 종류는 _CUSTOM_TYPE 뒤에 문자열로 저장)
+ACTION_TYPE_CODES = ('click', 'key_press', 'type_text', 'hotkey', 'scroll', 'wait', 'drag', 'move')
+_CUSTOM_TYPE = 0xFF
+
+# 선택 필드 (이름, 형식) - 순서가 곧 비트 번호이므로 뒤에만 추가할 것
+_OPTIONAL_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("screenshot_path", "str"),
+    ("screenshot_before_path", "str"),
+    ("button", "str"),
+    ("key", "str"),
+    ("scroll_dx", "i32"),
+    ("scroll_dy", "i32"),
+    ("timestamp_ns", "i64"),
+    ("path", "path"),
+    ("text", "str"),
+)
+
+
+def get_recording_log_path(test_cases_dir: str, test_case_name: Optional[str] = None,
+                           started_at: Optional[datetime] = None) -> str:
+    """녹화 로그 경로 (<test_cases_dir>/recordings/<이름>_<시작 시각>.qarec)"""
+    stamp = (started_at or datetime.now()).strftime("%Y%m%d_%H%M%S")
+    filename = f"{test_case_name or 'recording'}_{stamp}{RECORDING_LOG_SUFFIX}"
+    return os.path.join(test_cases_dir, RECORDING_LOG_DIRNAME, filename)
+
+
+def find_recording_logs(test_cases_dir: str) -> List[str]:
+    """녹화 로그 파일 목록 (최근 수정 순)"""
+    log_dir = os.path.join(test_cases_dir, RECORDING_LOG_DIRNAME)
+    if not os.path.isdir(log_dir):
+        return []
+    paths = [
+        os.path.join(log_dir, filename) for filename in os.listdir(log_dir)
+        if filename.endswith(RECORDING_LOG_SUFFIX)
+    ]
+    return sorted(paths, key=os.path.getmtime, reverse=True)
+
+
+def _pack_str(value: str) -> bytes:
+    data = value.encode('utf-8')
+    return _U32.pack(len(data)) + data
+
+
+def _unpack_str(buf: memoryview, offset: int) -> Tuple[str, int]:
+    (length,) = _U32.unpack_from(buf, offset)
+    offset += _U32.size
+    return str(buf[offset:offset + length], 'utf-8'), offset + length
+
+
+def encode_action(action: Dict[str, Any]) -> bytes:
+    """테스트 케이스 JSON 형식의 액션 딕셔너리를 레코드 본문으로 변환"""
+    action_type = action["action_type"]
+    type_code = ACTION_TYPE_CODES.index(action_type) if action_type in ACTION_TYPE_CODES else _CUSTOM_TYPE
+
+    mask = 0
+    tail = []
+    for bit, (name, kind) in enumerate(_OPTIONAL_FIELDS):
+        value = action.get(name)
+        if value is None:
+            continue
+        mask |= 1 << bit
+        if kind == "str":
+            tail.append(_pack_str(value))
+        elif kind == "i32":
+            tail.append(_I32.pack(value))
+        elif kind == "i64":
+            tail.append(_I64.pack(value))
+        else:
+            tail.append(_U32.pack(len(value)))
+            tail.extend(_PATH_POINT.pack(t, x, y) for t, x, y in value)
+
+    parts = [bytes([RECORD_ACTION]), _ACTION_HEAD.pack(type_code, action.get("x", 0), action.get("y", 0), mask)]
+    if type_code == _CUSTOM_TYPE:
+        parts.append(_pack_str(action_type))
+    parts.append(_pack_str(action.get("timestamp", "")))
+    parts.append(_pack_str(action.get("description", "")))
+    return b"".join(parts + tail)
+
+
+def decode_action(body: memoryview) -> Dict[str, Any]:
+    """레코드 본문을 액션 딕셔너리로 변환 (encode_action의 역)"""
+    type_code, x, y, mask = _ACTION_HEAD.unpack_from(body, 1)
+    offset = 1 + _ACTION_HEAD.size
+    if type_code == _CUSTOM_TYPE:
+        action_type, offset = _unpack_str(body, offset)
+    else:
+        action_type = ACTION_TYPE_CODES[type_code]
+    timestamp, offset = _unpack_str(body, offset)
+    description, offset = _unpack_str(body, offset)
+
+    action: Dict[str, Any] = {
+        "timestamp": timestamp,
+        "action_type": action_type,
+        "x": x,
+        "y": y,
+        "description": description
+    }
+    for bit, (name, kind) in enumerate(_OPTIONAL_FIELDS):
+        if not mask & (1 << bit):
+            continue
+        if kind == "str":
+            action[name], offset = _unpack_str(body, offset)
+        elif kind == "i32":
+            (action[name],) = _I32.unpack_from(body, offset)
+            offset += _I32.size
+        elif kind == "i64":
+            (action[name],) = _I64.unpack_from(body, offset)
+            offset += _I64.size
+        else:
+            (count,) = _U32.unpack_from(body, offset)
+            offset += _U32.size
+            action[name] = [list(p) for p in _PATH_POINT.iter_unpack(body[offset:offset + count * _PATH_POINT.size])]
+            offset += count * _PATH_POINT.size
+    return action
+
+
+class RecordingLogWriter:
+    """녹화 로그 기록기 (첫 레코드를 기록할 때 파일 생성)"""
+
+    def __init__(self, path: str, meta: Optional[Dict[str, Any]] = None,
+                 fsync_interval: float = DEFAULT_FSYNC_INTERVAL):
+        """
+        Args:
+            path: 로그 파일 경로
+            meta: 메타데이터 (name, created_at, capture_delay 등)
+            fsync_interval: fsync 간격 (초). 0이면 레코드마다, 음수면 닫을 때만
+        """
+        self.path = path
+        self.meta = dict(meta or {})
+        self.fsync_interval = fsync_interval
+        self.action_count = 0
+        self._file = None
+        self._last_sync = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def open(self):
+        """파일을 만들고 메타데이터 레코드 기록 (이미 열려 있으면 무시)"""
+        if self._file is not None:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, 'wb')
+        self._file.write(_FILE_HEADER)
+        self._write(bytes([RECORD_META]) + json.dumps(self.meta, ensure_ascii=False, default=str).encode('utf-8'))
+        self.sync()
+
+    def append(self, action: Dict[str, Any]):
+        """액션 레코드 추가 (테스트 케이스 JSON 형식의 딕셔너리)"""
+        self.open()
+        self._write(encode_action(action))
+        self.action_count += 1
+
+    def sync(self):
+        """기록된 레코드를 디스크에 반영"""
+        if self._file is None:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """fsync 후 파일 닫기"""
+        if self._file is None:
+            return
+        try:
+            self.sync()
+        finally:
+            self._file.close()
+            self._file = None
+
+    def _write(self, body: bytes):
+        self._file.write(_RECORD_HEADER.pack(len(body), zlib.crc32(body)) + body)
+        self._file.flush()
+        if self.fsync_interval >= 0 and time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+
+@dataclass
+class RecordingLog:
+    """읽어들인 녹화 로그"""
+    path: str
+    meta: Dict[str, Any] = field(default_factory=dict)
+    actions: List[Dict[str, Any]] = field(default_factory=list)
+    valid_size: int = 0  # 온전한 레코드가 끝나는 위치 (바이트)
+    truncated: bool = False  # 끝에 불완전하거나 손상된 레코드가 있었는지
+
+
+def read_recording_log(path: str) -> RecordingLog:
+    """녹화 로그 읽기 (파일 전체를 한 번에 읽어 파싱)
+
+    Raises:
+        ValueError: 녹화 로그 파일이 아닐 때
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data.startswith(LOG_MAGIC):
+        raise ValueError(f"녹화 로그 파일이 아닙니다: {path}")
+    if len(data) < len(_FILE_HEADER) or data[len(LOG_MAGIC)] != LOG_VERSION:
+        raise ValueError(f"지원하지 않는 녹화 로그 버전: {path}")
+
+    log = RecordingLog(path=path)
+    buf = memoryview(data)
+    offset = len(_FILE_HEADER)
+    while offset < len(data):
+        if offset + _RECORD_HEADER.size > len(data):
+            break
+        length, crc = _RECORD_HEADER.unpack_from(buf, offset)
+        start = offset + _RECORD_HEADER.size
+        body = buf[start:start + length]
+        if length == 0 or len(body) < length or zlib.crc32(body) != crc:
+            break
+        try:
+            if body[0] == RECORD_META:
+                log.meta = json.loads(str(body[1:], 'utf-8'))
+            elif body[0] == RECORD_ACTION:
+                log.actions.append(decode_action(body))
+        except (ValueError, IndexError, struct.error) as e:
+            logger.warning(f"녹화 로그 레코드 해석 실패: {path}@{offset}: {e}")
+            break
+        offset = start + length
+
+    log.valid_size = offset
+    log.truncated = offset < len(data)
+    if log.truncated:
+        logger.warning(f"녹화 로그 끝의 손상된 레코드 무시: {path} ({len(data) - offset}바이트)")
+    return log
+
+
+def recover_recording_log(path: str) -> RecordingLog:
+    """녹화 로그를 읽고 끝의 손상된 레코드를 파일에서 잘라냄"""
+    log = read_recording_log(path)
+    if log.truncated:
+        with open(path, 'r+b') as f:
+            f.truncate(log.valid_size)
+            f.flush()
+            os.fsync(f.fileno())
+    return log
+
+
+def log_to_test_case(log: RecordingLog, name: Optional[str] = None) -> Dict[str, Any]:
+    """녹화 로그를 테스트 케이스 JSON 형식으로 변환 (script_path/json_path 제외)"""
+    return {
+        "name": name or log.meta.get("name") or os.path.basename(log.path)[:-len(RECORDING_LOG_SUFFIX)],
+        "created_at": log.meta.get("created_at", datetime.now().isoformat()),
+        "capture_delay": log.meta.get("capture_delay"),
+        "actions": [dict(action) for action in log.actions]
+    }
+
+
+def write_test_case_log(test_case: Dict[str, Any], path: str,
+                     fsync_interval: float = -1) -> RecordingLogWriter:
+    """테스트 케이스 JSON을 녹화 로그로 저장
+
+    Args:
+        test_case: 테스트 케이스 데이터 ("actions" 포함)
+        path: 로그 파일 경로
+        fsync_interval: fsync 간격 (기본: 닫을 때만)
+
+    Returns:
+        닫힌 RecordingLogWriter (action_count 확인용)
+    """
+    meta = {k: v for k, v in test_case.items() if k != "actions"}
+    writer = RecordingLogWriter(path, meta, fsync_interval)
+    try:
+        writer.open()
+        for action in test_case.get("actions", []):
+            writer.append(action)
+    finally:
+        writer.close()
+    return writer
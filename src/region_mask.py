@@ -0,0 +1,241 @@
+"""
+RegionMaskStore - 테스트 케이스별 변동 영역 마스크
+
+시계, 파티클, 애니메이션 배너처럼 replay마다 바뀌는 화면 영역을
+타일 인덱스(TileComparator 격자 기준)로 기록한다.
+
+- 수동 마스크: 전체 액션 공통('*') 또는 액션별로 영역을 직접 지정
+- 학습 마스크: 검증에서 통과(또는 Vision LLM이 의미적 일치로 판단)한 프레임의
+  타일 변경 이력을 누적하여, 자주 바뀌는 타일을 자동으로 변동 영역으로 판단
+
+화면 전환처럼 넓은 영역이 바뀐 관측은 변동 영역 학습에서 제외한다.
+
+저장 위치: <test_cases_dir>/<테스트_케이스_이름>/masks.json
+"""
+
+import os
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.replay_manifest import get_artifact_dir
+from src.tile_comparator import DEFAULT_TILE_GRID
+
+logger = logging.getLogger(__name__)
+
+
+MASKS_FILENAME = "masks.json"
+GLOBAL_KEY = "*"
+
+
+def get_masks_path(test_cases_dir: str, test_case_name: str) -> str:
+    """변동 영역 마스크 파일 경로"""
+    return os.path.join(get_artifact_dir(test_cases_dir, test_case_name), MASKS_FILENAME)
+
+
+def region_to_tiles(x: float, y: float, width: float, height: float,
+                    grid: int = DEFAULT_TILE_GRID) -> List[int]:
+    """프레임 비율 좌표 영역(0.0~1.0)과 겹치는 타일 인덱스 목록
+
+    Args:
+        x, y: 영역 좌상단 (프레임 너비/높이 대비 비율)
+        width, height: 영역 크기 (비율)
+        grid: 타일 격자 크기
+    """
+    x0, y0 = max(0.0, x), max(0.0, y)
+    x1, y1 = min(1.0, x + width), min(1.0, y + height)
+    if x1 <= x0 or y1 <= y0:
+        return []
+    col0, col1 = int(x0 * grid), min(grid - 1, int((x1 * grid) - 1e-9))
+    row0, row1 = int(y0 * grid), min(grid - 1, int((y1 * grid) - 1e-9))
+    return [row * grid + col for row in range(row0, row1 + 1) for col in range(col0, col1 + 1)]
+
+
+@dataclass
+class ActionMask:
+    """액션 하나(또는 전체 공통)의 마스크 정보"""
+    manual_tiles: Set[int] = field(default_factory=set)
+    observations: int = 0
+    change_counts: Dict[int, int] = field(default_factory=dict)
+
+    def learned_tiles(self, min_observations: int, volatile_ratio: float) -> Set[int]:
+        """누적 관측에서 변동 영역으로 판단된 타일"""
+        if self.observations < min_observations:
+            return set()
+        return {
+            tile for tile, count in self.change_counts.items()
+            if count / self.observations >= volatile_ratio
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "manual_tiles": sorted(self.manual_tiles),
+            "observations": self.observations,
+            "change_counts": {str(t): c for t, c in sorted(self.change_counts.items())}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ActionMask':
+        return cls(
+            manual_tiles=set(data.get("manual_tiles", [])),
+            observations=data.get("observations", 0),
+            change_counts={int(t): c for t, c in data.get("change_counts", {}).items()}
+        )
+
+
+class RegionMaskStore:
+    """테스트 케이스별 변동 영역 마스크 저장소"""
+
+    def __init__(self, path: str, grid: int = DEFAULT_TILE_GRID, min_observations: int = 3,
+                 volatile_ratio: float = 0.3, max_learn_ratio: float = 0.25):
+        """
+        Args:
+            path: 마스크 JSON 파일 경로
+            grid: 타일 격자 크기 (TileComparator와 동일해야 함)
+            min_observations: 학습 마스크를 적용하기 위한 최소 관측 수
+            volatile_ratio: 관측 중 이 비율 이상 바뀐 타일을 변동 영역으로 판단
+            max_learn_ratio: 이 비율보다 많은 타일이 바뀐 관측은 학습에서 제외 (화면 전환 등)
+        """
+        self.path = path
+        self.grid = grid
+        self.min_observations = min_observations
+        self.volatile_ratio = volatile_ratio
+        self.max_learn_ratio = max_learn_ratio
+        self._masks: Dict[str, ActionMask] = {}
+        self._dirty = False
+        self.load()
+
+    @classmethod
+    def for_test_case(cls, config, test_case_name: str) -> 'RegionMaskStore':
+        """설정 값으로 테스트 케이스의 마스크 저장소 생성"""
+        test_cases_dir = config.get('test_cases.directory', 'test_cases')
+        return cls(
+            get_masks_path(test_cases_dir, test_case_name),
+            grid=config.get('automation.tile_grid', DEFAULT_TILE_GRID),
+            min_observations=config.get('automation.mask_min_observations', 3),
+            volatile_ratio=config.get('automation.mask_volatile_ratio', 0.3)
+        )
+
+    @property
+    def dirty(self) -> bool:
+        """저장되지 않은 변경이 있는지"""
+        return self._dirty
+
+    def load(self):
+        """저장된 마스크 로드 (파일이 없거나 격자가 다르면 빈 저장소)"""
+        self._masks = {}
+        self._dirty = False
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"마스크 파일 로드 실패, 무시: {self.path} ({e})")
+            return
+        if data.get("grid") != self.grid:
+            logger.warning(f"마스크 타일 격자 불일치 ({data.get('grid')} != {self.grid}), 무시: {self.path}")
+            return
+        for key, entry in data.get("actions", {}).items():
+            self._masks[key] = ActionMask.from_dict(entry)
+
+    def save(self):
+        """마스크 저장 (임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "grid": self.grid,
+            "actions": {key: mask.to_dict() for key, mask in sorted(self._masks.items())}
+        }
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    @staticmethod
+    def _key(action_index: Optional[int]) -> str:
+        return GLOBAL_KEY if action_index is None else str(action_index)
+
+    def _entry(self, action_index: Optional[int]) -> ActionMask:
+        return self._masks.setdefault(self._key(action_index), ActionMask())
+
+    def get_mask(self, action_index: Optional[int]) -> Set[int]:
+        """액션에 적용할 마스크 타일 (공통 수동 + 액션 수동 + 학습)"""
+        tiles: Set[int] = set()
+        common = self._masks.get(GLOBAL_KEY)
+        if common:
+            tiles |= common.manual_tiles
+        if action_index is not None:
+            entry = self._masks.get(self._key(action_index))
+            if entry:
+                tiles |= entry.manual_tiles
+                tiles |= entry.learned_tiles(self.min_observations, self.volatile_ratio)
+        return tiles
+
+    def add_tiles(self, action_index: Optional[int], tiles: Iterable[int]) -> List[int]:
+        """수동 마스크 타일 추가 (action_index가 None이면 전체 액션 공통)
+
+        Returns:
+            추가된 타일 목록
+        """
+        valid = [t for t in tiles if 0 <= t < self.grid * self.grid]
+        self._entry(action_index).manual_tiles.update(valid)
+        self._dirty = True
+        return valid
+
+    def add_region(self, action_index: Optional[int], x: float, y: float,
+                   width: float, height: float) -> List[int]:
+        """비율 좌표 영역을 수동 마스크로 추가"""
+        return self.add_tiles(action_index, region_to_tiles(x, y, width, height, self.grid))
+
+    def record_observation(self, action_index: int, changed_tiles: Iterable[int]) -> bool:
+        """통과한 프레임의 타일 변경 관측 기록 (변동 영역 학습)
+
+        Args:
+            action_index: 액션 인덱스
+            changed_tiles: 예상 프레임 대비 달라진 타일 (마스크 포함)
+
+        Returns:
+            학습에 반영되었는지 여부 (넓은 영역 변경은 제외)
+        """
+        changed = set(changed_tiles)
+        if len(changed) > self.max_learn_ratio * self.grid * self.grid:
+            return False
+        entry = self._entry(action_index)
+        entry.observations += 1
+        for tile in changed:
+            entry.change_counts[tile] = entry.change_counts.get(tile, 0) + 1
+        self._dirty = True
+        return True
+
+    def clear(self, action_index: Optional[int] = None, learned_only: bool = False):
+        """마스크 초기화
+
+        Args:
+            action_index: 지정하면 해당 액션만, None이면 전체
+            learned_only: True면 학습 이력만 지우고 수동 마스크는 유지
+        """
+        keys = list(self._masks) if action_index is None else [self._key(action_index)]
+        for key in keys:
+            if key not in self._masks:
+                continue
+            if learned_only:
+                self._masks[key].observations = 0
+                self._masks[key].change_counts = {}
+            else:
+                del self._masks[key]
+        self._dirty = True
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """마스크 요약 {키: {"manual", "learned", "observations"}}"""
+        result = {}
+        for key, mask in sorted(self._masks.items(), key=lambda kv: (kv[0] != GLOBAL_KEY, kv[0].zfill(8))):
+            result[key] = {
+                "manual": sorted(mask.manual_tiles),
+                "learned": sorted(mask.learned_tiles(self.min_observations, self.volatile_ratio)),
+                "observations": mask.observations
+            }
+        return result
@@ -0,0 +1,333 @@
+"""
+ReplayCheckpoint - 긴 의미론적 replay의 체크포인트와 이어서 실행
+
+액션을 하나 실행할 때마다, 그리고 재실행이 예외로 중단될 때
+다음 정보를 체크포인트 파일에 저장한다.
+- 완료한 액션 수(다음에 실행할 액션 인덱스)와 지금까지의 ReplayResult
+- 기대 화면 지문: 액션 직후 실제 화면 aHash와 녹화 시 다음 액션 전 화면 aHash
+- AccuracyTracker 세션 ID
+정확도 세션도 체크포인트와 같은 시점에 함께 저장한다 (SQLite 백엔드는 바뀐 행만 쓰므로 액션마다 저장해도 가볍다).
+automation.checkpoint_interval을 늘리면 그 액션 수마다 저장하며, 이 경우 프로세스가 강제 종료되면
+마지막 체크포인트 이후 액션은 다시 실행된다.
+
+재실행이 중단(크래시, 게임 멈춤)되면 이어서 실행 모드로 체크포인트 다음 액션부터 계속한다.
+시작 전에 현재 화면이 체크포인트 화면과 같은지 해시 거리로 확인하고, 해시가 다르면
+화면 상태 그래프(graph 명령)로 두 화면이 같은 상태로 인식되는지 확인한다.
+정확도 기록은 같은 AccuracyTracker 세션에 이어서 저장되므로 나눠 실행한 결과가 하나로 합쳐진다.
+재실행을 끝까지 마치면 체크포인트는 삭제된다.
+
+저장 위치: <test_cases_dir>/<테스트_케이스_이름>/replay_checkpoint.json
+"""
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image
+
+from src.accuracy_tracker import AccuracyTracker
+from src.frame_hasher import average_hash_hex, hex_hamming_distance
+from src.replay_manifest import get_artifact_dir
+from src.screen_state_graph import DEFAULT_MATCH_DISTANCE, ScreenStateGraph, get_state_graph_path
+from src.semantic_action_recorder import SemanticAction
+from src.semantic_action_replayer import ReplayResult, SemanticActionReplayer
+
+logger = logging.getLogger(__name__)
+
+
+CHECKPOINT_FILENAME = "replay_checkpoint.json"
+CHECKPOINT_VERSION = 1
+DEFAULT_CHECKPOINT_INTERVAL = 1  # 체크포인트/정확도 세션 저장 간격 (액션 수, 기본은 액션마다)
+_TUPLE_FIELDS = ("original_coords", "actual_coords", "coordinate_change")
+
+
+def get_checkpoint_path(test_cases_dir: str, test_case_name: str) -> str:
+    """replay 체크포인트 파일 경로"""
+    return os.path.join(get_artifact_dir(test_cases_dir, test_case_name), CHECKPOINT_FILENAME)
+
+
+def result_to_dict(result: ReplayResult) -> Dict[str, Any]:
+    return asdict(result)
+
+
+def result_from_dict(data: Dict[str, Any]) -> ReplayResult:
+    data = dict(data)
+    for key in _TUPLE_FIELDS:
+        if data.get(key) is not None:
+            data[key] = tuple(data[key])
+    known = ReplayResult.__dataclass_fields__
+    return ReplayResult(**{key: value for key, value in data.items() if key in known})
+
+
+class CheckpointMismatchError(Exception):
+    """현재 화면이 체크포인트 화면과 달라 이어서 실행할 수 없음"""
+    pass
+
+
+@dataclass
+class ReplayCheckpoint:
+    """replay 체크포인트"""
+    test_case_name: str
+    total_actions: int
+    next_index: int = 0  # 완료한 액션 수 (다음에 실행할 액션 인덱스)
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    screen_hash: Optional[str] = None  # 마지막 액션 직후 실제 화면 aHash
+    expected_hash: Optional[str] = None  # 녹화 시 다음 액션 전 화면 aHash
+    session_id: Optional[str] = None  # AccuracyTracker 세션 ID
+    updated_at: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["version"] = CHECKPOINT_VERSION
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ReplayCheckpoint':
+        return cls(
+            test_case_name=data["test_case_name"],
+            total_actions=data["total_actions"],
+            next_index=data.get("next_index", 0),
+            results=list(data.get("results", [])),
+            screen_hash=data.get("screen_hash"),
+            expected_hash=data.get("expected_hash"),
+            session_id=data.get("session_id"),
+            updated_at=data.get("updated_at", ""),
+        )
+
+    def replay_results(self) -> List[ReplayResult]:
+        return [result_from_dict(result) for result in self.results]
+
+
+class ReplayCheckpointStore:
+    """체크포인트 파일 저장/로드"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @classmethod
+    def for_test_case(cls, config, test_case_name: str) -> 'ReplayCheckpointStore':
+        test_cases_dir = config.get('test_cases.directory', 'test_cases')
+        return cls(get_checkpoint_path(test_cases_dir, test_case_name))
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def load(self) -> Optional[ReplayCheckpoint]:
+        """체크포인트 로드 (없거나 손상되었으면 None)"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != CHECKPOINT_VERSION:
+                logger.warning(f"체크포인트 버전 불일치, 무시: {self.path}")
+                return None
+            return ReplayCheckpoint.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"체크포인트 로드 실패, 무시: {self.path} ({e})")
+            return None
+
+    def save(self, checkpoint: ReplayCheckpoint):
+        """체크포인트 저장 (임시 파일에 쓴 뒤 교체)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        checkpoint.updated_at = datetime.now().isoformat()
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class CheckpointedReplay:
+    """체크포인트를 남기며 의미론적 replay를 실행"""
+
+    def __init__(self, replayer: SemanticActionReplayer, store: ReplayCheckpointStore,
+                 tracker: Optional[AccuracyTracker] = None, state_graph_path: Optional[str] = None,
+                 match_distance: int = DEFAULT_MATCH_DISTANCE,
+                 save_interval: int = DEFAULT_CHECKPOINT_INTERVAL):
+        """
+        Args:
+            replayer: 액션을 실행할 재실행기
+            store: 체크포인트 저장소
+            tracker: 정확도 추적기 (있으면 액션마다 기록하고 체크포인트와 함께 세션 저장)
+            state_graph_path: 화면 상태 그래프 파일 (해시가 다를 때 상태 인식에 사용)
+            match_distance: 체크포인트 화면과 같은 화면으로 보는 최대 aHash 거리
+            save_interval: 체크포인트 저장 간격 (액션 수, 1이면 액션마다)
+        """
+        self.replayer = replayer
+        self.store = store
+        self.tracker = tracker
+        self.state_graph_path = state_graph_path
+        self.match_distance = match_distance
+        self.save_interval = max(1, save_interval)
+
+    @classmethod
+    def for_test_case(cls, replayer: SemanticActionReplayer, config, test_case_name: str,
+                      tracker: Optional[AccuracyTracker] = None) -> 'CheckpointedReplay':
+        """설정(test_cases.directory, automation.state_match_distance, automation.checkpoint_interval)으로 생성"""
+        test_cases_dir = config.get('test_cases.directory', 'test_cases')
+        return cls(
+            replayer,
+            ReplayCheckpointStore(get_checkpoint_path(test_cases_dir, test_case_name)),
+            tracker=tracker,
+            state_graph_path=get_state_graph_path(test_cases_dir),
+            match_distance=config.get('automation.state_match_distance', DEFAULT_MATCH_DISTANCE),
+            save_interval=config.get('automation.checkpoint_interval', DEFAULT_CHECKPOINT_INTERVAL),
+        )
+
+    def run(self, test_case_name: str, actions: Sequence[SemanticAction],
+            resume: bool = False, force: bool = False) -> List[ReplayResult]:
+        """재실행 (resume이면 체크포인트 다음 액션부터)
+
+        Args:
+            test_case_name: 테스트 케이스 이름
+            actions: 전체 액션 리스트
+            resume: 체크포인트에서 이어서 실행
+            force: 현재 화면이 체크포인트 화면과 달라도 이어서 실행
+
+        Returns:
+            전체 ReplayResult 리스트 (체크포인트 이전 결과 포함)
+
+        Raises:
+            CheckpointMismatchError: 현재 화면이 체크포인트 화면과 다를 때 (force가 아니면)
+        """
+        checkpoint = self._start(test_case_name, actions, resume, force)
+        results = checkpoint.replay_results()
+        self.replayer.results = list(results)
+        self.replayer._action_counter = checkpoint.next_index
+
+        saved_index = checkpoint.next_index
+        try:
+            for index in range(checkpoint.next_index, len(actions)):
+                action = actions[index]
+                logger.info(f"액션 {index + 1}/{len(actions)} 재실행: {action.description}")
+                result = self.replayer.replay_action(action)
+                results.append(result)
+                if not result.success:
+                    logger.warning(f"액션 {index + 1} 실패: {result.error_message}")
+
+                self._record(result)
+                checkpoint.next_index = index + 1
+                checkpoint.results.append(result_to_dict(result))
+                if checkpoint.next_index - saved_index >= self.save_interval and checkpoint.next_index < len(actions):
+                    # 재실행기가 액션 직후 캡처한 화면 해시 재사용 (없으면 캡처)
+                    self._save(checkpoint, actions, self.replayer.last_screen_hash or self._current_hash())
+                    saved_index = checkpoint.next_index
+        except BaseException:
+            # 중단(예외, Ctrl+C) 시 완료한 액션까지 저장
+            if checkpoint.next_index > saved_index:
+                self._save(checkpoint, actions, self._current_hash())
+            raise
+
+        if self.tracker is not None:
+            self.tracker.save_session()
+        self.store.clear()
+        logger.info(f"재실행 완료, 체크포인트 삭제: {test_case_name}")
+        return results
+
+    def _start(self, test_case_name: str, actions: Sequence[SemanticAction],
+               resume: bool, force: bool) -> ReplayCheckpoint:
+        """체크포인트 준비 (이어서 실행이면 화면 확인 후 기존 체크포인트, 아니면 새 체크포인트)"""
+        if resume:
+            checkpoint = self.store.load()
+            if checkpoint is None:
+                logger.info("체크포인트가 없어 처음부터 재실행합니다")
+            elif checkpoint.test_case_name != test_case_name or checkpoint.total_actions != len(actions):
+                logger.warning("체크포인트가 현재 테스트 케이스와 맞지 않아 처음부터 재실행합니다")
+            else:
+                if checkpoint.next_index > 0:
+                    matched, reason = self.verify_screen(checkpoint)
+                    if not matched and not force:
+                        raise CheckpointMismatchError(
+                            f"현재 화면이 체크포인트(액션 {checkpoint.next_index}) 화면과 다릅니다: {reason}"
+                        )
+                    logger.info(f"체크포인트에서 이어서 실행: 액션 {checkpoint.next_index + 1}/{len(actions)} ({reason})")
+                if self.tracker is not None:
+                    if checkpoint.session_id:
+                        self.tracker.resume_session(checkpoint.session_id, checkpoint.next_index)
+                    else:
+                        checkpoint.session_id = self.tracker.start_session()
+                return checkpoint
+
+        checkpoint = ReplayCheckpoint(test_case_name, len(actions))
+        if self.tracker is not None:
+            checkpoint.session_id = self.tracker.start_session()
+        self.store.save(checkpoint)
+        return checkpoint
+
+    def _save(self, checkpoint: ReplayCheckpoint, actions: Sequence[SemanticAction], screen_hash: Optional[str]):
+        """체크포인트와 정확도 세션을 함께 저장 (이어서 실행할 때 둘이 같은 액션까지 완료된 상태)"""
+        index = checkpoint.next_index
+        checkpoint.screen_hash = screen_hash
+        checkpoint.expected_hash = (actions[index].ui_state_hash_before if index < len(actions)
+                                    else actions[index - 1].ui_state_hash_after)
+        if self.tracker is not None:
+            self.tracker.save_session()
+        self.store.save(checkpoint)
+
+    def verify_screen(self, checkpoint: ReplayCheckpoint) -> Tuple[bool, str]:
+        """현재 화면이 체크포인트 화면과 같은지
+
+        Returns:
+            (일치 여부, 판단 근거)
+        """
+        current = self._current_hash()
+        if current is None:
+            return False, "화면 캡처 실패"
+
+        references = [h for h in (checkpoint.screen_hash, checkpoint.expected_hash) if h]
+        if not references:
+            return True, "기대 화면 정보 없음"
+        distance = min(hex_hamming_distance(current, reference) for reference in references)
+        if distance <= self.match_distance:
+            return True, f"해시 거리 {distance}"
+
+        state = self._recognize_same_state(current, references)
+        if state is not None:
+            return True, f"화면 상태 {state} 인식 (해시 거리 {distance})"
+        return False, f"해시 거리 {distance} > {self.match_distance}"
+
+    def _recognize_same_state(self, current: str, references: List[str]) -> Optional[int]:
+        """상태 그래프에서 현재 화면과 기대 화면이 같은 상태로 인식되면 그 상태 ID"""
+        if not self.state_graph_path or not os.path.exists(self.state_graph_path):
+            return None
+        graph = ScreenStateGraph(self.state_graph_path)
+        try:
+            match = graph.recognize(int(current, 16))
+            if match is None:
+                return None
+            for reference in references:
+                expected = graph.recognize(int(reference, 16))
+                if expected is not None and expected.state_id == match.state_id:
+                    return match.state_id
+            return None
+        finally:
+            graph.close()
+
+    def _current_hash(self) -> Optional[str]:
+        screenshot: Optional[Image.Image] = self.replayer._capture_screenshot()
+        return average_hash_hex(screenshot) if screenshot is not None else None
+
+    def _record(self, result: ReplayResult):
+        """정확도 추적기에 기록 (세션 저장은 체크포인트와 함께)"""
+        if self.tracker is None:
+            return
+        if result.success:
+            self.tracker.record_success(
+                result.action_id, result.method, result.original_coords, result.actual_coords,
+                execution_time=result.execution_time,
+                screen_transition_matched=result.screen_transition_verified
+            )
+        else:
+            self.tracker.record_failure(
+                result.action_id, result.error_message, result.original_coords,
+                execution_time=result.execution_time
+            )
@@ -0,0 +1,507 @@
+"""
+ReplayManifest - 테스트 케이스 replay 매니페스트
+
+테스트 케이스를 replay 전에 한 번 "컴파일"하여 검증에 필요한 정보를
+미리 계산해 둔다. replay 시에는 매니페스트만 로드하면 되므로
+예상 스크린샷 경로 해석, 존재 확인, PNG 디코딩, 해시 계산을
+액션마다 반복하지 않는다.
+
+매니페스트 내용:
+- 해석된(절대 경로) 예상 프레임 참조와 파일 크기/수정 시각
+- 예상 프레임의 perceptual hash (phash, ahash, dhash, FrameHasher로 계산)
+- 다운스케일된 그레이스케일 썸네일
+- 액션 타이밍 (녹화 시점 오프셋, 대기 시간)
+
+저장 위치: <test_cases_dir>/<테스트_케이스_이름>/manifest.json
+"""
+
+import os
+import re
+import json
+import base64
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, asdict
+
+import numpy as np
+from PIL import Image
+
+from src.frame_hasher import HASH_ENGINE, default_hasher
+
+logger = logging.getLogger(__name__)
+
+
+# 매니페스트 형식 버전 (형식이 바뀌면 기존 매니페스트는 재컴파일된다)
+MANIFEST_VERSION = 1
+
+# 기본 썸네일 크기 (정사각형, 그레이스케일)
+DEFAULT_THUMBNAIL_SIZE = 64
+
+MANIFEST_FILENAME = "manifest.json"
+
+
+def get_project_root() -> str:
+    """프로젝트 루트 디렉토리 (src 폴더의 상위)"""
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def resolve_frame_path(path: Optional[str]) -> str:
+    """녹화 시 저장된 스크린샷 경로를 절대 경로로 변환
+
+    상대 경로는 프로젝트 루트 기준으로 해석하고,
+    Windows/POSIX 경로 구분자를 현재 OS에 맞게 정규화한다.
+
+    Args:
+        path: 테스트 케이스에 기록된 스크린샷 경로
+
+    Returns:
+        절대 경로 (path가 비어있으면 빈 문자열)
+    """
+    if not path:
+        return ""
+    if os.path.isabs(path):
+        return path
+
+    # 경로 구분자 정규화 (Windows 호환)
+    normalized = path.replace('/', os.sep).replace('\\', os.sep)
+    return os.path.normpath(os.path.join(get_project_root(), normalized))
+
+
+def get_artifact_dir(test_cases_dir: str, test_case_name: str) -> str:
+    """테스트 케이스 부속 파일 디렉토리 경로
+
+    매니페스트 등 테스트 케이스에서 파생된 파일을 저장하는 디렉토리.
+
+    Args:
+        test_cases_dir: 테스트 케이스 디렉토리
+        test_case_name: 테스트 케이스 이름
+
+    Returns:
+        <test_cases_dir>/<test_case_name>
+    """
+    return os.path.join(test_cases_dir, test_case_name)
+
+
+def get_manifest_path(test_cases_dir: str, test_case_name: str) -> str:
+    """매니페스트 파일 경로"""
+    return os.path.join(get_artifact_dir(test_cases_dir, test_case_name), MANIFEST_FILENAME)
+
+
+def parse_wait_seconds(description: str) -> float:
+    """wait 액션 설명에서 대기 시간 파싱 ("2.5초 대기" → 2.5)
+
+    파싱 실패 시 기본 1초 (ScriptGenerator._parse_wait_time과 동일)
+    """
+    match = re.search(r'(\d+\.?\d*)초', description or '')
+    if match:
+        return float(match.group(1))
+    return 1.0
+
+
+def _parse_timestamp(timestamp: str) -> Optional[datetime]:
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+
+
+@dataclass
+class FrameFingerprint:
+    """예상 프레임의 사전 계산 정보"""
+    path: str
+    file_size: int
+    file_mtime: float
+    width: int
+    height: int
+    phash: str
+    ahash: str
+    dhash: str
+    thumbnail: str = ""  # base64 인코딩된 그레이스케일 픽셀 (thumbnail_size x thumbnail_size)
+    thumbnail_size: int = 0
+
+    def is_stale(self) -> bool:
+        """원본 파일이 없어졌거나 변경되었는지 확인"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return True
+        return stat.st_size != self.file_size or stat.st_mtime != self.file_mtime
+
+    def get_thumbnail(self) -> Optional[Image.Image]:
+        """썸네일을 PIL 그레이스케일 이미지로 복원"""
+        if not self.thumbnail or self.thumbnail_size <= 0:
+            return None
+        data = base64.b64decode(self.thumbnail)
+        return Image.frombytes('L', (self.thumbnail_size, self.thumbnail_size), data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "file_size": self.file_size,
+            "file_mtime": self.file_mtime,
+            "width": self.width,
+            "height": self.height,
+            "phash": self.phash,
+            "ahash": self.ahash,
+            "dhash": self.dhash,
+            "thumbnail": self.thumbnail,
+            "thumbnail_size": self.thumbnail_size
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FrameFingerprint':
+        return cls(
+            path=data.get("path", ""),
+            file_size=data.get("file_size", 0),
+            file_mtime=data.get("file_mtime", 0.0),
+            width=data.get("width", 0),
+            height=data.get("height", 0),
+            phash=data.get("phash", ""),
+            ahash=data.get("ahash", ""),
+            dhash=data.get("dhash", ""),
+            thumbnail=data.get("thumbnail", ""),
+            thumbnail_size=data.get("thumbnail_size", 0)
+        )
+
+
+@dataclass
+class ManifestEntry:
+    """액션별 매니페스트 항목"""
+    action_index: int
+    action_type: str
+    description: str
+    screenshot_path: str = ""  # 테스트 케이스에 기록된 원래 경로 (항목 대조용)
+    offset_seconds: float = 0.0  # 첫 액션 기준 녹화 시점 (초)
+    wait_seconds: float = 0.0  # wait 액션의 대기 시간 (초)
+    expected_frame: Optional[FrameFingerprint] = None
+    before_frame: Optional[FrameFingerprint] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "action_index": self.action_index,
+            "action_type": self.action_type,
+            "description": self.description,
+            "screenshot_path": self.screenshot_path,
+            "offset_seconds": self.offset_seconds,
+            "wait_seconds": self.wait_seconds,
+            "expected_frame": self.expected_frame.to_dict() if self.expected_frame else None,
+            "before_frame": self.before_frame.to_dict() if self.before_frame else None
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ManifestEntry':
+        expected = data.get("expected_frame")
+        before = data.get("before_frame")
+        return cls(
+            action_index=data.get("action_index", 0),
+            action_type=data.get("action_type", ""),
+            description=data.get("description", ""),
+            screenshot_path=data.get("screenshot_path", ""),
+            offset_seconds=data.get("offset_seconds", 0.0),
+            wait_seconds=data.get("wait_seconds", 0.0),
+            expected_frame=FrameFingerprint.from_dict(expected) if expected else None,
+            before_frame=FrameFingerprint.from_dict(before) if before else None
+        )
+
+
+@dataclass
+class ReplayManifest:
+    """테스트 케이스 replay 매니페스트"""
+    test_case_name: str
+    source_path: str = ""
+    source_mtime: float = 0.0
+    compiled_at: str = ""
+    version: int = MANIFEST_VERSION
+    hash_engine: str = HASH_ENGINE
+    thumbnail_size: int = DEFAULT_THUMBNAIL_SIZE
+    capture_delay: Optional[float] = None
+    entries: List[ManifestEntry] = field(default_factory=list)
+
+    def get_entry(self, action_index: int) -> Optional[ManifestEntry]:
+        """액션 인덱스로 항목 조회"""
+        if 0 <= action_index < len(self.entries):
+            entry = self.entries[action_index]
+            if entry.action_index == action_index:
+                return entry
+        for entry in self.entries:
+            if entry.action_index == action_index:
+                return entry
+        return None
+
+    def get_expected_frame(self, action_index: int,
+                           screenshot_path: Optional[str] = None) -> Optional[FrameFingerprint]:
+        """액션의 예상 프레임 정보 조회
+
+        screenshot_path가 주어지면 매니페스트에 기록된 경로와 일치할 때만 반환한다.
+        (테스트 케이스와 매니페스트의 액션 순서가 어긋난 경우 방지)
+        """
+        entry = self.get_entry(action_index)
+        if entry is None or entry.expected_frame is None:
+            return None
+        if screenshot_path is not None and entry.screenshot_path != screenshot_path:
+            return None
+        return entry.expected_frame
+
+    def is_stale(self) -> bool:
+        """재컴파일이 필요한지 확인
+
+        형식 버전/해시 엔진이 바뀌었거나, 원본 테스트 케이스 또는
+        예상 프레임 파일이 변경된 경우 True.
+        """
+        if self.version != MANIFEST_VERSION or self.hash_engine != HASH_ENGINE:
+            return True
+        if self.source_path:
+            try:
+                if os.stat(self.source_path).st_mtime != self.source_mtime:
+                    return True
+            except OSError:
+                return True
+        for entry in self.entries:
+            for frame in (entry.expected_frame, entry.before_frame):
+                if frame is not None and frame.is_stale():
+                    return True
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "test_case_name": self.test_case_name,
+            "source_path": self.source_path,
+            "source_mtime": self.source_mtime,
+            "compiled_at": self.compiled_at,
+            "version": self.version,
+            "hash_engine": self.hash_engine,
+            "thumbnail_size": self.thumbnail_size,
+            "capture_delay": self.capture_delay,
+            "entries": [entry.to_dict() for entry in self.entries]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ReplayManifest':
+        return cls(
+            test_case_name=data.get("test_case_name", ""),
+            source_path=data.get("source_path", ""),
+            source_mtime=data.get("source_mtime", 0.0),
+            compiled_at=data.get("compiled_at", ""),
+            version=data.get("version", 0),
+            hash_engine=data.get("hash_engine", ""),
+            thumbnail_size=data.get("thumbnail_size", DEFAULT_THUMBNAIL_SIZE),
+            capture_delay=data.get("capture_delay"),
+            entries=[ManifestEntry.from_dict(e) for e in data.get("entries", [])]
+        )
+
+    def save(self, path: str) -> str:
+        """매니페스트를 JSON 파일로 저장"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> 'ReplayManifest':
+        """JSON 파일에서 매니페스트 로드"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+class ReplayManifestCompiler:
+    """테스트 케이스를 replay 매니페스트로 컴파일"""
+
+    def __init__(self, config=None):
+        """
+        Args:
+            config: 설정 관리자 (None이면 기본값 사용)
+        """
+        self.config = config
+        if config is not None:
+            self.test_cases_dir = config.get('test_cases.directory', 'test_cases')
+            self.thumbnail_size = config.get('automation.thumbnail_size', DEFAULT_THUMBNAIL_SIZE)
+        else:
+            self.test_cases_dir = 'test_cases'
+            self.thumbnail_size = DEFAULT_THUMBNAIL_SIZE
+
+    def fingerprint_frame(self, path: Optional[str],
+                          with_thumbnail: bool = True) -> Optional[FrameFingerprint]:
+        """스크린샷 파일의 사전 계산 정보 생성
+
+        Args:
+            path: 테스트 케이스에 기록된 스크린샷 경로
+            with_thumbnail: 썸네일 포함 여부
+
+        Returns:
+            FrameFingerprint (파일이 없으면 None)
+        """
+        return self.fingerprint_frames([(path, with_thumbnail)]).get((path, with_thumbnail))
+
+    def fingerprint_frames(
+        self,
+        requests: List[Tuple[Optional[str], bool]]
+    ) -> Dict[Tuple[Optional[str], bool], Optional[FrameFingerprint]]:
+        """여러 스크린샷 파일의 사전 계산 정보를 일괄 생성
+
+        각 프레임은 한 번만 디코딩/다운샘플링하고, 해시는 FrameHasher의
+        일괄 API로 한 번에 계산한다.
+
+        Args:
+            requests: (스크린샷 경로, 썸네일 포함 여부) 리스트
+
+        Returns:
+            {(경로, 썸네일 포함 여부): FrameFingerprint 또는 None}
+        """
+        results: Dict[Tuple[Optional[str], bool], Optional[FrameFingerprint]] = {}
+        pending = []
+        pixels = []
+
+        for key in dict.fromkeys(requests):
+            path, with_thumbnail = key
+            results[key] = None
+            resolved = resolve_frame_path(path)
+            if not resolved or not os.path.exists(resolved):
+                continue
+            try:
+                stat = os.stat(resolved)
+                with Image.open(resolved) as image:
+                    image.load()
+                    pixels.append(default_hasher.prepare(image))
+
+                    thumbnail = ""
+                    thumbnail_size = 0
+                    if with_thumbnail and self.thumbnail_size > 0:
+                        thumbnail_size = self.thumbnail_size
+                        gray = image.convert('L').resize(
+                            (thumbnail_size, thumbnail_size), Image.Resampling.BILINEAR
+                        )
+                        thumbnail = base64.b64encode(gray.tobytes()).decode('ascii')
+
+                    pending.append((key, FrameFingerprint(
+                        path=resolved,
+                        file_size=stat.st_size,
+                        file_mtime=stat.st_mtime,
+                        width=image.size[0],
+                        height=image.size[1],
+                        phash="",
+                        ahash="",
+                        dhash="",
+                        thumbnail=thumbnail,
+                        thumbnail_size=thumbnail_size
+                    )))
+            except Exception as e:
+                logger.warning(f"프레임 정보 계산 실패: {path} ({e})")
+
+        if pending:
+            hashes = default_hasher.hash_pixels(np.stack(pixels))
+            for (key, frame), frame_hashes in zip(pending, hashes):
+                frame.phash = frame_hashes.phash_hex
+                frame.ahash = frame_hashes.ahash_hex
+                frame.dhash = frame_hashes.dhash_hex
+                results[key] = frame
+
+        return results
+
+    def compile(self, test_case: Dict[str, Any], source_path: str = "") -> ReplayManifest:
+        """테스트 케이스 딕셔너리를 매니페스트로 컴파일
+
+        Args:
+            test_case: 테스트 케이스 데이터 (name, actions 필드 포함)
+            source_path: 원본 테스트 케이스 JSON 경로 (변경 감지용)
+
+        Returns:
+            ReplayManifest 객체
+        """
+        test_case_name = test_case.get("name", "unknown")
+        actions = [
+            action if isinstance(action, dict) else asdict(action)
+            for action in test_case.get("actions", [])
+        ]
+
+        manifest = ReplayManifest(
+            test_case_name=test_case_name,
+            source_path=os.path.abspath(source_path) if source_path else "",
+            source_mtime=os.stat(source_path).st_mtime if source_path and os.path.exists(source_path) else 0.0,
+            compiled_at=datetime.now().isoformat(),
+            thumbnail_size=self.thumbnail_size,
+            capture_delay=test_case.get("capture_delay")
+        )
+
+        # 같은 프레임을 여러 액션이 참조하는 경우 한 번만 계산
+        requests = []
+        for action in actions:
+            if action.get("screenshot_path"):
+                requests.append((action["screenshot_path"], True))
+            requests.append((action.get("screenshot_before_path"), False))
+        frames = self.fingerprint_frames(requests)
+
+        first_time = None
+        for index, action in enumerate(actions):
+            action_type = action.get("action_type", "")
+            description = action.get("description", "")
+
+            timestamp = _parse_timestamp(action.get("timestamp", ""))
+            if timestamp is not None and first_time is None:
+                first_time = timestamp
+            offset = (timestamp - first_time).total_seconds() if timestamp and first_time else 0.0
+
+            screenshot_path = action.get("screenshot_path") or ""
+            manifest.entries.append(ManifestEntry(
+                action_index=index,
+                action_type=action_type,
+                description=description,
+                screenshot_path=screenshot_path,
+                offset_seconds=offset,
+                wait_seconds=parse_wait_seconds(description) if action_type == 'wait' else 0.0,
+                expected_frame=frames.get((screenshot_path, True)) if screenshot_path else None,
+                before_frame=frames.get((action.get("screenshot_before_path"), False))
+            ))
+
+        frame_count = sum(1 for e in manifest.entries if e.expected_frame)
+        logger.info(f"매니페스트 컴파일: {test_case_name}, 액션 {len(manifest.entries)}개, 예상 프레임 {frame_count}개")
+        return manifest
+
+    def compile_file(self, json_path: str, output_path: Optional[str] = None) -> ReplayManifest:
+        """테스트 케이스 JSON 파일을 컴파일하여 매니페스트 저장
+
+        Args:
+            json_path: 테스트 케이스 JSON 경로
+            output_path: 매니페스트 저장 경로 (None이면 기본 위치)
+
+        Returns:
+            ReplayManifest 객체
+        """
+        with open(json_path, 'r', encoding='utf-8') as f:
+            test_case = json.load(f)
+
+        manifest = self.compile(test_case, json_path)
+        if output_path is None:
+            output_path = get_manifest_path(os.path.dirname(json_path), manifest.test_case_name)
+        manifest.save(output_path)
+        return manifest
+
+    def load_or_compile(self, test_case_name: str) -> Optional[ReplayManifest]:
+        """매니페스트 로드 (없거나 오래되었으면 재컴파일)
+
+        Args:
+            test_case_name: 테스트 케이스 이름
+
+        Returns:
+            ReplayManifest (테스트 케이스 JSON이 없으면 None)
+        """
+        manifest_path = get_manifest_path(self.test_cases_dir, test_case_name)
+
+        if os.path.exists(manifest_path):
+            try:
+                manifest = ReplayManifest.load(manifest_path)
+                if not manifest.is_stale():
+                    return manifest
+                logger.info(f"매니페스트가 오래되어 재컴파일: {test_case_name}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"매니페스트 로드 실패, 재컴파일: {e}")
+
+        json_path = os.path.join(self.test_cases_dir, f"{test_case_name}.json")
+        if not os.path.exists(json_path):
+            return None
+
+        return self.compile_file(json_path, manifest_path)
@@ -0,0 +1,321 @@
+"""
+ReplayPlan - 좌표 기반 재실행 계획과 인터프리터
+
+테스트 케이스 스크립트(.py)는 재실행 계획(PLAN, 데이터만 포함)과 이 모듈을 호출하는
+얇은 실행기로 생성한다. 재실행 로직(윈도우 오프셋, 입력, 검증, 대기)은 모두 여기 있으므로
+엔진을 개선해도 스크립트를 다시 생성할 필요가 없다.
+
+계획 형식:
+    {
+        "version": 1,
+        "window_title": 게임 윈도우 타이틀,
+        "capture_delay": 검증 캡처 전 대기 (초),
+        "type_interval": type_text 키 간격 (초, 없으면 automation.type_interval 기본값),
+        "steps": [액션 딕셔너리, ...]
+    }
+각 단계는 테스트 케이스 JSON의 액션 딕셔너리에서 재실행에 필요한 필드만 남긴 것이다.
+(wait 액션은 description에서 파싱한 wait_time 포함)
+
+PlanInterpreter는 실행 전에 단계마다 입력 함수를 한 번 준비해 두고,
+액션 간 지연은 sleep 대신 마감 시각(wait_until) 기준으로 맞춘다.
+입력마다 pyautogui.PAUSE(기본 0.1초)가 더해지지 않도록 _pause=False로 호출한다.
+타임라인 모드(--timeline)에서는 action_delay 대신 녹화 시각에 맞춰 입력한다 (TimelineScheduler).
+"""
+
+import argparse
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pyautogui
+
+from src.input_timeline import replay_pointer_path, wait_until
+from src.keystroke_coalescer import DEFAULT_TYPE_INTERVAL, key_press_args, parse_hotkey
+from src.timeline_scheduler import DEFAULT_REPLAY_SPEED, INSTANT_ACTIONS, TimelineScheduler
+
+
+PLAN_VERSION = 1
+
+# 계획에 남기는 액션 필드 (그 밖의 의미론적 정보/해시/경로는 좌표 재실행에 쓰지 않음)
+PLAN_STEP_FIELDS = ('action_type', 'timestamp', 'timestamp_ns', 'x', 'y', 'description', 'button', 'key',
+                    'text', 'scroll_dy', 'path', 'wait_time', 'screenshot_path')
+
+
+def build_replay_plan(actions: Sequence[Dict[str, Any]], window_title: str = '',
+                      capture_delay: float = 2.0,
+                      type_interval: float = DEFAULT_TYPE_INTERVAL) -> Dict[str, Any]:
+    """액션 딕셔너리 목록으로 재실행 계획 생성
+
+    Args:
+        actions: 액션 딕셔너리 목록 (wait 액션은 wait_time 포함)
+        window_title: 게임 윈도우 타이틀
+        capture_delay: 검증 캡처 전 대기 시간 (초)
+        type_interval: type_text 키 간격 (초)
+
+    Returns:
+        재실행 계획 딕셔너리
+    """
+    steps = []
+    for action in actions:
+        steps.append({
+            field: action[field] for field in PLAN_STEP_FIELDS
+            if action.get(field) not in (None, '', [])
+        })
+    return {
+        "version": PLAN_VERSION,
+        "window_title": window_title,
+        "capture_delay": capture_delay,
+        "type_interval": type_interval,
+        "steps": steps
+    }
+
+
+def get_window_offset(window_title: str) -> Tuple[int, int]:
+    """게임 윈도우의 스크린 오프셋 (윈도우를 찾지 못하면 (0, 0))"""
+    if not window_title:
+        return (0, 0)
+    try:
+        from src.window_capture import WindowCapture
+        wc = WindowCapture(window_title)
+        if wc.find_window():
+            rect = wc.get_window_rect()
+            if rect:
+                return (rect[0], rect[1])
+    except Exception as e:
+        print(f"⚠ 윈도우 오프셋 가져오기 실패: {e}")
+    return (0, 0)
+
+
+class PlanInterpreter:
+    """재실행 계획 인터프리터
+
+    단계마다 (입력 함수, 입력 후 대기 시간)을 한 번 준비해 두고 순서대로 실행한다.
+    """
+
+    def __init__(self, plan: Dict[str, Any], window_offset: Tuple[int, int] = (0, 0), driver: Any = None,
+                 clock: Callable[[], int] = time.perf_counter_ns,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            plan: 재실행 계획 (build_replay_plan)
+            window_offset: 게임 윈도우 스크린 오프셋
+            driver: 입력 장치 (pyautogui와 같은 click/scroll/press/write/hotkey 제공, None이면 pyautogui)
+            clock: 나노초 시계 (테스트용)
+            sleep: 초 단위 sleep 함수 (테스트용)
+
+        Raises:
+            ValueError: 지원하지 않는 계획 버전
+        """
+        if plan.get("version") != PLAN_VERSION:
+            raise ValueError(f"지원하지 않는 재실행 계획 버전: {plan.get('version')}")
+        self.plan = plan
+        self.steps: List[Dict[str, Any]] = plan.get("steps", [])
+        self.window_offset = window_offset
+        self.driver = driver or pyautogui
+        self.capture_delay = plan.get("capture_delay", 2.0)
+        self.type_interval = plan.get("type_interval", DEFAULT_TYPE_INTERVAL)
+        self._clock = clock
+        self._sleep = sleep
+        self._prepared = [self._prepare(step) for step in self.steps]
+        # 가장 크게 늦은 단계 시작 지연 (ns)
+        self.max_late_ns = 0
+        # 마지막 타임라인 실행의 스케줄러 (스케줄 오차 보고용)
+        self.timeline: Optional[TimelineScheduler] = None
+
+    def _prepare(self, step: Dict[str, Any]) -> Optional[Callable[[], None]]:
+        """단계의 입력 함수 준비 (입력이 없는 단계는 None)"""
+        driver = self.driver
+        action_type = step.get('action_type', '')
+        offset_x, offset_y = self.window_offset
+        x = step.get('x', 0) + offset_x
+        y = step.get('y', 0) + offset_y
+
+        if action_type == 'click':
+            button = step.get('button') or 'left'
+            return lambda: driver.click(x, y, button=button, _pause=False)
+        if action_type == 'key_press':
+            if not step.get('key'):
+                return None
+            method, key_name = key_press_args(str(step['key']))
+            press = getattr(driver, method)
+            return lambda: press(key_name, _pause=False)
+        if action_type == 'type_text':
+            text, interval = step.get('text') or '', self.type_interval
+            return lambda: driver.write(text, interval=interval, _pause=False)
+        if action_type == 'hotkey':
+            if not step.get('key'):
+                return None
+            keys = parse_hotkey(str(step['key']))
+            return lambda: driver.hotkey(*keys, _pause=False)
+        if action_type == 'scroll':
+            amount = (step.get('scroll_dy') or 0) * 100
+            if amount == 0:
+                return None
+            return lambda: driver.scroll(amount, x, y, _pause=False)
+        if action_type in ('drag', 'move'):
+            path = step.get('path') or []
+            button = step.get('button') if action_type == 'drag' else None
+            return lambda: replay_pointer_path(path, button, self.window_offset, driver=driver)
+        if action_type == 'wait':
+            return None
+
+        def unknown():
+            print(f"  ⚠ 알 수 없는 액션 타입: {action_type}")
+        return unknown
+
+    def run(self, action_delay: float = 0.5, verifier: Any = None, skip_wait: bool = True,
+            timeline_speed: Optional[float] = None) -> int:
+        """계획 실행
+
+        Args:
+            action_delay: 액션 간 지연 시간 (초)
+            verifier: ReplayVerifier (있으면 screenshot_path가 있는 액션마다 capture_delay 후 검증)
+            skip_wait: 검증 중에는 wait 액션 건너뛰기
+            timeline_speed: 지정하면 녹화 시각에 맞춰 이 배속으로 실행 (action_delay/wait 액션은 쓰지 않음)
+
+        Returns:
+            실행한 단계 수
+        """
+        if timeline_speed is not None:
+            return self._run_timeline(timeline_speed, verifier)
+
+        clock = self._clock
+        total = len(self.steps)
+        deadline = clock()
+        for index, (step, execute) in enumerate(zip(self.steps, self._prepared)):
+            self.max_late_ns = max(self.max_late_ns, wait_until(deadline, clock, self._sleep))
+            description = step.get('description', f'액션 {index}')
+            is_wait = step.get('action_type') == 'wait'
+            if is_wait and verifier is not None and skip_wait:
+                print(f"[{index + 1}/{total}] {description} (건너뜀)")
+                deadline = clock()
+                continue
+
+            print(f"[{index + 1}/{total}] {description}")
+            delay = action_delay + (step.get('wait_time', 1.0) if is_wait else 0.0)
+            try:
+                if execute is not None:
+                    execute()
+                deadline = clock() + int(delay * 1e9)
+
+                # 검증 모드: 녹화 시점과 같은 타이밍(CAPTURE_DELAY)으로 스크린샷 검증
+                if verifier is not None and not is_wait and step.get('screenshot_path'):
+                    wait_until(deadline + int(self.capture_delay * 1e9), clock, self._sleep)
+                    next_step = self.steps[index + 1] if index + 1 < total else None
+                    verifier.capture_and_verify(index, step, next_step)
+                    deadline = clock()
+            except Exception as e:
+                print(f"  ❌ 액션 실행 실패: {e}")
+                # 오류가 발생해도 계속 진행 (Requirements 9.5)
+                deadline = clock() + int(delay * 1e9)
+        return total
+
+    def _run_timeline(self, speed: float, verifier: Any) -> int:
+        """녹화 시각 기준 실행 (검증은 녹화와 같은 capture_delay 후, 검증 시간은 타임라인에서 제외)"""
+        clock = self._clock
+        timeline = TimelineScheduler.for_actions(self.steps, speed, clock=clock, sleep=self._sleep)
+        self.timeline = timeline
+        total = len(self.steps)
+        for index, (step, execute) in enumerate(zip(self.steps, self._prepared)):
+            action_type = step.get('action_type')
+            if action_type == 'wait':
+                continue
+            print(f"[{index + 1}/{total}] {step.get('description', f'액션 {index}')}")
+            try:
+                with timeline.inject(index, action_type in INSTANT_ACTIONS):
+                    if execute is not None:
+                        execute()
+                if verifier is not None and step.get('screenshot_path'):
+                    wait_until(clock() + int(self.capture_delay * 1e9), clock, self._sleep)
+                    with timeline.paused():
+                        next_step = self.steps[index + 1] if index + 1 < total else None
+                        verifier.capture_and_verify(index, step, next_step)
+            except Exception as e:
+                print(f"  ❌ 액션 실행 실패: {e}")
+        return total
+
+
+def run_plan(plan: Dict[str, Any], action_delay: float = 0.5, verify: bool = False,
+             test_case_name: str = "unknown", skip_wait: bool = True,
+             timeline: bool = False, speed: float = DEFAULT_REPLAY_SPEED):
+    """재실행 계획 실행 (생성된 스크립트의 진입점)
+
+    Args:
+        plan: 재실행 계획
+        action_delay: 액션 간 지연 시간 (초)
+        verify: 검증 모드 활성화 여부
+        test_case_name: 테스트 케이스 이름 (검증 보고서용)
+        skip_wait: 검증 모드에서 대기 액션 건너뛰기
+        timeline: 녹화 시각에 맞춰 실행
+        speed: 타임라인 재생 배속
+
+    Returns:
+        검증 보고서 (검증 모드가 아니면 None)
+    """
+    window_offset = get_window_offset(plan.get("window_title", ''))
+    if window_offset != (0, 0):
+        print(f"✓ 게임 윈도우 감지: 오프셋 {window_offset}")
+    else:
+        print("⚠ 게임 윈도우를 찾지 못했습니다. 좌표가 정확하지 않을 수 있습니다.")
+
+    verifier = None
+    if verify:
+        try:
+            from src.config_manager import ConfigManager
+            from src.replay_verifier import ReplayVerifier
+        except ImportError:
+            print("⚠ 검증 모듈을 로드할 수 없습니다. 검증 없이 진행합니다.")
+        else:
+            config = ConfigManager()
+            config.load_config()
+            verifier = ReplayVerifier(config)
+            verifier.start_verification_session(test_case_name, report_dir="reports")
+            print("✓ 검증 모드 활성화")
+            print("✓ 빠른 검증 모드: 대기 시간 건너뛰기" if skip_wait else "✓ 전체 재현 모드: 대기 시간 포함")
+
+    interpreter = PlanInterpreter(plan, window_offset)
+    print(f"총 {len(interpreter.steps)}개의 액션을 재실행합니다...")
+    print()
+    interpreter.run(action_delay, verifier, skip_wait, timeline_speed=speed if timeline else None)
+    print()
+    print("✓ 재실행 완료")
+    if interpreter.timeline is not None:
+        print(f"  {interpreter.timeline.summary()}")
+
+    if verifier:
+        report = verifier.generate_report()
+        if interpreter.timeline is not None:
+            report.timeline_statistics = interpreter.timeline.report()
+        verifier.print_report(report)
+        verifier.save_report(report)
+        return report
+    return None
+
+
+def main(plan: Dict[str, Any], script_path: str, argv: Optional[List[str]] = None):
+    """생성된 스크립트의 명령행 처리
+
+    Args:
+        plan: 재실행 계획
+        script_path: 스크립트 경로 (테스트 케이스 이름 기본값)
+        argv: 명령행 인자 (None이면 sys.argv)
+    """
+    parser = argparse.ArgumentParser(description='Replay Script')
+    parser.add_argument('--delay', type=float, default=0.5, help='액션 간 지연 시간 (초)')
+    parser.add_argument('--verify', action='store_true', help='검증 모드 활성화')
+    parser.add_argument('--full-replay', action='store_true', help='전체 재현 모드 (대기 시간 포함)')
+    parser.add_argument('--name', type=str, default='unknown', help='테스트 케이스 이름')
+    parser.add_argument('--timeline', action='store_true', help='녹화 시각에 맞춰 재실행 (--delay 무시)')
+    parser.add_argument('--speed', type=float, default=DEFAULT_REPLAY_SPEED, help='타임라인 재생 배속')
+    args = parser.parse_args(argv)
+    if args.speed <= 0:
+        parser.error('--speed는 0보다 커야 합니다')
+
+    # 테스트 케이스 이름 자동 추출 (파일명에서)
+    if args.name == 'unknown':
+        args.name = os.path.splitext(os.path.basename(script_path))[0]
+
+    # skip_wait: 검증 모드에서 기본 True, --full-replay 옵션 시 False
+    return run_plan(plan, action_delay=args.delay, verify=args.verify,
+                    test_case_name=args.name, skip_wait=not args.full_replay,
+                    timeline=args.timeline, speed=args.speed)
@@ -13,9 +13,10 @@ ReplayVerifier - 통합 검증기
 import os
 import json
 import logging
+import threading
 import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Iterable, List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from PIL import Image
 import pyautogui
@@ -26,6 +27,20 @@ from src.ui_analyzer import UIAnalyzer
 from src.accuracy_tracker import AccuracyTracker, ActionExecutionResult
 from src.window_capture import WindowCapture, capture_game_window
 from src.semantic_action_replayer import ReplayResult
+from src.replay_manifest import (
+    ReplayManifest, ReplayManifestCompiler, FrameFingerprint, resolve_frame_path
+)
+from src.expected_analysis_store import ExpectedAnalysisStore
+from src.tile_comparator import (
+    TileComparator, TileComparison, TileSignature, DEFAULT_TILE_GRID, tile_index_at
+)
+from src.region_mask import RegionMaskStore
+from src.report_stream import ReportStreamWriter, get_stream_path, iter_stream_results
+from src.verification_cascade import (
+    CascadeStatistics, CascadeThresholds, CascadeTrace, normalize_texts, text_similarity, tile_ssim,
+    STAGE_HASH, STAGE_TILE, STAGE_SSIM, STAGE_OCR, STAGE_VISION,
+    DECISION_PASS, DECISION_FAIL, DECISION_CONTINUE, DECISION_SKIP
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +68,20 @@ class VerificationResult:
             "final_result": self.final_result,
             "details": self.details
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'VerificationResult':
+        """to_dict() 결과(스트리밍 보고서 레코드 등)에서 복원"""
+        return cls(
+            action_index=data.get("action_index", -1),
+            action_description=data.get("action_description", ""),
+            screenshot_match=data.get("screenshot_match", False),
+            screenshot_similarity=data.get("screenshot_similarity", 0.0),
+            vision_verified=data.get("vision_verified", False),
+            vision_match=data.get("vision_match", False),
+            final_result=data.get("final_result", "unknown"),
+            details=data.get("details", {})
+        )
 
 
 @dataclass
@@ -100,7 +129,9 @@ class ReplayReport:
     success_rate: float
     verification_results: List[VerificationResult] = field(default_factory=list)
     matching_statistics: Optional[MatchingStatistics] = None
+    cascade_statistics: Optional[CascadeStatistics] = None
     summary: str = ""
+    timeline_statistics: Optional[Dict[str, Any]] = None  # 타임라인 재실행 스케줄 오차 (TimelineScheduler.report)
     
     def to_dict(self) -> Dict[str, Any]:
         result = {
@@ -118,9 +149,124 @@ class ReplayReport:
         }
         if self.matching_statistics:
             result["matching_statistics"] = self.matching_statistics.to_dict()
+        if self.cascade_statistics:
+            result["cascade_statistics"] = self.cascade_statistics.to_dict()
+        if self.timeline_statistics:
+            result["timeline_statistics"] = self.timeline_statistics
         return result
 
 
+def build_replay_report(test_case_name: str, session_id: str, start_time: str, end_time: str,
+                        results: List[VerificationResult]) -> ReplayReport:
+    """검증 결과 목록으로 보고서 생성 (요약 문자열, 단계별 통계 포함)"""
+    passed = sum(1 for r in results if r.final_result == "pass")
+    failed = sum(1 for r in results if r.final_result == "fail")
+    warnings = sum(1 for r in results if r.final_result == "warning")
+    total = len(results)
+    
+    success_rate = (passed + warnings) / total if total > 0 else 0.0
+    
+    # 요약 생성
+    summary_lines = [
+        f"테스트 케이스: {test_case_name}",
+        f"실행 시간: {start_time} ~ {end_time}",
+        f"",
+        f"=== 검증 결과 요약 ===",
+        f"총 액션 수: {total}",
+        f"✓ 통과 (PASS): {passed}",
+        f"⚠ 경고 (WARNING): {warnings}",
+        f"✗ 실패 (FAIL): {failed}",
+        f"성공률: {success_rate * 100:.1f}%",
+    ]
+    
+    cascade_stats = None
+    traces = [r.details["cascade"] for r in results if "cascade" in r.details]
+    if traces:
+        cascade_stats = CascadeStatistics.from_traces(traces)
+        summary_lines.append("")
+        summary_lines.append("=== 검증 단계별 판정 ===")
+        summary_lines.extend(cascade_stats.summary_lines())
+    
+    if failed > 0:
+        summary_lines.append("")
+        summary_lines.append("=== 실패한 액션 ===")
+        for r in results:
+            if r.final_result == "fail":
+                summary_lines.append(f"  [{r.action_index}] {r.action_description}")
+    
+    return ReplayReport(
+        test_case_name=test_case_name,
+        session_id=session_id,
+        start_time=start_time,
+        end_time=end_time,
+        total_actions=total,
+        passed_count=passed,
+        failed_count=failed,
+        warning_count=warnings,
+        success_rate=success_rate,
+        verification_results=results,
+        cascade_statistics=cascade_stats,
+        summary="\n".join(summary_lines)
+    )
+
+
+def write_report_files(report: ReplayReport, output_dir: str,
+                       result_records: Optional[Iterable[Dict[str, Any]]] = None) -> str:
+    """JSON/TXT 보고서 저장
+    
+    Args:
+        report: ReplayReport 객체
+        output_dir: 출력 디렉토리
+        result_records: JSON에 기록할 상세 결과 (None이면 report.verification_results).
+                        스트리밍 보고서에서 한 건씩 읽어 기록할 때 사용
+        
+    Returns:
+        JSON 보고서 경로
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    base = os.path.join(output_dir, f"{report.test_case_name}_{report.session_id}_report")
+    
+    # JSON 보고서 저장 (상세 결과는 한 건씩 기록)
+    json_path = base + ".json"
+    data = report.to_dict()
+    data.pop("verification_results")
+    if result_records is None:
+        result_records = (r.to_dict() for r in report.verification_results)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        header = json.dumps(data, ensure_ascii=False, indent=2)
+        f.write(header[:-2] + ',\n  "verification_results": [')
+        for i, record in enumerate(result_records):
+            body = json.dumps(record, ensure_ascii=False, indent=2).replace("\n", "\n    ")
+            f.write(("," if i else "") + "\n    " + body)
+        f.write("\n  ]\n}")
+    
+    # 텍스트 보고서 저장
+    txt_path = base + ".txt"
+    with open(txt_path, 'w', encoding='utf-8') as f:
+        f.write(report.summary)
+        f.write("\n\n")
+        f.write("=== 상세 결과 ===\n")
+        for r in report.verification_results:
+            status = {"pass": "✓", "fail": "✗", "warning": "⚠"}.get(r.final_result, "?")
+            f.write(f"{status} [{r.action_index}] {r.action_description}\n")
+            f.write(f"    스크린샷 유사도: {r.screenshot_similarity:.3f}\n")
+            cascade = r.details.get("cascade")
+            if cascade and cascade["resolved_by"]:
+                f.write(f"    판정 단계: {cascade['resolved_by']} ({cascade['total_ms']:.1f}ms)\n")
+            tiles = r.details.get("screenshot_verification", {}).get("tile_comparison")
+            if tiles and tiles["changed_tiles"]:
+                f.write(f"    변경 타일: {len(tiles['unmasked_changed_tiles'])}개"
+                        f" (변동 영역 {len(tiles['masked_tiles'])}개 제외)\n")
+            if r.vision_verified:
+                f.write(f"    Vision LLM 검증: {'통과' if r.vision_match else '실패'}\n")
+    
+    return json_path
+
+
+# 스트리밍 기록 후 메모리에서 제거하는 대용량 상세 정보 (JSONL/JSON 보고서에는 유지)
+_HEAVY_VISION_DETAILS = ("expected_ui_elements", "actual_ui_elements", "comparison_details")
+
+
 class ReplayVerifier:
     """통합 검증기"""
     
@@ -143,12 +289,44 @@ class ReplayVerifier:
         self._window_title = config.get('game.window_title', '')
         self._window_capture = WindowCapture(self._window_title) if self._window_title else None
         self._capture_delay = config.get('automation.capture_delay', 0.5)  # 캡처 전 대기 시간
+        
+        # replay 매니페스트 (예상 프레임 해시 등 사전 계산 정보)
+        self._use_manifest = config.get('automation.use_replay_manifest', True)
+        self._manifest: Optional[ReplayManifest] = None
+        
+        # 예상 프레임 UI 분석 캐시 (테스트 케이스 옆에 저장)
+        self._cache_expected_analysis = config.get('automation.cache_expected_analysis', True)
+        self._analysis_store: Optional[ExpectedAnalysisStore] = None
+        
+        # 타일 단위 비교 및 변동 영역 마스크 (test_cases/<name>/masks.json)
+        self._tile_comparison = config.get('automation.tile_comparison', True)
+        self._learn_masks = config.get('automation.learn_volatile_regions', True)
+        self.tile_comparator = TileComparator(grid=config.get('automation.tile_grid', DEFAULT_TILE_GRID))
+        self._mask_store: Optional[RegionMaskStore] = None
+        self._tile_signatures: Dict[str, TileSignature] = {}
+        
+        # 다단계 검증 임계값 (automation.cascade.*)
+        self._cascade = CascadeThresholds.from_config(config)
+        self._expected_ocr_texts: Dict[str, List[str]] = {}
+        # OCR 엔진은 스레드 안전하지 않으므로 백그라운드 검증 시 직렬화
+        self._ocr_lock = threading.Lock()
+        
+        # 검증 결과 스트리밍 기록 (<report_dir>/<name>_<session>_report.jsonl)
+        self._stream_report = config.get('automation.stream_report', True)
+        self._report_stream: Optional[ReportStreamWriter] = None
     
-    def start_verification_session(self, test_case_name: str) -> str:
+    def start_verification_session(self, test_case_name: str,
+                                   manifest: Optional[ReplayManifest] = None,
+                                   report_dir: Optional[str] = None) -> str:
         """검증 세션 시작
         
+        매니페스트가 주어지지 않으면 테스트 케이스의 매니페스트를 로드한다.
+        (없거나 오래된 경우 컴파일하여 저장)
+        
         Args:
             test_case_name: 테스트 케이스 이름
+            manifest: 미리 로드한 replay 매니페스트 (선택)
+            report_dir: 보고서 디렉토리 - 지정하면 검증 결과를 JSONL로 즉시 기록
             
         Returns:
             세션 ID
@@ -158,6 +336,42 @@ class ReplayVerifier:
         self.start_time = datetime.now().isoformat()
         self.verification_results = []
         
+        if self._report_stream:
+            self._report_stream.close()
+        self._report_stream = None
+        if report_dir and self._stream_report:
+            try:
+                writer = ReportStreamWriter(get_stream_path(report_dir, test_case_name, self.session_id))
+                writer.open(test_case_name, self.session_id, self.start_time)
+                self._report_stream = writer
+            except OSError as e:
+                logger.warning(f"스트리밍 보고서 생성 실패, 종료 시에만 저장: {e}")
+        
+        if manifest is None and self._use_manifest:
+            try:
+                manifest = ReplayManifestCompiler(self.config).load_or_compile(test_case_name)
+            except Exception as e:
+                logger.warning(f"매니페스트 로드 실패, 스크린샷 파일로 검증: {e}")
+        self.load_manifest(manifest)
+        
+        self._analysis_store = None
+        if self._cache_expected_analysis:
+            try:
+                self._analysis_store = ExpectedAnalysisStore.for_test_case(
+                    self.config, test_case_name, self.ui_analyzer
+                )
+            except Exception as e:
+                logger.warning(f"예상 프레임 분석 저장소 초기화 실패: {e}")
+        
+        self._mask_store = None
+        self._tile_signatures = {}
+        self._expected_ocr_texts = {}
+        if self._tile_comparison:
+            try:
+                self._mask_store = RegionMaskStore.for_test_case(self.config, test_case_name)
+            except Exception as e:
+                logger.warning(f"변동 영역 마스크 로드 실패: {e}")
+        
         # replay 스크린샷 저장 디렉토리 생성
         screenshot_dir = self.config.get('automation.screenshot_dir', 'screenshots')
         self._replay_screenshots_dir = os.path.join(screenshot_dir, f"replay_{self.session_id}")
@@ -174,6 +388,259 @@ class ReplayVerifier:
         logger.info(f"검증 세션 시작: {test_case_name}, session={self.session_id}")
         return self.session_id
     
+    def load_manifest(self, manifest: Optional[ReplayManifest]):
+        """replay 매니페스트 설정
+        
+        매니페스트가 있으면 예상 프레임의 해시를 매니페스트에서 가져오고,
+        예상 PNG는 Vision LLM 검증으로 넘어갈 때만 디코딩한다.
+        
+        Args:
+            manifest: ReplayManifest 객체 (None이면 해제)
+        """
+        self._manifest = manifest
+        if manifest:
+            logger.info(f"매니페스트 로드: {manifest.test_case_name} (액션 {len(manifest.entries)}개)")
+    
+    def _resolve_expected_frame(self, action_index: int, 
+                                action: Dict[str, Any]) -> Tuple[str, Optional[FrameFingerprint]]:
+        """예상 스크린샷 경로와 매니페스트 프레임 정보 조회
+        
+        Args:
+            action_index: 액션 인덱스
+            action: 액션 데이터
+            
+        Returns:
+            (예상 스크린샷 절대 경로, FrameFingerprint 또는 None)
+        """
+        screenshot_path = action.get('screenshot_path', '') or ''
+        if self._manifest and screenshot_path:
+            frame = self._manifest.get_expected_frame(action_index, screenshot_path)
+            if frame is not None:
+                return frame.path, frame
+        return resolve_frame_path(screenshot_path), None
+    
+    def _verify_expected_frame(self, expected_path: str, frame: Optional[FrameFingerprint],
+                               actual_image: Image.Image) -> Dict[str, Any]:
+        """예상 프레임과 실제 이미지의 스크린샷 비교 (hash 단계)
+        
+        매니페스트 정보가 있으면 미리 계산된 해시로 비교하고,
+        없으면 예상 스크린샷 파일을 열어 비교한다.
+        """
+        if frame is not None:
+            verify_result = self.screenshot_verifier.verify_with_hash(
+                frame.phash, actual_image, expected_path
+            )
+            verify_result["source"] = "manifest"
+            return verify_result
+        return self.screenshot_verifier.verify_screenshot(expected_path, actual_image)
+    
+    def _expected_tile_signature(self, expected_path: str,
+                                 frame: Optional[FrameFingerprint]) -> TileSignature:
+        """예상 프레임의 타일 해시 (매니페스트 썸네일 우선, 세션 내 캐시)"""
+        signature = self._tile_signatures.get(expected_path)
+        if signature is None:
+            thumbnail = frame.get_thumbnail() if frame is not None else None
+            if thumbnail is not None:
+                signature = self.tile_comparator.signature(thumbnail)
+            else:
+                with Image.open(expected_path) as image:
+                    signature = self.tile_comparator.signature(image)
+            self._tile_signatures[expected_path] = signature
+        return signature
+    
+    def _compare_tiles(self, action_index: int, expected_path: str,
+                       frame: Optional[FrameFingerprint], actual_image: Image.Image
+                       ) -> Optional[Tuple[TileComparison, TileSignature, TileSignature, Set[int]]]:
+        """타일 단위 비교 (변동 영역 마스크 적용)
+        
+        Returns:
+            (TileComparison, 예상 타일 해시, 실제 타일 해시, 마스크) 또는 실패 시 None
+        """
+        try:
+            mask = self._mask_store.get_mask(action_index) if self._mask_store else set()
+            expected = self._expected_tile_signature(expected_path, frame)
+            actual = self.tile_comparator.signature(actual_image)
+            return self.tile_comparator.compare(expected, actual, mask), expected, actual, mask
+        except Exception as e:
+            logger.debug(f"타일 비교 생략: {e}")
+            return None
+    
+    def _compare_ocr_texts(self, expected_path: str, actual_image: Image.Image,
+                           mask: Set[int]) -> Tuple[str, Optional[float], str]:
+        """화면 텍스트만 OCR로 추출하여 비교 (ocr 단계)
+        
+        변동 영역 마스크 안의 텍스트(시계 등)는 비교에서 제외한다.
+        
+        Returns:
+            (판정, 텍스트 유사도, 메모)
+        """
+        grid = self.tile_comparator.grid
+        
+        def in_mask(size):
+            width, height = size
+            return lambda x, y: tile_index_at(x, y, width, height, grid) in mask
+        
+        try:
+            expected_texts = self._expected_ocr_texts.get(expected_path)
+            with self._ocr_lock:
+                if expected_texts is None:
+                    with Image.open(expected_path) as image:
+                        image.load()
+                        expected_texts = normalize_texts(
+                            self.ui_analyzer.analyze_with_ocr(image), in_mask(image.size)
+                        )
+                    self._expected_ocr_texts[expected_path] = expected_texts
+                actual_texts = normalize_texts(
+                    self.ui_analyzer.analyze_with_ocr(actual_image), in_mask(actual_image.size)
+                )
+        except Exception as e:
+            return DECISION_SKIP, None, f"OCR 실패: {e}"
+        
+        thresholds = self._cascade
+        if min(len(expected_texts), len(actual_texts)) < thresholds.ocr_min_texts:
+            return DECISION_SKIP, None, f"텍스트 부족 (예상 {len(expected_texts)}개, 실제 {len(actual_texts)}개)"
+        
+        score = text_similarity(expected_texts, actual_texts)
+        if score >= thresholds.ocr_pass:
+            return DECISION_PASS, score, ""
+        if score <= thresholds.ocr_fail:
+            return DECISION_FAIL, score, ""
+        return DECISION_CONTINUE, score, ""
+    
+    def _run_verification_cascade(self, action_index: int, action: Dict[str, Any],
+                                  expected_path: str, frame: Optional[FrameFingerprint],
+                                  actual_image: Image.Image, result: VerificationResult):
+        """비용이 낮은 단계부터 검증하여 result를 갱신
+        
+        hash → tile → ssim → ocr → vision_llm 순서로 진행하며,
+        통과/실패가 확정되면 이후 단계를 생략한다.
+        각 단계의 판정과 소요 시간은 details["cascade"]에 기록된다.
+        """
+        thresholds = self._cascade
+        trace = CascadeTrace()
+        
+        # 1단계: 전체 프레임 해시
+        started = time.perf_counter()
+        verify_result = self._verify_expected_frame(expected_path, frame, actual_image)
+        result.screenshot_match = verify_result["match"]
+        result.screenshot_similarity = verify_result["similarity"]
+        result.details["screenshot_verification"] = verify_result
+        if verify_result.get("error"):
+            trace.record(STAGE_HASH, DECISION_SKIP, started, note=verify_result["error"])
+        else:
+            trace.record(STAGE_HASH, DECISION_PASS if verify_result["match"] else DECISION_CONTINUE,
+                         started, score=verify_result["similarity"],
+                         note=f"hash_diff={verify_result.get('hash_diff')}")
+        
+        # 2단계: 타일 비교 (통과한 경우에도 변동 영역 학습을 위해 계산)
+        tiles = None
+        if self._tile_comparison and (not trace.resolved or self._learn_masks):
+            started = time.perf_counter()
+            tiles = self._compare_tiles(action_index, expected_path, frame, actual_image)
+            if tiles is not None:
+                verify_result["tile_comparison"] = tiles[0].to_dict(actual_image.size)
+            if not trace.resolved and thresholds.is_enabled(STAGE_TILE):
+                if tiles is None:
+                    trace.record(STAGE_TILE, DECISION_SKIP, started, note="타일 비교 불가")
+                else:
+                    comparison = tiles[0]
+                    changed = 1.0 - comparison.tile_similarity
+                    if comparison.is_stable:
+                        decision = DECISION_PASS
+                        if comparison.masked_tiles:
+                            verify_result["masked_match"] = True
+                    elif thresholds.tile_fail_ratio > 0 and changed >= thresholds.tile_fail_ratio:
+                        decision = DECISION_FAIL
+                    else:
+                        decision = DECISION_CONTINUE
+                    trace.record(STAGE_TILE, decision, started, score=comparison.tile_similarity,
+                                 note=f"changed={len(comparison.unmasked_changed_tiles)}, "
+                                      f"masked={len(comparison.masked_tiles)}")
+        
+        # 3단계: 축소 그레이스케일 SSIM
+        if not trace.resolved and thresholds.is_enabled(STAGE_SSIM):
+            started = time.perf_counter()
+            if tiles is None:
+                trace.record(STAGE_SSIM, DECISION_SKIP, started, note="타일 데이터 없음")
+            else:
+                mean_ssim, worst_ssim = tile_ssim(tiles[1], tiles[2], tiles[3])
+                if worst_ssim >= thresholds.ssim_pass:
+                    decision = DECISION_PASS
+                elif mean_ssim < thresholds.ssim_fail:
+                    decision = DECISION_FAIL
+                else:
+                    decision = DECISION_CONTINUE
+                trace.record(STAGE_SSIM, decision, started, score=mean_ssim,
+                             note=f"min={worst_ssim:.3f}")
+        
+        # 4단계: 텍스트 OCR 비교
+        if not trace.resolved and thresholds.is_enabled(STAGE_OCR):
+            started = time.perf_counter()
+            decision, score, note = self._compare_ocr_texts(
+                expected_path, actual_image, tiles[3] if tiles else set()
+            )
+            trace.record(STAGE_OCR, decision, started, score=score, note=note)
+        
+        # 5단계: 애매한 구간만 Vision LLM으로 재검증
+        if not trace.resolved and thresholds.is_enabled(STAGE_VISION):
+            logger.info(f"[{action_index}] 스크린샷 불일치 (similarity={result.screenshot_similarity:.3f}), Vision LLM 검증 시도...")
+            result.vision_verified = True
+            started = time.perf_counter()
+            try:
+                vision_match, vision_details = self._verify_with_vision_llm(
+                    expected_path, actual_image, action
+                )
+                result.vision_match = vision_match
+                result.details["vision_details"] = vision_details
+                trace.record(STAGE_VISION, DECISION_PASS if vision_match else DECISION_FAIL, started)
+            except Exception as e:
+                logger.error(f"Vision LLM 검증 오류: {e}")
+                result.details["vision_error"] = str(e)
+                trace.record(STAGE_VISION, DECISION_SKIP, started, note=str(e))
+        
+        result.details["cascade"] = trace.to_dict()
+        
+        if trace.decision == DECISION_PASS:
+            if trace.resolved_by in (STAGE_HASH, STAGE_TILE, STAGE_SSIM):
+                # 스크린샷 수준 일치 - PASS
+                verify_result["match"] = True
+                result.screenshot_match = True
+                result.final_result = "pass"
+                logger.info(f"[{action_index}] 스크린샷 검증 통과 ({trace.resolved_by}, similarity={result.screenshot_similarity:.3f})")
+            else:
+                result.final_result = "warning"  # 스크린샷은 다르지만 텍스트/의미적으로 일치
+                logger.info(f"[{action_index}] {trace.resolved_by} 검증 통과 (의미적 일치)")
+        elif trace.decision == DECISION_FAIL:
+            result.final_result = "fail"
+            logger.warning(f"[{action_index}] {trace.resolved_by} 검증 실패")
+        else:
+            # 판정 불가 (Vision LLM 오류/비활성) - 스크린샷 유사도가 높으면 warning으로 처리
+            if result.screenshot_similarity >= 0.7:
+                result.final_result = "warning"
+                reason = "Vision LLM 오류" if "vision_error" in result.details else "판정 단계 없음"
+                result.details["note"] = f"{reason}, 유사도 {result.screenshot_similarity:.1%}로 warning 처리"
+            else:
+                result.final_result = "fail"
+    
+    def _record_tile_observation(self, action_index: int, result: VerificationResult):
+        """통과한 프레임의 타일 변경 이력을 변동 영역 학습에 반영"""
+        if not (self._learn_masks and self._mask_store):
+            return
+        if result.details.get("cascade", {}).get("decision") != DECISION_PASS:
+            return
+        tiles = result.details.get("screenshot_verification", {}).get("tile_comparison")
+        if tiles is not None:
+            self._mask_store.record_observation(action_index, tiles["changed_tiles"])
+    
+    def save_region_masks(self):
+        """학습된 변동 영역 마스크 저장 (변경이 있을 때만)"""
+        if self._mask_store and self._mask_store.dirty:
+            try:
+                self._mask_store.save()
+                logger.info(f"변동 영역 마스크 저장: {self._mask_store.path}")
+            except OSError as e:
+                logger.warning(f"변동 영역 마스크 저장 실패: {e}")
+    
     def _capture_screenshot(self) -> Image.Image:
         """게임 윈도우 스크린샷 캡처
         
@@ -203,22 +670,55 @@ class ReplayVerifier:
             action: 현재 액션 데이터 딕셔너리
             next_action: 다음 액션 데이터 (현재 사용하지 않음)
             
+        Returns:
+            VerificationResult 객체
+        """
+        # 현재 화면 캡처 (게임 윈도우만)
+        try:
+            current_screenshot = self.capture_frame()
+        except Exception as e:
+            logger.error(f"스크린샷 캡처 실패: {e}")
+            result = VerificationResult(
+                action_index=action_index,
+                action_description=action.get('description', f'액션 {action_index}'),
+                screenshot_match=False,
+                screenshot_similarity=0.0,
+                final_result="fail"
+            )
+            result.details["error"] = str(e)
+            self._append_result(result)
+            return result
+        
+        return self.verify_captured_frame(action_index, action, current_screenshot)
+    
+    def capture_frame(self) -> Image.Image:
+        """검증용 현재 화면 캡처 (저장/비교 없이 캡처만 수행)
+        
+        백그라운드 검증 모드에서 replay 스레드는 이 메서드로 캡처만 하고,
+        비교는 verify_captured_frame()으로 작업 스레드에서 수행한다.
+        """
+        return self._capture_screenshot()
+    
+    def verify_captured_frame(self, action_index: int, action: Dict[str, Any],
+                              current_screenshot: Image.Image,
+                              record: bool = True) -> VerificationResult:
+        """캡처된 화면을 저장하고 예상 스크린샷과 비교
+        
+        Args:
+            action_index: 액션 인덱스
+            action: 액션 데이터 딕셔너리
+            current_screenshot: capture_frame()으로 캡처한 이미지
+            record: True면 결과를 바로 verification_results에 추가.
+                    False면 호출자가 record_result()로 액션 순서대로 추가한다.
+            
         Returns:
             VerificationResult 객체
         """
         description = action.get('description', f'액션 {action_index}')
         
         # 현재 액션의 스크린샷과 비교 (녹화 시 액션 후 대기 후 캡처했으므로)
-        expected_screenshot = action.get('screenshot_path', '')
-        
-        # 상대 경로를 절대 경로로 변환 (프로젝트 루트 기준)
-        if expected_screenshot and not os.path.isabs(expected_screenshot):
-            # 프로젝트 루트 찾기 (src 폴더의 상위)
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            # 경로 구분자 정규화 (Windows 호환)
-            expected_screenshot = expected_screenshot.replace('/', os.sep).replace('\\', os.sep)
-            expected_screenshot = os.path.join(project_root, expected_screenshot)
-            expected_screenshot = os.path.normpath(expected_screenshot)
+        # 매니페스트가 있으면 경로 해석/존재 확인을 생략 (컴파일 시 완료)
+        expected_screenshot, expected_frame = self._resolve_expected_frame(action_index, action)
         
         result = VerificationResult(
             action_index=action_index,
@@ -230,82 +730,66 @@ class ReplayVerifier:
         result.details["expected_screenshot_path"] = expected_screenshot
         
         # 디버그: 경로 존재 여부 출력
-        if expected_screenshot:
+        if expected_screenshot and expected_frame is None:
             exists = os.path.exists(expected_screenshot)
             logger.info(f"[{action_index}] 예상 스크린샷 경로: {expected_screenshot}, 존재: {exists}")
             if not exists:
                 print(f"  ⚠ 예상 스크린샷 경로: {expected_screenshot}")
                 print(f"  ⚠ 파일 존재 여부: {exists}")
         
-        # 현재 화면 캡처 (게임 윈도우만)
+        # replay 스크린샷 저장
         try:
-            current_screenshot = self._capture_screenshot()
-            
-            # replay 스크린샷 저장
             replay_screenshot_path = os.path.join(
                 self._replay_screenshots_dir, 
                 f"action_{action_index:04d}.png"
             )
             current_screenshot.save(replay_screenshot_path)
             result.details["replay_screenshot"] = replay_screenshot_path
-            
         except Exception as e:
-            logger.error(f"스크린샷 캡처 실패: {e}")
+            logger.error(f"replay 스크린샷 저장 실패: {e}")
             result.final_result = "fail"
             result.details["error"] = str(e)
-            self.verification_results.append(result)
+            if record:
+                self._append_result(result)
             return result
         
-        # 1단계: 스크린샷 비교
-        if expected_screenshot and os.path.exists(expected_screenshot):
-            verify_result = self.screenshot_verifier.verify_screenshot(
-                expected_screenshot, current_screenshot
+        # 단계별 검증 (hash → tile → ssim → ocr → vision_llm)
+        if expected_frame is not None or (expected_screenshot and os.path.exists(expected_screenshot)):
+            self._run_verification_cascade(
+                action_index, action, expected_screenshot, expected_frame, current_screenshot, result
             )
-            result.screenshot_match = verify_result["match"]
-            result.screenshot_similarity = verify_result["similarity"]
-            result.details["screenshot_verification"] = verify_result
-            
-            if result.screenshot_match:
-                # 스크린샷 일치 - PASS
-                result.final_result = "pass"
-                logger.info(f"[{action_index}] 스크린샷 검증 통과 (similarity={result.screenshot_similarity:.3f})")
-            else:
-                # 2단계: Vision LLM으로 재검증
-                logger.info(f"[{action_index}] 스크린샷 불일치 (similarity={result.screenshot_similarity:.3f}), Vision LLM 검증 시도...")
-                result.vision_verified = True
-                
-                try:
-                    vision_match, vision_details = self._verify_with_vision_llm(
-                        expected_screenshot, current_screenshot, action
-                    )
-                    result.vision_match = vision_match
-                    result.details["vision_details"] = vision_details
-                    
-                    if vision_match:
-                        result.final_result = "warning"  # 스크린샷은 다르지만 의미적으로 일치
-                        logger.info(f"[{action_index}] Vision LLM 검증 통과 (의미적 일치)")
-                    else:
-                        result.final_result = "fail"
-                        logger.warning(f"[{action_index}] Vision LLM 검증 실패")
-                        
-                except Exception as e:
-                    logger.error(f"Vision LLM 검증 오류: {e}")
-                    # Vision LLM 실패해도 스크린샷 유사도가 높으면 warning으로 처리
-                    if result.screenshot_similarity >= 0.7:
-                        result.final_result = "warning"
-                        result.details["note"] = f"Vision LLM 오류, 유사도 {result.screenshot_similarity:.1%}로 warning 처리"
-                    else:
-                        result.final_result = "fail"
-                    result.details["vision_error"] = str(e)
         else:
             # 예상 스크린샷 없음 - 검증 불가, warning 처리
             result.final_result = "warning"
             result.details["note"] = "예상 스크린샷 없음, 검증 생략"
             logger.warning(f"[{action_index}] 예상 스크린샷 없음: {expected_screenshot}")
         
-        self.verification_results.append(result)
+        if record:
+            self.record_result(action_index, result)
         return result
     
+    def record_result(self, action_index: int, result: VerificationResult):
+        """검증 결과를 세션에 추가하고 변동 영역 학습에 반영"""
+        self._record_tile_observation(action_index, result)
+        self._append_result(result)
+    
+    def _append_result(self, result: VerificationResult):
+        """검증 결과 추가 (스트리밍 보고서에 즉시 기록)
+        
+        기록 후 메모리의 결과에서는 UI 요소 목록 등 대용량 상세 정보를 제거한다.
+        """
+        if self._report_stream and self._report_stream.is_open:
+            try:
+                self._report_stream.write_result(result.to_dict())
+                vision_details = result.details.get("vision_details")
+                if isinstance(vision_details, dict):
+                    result.details["vision_details"] = {
+                        k: v for k, v in vision_details.items() if k not in _HEAVY_VISION_DETAILS
+                    }
+            except (OSError, ValueError) as e:
+                logger.warning(f"스트리밍 보고서 기록 실패: {e}")
+        self.verification_results.append(result)
+    
     def _verify_with_vision_llm(self, expected_path: str, actual_image: Image.Image, 
                                 action: Dict[str, Any]) -> Tuple[bool, Dict[str, Any]]:
         """Vision LLM으로 의미적 검증
@@ -321,13 +805,10 @@ class ReplayVerifier:
         details = {}
         
         try:
-            # 예상 이미지 로드
-            expected_image = Image.open(expected_path)
-            
-            # 예상 이미지 분석
-            logger.info("예상 이미지 Vision LLM 분석 중...")
-            expected_ui = self.ui_analyzer.analyze_with_retry(expected_image, retry_count=2)
+            # 예상 이미지 분석 (저장된 분석 결과가 있으면 재사용)
+            expected_ui = self._analyze_expected_frame(expected_path)
             details["expected_ui_source"] = expected_ui.get("source", "unknown")
+            details["expected_ui_cached"] = expected_ui.get("cached", False)
             
             # 예상 이미지 분석 결과 상세 기록
             expected_buttons = [b.get('text', '') for b in expected_ui.get('buttons', []) if b.get('text')]
@@ -384,6 +865,28 @@ class ReplayVerifier:
             details["error"] = str(e)
             raise
     
+    def _analyze_expected_frame(self, expected_path: str) -> Dict[str, Any]:
+        """예상 이미지 UI 분석
+        
+        분석 저장소에 유효한 결과가 있으면 Vision LLM을 호출하지 않고 반환하고,
+        없거나 오래되었으면 분석 후 저장한다.
+        
+        Args:
+            expected_path: 예상 스크린샷 경로
+            
+        Returns:
+            UI 분석 결과 딕셔너리
+        """
+        if self._analysis_store is not None:
+            try:
+                return self._analysis_store.get_or_analyze(expected_path)
+            except Exception as e:
+                logger.warning(f"예상 프레임 분석 저장소 사용 실패, 직접 분석: {e}")
+        
+        logger.info("예상 이미지 Vision LLM 분석 중...")
+        expected_image = Image.open(expected_path)
+        return self.ui_analyzer.analyze_with_retry(expected_image, retry_count=2)
+    
     def _compare_ui_elements(self, expected_ui: Dict, actual_ui: Dict, 
                             action: Dict[str, Any]) -> Tuple[bool, float, Dict[str, Any]]:
         """UI 요소 비교
@@ -453,53 +956,21 @@ class ReplayVerifier:
             ReplayReport 객체
         """
         end_time = datetime.now().isoformat()
+        self.save_region_masks()
+        if self._report_stream:
+            self._report_stream.close(end_time)
         
-        passed = sum(1 for r in self.verification_results if r.final_result == "pass")
-        failed = sum(1 for r in self.verification_results if r.final_result == "fail")
-        warnings = sum(1 for r in self.verification_results if r.final_result == "warning")
-        total = len(self.verification_results)
-        
-        success_rate = (passed + warnings) / total if total > 0 else 0.0
-        
-        # 요약 생성
-        summary_lines = [
-            f"테스트 케이스: {self.test_case_name}",
-            f"실행 시간: {self.start_time} ~ {end_time}",
-            f"",
-            f"=== 검증 결과 요약 ===",
-            f"총 액션 수: {total}",
-            f"✓ 통과 (PASS): {passed}",
-            f"⚠ 경고 (WARNING): {warnings}",
-            f"✗ 실패 (FAIL): {failed}",
-            f"성공률: {success_rate * 100:.1f}%",
-        ]
-        
-        if failed > 0:
-            summary_lines.append("")
-            summary_lines.append("=== 실패한 액션 ===")
-            for r in self.verification_results:
-                if r.final_result == "fail":
-                    summary_lines.append(f"  [{r.action_index}] {r.action_description}")
-        
-        report = ReplayReport(
-            test_case_name=self.test_case_name,
-            session_id=self.session_id,
-            start_time=self.start_time,
-            end_time=end_time,
-            total_actions=total,
-            passed_count=passed,
-            failed_count=failed,
-            warning_count=warnings,
-            success_rate=success_rate,
-            verification_results=self.verification_results,
-            summary="\n".join(summary_lines)
+        return build_replay_report(
+            self.test_case_name, self.session_id, self.start_time, end_time,
+            self.verification_results
         )
-        
-        return report
     
     def save_report(self, report: ReplayReport, output_dir: str = "reports") -> str:
         """보고서 저장
         
+        스트리밍 보고서가 있으면 상세 결과는 JSONL에서 읽어 기록한다.
+        (메모리의 결과는 UI 요소 목록 등이 제거된 요약본)
+        
         Args:
             report: ReplayReport 객체
             output_dir: 출력 디렉토리
@@ -507,26 +978,12 @@ class ReplayVerifier:
         Returns:
             저장된 파일 경로
         """
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # JSON 보고서 저장
-        json_path = os.path.join(output_dir, f"{self.test_case_name}_{self.session_id}_report.json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(report.to_dict(), f, ensure_ascii=False, indent=2)
-        
-        # 텍스트 보고서 저장
-        txt_path = os.path.join(output_dir, f"{self.test_case_name}_{self.session_id}_report.txt")
-        with open(txt_path, 'w', encoding='utf-8') as f:
-            f.write(report.summary)
-            f.write("\n\n")
-            f.write("=== 상세 결과 ===\n")
-            for r in report.verification_results:
-                status = {"pass": "✓", "fail": "✗", "warning": "⚠"}.get(r.final_result, "?")
-                f.write(f"{status} [{r.action_index}] {r.action_description}\n")
-                f.write(f"    스크린샷 유사도: {r.screenshot_similarity:.3f}\n")
-                if r.vision_verified:
-                    f.write(f"    Vision LLM 검증: {'통과' if r.vision_match else '실패'}\n")
-        
+        stream = self._report_stream
+        if stream and stream.result_count and stream.path and os.path.exists(stream.path):
+            stream.close(report.end_time)
+            json_path = write_report_files(report, output_dir, iter_stream_results(stream.path))
+        else:
+            json_path = write_report_files(report, output_dir)
         logger.info(f"보고서 저장: {json_path}")
         return json_path
     
@@ -564,14 +1021,7 @@ class ReplayVerifier:
             검증 결과
         """
         description = action.get('description', f'액션 {action_index}')
-        expected_screenshot = action.get('screenshot_path', '')
-        
-        # 상대 경로를 절대 경로로 변환 (프로젝트 루트 기준)
-        if expected_screenshot and not os.path.isabs(expected_screenshot):
-            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            expected_screenshot = expected_screenshot.replace('/', os.sep).replace('\\', os.sep)
-            expected_screenshot = os.path.join(project_root, expected_screenshot)
-            expected_screenshot = os.path.normpath(expected_screenshot)
+        expected_screenshot, expected_frame = self._resolve_expected_frame(action_index, action)
         
         result = VerificationResult(
             action_index=action_index,
@@ -583,11 +1033,11 @@ class ReplayVerifier:
         result.details["expected_screenshot_path"] = expected_screenshot
         
         # Requirements 3.2: screenshot_path가 없으면 warning 처리
-        if not expected_screenshot or not os.path.exists(expected_screenshot):
+        if expected_frame is None and (not expected_screenshot or not os.path.exists(expected_screenshot)):
             result.final_result = "warning"
             result.details["note"] = "screenshot_path 없음 또는 파일 미존재, 검증 생략"
             logger.warning(f"[{action_index}] screenshot_path 없음, warning 처리: {expected_screenshot}")
-            self.verification_results.append(result)
+            self._append_result(result)
             return result
         
         # replay 스크린샷 저장
@@ -602,54 +1052,18 @@ class ReplayVerifier:
         except Exception as e:
             logger.warning(f"replay 스크린샷 저장 실패: {e}")
         
-        # Requirements 3.1: screenshot_path로 검증 수행
+        # Requirements 3.1: screenshot_path로 검증 수행 (단계별 검증)
         try:
-            verify_result = self.screenshot_verifier.verify_screenshot(
-                expected_screenshot, current_screenshot
+            self._run_verification_cascade(
+                action_index, action, expected_screenshot, expected_frame, current_screenshot, result
             )
-            result.screenshot_match = verify_result["match"]
-            result.screenshot_similarity = verify_result["similarity"]
-            result.details["screenshot_verification"] = verify_result
-            
-            if result.screenshot_match:
-                # 스크린샷 일치 - PASS
-                result.final_result = "pass"
-                logger.info(f"[{action_index}] 좌표 기반 검증 통과 (similarity={result.screenshot_similarity:.3f})")
-            else:
-                # Vision LLM으로 재검증
-                logger.info(f"[{action_index}] 스크린샷 불일치 (similarity={result.screenshot_similarity:.3f}), Vision LLM 검증 시도...")
-                result.vision_verified = True
-                
-                try:
-                    vision_match, vision_details = self._verify_with_vision_llm(
-                        expected_screenshot, current_screenshot, action
-                    )
-                    result.vision_match = vision_match
-                    result.details["vision_details"] = vision_details
-                    
-                    if vision_match:
-                        result.final_result = "warning"  # 스크린샷은 다르지만 의미적으로 일치
-                        logger.info(f"[{action_index}] Vision LLM 검증 통과 (의미적 일치)")
-                    else:
-                        result.final_result = "fail"
-                        logger.warning(f"[{action_index}] Vision LLM 검증 실패")
-                        
-                except Exception as e:
-                    logger.error(f"Vision LLM 검증 오류: {e}")
-                    # Vision LLM 실패해도 스크린샷 유사도가 높으면 warning으로 처리
-                    if result.screenshot_similarity >= 0.7:
-                        result.final_result = "warning"
-                        result.details["note"] = f"Vision LLM 오류, 유사도 {result.screenshot_similarity:.1%}로 warning 처리"
-                    else:
-                        result.final_result = "fail"
-                    result.details["vision_error"] = str(e)
-                    
         except Exception as e:
             logger.error(f"스크린샷 검증 실패: {e}")
             result.final_result = "fail"
             result.details["error"] = str(e)
         
-        self.verification_results.append(result)
+        self._record_tile_observation(action_index, result)
+        self._append_result(result)
         return result
     
     def determine_test_result(self) -> bool:
@@ -691,7 +1105,8 @@ class ReplayVerifier:
         total = len(replay_results)
         
         # 매칭 방법별 카운트 (Requirements: 4.1)
-        semantic_count = sum(1 for r in replay_results if r.method == 'semantic')
+        # 'template'(클릭 영역 크롭 매칭)도 현재 화면에서 요소 위치를 다시 찾으므로 의미론적 매칭으로 집계
+        semantic_count = sum(1 for r in replay_results if r.method in ('semantic', 'template'))
         coordinate_count = sum(1 for r in replay_results if r.method == 'coordinate')
         # 'direct'도 coordinate 기반으로 간주 (원래 좌표 그대로 사용)
         direct_count = sum(1 for r in replay_results if r.method == 'direct')
@@ -0,0 +1,223 @@
+"""
+ReportStream - 검증 결과 스트리밍 기록 (JSONL)
+
+ReplayVerifier는 검증 결과가 확정될 때마다 한 줄씩 JSONL 파일에 추가한다.
+replay 도중 프로세스가 종료되어도 그때까지의 결과가 남으며,
+남은 스트림은 기존 JSON/TXT 보고서 형식으로 마무리하거나 여러 실행을 합산할 수 있다.
+
+레코드 형식 (한 줄에 하나):
+    {"type": "session", "test_case_name": ..., "session_id": ..., "start_time": ...}
+    {"type": "result", "action_index": ..., ... VerificationResult.to_dict() ...}
+    {"type": "end", "end_time": ...}
+
+"end" 레코드가 없으면 중단된 실행으로 본다.
+마지막 줄이 쓰다 만 상태(JSON 오류)이면 해당 줄만 무시한다.
+"""
+
+import os
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+STREAM_SUFFIX = "_report.jsonl"
+
+RECORD_SESSION = "session"
+RECORD_RESULT = "result"
+RECORD_END = "end"
+
+
+def get_stream_path(output_dir: str, test_case_name: str, session_id: str) -> str:
+    """스트리밍 보고서 파일 경로 (JSON/TXT 보고서와 같은 이름 규칙)"""
+    return os.path.join(output_dir, f"{test_case_name}_{session_id}{STREAM_SUFFIX}")
+
+
+class ReportStreamWriter:
+    """검증 결과를 JSONL로 한 줄씩 기록 (기록마다 디스크에 반영)"""
+
+    def __init__(self, path: str, fsync: bool = True):
+        """
+        Args:
+            path: JSONL 파일 경로
+            fsync: 기록마다 os.fsync 호출 (전원 차단 등에도 결과 보존)
+        """
+        self.path = path
+        self.fsync = fsync
+        self.result_count = 0
+        self._file = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._file is not None
+
+    def open(self, test_case_name: str, session_id: str, start_time: str):
+        """파일을 열고 세션 레코드 기록"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        self._write({
+            "type": RECORD_SESSION,
+            "test_case_name": test_case_name,
+            "session_id": session_id,
+            "start_time": start_time
+        })
+
+    def write_result(self, result: Dict[str, Any]):
+        """검증 결과 레코드 추가 (VerificationResult.to_dict() 결과)"""
+        self._write({"type": RECORD_RESULT, **result})
+        self.result_count += 1
+
+    def close(self, end_time: Optional[str] = None):
+        """종료 레코드를 기록하고 파일 닫기"""
+        if self._file is None:
+            return
+        try:
+            self._write({"type": RECORD_END, "end_time": end_time or datetime.now().isoformat()})
+        finally:
+            self._file.close()
+            self._file = None
+
+    def _write(self, record: Dict[str, Any]):
+        if self._file is None:
+            raise ValueError(f"스트림이 열려 있지 않음: {self.path}")
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+
+def iter_stream_records(path: str) -> Iterator[Dict[str, Any]]:
+    """JSONL 레코드 순회 (손상된 줄은 경고 후 건너뜀)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"보고서 스트림 손상된 줄 무시: {path}:{line_no}")
+
+
+def iter_stream_results(path: str) -> Iterator[Dict[str, Any]]:
+    """결과 레코드만 순회 ("type" 키 제외)"""
+    for record in iter_stream_records(path):
+        if record.get("type") == RECORD_RESULT:
+            yield {k: v for k, v in record.items() if k != "type"}
+
+
+@dataclass
+class ReportStream:
+    """읽어들인 스트리밍 보고서"""
+    path: str
+    test_case_name: str = ""
+    session_id: str = ""
+    start_time: str = ""
+    end_time: str = ""
+    results: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def finished(self) -> bool:
+        """종료 레코드까지 기록된 실행인지"""
+        return bool(self.end_time)
+
+    def count(self, final_result: str) -> int:
+        return sum(1 for r in self.results if r.get("final_result") == final_result)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "test_case_name": self.test_case_name,
+            "session_id": self.session_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "finished": self.finished,
+            "total": len(self.results),
+            "passed": self.count("pass"),
+            "failed": self.count("fail"),
+            "warning": self.count("warning")
+        }
+
+
+def read_report_stream(path: str) -> ReportStream:
+    """JSONL 보고서 읽기 (중단된 실행도 기록된 결과까지 반환)"""
+    stream = ReportStream(path=path)
+    for record in iter_stream_records(path):
+        record_type = record.get("type")
+        if record_type == RECORD_SESSION:
+            stream.test_case_name = record.get("test_case_name", "")
+            stream.session_id = record.get("session_id", "")
+            stream.start_time = record.get("start_time", "")
+        elif record_type == RECORD_RESULT:
+            stream.results.append({k: v for k, v in record.items() if k != "type"})
+        elif record_type == RECORD_END:
+            stream.end_time = record.get("end_time", "")
+    return stream
+
+
+def find_report_streams(directory: str, test_case_name: Optional[str] = None) -> List[str]:
+    """디렉토리의 JSONL 보고서 목록 (이름순 = 세션 시간순)"""
+    if not os.path.isdir(directory):
+        return []
+    prefix = f"{test_case_name}_" if test_case_name else ""
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.endswith(STREAM_SUFFIX) and name.startswith(prefix)
+    )
+
+
+def aggregate_report_streams(paths: Iterable[str]) -> Dict[str, Any]:
+    """여러 실행(중단된 실행 포함)의 결과 합산
+
+    Returns:
+        runs: 실행별 요약, totals: 전체 결과 수,
+        failed_actions: 액션 인덱스별 실패 횟수
+    """
+    runs = []
+    totals = {"total": 0, "passed": 0, "failed": 0, "warning": 0}
+    failed_actions: Dict[int, int] = {}
+    for path in paths:
+        stream = read_report_stream(path)
+        summary = stream.to_dict()
+        runs.append(summary)
+        for key in totals:
+            totals[key] += summary[key]
+        for result in stream.results:
+            if result.get("final_result") == "fail":
+                index = result.get("action_index", -1)
+                failed_actions[index] = failed_actions.get(index, 0) + 1
+    return {
+        "runs": runs,
+        "finished_runs": sum(1 for r in runs if r["finished"]),
+        "interrupted_runs": sum(1 for r in runs if not r["finished"]),
+        "totals": totals,
+        "failed_actions": dict(sorted(failed_actions.items()))
+    }
+
+
+def finalize_report_stream(path: str, output_dir: Optional[str] = None):
+    """스트림(중단된 실행 포함)을 기존 JSON/TXT 보고서로 마무리
+
+    Args:
+        path: JSONL 파일 경로
+        output_dir: 보고서 저장 디렉토리 (None이면 JSONL과 같은 디렉토리)
+
+    Returns:
+        (ReplayReport, JSON 보고서 경로)
+    """
+    from src.replay_verifier import VerificationResult, build_replay_report, write_report_files
+
+    stream = read_report_stream(path)
+    results = [VerificationResult.from_dict(r) for r in stream.results]
+    report = build_replay_report(
+        stream.test_case_name, stream.session_id, stream.start_time,
+        stream.end_time or datetime.now().isoformat(), results
+    )
+    if not stream.finished:
+        report.summary += "\n\n⚠ 중단된 실행: 기록된 결과까지만 포함"
+    output_dir = output_dir or os.path.dirname(path) or "."
+    json_path = write_report_files(report, output_dir)
+    return report, json_path
@@ -0,0 +1,483 @@
+"""
+ScreenStateGraph - 녹화 기록에서 만든 화면 상태 그래프
+
+모든 테스트 케이스의 액션 전후 프레임을 모아
+- 노드(상태): 지각적으로 비슷한 프레임(aHash 해밍 거리 match_distance 이하)의 묶음
+- 간선(전환): 상태 A에서 실행한 액션과 그 결과 상태 B (관측 횟수, 전환 종류 포함)
+로 이루어진 그래프를 SQLite 파일에 저장한다.
+
+상태 인식은 다중 인덱스 해싱을 사용한다. 64비트 해시를 match_distance + 1개의 조각으로
+나누면 거리가 match_distance 이하인 두 해시는 적어도 한 조각이 정확히 같으므로
+(비둘기집 원리) 조각별 B-tree 인덱스 조회(O(log n))로 후보만 찾아 거리를 계산한다.
+
+테스트 케이스 JSON의 수정 시각을 기록해 두고 바뀐 테스트 케이스만 다시 반영한다.
+replay 중 화면이 기록과 어긋나면 현재 상태에서 다음 액션의 시작 상태까지
+알려진 최단 경로(plan_recovery)를 찾아 실행하여 동기화할 수 있다.
+
+저장 위치: <test_cases_dir>/state_graph.sqlite
+"""
+
+import os
+import json
+import logging
+import sqlite3
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from PIL import Image
+
+from src.frame_hasher import HASH_BITS, average_hash, hamming_distance
+from src.replay_manifest import resolve_frame_path
+
+logger = logging.getLogger(__name__)
+
+
+STATE_GRAPH_FILENAME = "state_graph.sqlite"
+DEFAULT_MATCH_DISTANCE = 6  # 같은 상태로 보는 aHash 최대 해밍 거리
+MAX_MATCH_DISTANCE = 15
+DEFAULT_MAX_PATH_LENGTH = 20
+
+# 재실행에 필요한 액션 필드 (간선에 저장, 스크린샷/타임스탬프 제외)
+REPLAY_FIELDS = ("action_type", "x", "y", "description", "button", "key", "text",
+                 "scroll_dx", "scroll_dy", "path")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS states (
+    id INTEGER PRIMARY KEY,
+    hash INTEGER NOT NULL,
+    observations INTEGER NOT NULL DEFAULT 1,
+    frame_path TEXT
+);
+CREATE TABLE IF NOT EXISTS state_chunks (
+    chunk INTEGER NOT NULL,
+    value INTEGER NOT NULL,
+    state_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_state_chunks ON state_chunks (chunk, value);
+CREATE TABLE IF NOT EXISTS transitions (
+    test_case TEXT NOT NULL,
+    from_state INTEGER NOT NULL,
+    to_state INTEGER NOT NULL,
+    action_key TEXT NOT NULL,
+    action TEXT NOT NULL,
+    action_index INTEGER NOT NULL,
+    transition_type TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (test_case, from_state, to_state, action_key)
+);
+CREATE INDEX IF NOT EXISTS idx_transitions_from ON transitions (from_state);
+CREATE TABLE IF NOT EXISTS action_states (
+    test_case TEXT NOT NULL,
+    action_index INTEGER NOT NULL,
+    before_state INTEGER,
+    after_state INTEGER,
+    PRIMARY KEY (test_case, action_index)
+);
+CREATE TABLE IF NOT EXISTS state_observations (
+    test_case TEXT NOT NULL,
+    state_id INTEGER NOT NULL,
+    count INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (test_case, state_id)
+);
+CREATE TABLE IF NOT EXISTS sources (
+    test_case TEXT PRIMARY KEY,
+    path TEXT,
+    mtime REAL,
+    action_count INTEGER,
+    updated_at TEXT
+);
+"""
+
+
+def get_state_graph_path(test_cases_dir: str) -> str:
+    """화면 상태 그래프 파일 경로"""
+    return os.path.join(test_cases_dir, STATE_GRAPH_FILENAME)
+
+
+def classify_transition(distance: int) -> str:
+    """전후 프레임 aHash 해밍 거리로 화면 전환 종류 판단"""
+    if distance == 0:
+        return "none"
+    if distance < 10:
+        return "minor_change"
+    if distance < 30:
+        return "partial_change"
+    return "full_transition"
+
+
+def chunk_widths(match_distance: int) -> List[int]:
+    """match_distance + 1개 조각의 비트 폭 (합계 64)"""
+    count = match_distance + 1
+    base, extra = divmod(HASH_BITS, count)
+    return [base + 1 if i < extra else base for i in range(count)]
+
+
+def split_hash(value: int, widths: Iterable[int]) -> List[int]:
+    """해시를 상위 비트부터 조각으로 나눔"""
+    chunks = []
+    shift = HASH_BITS
+    for width in widths:
+        shift -= width
+        chunks.append((value >> shift) & ((1 << width) - 1))
+    return chunks
+
+
+def _to_signed(value: int) -> int:
+    """64비트 부호 없는 해시 → SQLite INTEGER(부호 있는 64비트)"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+def replay_action(action: Dict[str, Any]) -> Dict[str, Any]:
+    """간선에 저장할 재실행용 액션 필드만 추출"""
+    return {k: action[k] for k in REPLAY_FIELDS if action.get(k) is not None}
+
+
+@dataclass
+class StateMatch:
+    """상태 인식 결과"""
+    state_id: int
+    distance: int
+
+
+@dataclass
+class Transition:
+    """상태 전환 간선"""
+    from_state: int
+    to_state: int
+    action: Dict[str, Any]
+    test_case: str
+    action_index: int
+    transition_type: str
+    count: int = 1
+
+
+class ScreenStateGraph:
+    """SQLite 기반 화면 상태 그래프"""
+
+    def __init__(self, path: str, match_distance: int = DEFAULT_MATCH_DISTANCE):
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:" 가능)
+            match_distance: 같은 상태로 보는 최대 해밍 거리 (그래프를 처음 만들 때만 적용)
+        """
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        self.match_distance = self._init_match_distance(max(0, min(MAX_MATCH_DISTANCE, int(match_distance))))
+        self._widths = chunk_widths(self.match_distance)
+
+    @classmethod
+    def for_config(cls, config) -> 'ScreenStateGraph':
+        """설정(test_cases.directory, automation.state_match_distance)으로 그래프 열기"""
+        test_cases_dir = config.get('test_cases.directory', 'test_cases')
+        return cls(
+            get_state_graph_path(test_cases_dir),
+            config.get('automation.state_match_distance', DEFAULT_MATCH_DISTANCE)
+        )
+
+    def _init_match_distance(self, requested: int) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'match_distance'").fetchone()
+        if row is None:
+            with self._conn:
+                self._conn.execute("INSERT INTO meta (key, value) VALUES ('match_distance', ?)", (str(requested),))
+            return requested
+        stored = int(row[0])
+        if stored != requested:
+            logger.warning(f"상태 그래프는 match_distance={stored}로 만들어짐 (요청 {requested}), "
+                           f"기존 값 사용 (바꾸려면 전체 재구성): {self.path}")
+        return stored
+
+    def close(self):
+        self._conn.close()
+
+    # ----- 상태 -----
+
+    @property
+    def state_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM states").fetchone()[0]
+
+    @property
+    def transition_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM transitions").fetchone()[0]
+
+    @staticmethod
+    def hash_image(image: Image.Image) -> int:
+        """상태 인식에 사용하는 프레임 해시 (aHash, SemanticAction.ui_state_hash와 동일)"""
+        return average_hash(image)
+
+    def recognize(self, value: int) -> Optional[StateMatch]:
+        """해시와 가장 가까운 상태 (match_distance 이내가 없으면 None)"""
+        candidates = set()
+        for chunk, part in enumerate(split_hash(value, self._widths)):
+            rows = self._conn.execute(
+                "SELECT state_id FROM state_chunks WHERE chunk = ? AND value = ?", (chunk, part)
+            )
+            candidates.update(row[0] for row in rows)
+        if not candidates:
+            return None
+
+        placeholders = ",".join("?" * len(candidates))
+        best = None
+        for state_id, stored in self._conn.execute(
+            f"SELECT id, hash FROM states WHERE id IN ({placeholders})", tuple(candidates)
+        ):
+            distance = hamming_distance(value, _to_unsigned(stored))
+            if distance <= self.match_distance and (best is None or
+                                                    (distance, state_id) < (best.distance, best.state_id)):
+                best = StateMatch(state_id, distance)
+        return best
+
+    def recognize_image(self, image: Image.Image) -> Optional[StateMatch]:
+        """프레임 이미지로 현재 상태 인식"""
+        return self.recognize(self.hash_image(image))
+
+    def add_observation(self, value: int, frame_path: Optional[str] = None) -> int:
+        """프레임 해시를 기존 상태에 합치거나 새 상태로 추가
+
+        Returns:
+            상태 ID
+        """
+        match = self.recognize(value)
+        if match is not None:
+            self._conn.execute("UPDATE states SET observations = observations + 1 WHERE id = ?", (match.state_id,))
+            return match.state_id
+        cursor = self._conn.execute(
+            "INSERT INTO states (hash, frame_path) VALUES (?, ?)", (_to_signed(value), frame_path)
+        )
+        state_id = cursor.lastrowid
+        self._conn.executemany(
+            "INSERT INTO state_chunks (chunk, value, state_id) VALUES (?, ?, ?)",
+            [(chunk, part, state_id) for chunk, part in enumerate(split_hash(value, self._widths))]
+        )
+        return state_id
+
+    # ----- 테스트 케이스 반영 -----
+
+    def _frame_hash(self, action: Dict[str, Any], when: str) -> Tuple[Optional[int], Optional[str]]:
+        """액션 전/후 프레임 해시와 경로 (저장된 ui_state_hash 우선, 없으면 스크린샷 파일에서 계산)"""
+        stored = action.get(f"ui_state_hash_{when}")
+        if when == "before":
+            frame_path = action.get("screenshot_before_path")
+        else:
+            frame_path = action.get("screenshot_after_path") or action.get("screenshot_path")
+        if stored:
+            return int(stored, 16), frame_path
+        resolved = resolve_frame_path(frame_path)
+        if not resolved or not os.path.exists(resolved):
+            return None, None
+        try:
+            with Image.open(resolved) as image:
+                return self.hash_image(image), frame_path
+        except (OSError, ValueError) as e:
+            logger.warning(f"상태 그래프 프레임 해시 실패, 무시: {resolved} ({e})")
+            return None, None
+
+    def ingest_test_case(self, test_case: Dict[str, Any], name: Optional[str] = None,
+                         source_path: Optional[str] = None, mtime: Optional[float] = None) -> int:
+        """테스트 케이스의 액션 전후 상태와 전환을 그래프에 반영 (같은 이름의 기존 반영분은 교체)
+
+        Args:
+            test_case: 테스트 케이스 데이터 (actions 포함)
+            name: 테스트 케이스 이름 (None이면 test_case["name"])
+            source_path: 테스트 케이스 JSON 경로 (증분 갱신용)
+            mtime: 테스트 케이스 JSON 수정 시각 (증분 갱신용)
+
+        Returns:
+            반영된 전환 수
+        """
+        name = name or test_case.get("name", "unknown")
+        actions = test_case.get("actions", [])
+        count = 0
+        with self._conn:
+            self._remove_test_case(name)
+
+            current = None  # 직전 액션 후 상태
+            for index, action in enumerate(actions):
+                if action.get("action_type") == "wait":
+                    continue
+                before_hash, before_path = self._frame_hash(action, "before")
+                after_hash, after_path = self._frame_hash(action, "after")
+                before = self._observe(name, before_hash, before_path) if before_hash is not None else current
+                after = self._observe(name, after_hash, after_path) if after_hash is not None else None
+                self._conn.execute(
+                    "INSERT INTO action_states (test_case, action_index, before_state, after_state) "
+                    "VALUES (?, ?, ?, ?)", (name, index, before, after)
+                )
+
+                if before is not None and after is not None:
+                    self._add_transition(name, index, action, before, after, before_hash, after_hash)
+                    count += 1
+                current = after
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sources (test_case, path, mtime, action_count, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (name, source_path, mtime, len(actions), datetime.now().isoformat())
+            )
+        return count
+
+    def _observe(self, test_case: str, value: int, frame_path: Optional[str]) -> int:
+        """add_observation + 테스트 케이스별 관측 수 기록 (재반영 시 차감용)"""
+        state_id = self.add_observation(value, frame_path)
+        self._conn.execute(
+            "INSERT INTO state_observations (test_case, state_id) VALUES (?, ?) "
+            "ON CONFLICT (test_case, state_id) DO UPDATE SET count = count + 1",
+            (test_case, state_id)
+        )
+        return state_id
+
+    def _remove_test_case(self, test_case: str):
+        """테스트 케이스의 기존 반영분(전환, 액션 상태, 상태 관측 수)을 제거하고 관측이 없어진 상태 삭제"""
+        self._conn.execute("DELETE FROM transitions WHERE test_case = ?", (test_case,))
+        self._conn.execute("DELETE FROM action_states WHERE test_case = ?", (test_case,))
+        contributed = self._conn.execute(
+            "SELECT state_id, count FROM state_observations WHERE test_case = ?", (test_case,)
+        ).fetchall()
+        if not contributed:
+            return
+        self._conn.executemany(
+            "UPDATE states SET observations = observations - ? WHERE id = ?",
+            [(count, state_id) for state_id, count in contributed]
+        )
+        self._conn.execute("DELETE FROM state_observations WHERE test_case = ?", (test_case,))
+        orphans = [(row[0],) for row in self._conn.execute("SELECT id FROM states WHERE observations <= 0")]
+        self._conn.executemany("DELETE FROM state_chunks WHERE state_id = ?", orphans)
+        self._conn.executemany("DELETE FROM states WHERE id = ?", orphans)
+
+    def _add_transition(self, test_case: str, index: int, action: Dict[str, Any], before: int, after: int,
+                        before_hash: Optional[int], after_hash: Optional[int]):
+        transition_type = (action.get("screen_transition") or {}).get("transition_type")
+        if not transition_type:
+            if before_hash is not None and after_hash is not None:
+                transition_type = classify_transition(hamming_distance(before_hash, after_hash))
+            else:
+                transition_type = "none" if before == after else "unknown"
+        stored = replay_action(action)
+        action_key = json.dumps({k: v for k, v in stored.items() if k != "description"},
+                                sort_keys=True, ensure_ascii=False)
+        self._conn.execute(
+            "INSERT INTO transitions (test_case, from_state, to_state, action_key, action, action_index, "
+            "transition_type) VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (test_case, from_state, to_state, action_key) DO UPDATE SET count = count + 1",
+            (test_case, before, after, action_key, json.dumps(stored, ensure_ascii=False), index, transition_type)
+        )
+
+    def update_from_directory(self, test_cases_dir: str, force: bool = False) -> Dict[str, int]:
+        """테스트 케이스 디렉토리의 변경분만 그래프에 반영
+
+        Args:
+            test_cases_dir: 테스트 케이스 JSON 디렉토리
+            force: True면 수정 시각과 관계없이 모두 다시 반영
+
+        Returns:
+            {"updated", "skipped", "failed", "states", "transitions"}
+        """
+        known = {
+            name: mtime for name, mtime in self._conn.execute("SELECT test_case, mtime FROM sources")
+        }
+        stats = {"updated": 0, "skipped": 0, "failed": 0}
+        for filename in sorted(os.listdir(test_cases_dir)) if os.path.isdir(test_cases_dir) else []:
+            if not filename.endswith(".json"):
+                continue
+            json_path = os.path.join(test_cases_dir, filename)
+            mtime = os.path.getmtime(json_path)
+            try:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    test_case = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"상태 그래프: 테스트 케이스 로드 실패, 무시: {json_path} ({e})")
+                stats["failed"] += 1
+                continue
+            if not isinstance(test_case, dict) or not isinstance(test_case.get("actions"), list):
+                continue
+            name = test_case.get("name") or filename[:-5]
+            if not force and known.get(name) == mtime:
+                stats["skipped"] += 1
+                continue
+            self.ingest_test_case(test_case, name, json_path, mtime)
+            stats["updated"] += 1
+        stats["states"] = self.state_count
+        stats["transitions"] = self.transition_count
+        return stats
+
+    # ----- 조회 -----
+
+    def transitions_from(self, state_id: int) -> List[Transition]:
+        """상태에서 나가는 간선 (같은 액션은 테스트 케이스 간 관측 횟수 합산, 많이 관측된 순)"""
+        rows = self._conn.execute(
+            "SELECT from_state, to_state, action, MIN(test_case), MIN(action_index), transition_type, SUM(count) "
+            "FROM transitions WHERE from_state = ? AND to_state != from_state "
+            "GROUP BY to_state, action_key ORDER BY SUM(count) DESC, to_state",
+            (state_id,)
+        )
+        return [
+            Transition(from_state, to_state, json.loads(action), test_case, index, transition_type, count)
+            for from_state, to_state, action, test_case, index, transition_type, count in rows
+        ]
+
+    def shortest_path(self, from_state: int, to_state: int,
+                      max_length: int = DEFAULT_MAX_PATH_LENGTH) -> Optional[List[Transition]]:
+        """알려진 전환만으로 from_state에서 to_state까지 가는 최단 경로 (BFS)
+
+        Returns:
+            전환 목록 (같은 상태면 빈 목록, 경로가 없으면 None)
+        """
+        if from_state == to_state:
+            return []
+        previous: Dict[int, Transition] = {}
+        frontier = deque([(from_state, 0)])
+        visited = {from_state}
+        while frontier:
+            state, depth = frontier.popleft()
+            if depth >= max_length:
+                continue
+            for transition in self.transitions_from(state):
+                if transition.to_state in visited:
+                    continue
+                visited.add(transition.to_state)
+                previous[transition.to_state] = transition
+                if transition.to_state == to_state:
+                    path = [transition]
+                    while path[-1].from_state != from_state:
+                        path.append(previous[path[-1].from_state])
+                    return list(reversed(path))
+                frontier.append((transition.to_state, depth + 1))
+        return None
+
+    def action_states(self, test_case: str, action_index: int) -> Tuple[Optional[int], Optional[int]]:
+        """녹화 시 액션 전/후 상태 ID (기록이 없으면 (None, None))"""
+        row = self._conn.execute(
+            "SELECT before_state, after_state FROM action_states WHERE test_case = ? AND action_index = ?",
+            (test_case, action_index)
+        ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    def plan_recovery(self, current_hash: int, test_case: str, action_index: int,
+                      max_length: int = DEFAULT_MAX_PATH_LENGTH) -> Optional[List[Transition]]:
+        """현재 화면에서 action_index 액션의 녹화 시 시작 상태로 돌아가는 경로
+
+        Args:
+            current_hash: 현재 화면 해시 (hash_image)
+            test_case: 테스트 케이스 이름
+            action_index: 다음에 실행할 액션 인덱스
+            max_length: 최대 경로 길이
+
+        Returns:
+            실행할 전환 목록 (이미 같은 상태면 빈 목록, 인식/경로 탐색 실패 시 None)
+        """
+        target, _ = self.action_states(test_case, action_index)
+        if target is None:
+            return None
+        current = self.recognize(current_hash)
+        if current is None:
+            return None
+        return self.shortest_path(current.state_id, target, max_length)
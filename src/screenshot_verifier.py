@@ -7,9 +7,10 @@ ScreenshotVerifier - 스크린샷 비교 검증기
 
 import os
 import logging
-from typing import Tuple, Optional
+from typing import List, Sequence, Tuple, Optional
 from PIL import Image
-import imagehash
+
+from src.frame_hasher import FrameHashes, default_hasher, hamming_distance
 
 logger = logging.getLogger(__name__)
 
@@ -28,16 +29,38 @@ class ScreenshotVerifier:
         """
         self.hash_threshold = hash_threshold
     
-    def compute_hash(self, image: Image.Image) -> imagehash.ImageHash:
-        """이미지의 perceptual hash 계산
+    def compute_hash(self, image: Image.Image) -> int:
+        """이미지의 perceptual hash(pHash) 계산
+        
+        Args:
+            image: PIL Image 객체
+            
+        Returns:
+            64비트 pHash 정수
+        """
+        return default_hasher.hash_image(image).phash
+    
+    def compute_hashes(self, image: Image.Image) -> FrameHashes:
+        """이미지의 aHash/dHash/pHash를 한 번에 계산
         
         Args:
             image: PIL Image 객체
             
         Returns:
-            ImageHash 객체
+            FrameHashes 객체
         """
-        return imagehash.phash(image)
+        return default_hasher.hash_image(image)
+    
+    def compute_hashes_batch(self, images: Sequence[Image.Image]) -> List[FrameHashes]:
+        """여러 이미지의 해시를 일괄 계산
+        
+        Args:
+            images: PIL Image 리스트
+            
+        Returns:
+            FrameHashes 리스트 (입력 순서와 동일)
+        """
+        return default_hasher.hash_batch(images)
     
     def compare_images(self, image1: Image.Image, image2: Image.Image) -> Tuple[bool, int, float]:
         """두 이미지 비교
@@ -53,7 +76,7 @@ class ScreenshotVerifier:
         hash2 = self.compute_hash(image2)
         
         # 해시 차이 계산 (Hamming distance)
-        hash_diff = hash1 - hash2
+        hash_diff = hamming_distance(hash1, hash2)
         
         # 유사도 점수 계산 (0~1, 1이 완전 일치)
         # phash는 64비트이므로 최대 차이는 64
@@ -88,7 +111,66 @@ class ScreenshotVerifier:
         image2 = Image.open(path2)
         
         return self.compare_images(image1, image2)
-    
+
+    def compare_with_hash(self, expected_hash: str, image: Image.Image) -> Tuple[bool, int, float]:
+        """미리 계산된 해시와 이미지 비교
+
+        예상 이미지를 디코딩하지 않고 replay 매니페스트에 저장된 해시로 비교한다.
+
+        Args:
+            expected_hash: 예상 이미지의 phash (16진수 문자열)
+            image: 비교 대상 이미지
+
+        Returns:
+            (일치 여부, 해시 차이, 유사도 점수 0.0~1.0)
+        """
+        hash_diff = hamming_distance(int(expected_hash, 16), self.compute_hash(image))
+        similarity = 1.0 - (hash_diff / 64.0)
+        is_match = hash_diff <= self.hash_threshold
+
+        logger.debug(f"해시 비교: hash_diff={hash_diff}, similarity={similarity:.3f}, match={is_match}")
+
+        return is_match, hash_diff, similarity
+
+    def verify_with_hash(self, expected_hash: str, actual_image: Image.Image,
+                         expected_path: str = "") -> dict:
+        """미리 계산된 해시로 스크린샷 검증
+
+        verify_screenshot과 동일한 형식의 결과를 반환한다.
+
+        Args:
+            expected_hash: 예상 스크린샷의 phash (16진수 문자열)
+            actual_image: 실제 캡처된 이미지
+            expected_path: 예상 스크린샷 경로 (결과 기록용)
+
+        Returns:
+            검증 결과 딕셔너리 (verify_screenshot 참고)
+        """
+        result = {
+            "match": False,
+            "hash_diff": -1,
+            "similarity": 0.0,
+            "expected_path": expected_path,
+            "error": ""
+        }
+
+        try:
+            is_match, hash_diff, similarity = self.compare_with_hash(expected_hash, actual_image)
+            result["match"] = is_match
+            result["hash_diff"] = hash_diff
+            result["similarity"] = similarity
+
+            if is_match:
+                logger.info(f"스크린샷 일치: {expected_path} (similarity={similarity:.3f})")
+            else:
+                logger.warning(f"스크린샷 불일치: {expected_path} (hash_diff={hash_diff}, similarity={similarity:.3f})")
+
+        except Exception as e:
+            result["error"] = str(e)
+            logger.error(f"스크린샷 검증 실패: {e}")
+
+        return result
+
     def verify_screenshot(self, expected_path: str, actual_image: Image.Image) -> dict:
         """스크린샷 검증
         
@@ -9,12 +9,17 @@ import json
 import os
 import re
 import time
+from contextlib import nullcontext
 from typing import List, Dict, Any, Union, Optional, Tuple
 from PIL import Image
 import pyautogui
 
 from src.input_monitor import Action
+from src.input_timeline import replay_pointer_path
+from src.keystroke_coalescer import DEFAULT_TYPE_INTERVAL, key_press_args, parse_hotkey
+from src.replay_plan import PLAN_STEP_FIELDS, build_replay_plan
 from src.semantic_action_recorder import SemanticAction
+from src.timeline_scheduler import DEFAULT_REPLAY_SPEED, INSTANT_ACTIONS, REPLAY_TIMINGS, TimelineScheduler
 
 
 class ScriptGenerator:
@@ -29,223 +34,90 @@ class ScriptGenerator:
         self.verifier = None  # ReplayVerifier 인스턴스 (검증 모드용)
         self._verify_mode = False
         self._verification_results = []  # 검증 결과 저장
+        self.timeline_report: Optional[Dict[str, Any]] = None  # 마지막 타임라인 재실행의 스케줄 오차
     
     def generate_replay_script(self, actions: List[Action], output_path: str, 
                                verify_mode: bool = True, capture_delay: float = 2.0) -> str:
         """재실행 스크립트 생성
         
+        스크립트에는 재실행 계획(데이터)만 저장하고 실행은 src.replay_plan의
+        PlanInterpreter가 담당하므로, 재실행 엔진이 바뀌어도 다시 생성할 필요가 없다.
+        
         Args:
             actions: 액션 리스트
             output_path: 출력 파일 경로
-            verify_mode: 검증 모드 지원 여부 (기본: True)
+            verify_mode: 검증 모드 지원 여부 (기본: True, 생성된 스크립트는 항상 --verify 지원)
             capture_delay: 스크린샷 캡처 전 대기 시간 (기본: 2.0초)
             
         Returns:
             생성된 스크립트 경로
         """
-        # 스크립트 헤더 생성 (capture_delay 포함)
-        script_content = self._generate_script_header(verify_mode, capture_delay)
-        
-        # 액션 데이터 생성 (딕셔너리 형식으로 저장)
-        script_content += self._generate_actions_data(actions)
-        
-        # replay_actions 함수 생성 (액션 코드 직접 생성)
-        script_content += self._generate_replay_function_with_actions(actions, verify_mode)
-        
-        # 메인 실행 코드 생성
-        script_content += self._generate_main_code(verify_mode)
+        plan = build_replay_plan(
+            [self._plan_step(action) for action in actions],
+            window_title=self.config.get('game.window_title', ''),
+            capture_delay=capture_delay,
+            type_interval=self.config.get('automation.type_interval', DEFAULT_TYPE_INTERVAL)
+        )
         
         # UTF-8 인코딩으로 파일 저장 (Requirements 5.4)
         with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(script_content)
+            f.write(self._generate_launcher(plan))
         
         return output_path
     
-    def _generate_script_header(self, verify_mode: bool = True, capture_delay: float = 2.0) -> str:
-        """스크립트 헤더 생성
+    def _generate_launcher(self, plan: Dict[str, Any]) -> str:
+        """재실행 계획(PLAN)과 src.replay_plan 호출만 포함하는 스크립트 생성
         
         Args:
-            verify_mode: 검증 모드 지원 여부
-            capture_delay: 스크린샷 캡처 전 대기 시간 (초)
+            plan: 재실행 계획 (build_replay_plan)
             
         Returns:
-            헤더 문자열
+            스크립트 문자열
         """
-        # config에서 윈도우 타이틀 가져오기
-        window_title = self.config.get('game.window_title', '')
-        
-        header = '''#!/usr/bin/env python
+        steps = "".join(f"        {step!r},\n" for step in plan["steps"])
+        settings = "".join(f"    {key!r}: {value!r},\n" for key, value in plan.items() if key != "steps")
+        return '''#!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """
 자동 생성된 Replay Script
 
-이 스크립트는 기록된 액션을 재실행합니다.
+기록된 액션의 재실행 계획(PLAN)만 포함하며, 실행은 src/replay_plan.py가 담당합니다.
 --verify 옵션으로 검증 모드를 활성화할 수 있습니다.
 
 좌표는 게임 윈도우 기준 상대 좌표로 저장되어 있으며,
 재현 시 윈도우 위치를 감지하여 스크린 절대 좌표로 변환합니다.
 """
 
-import pyautogui
-import time
-import sys
 import os
+import sys
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# 윈도우 좌표 변환용 임포트
-try:
-    from src.window_capture import WindowCapture
-    WINDOW_CAPTURE_AVAILABLE = True
-except ImportError:
-    WINDOW_CAPTURE_AVAILABLE = False
+from src.replay_plan import main, run_plan
 
-# 게임 윈도우 타이틀
-GAME_WINDOW_TITLE = ''' + repr(window_title) + '''
+PLAN = {
+''' + settings + """    'steps': [
+""" + steps + '''    ],
+}
 
-# 녹화 시점의 스크린샷 캡처 대기 시간 (검증 시 동일하게 적용)
-CAPTURE_DELAY = ''' + str(capture_delay) + '''
 
-# 윈도우 오프셋 캐시
-_window_offset = None
+def replay_actions(action_delay=0.5, verify=False, test_case_name="unknown", skip_wait=True):
+    """액션을 순서대로 재실행 (검증 모드면 검증 보고서 반환)"""
+    return run_plan(PLAN, action_delay=action_delay, verify=verify,
+                    test_case_name=test_case_name, skip_wait=skip_wait)
 
-def get_window_offset():
-    """게임 윈도우의 스크린 오프셋 가져오기
-    
-    Returns:
-        (offset_x, offset_y) 튜플
-    """
-    global _window_offset
-    
-    if _window_offset is not None:
-        return _window_offset
-    
-    if WINDOW_CAPTURE_AVAILABLE and GAME_WINDOW_TITLE:
-        try:
-            wc = WindowCapture(GAME_WINDOW_TITLE)
-            if wc.find_window():
-                rect = wc.get_window_rect()
-                if rect:
-                    _window_offset = (rect[0], rect[1])
-                    return _window_offset
-        except Exception as e:
-            print(f"⚠ 윈도우 오프셋 가져오기 실패: {e}")
-    
-    _window_offset = (0, 0)
-    return _window_offset
-
-def to_screen_coords(window_x, window_y):
-    """윈도우 상대 좌표를 스크린 절대 좌표로 변환
-    
-    Args:
-        window_x: 윈도우 기준 X 좌표
-        window_y: 윈도우 기준 Y 좌표
-        
-    Returns:
-        (screen_x, screen_y) 스크린 절대 좌표
-    """
-    offset_x, offset_y = get_window_offset()
-    return (window_x + offset_x, window_y + offset_y)
-
-'''
-        if verify_mode:
-            header += '''
-# 검증 모드용 임포트
-try:
-    from src.config_manager import ConfigManager
-    from src.replay_verifier import ReplayVerifier
-    VERIFY_AVAILABLE = True
-except ImportError:
-    VERIFY_AVAILABLE = False
 
+if __name__ == '__main__':
+    main(PLAN, __file__)
 '''
-        return header
     
-    def _generate_actions_data(self, actions: List[Union[Action, SemanticAction]]) -> str:
-        """액션 데이터를 Python 리스트로 변환
-        
-        SemanticAction의 경우 semantic_info, screenshot_before_path 등 
-        추가 필드도 포함하여 저장한다.
-        
-        Requirements: 2.1, 2.2, 2.3
-        
-        Args:
-            actions: 액션 리스트 (Action 또는 SemanticAction)
-            
-        Returns:
-            액션 데이터 문자열
-        """
-        data = "# 기록된 액션 데이터\n"
-        data += "ACTIONS = [\n"
-        
-        for action in actions:
-            data += "    {\n"
-            data += f"        'timestamp': {repr(action.timestamp)},\n"
-            data += f"        'action_type': {repr(action.action_type)},\n"
-            data += f"        'x': {action.x},\n"
-            data += f"        'y': {action.y},\n"
-            data += f"        'description': {repr(action.description)},\n"
-            
-            # wait 액션의 경우 description에서 시간 파싱 (Requirements 5.5)
-            if action.action_type == 'wait':
-                wait_time = self._parse_wait_time(action.description)
-                data += f"        'wait_time': {wait_time},\n"
-            
-            # 선택적 필드 추가
-            if action.button:
-                data += f"        'button': '{action.button}',\n"
-            if action.key:
-                # 키 값을 문자열로 안전하게 변환
-                key_str = str(action.key).replace("'", "\\'")
-                data += f"        'key': '{key_str}',\n"
-            if action.scroll_dx is not None:
-                data += f"        'scroll_dx': {action.scroll_dx},\n"
-            if action.scroll_dy is not None:
-                data += f"        'scroll_dy': {action.scroll_dy},\n"
-            if action.screenshot_path:
-                data += f"        'screenshot_path': '{action.screenshot_path}',\n"
-            
-            # SemanticAction 추가 필드 (Requirements: 2.1, 2.2, 2.3)
-            if isinstance(action, SemanticAction):
-                # screenshot_before_path (Requirements: 2.2)
-                if action.screenshot_before_path:
-                    data += f"        'screenshot_before_path': {repr(action.screenshot_before_path)},\n"
-                
-                # screenshot_after_path
-                if action.screenshot_after_path:
-                    data += f"        'screenshot_after_path': {repr(action.screenshot_after_path)},\n"
-                
-                # click_region_crop_path
-                if action.click_region_crop_path:
-                    data += f"        'click_region_crop_path': {repr(action.click_region_crop_path)},\n"
-                
-                # ui_state_hash_before
-                if action.ui_state_hash_before:
-                    data += f"        'ui_state_hash_before': {repr(action.ui_state_hash_before)},\n"
-                
-                # ui_state_hash_after
-                if action.ui_state_hash_after:
-                    data += f"        'ui_state_hash_after': {repr(action.ui_state_hash_after)},\n"
-                
-                # semantic_info (Requirements: 2.1, 2.3)
-                if action.semantic_info:
-                    # semantic_info를 JSON 형식으로 직렬화
-                    semantic_info_str = json.dumps(action.semantic_info, ensure_ascii=False, indent=12)
-                    # 들여쓰기 조정
-                    semantic_info_str = semantic_info_str.replace('\n', '\n        ')
-                    data += f"        'semantic_info': {semantic_info_str},\n"
-                
-                # screen_transition
-                if action.screen_transition:
-                    screen_transition_str = json.dumps(action.screen_transition, ensure_ascii=False, indent=12)
-                    screen_transition_str = screen_transition_str.replace('\n', '\n        ')
-                    data += f"        'screen_transition': {screen_transition_str},\n"
-            
-            data += "    },\n"
-        
-        data += "]\n\n"
-        return data
+    def _plan_step(self, action: Union[Action, SemanticAction]) -> Dict[str, Any]:
+        """액션을 재실행 계획 단계로 변환 (wait 액션은 description에서 대기 시간 파싱)"""
+        step = {field: getattr(action, field, None) for field in PLAN_STEP_FIELDS}
+        if action.action_type == 'wait':
+            step['wait_time'] = self._parse_wait_time(action.description)
+        return step
     
     def _parse_wait_time(self, description: str) -> float:
         """대기 액션의 description에서 시간 파싱
@@ -264,292 +136,6 @@ except ImportError:
             # 파싱 실패 시 기본 1초
             return 1.0
     
-    def _generate_replay_function_with_actions(self, actions: List[Action], 
-                                                verify_mode: bool = True) -> str:
-        """액션을 직접 코드로 변환하여 replay_actions 함수 생성
-        
-        Args:
-            actions: 액션 리스트
-            verify_mode: 검증 모드 지원 여부
-            
-        Returns:
-            함수 코드 문자열
-        """
-        function = '''def replay_actions(action_delay=0.5, verify=False, test_case_name="unknown", skip_wait=True):
-    """액션을 순서대로 재실행
-    
-    Args:
-        action_delay: 액션 간 지연 시간 (초)
-        verify: 검증 모드 활성화 여부
-        test_case_name: 테스트 케이스 이름 (검증 모드용)
-        skip_wait: 검증 모드에서 대기 액션 건너뛰기 (기본: True)
-    """
-    verifier = None
-    
-    # 윈도우 오프셋 미리 가져오기
-    offset_x, offset_y = get_window_offset()
-    if offset_x != 0 or offset_y != 0:
-        print(f"✓ 게임 윈도우 감지: 오프셋 ({offset_x}, {offset_y})")
-    else:
-        print("⚠ 게임 윈도우를 찾지 못했습니다. 좌표가 정확하지 않을 수 있습니다.")
-    
-    # 검증 모드 초기화
-    if verify and VERIFY_AVAILABLE:
-        config = ConfigManager()
-        config.load_config()
-        verifier = ReplayVerifier(config)
-        verifier.start_verification_session(test_case_name)
-        print("✓ 검증 모드 활성화")
-        if skip_wait:
-            print("✓ 빠른 검증 모드: 대기 시간 건너뛰기")
-        else:
-            print("✓ 전체 재현 모드: 대기 시간 포함")
-    elif verify and not VERIFY_AVAILABLE:
-        print("⚠ 검증 모듈을 로드할 수 없습니다. 검증 없이 진행합니다.")
-    
-    print(f"총 {count}개의 액션을 재실행합니다...")
-    print()
-    
-'''.replace('{count}', str(len(actions)))
-        
-        # 각 액션을 Python 코드로 변환
-        for i, action in enumerate(actions, 1):
-            # description을 안전하게 이스케이프
-            safe_description = repr(action.description)
-            
-            # 액션 설명 출력
-            function += f"    # 액션 {i}: {safe_description}\n"
-            
-            # wait 액션은 검증 모드에서 skip_wait 옵션에 따라 건너뛸 수 있음
-            if action.action_type == 'wait':
-                function += f"    # 검증 모드 + skip_wait일 때 대기 건너뛰기\n"
-                function += f"    if verify and skip_wait:\n"
-                function += f"        print(f'[{i}/{len(actions)}] ' + {safe_description} + ' (건너뜀)')\n"
-                function += f"    else:\n"
-                function += f"        print(f'[{i}/{len(actions)}] ' + {safe_description})\n"
-                function += f"        try:\n"
-                # wait 액션 코드 생성
-                action_code = self._generate_action_code(action)
-                for line in action_code.split('\n'):
-                    if line.strip():
-                        function += f"            {line}\n"
-                function += f"            # 액션 간 지연 시간\n"
-                function += f"            if action_delay > 0:\n"
-                function += f"                time.sleep(action_delay)\n"
-                function += f"        except Exception as e:\n"
-                function += f"            print(f'  ❌ 액션 실행 실패: {{e}}')\n"
-                function += f"            pass\n"
-                function += "\n"
-            else:
-                function += f"    print(f'[{i}/{len(actions)}] ' + {safe_description})\n"
-                function += "    try:\n"
-                
-                # 액션 타입별 코드 생성
-                action_code = self._generate_action_code(action)
-                # 들여쓰기 추가 (try 블록 내부)
-                for line in action_code.split('\n'):
-                    if line.strip():
-                        function += f"        {line}\n"
-                
-                # 액션 간 지연
-                function += "        # 액션 간 지연 시간\n"
-                function += "        if action_delay > 0:\n"
-                function += "            time.sleep(action_delay)\n"
-            
-            # 검증 모드: screenshot_path가 있는 액션만 검증 (wait 액션이 아닌 경우)
-            if action.action_type != 'wait':
-                if verify_mode and action.screenshot_path:
-                    function += "        # 검증 모드: CAPTURE_DELAY 대기 후 스크린샷 검증 (녹화 시점과 동일한 타이밍)\n"
-                    function += "        if verifier:\n"
-                    function += "            time.sleep(CAPTURE_DELAY)  # 화면 전환 완료 대기\n"
-                    # 다음 액션이 있으면 다음 액션 정보 전달
-                    if i < len(actions):
-                        function += f"            next_action = ACTIONS[{i}] if {i} < len(ACTIONS) else None\n"
-                        function += f"            verifier.capture_and_verify({i-1}, ACTIONS[{i-1}], next_action)\n"
-                    else:
-                        function += f"            verifier.capture_and_verify({i-1}, ACTIONS[{i-1}], None)\n"
-                
-                function += "    except Exception as e:\n"
-                function += "        print(f'  ❌ 액션 실행 실패: {e}')\n"
-                function += "        # 오류가 발생해도 계속 진행 (Requirements 9.5)\n"
-                function += "        pass\n"
-                function += "\n"
-        
-        function += "    print()\n"
-        function += "    print('✓ 재실행 완료')\n"
-        function += "\n"
-        function += "    # 검증 보고서 생성\n"
-        function += "    if verifier:\n"
-        function += "        report = verifier.generate_report()\n"
-        function += "        verifier.print_report(report)\n"
-        function += "        verifier.save_report(report)\n"
-        function += "        return report\n"
-        function += "    return None\n\n\n"
-        
-        return function
-    
-    def _generate_action_code(self, action: Action) -> str:
-        """액션을 Python 코드로 변환
-        
-        좌표는 윈도우 상대 좌표로 저장되어 있으므로,
-        to_screen_coords()를 사용하여 스크린 절대 좌표로 변환한다.
-        
-        Args:
-            action: 변환할 액션
-            
-        Returns:
-            Python 코드 문자열
-        """
-        if action.action_type == 'click':
-            button = action.button or 'left'
-            # 윈도우 상대 좌표를 스크린 절대 좌표로 변환하여 클릭
-            return f"screen_x, screen_y = to_screen_coords({action.x}, {action.y}); pyautogui.click(screen_x, screen_y, button='{button}')"
-        
-        elif action.action_type == 'key_press':
-            if action.key:
-                key_str = str(action.key).replace("'", "\\'")
-                # 특수 키 처리
-                if key_str.startswith('Key.'):
-                    key_name = key_str.replace('Key.', '')
-                    return f"pyautogui.press('{key_name}')"
-                else:
-                    return f"pyautogui.write('{key_str}')"
-            return "pass  # 키 정보 없음"
-        
-        elif action.action_type == 'scroll':
-            scroll_dy = action.scroll_dy or 0
-            if scroll_dy != 0:
-                # 윈도우 상대 좌표를 스크린 절대 좌표로 변환하여 스크롤
-                return f"screen_x, screen_y = to_screen_coords({action.x}, {action.y}); pyautogui.scroll({scroll_dy * 100}, screen_x, screen_y)"
-            return "pass  # 스크롤 양 없음"
-        
-        elif action.action_type == 'wait':
-            # description에서 시간 파싱 (Requirements 5.5)
-            wait_time = self._parse_wait_time(action.description)
-            return f"time.sleep({wait_time})"
-        
-        else:
-            return f"print('  ⚠ 알 수 없는 액션 타입: {action.action_type}')"
-    
-    def _generate_replay_function(self) -> str:
-        """replay_actions 함수 생성
-        
-        Returns:
-            함수 코드 문자열
-        """
-        function = '''def replay_actions(actions, action_delay=0.5):
-    """액션을 순서대로 재실행
-    
-    Args:
-        actions: 액션 리스트
-        action_delay: 액션 간 지연 시간 (초)
-    """
-    print(f"총 {len(actions)}개의 액션을 재실행합니다...")
-    print()
-    
-    # 윈도우 오프셋 미리 가져오기
-    offset_x, offset_y = get_window_offset()
-    if offset_x != 0 or offset_y != 0:
-        print(f"✓ 게임 윈도우 감지: 오프셋 ({offset_x}, {offset_y})")
-    else:
-        print("⚠ 게임 윈도우를 찾지 못했습니다. 좌표가 정확하지 않을 수 있습니다.")
-    print()
-    
-    for i, action in enumerate(actions, 1):
-        action_type = action['action_type']
-        x = action['x']
-        y = action['y']
-        description = action['description']
-        
-        # 액션 실행 전 설명 출력 (Requirements 5.6)
-        print(f"[{i}/{len(actions)}] {description}")
-        
-        try:
-            if action_type == 'click':
-                # 윈도우 상대 좌표를 스크린 절대 좌표로 변환
-                screen_x, screen_y = to_screen_coords(x, y)
-                button = action.get('button', 'left')
-                pyautogui.click(screen_x, screen_y, button=button)
-                
-            elif action_type == 'key_press':
-                # 키보드 입력 실행
-                key = action.get('key', '')
-                if key:
-                    # 특수 키 처리
-                    if key.startswith('Key.'):
-                        # pynput의 Key 객체 형식 처리
-                        key_name = key.replace('Key.', '')
-                        pyautogui.press(key_name)
-                    else:
-                        # 일반 문자 입력
-                        pyautogui.write(key)
-                
-            elif action_type == 'scroll':
-                # 윈도우 상대 좌표를 스크린 절대 좌표로 변환
-                screen_x, screen_y = to_screen_coords(x, y)
-                scroll_dy = action.get('scroll_dy', 0)
-                if scroll_dy != 0:
-                    # pyautogui는 양수가 위로, 음수가 아래로
-                    pyautogui.scroll(scroll_dy * 100, screen_x, screen_y)
-                
-            elif action_type == 'wait':
-                # 대기 액션 실행
-                # wait_time은 액션 데이터에 직접 포함됨
-                wait_time = action.get('wait_time', 1.0)
-                time.sleep(wait_time)
-            
-            else:
-                print(f"  ⚠ 알 수 없는 액션 타입: {action_type}")
-            
-            # 액션 간 지연 시간 (Requirements 6.5)
-            if action_delay > 0:
-                time.sleep(action_delay)
-        
-        except Exception as e:
-            print(f"  ❌ 액션 실행 실패: {e}")
-            # 오류가 발생해도 계속 진행 (Requirements 9.5)
-            continue
-    
-    print()
-    print("✓ 재실행 완료")
-
-
-'''
-        return function
-    
-    def _generate_main_code(self, verify_mode: bool = True) -> str:
-        """메인 실행 코드 생성
-        
-        Args:
-            verify_mode: 검증 모드 지원 여부
-            
-        Returns:
-            메인 코드 문자열
-        """
-        main = '''if __name__ == '__main__':
-    import argparse
-    
-    parser = argparse.ArgumentParser(description='Replay Script')
-    parser.add_argument('--delay', type=float, default=0.5, help='액션 간 지연 시간 (초)')
-    parser.add_argument('--verify', action='store_true', help='검증 모드 활성화')
-    parser.add_argument('--full-replay', action='store_true', help='전체 재현 모드 (대기 시간 포함)')
-    parser.add_argument('--name', type=str, default='unknown', help='테스트 케이스 이름')
-    
-    args = parser.parse_args()
-    
-    # 테스트 케이스 이름 자동 추출 (파일명에서)
-    if args.name == 'unknown':
-        import os
-        args.name = os.path.splitext(os.path.basename(__file__))[0]
-    
-    # skip_wait: 검증 모드에서 기본 True, --full-replay 옵션 시 False
-    skip_wait = not args.full_replay
-    
-    # 액션 재실행
-    replay_actions(action_delay=args.delay, verify=args.verify, test_case_name=args.name, skip_wait=skip_wait)
-'''
-        return main
-
     def save_test_case_json(
         self, 
         actions: List[Union[Action, SemanticAction]], 
@@ -595,6 +181,12 @@ except ImportError:
                     "scroll_dx": action.scroll_dx,
                     "scroll_dy": action.scroll_dy
                 }
+                if action.timestamp_ns is not None:
+                    action_dict["timestamp_ns"] = action.timestamp_ns
+                if action.path:
+                    action_dict["path"] = action.path
+                if action.text:
+                    action_dict["text"] = action.text
             actions_data.append(action_dict)
         
         # 테스트 케이스 구조 생성
@@ -676,7 +268,10 @@ except ImportError:
                 button=action_dict.get("button"),
                 key=action_dict.get("key"),
                 scroll_dx=action_dict.get("scroll_dx"),
-                scroll_dy=action_dict.get("scroll_dy")
+                scroll_dy=action_dict.get("scroll_dy"),
+                timestamp_ns=action_dict.get("timestamp_ns"),
+                path=action_dict.get("path"),
+                text=action_dict.get("text")
             )
 
     def load_actions_from_json(self, input_path: str) -> List[Union[Action, SemanticAction]]:
@@ -697,27 +292,49 @@ except ImportError:
         self, 
         test_case: Dict[str, Any],
         verify: bool = False,
-        report_dir: str = "reports"
+        report_dir: str = "reports",
+        verification_mode: Optional[str] = None,
+        abort_on_failure: Optional[bool] = None,
+        timing: Optional[str] = None,
+        speed: Optional[float] = None
     ) -> Tuple[bool, Optional[Any]]:
         """검증 모드로 테스트 케이스 재실행
         
         좌표 기반 replay에서 검증 기능을 활성화하여 테스트 성공/실패 여부를 
         판단하고 보고서를 생성한다.
         
+        background/offline 검증 모드에서는 replay 스레드가 캡처만 하고
+        검증은 작업 스레드에서 수행하므로 replay 시간이 입력 시간에 가까워진다.
+        
+        timing이 'timeline'이면 액션마다 action_delay를 sleep하는 대신 녹화 시각에 맞춰 입력하고
+        (wait 액션은 건너뜀), 검증 시간은 타임라인에서 제외한다. 스케줄 오차는 timeline_report와
+        보고서의 timeline_statistics에 남는다.
+        
         Requirements: 1.1, 1.2, 2.1, 2.5
         
         Args:
             test_case: 테스트 케이스 데이터 (name, actions 필드 포함)
             verify: 검증 활성화 여부
             report_dir: 보고서 저장 디렉토리
+            verification_mode: inline/background/offline (None이면 automation.verification_mode)
+            abort_on_failure: 실패가 확정되면 남은 액션 실행 중단
+                              (None이면 automation.abort_on_failure, offline 모드는 실행 오류만 해당)
+            timing: 'delay' 또는 'timeline' (None이면 automation.replay_timing)
+            speed: 타임라인 재생 배속 (None이면 automation.replay_speed)
             
         Returns:
             (테스트 성공 여부, 보고서 객체)
             - verify=False인 경우: (True, None)
             - verify=True인 경우: (성공여부, ReplayReport)
+            
+        Raises:
+            ValueError: 알 수 없는 timing이거나 speed가 0 이하일 때
         """
         from src.replay_verifier import ReplayVerifier
         from src.window_capture import WindowCapture
+        from src.background_verification import (
+            BackgroundVerifier, MODE_INLINE, error_result, resolve_mode
+        )
         
         test_case_name = test_case.get("name", "unknown")
         actions = test_case.get("actions", [])
@@ -743,16 +360,38 @@ except ImportError:
                     "key": getattr(action, 'key', None),
                     "scroll_dx": getattr(action, 'scroll_dx', None),
                     "scroll_dy": getattr(action, 'scroll_dy', None),
+                    "timestamp_ns": getattr(action, 'timestamp_ns', None),
+                    "path": getattr(action, 'path', None),
+                    "text": getattr(action, 'text', None),
                 })
         
         self._verify_mode = verify
         self._verification_results = []
         
+        if verification_mode is None:
+            verification_mode = self.config.get('automation.verification_mode', MODE_INLINE)
+        verification_mode = resolve_mode(verification_mode)
+        if abort_on_failure is None:
+            abort_on_failure = self.config.get('automation.abort_on_failure', False)
+        if timing is None:
+            timing = self.config.get('automation.replay_timing', 'delay')
+        if timing not in REPLAY_TIMINGS:
+            raise ValueError(f"알 수 없는 재실행 타이밍: {timing} ({', '.join(REPLAY_TIMINGS)})")
+        timeline = None
+        if timing == 'timeline':
+            timeline = TimelineScheduler.for_actions(
+                action_dicts, speed if speed is not None else self.config.get('automation.replay_speed',
+                                                                              DEFAULT_REPLAY_SPEED))
+        self.timeline_report = None
+        
         # 검증 모드 초기화
+        background = None
         if verify:
             self.verifier = ReplayVerifier(self.config)
-            self.verifier.start_verification_session(test_case_name)
-            print(f"✓ 검증 모드 활성화: {test_case_name}")
+            self.verifier.start_verification_session(test_case_name, report_dir=report_dir)
+            if verification_mode != MODE_INLINE:
+                background = BackgroundVerifier.from_config(self.verifier, self.config, verification_mode)
+            print(f"✓ 검증 모드 활성화: {test_case_name} ({verification_mode})")
         else:
             self.verifier = None
         
@@ -776,51 +415,106 @@ except ImportError:
         print(f"총 {len(action_dicts)}개의 액션을 재실행합니다...")
         print()
         
+        # 검증 실패 시 상태 그래프로 다음 액션의 시작 화면 복구 (inline 검증만)
+        state_graph_recovery = (verify and background is None and not abort_on_failure and
+                                self.config.get('automation.state_graph_recovery', False))
+        state_graph = None
+        
         # 각 액션 실행
+        replay_started = time.perf_counter()
+        aborted_result = None
         for i, action_dict in enumerate(action_dicts):
             action_type = action_dict.get('action_type', '')
             description = action_dict.get('description', f'액션 {i}')
             
+            # 타임라인 모드: 대기 시간은 다음 입력의 녹화 시각에 반영되어 있음
+            if timeline is not None and action_type == 'wait':
+                continue
+            
             print(f"[{i+1}/{len(action_dicts)}] {description}")
             
             try:
                 # 액션 실행
-                self._execute_single_action(action_dict, window_offset)
-                
-                # 액션 간 지연
                 action_delay = self.config.get('automation.action_delay', 0.5)
-                if action_delay > 0:
-                    time.sleep(action_delay)
+                if timeline is not None:
+                    with timeline.inject(i, action_type in INSTANT_ACTIONS):
+                        self._execute_single_action(action_dict, window_offset)
+                    # 검증 캡처 전 화면 전환 대기는 타임라인에 포함 (녹화 시에도 다음 입력 전에 캡처)
+                    if verify and action_delay > 0:
+                        time.sleep(action_delay)
+                else:
+                    self._execute_single_action(action_dict, window_offset)
+                    
+                    # 액션 간 지연
+                    if action_delay > 0:
+                        time.sleep(action_delay)
                 
-                # 검증 수행 (wait 액션이 아닌 경우)
+                # 검증 수행 (wait 액션이 아닌 경우, 검증 시간은 타임라인에서 제외)
                 if verify and action_type != 'wait':
-                    next_action = action_dicts[i + 1] if i + 1 < len(action_dicts) else None
-                    result = self._execute_action_with_verification(action_dict, i, next_action)
-                    self._verification_results.append(result)
+                    with timeline.paused() if timeline is not None else nullcontext():
+                        if background:
+                            # 캡처만 하고 검증은 작업 스레드에 맡김
+                            background.submit(i, action_dict, self.verifier.capture_frame())
+                        else:
+                            next_action = action_dicts[i + 1] if i + 1 < len(action_dicts) else None
+                            result = self._execute_action_with_verification(action_dict, i, next_action)
+                            self._verification_results.append(result)
+                            if result.final_result == "fail":
+                                aborted_result = result
+                                if state_graph_recovery and i + 1 < len(action_dicts):
+                                    if state_graph is None:
+                                        from src.screen_state_graph import ScreenStateGraph
+                                        state_graph = ScreenStateGraph.for_config(self.config)
+                                    if self._recover_with_state_graph(state_graph, test_case_name, i + 1,
+                                                                      window_offset):
+                                        print(f"  ✓ 상태 그래프 복구 완료, 액션 {i + 2}부터 계속")
+                                    else:
+                                        print(f"  ⚠ 상태 그래프 복구 실패, 액션 {i + 2}부터 그대로 계속")
                     
             except Exception as e:
                 print(f"  ❌ 액션 실행 실패: {e}")
                 # 검증 실패 시에도 다음 액션 계속 실행 (Requirements 4.1)
                 if verify:
-                    from src.replay_verifier import VerificationResult
-                    fail_result = VerificationResult(
-                        action_index=i,
-                        action_description=description,
-                        screenshot_match=False,
-                        screenshot_similarity=0.0,
-                        final_result="fail",
-                        details={"error": str(e)}
-                    )
-                    self._verification_results.append(fail_result)
-                    self.verifier.verification_results.append(fail_result)
-                continue
-        
+                    fail_result = error_result(i, action_dict, e)
+                    if background:
+                        background.add_result(i, fail_result)
+                    else:
+                        self._verification_results.append(fail_result)
+                        self.verifier.record_result(i, fail_result)
+                    aborted_result = fail_result
+            
+            # 실패 확정 시 조기 중단 (백그라운드 검증은 완료된 결과만 확인)
+            if verify and abort_on_failure:
+                if background:
+                    aborted_result = background.first_failure()
+                if aborted_result is not None:
+                    print(f"  ✗ 액션 {aborted_result.action_index + 1} 검증 실패로 재실행을 중단합니다.")
+                    break
+            aborted_result = None
+        
+        input_seconds = time.perf_counter() - replay_started
+        if state_graph is not None:
+            state_graph.close()
         print()
         print("✓ 재실행 완료")
+        if timeline is not None:
+            self.timeline_report = timeline.report()
+            print(f"  {timeline.summary()}")
+        
+        # 백그라운드 검증 결과를 액션 순서대로 합침
+        if background:
+            if background.pending_count:
+                print(f"  검증 대기 중... ({background.pending_count}개 프레임)")
+            join_started = time.perf_counter()
+            self._verification_results = background.join()
+            for result in self._verification_results:
+                self._print_verification_status(result, prefix=f"  [{result.action_index + 1}] ")
+            print(f"  입력 {input_seconds:.1f}초, 검증 대기 {time.perf_counter() - join_started:.1f}초")
         
         # 보고서 생성 및 저장
         if verify and self.verifier:
             report = self.verifier.generate_report()
+            report.timeline_statistics = self.timeline_report
             self.verifier.print_report(report)
             self.verifier.save_report(report, report_dir)
             
@@ -833,9 +527,44 @@ except ImportError:
         
         return True, None
     
+    def _recover_with_state_graph(self, state_graph, test_case_name: str, next_index: int,
+                                  window_offset: Tuple[int, int]) -> bool:
+        """현재 화면에서 다음 액션의 녹화 시 시작 상태까지 상태 그래프 경로를 실행
+        
+        Args:
+            state_graph: ScreenStateGraph
+            test_case_name: 테스트 케이스 이름
+            next_index: 다음에 실행할 액션 인덱스
+            window_offset: 윈도우 오프셋 (offset_x, offset_y)
+            
+        Returns:
+            다음 액션의 시작 상태에 도달했는지 여부
+        """
+        frame = self.verifier.capture_frame()
+        if frame is None:
+            return False
+        path = state_graph.plan_recovery(state_graph.hash_image(frame), test_case_name, next_index)
+        if path is None:
+            print("  ⚠ 상태 그래프 복구 경로 없음")
+            return False
+        if not path:
+            return True
+        
+        print(f"  ↻ 상태 그래프 복구: {len(path)}개 액션")
+        action_delay = self.config.get('automation.action_delay', 0.5)
+        for transition in path:
+            print(f"    - {transition.action.get('description') or transition.action.get('action_type')} "
+                  f"({transition.test_case} #{transition.action_index + 1})")
+            self._execute_single_action(transition.action, window_offset)
+            if action_delay > 0:
+                time.sleep(action_delay)
+        return True
+    
     def _execute_single_action(self, action_dict: Dict[str, Any], window_offset: Tuple[int, int]):
         """단일 액션 실행
         
+        pyautogui의 호출마다 붙는 PAUSE(기본 0.1초)는 쓰지 않는다 (액션 간 지연은 호출자가 관리).
+        
         Args:
             action_dict: 액션 데이터 딕셔너리
             window_offset: 윈도우 오프셋 (offset_x, offset_y)
@@ -850,27 +579,37 @@ except ImportError:
         
         if action_type == 'click':
             button = action_dict.get('button', 'left')
-            pyautogui.click(screen_x, screen_y, button=button)
+            pyautogui.click(screen_x, screen_y, button=button, _pause=False)
             
         elif action_type == 'key_press':
             key = action_dict.get('key', '')
             if key:
-                if str(key).startswith('Key.'):
-                    key_name = str(key).replace('Key.', '')
-                    pyautogui.press(key_name)
-                else:
-                    pyautogui.write(str(key))
+                method, key_name = key_press_args(str(key))
+                getattr(pyautogui, method)(key_name, _pause=False)
                     
         elif action_type == 'scroll':
             scroll_dy = action_dict.get('scroll_dy', 0)
             if scroll_dy != 0:
-                pyautogui.scroll(scroll_dy * 100, screen_x, screen_y)
+                pyautogui.scroll(scroll_dy * 100, screen_x, screen_y, _pause=False)
                 
         elif action_type == 'wait':
             # description에서 시간 파싱
             description = action_dict.get('description', '')
             wait_time = self._parse_wait_time(description)
             time.sleep(wait_time)
+        
+        elif action_type in ('drag', 'move'):
+            button = action_dict.get('button') if action_type == 'drag' else None
+            replay_pointer_path(action_dict.get('path') or [], button, window_offset)
+        
+        elif action_type == 'type_text':
+            interval = self.config.get('automation.type_interval', DEFAULT_TYPE_INTERVAL)
+            pyautogui.write(action_dict.get('text') or '', interval=interval, _pause=False)
+        
+        elif action_type == 'hotkey':
+            key = action_dict.get('key', '')
+            if key:
+                pyautogui.hotkey(*parse_hotkey(str(key)), _pause=False)
     
     def _execute_action_with_verification(
         self,
@@ -907,11 +646,13 @@ except ImportError:
         # ReplayVerifier의 capture_and_verify 호출
         result = self.verifier.capture_and_verify(action_index, action, next_action)
         
-        # 결과 상태 출력
-        status_icon = {"pass": "✓", "fail": "✗", "warning": "⚠"}.get(result.final_result, "?")
-        print(f"  {status_icon} 검증: {result.final_result} (유사도: {result.screenshot_similarity:.3f})")
-        
+        self._print_verification_status(result)
         return result
+    
+    def _print_verification_status(self, result: Any, prefix: str = "  "):
+        """검증 결과 상태 출력"""
+        status_icon = {"pass": "✓", "fail": "✗", "warning": "⚠"}.get(result.final_result, "?")
+        print(f"{prefix}{status_icon} 검증: {result.final_result} (유사도: {result.screenshot_similarity:.3f})")
 
 
 if __name__ == '__main__':
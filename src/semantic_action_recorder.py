@@ -8,20 +8,26 @@ import logging
 import os
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Callable, Optional, Dict, Any, List
 
 import pyautogui
 from PIL import Image
-import imagehash
 
 from src.input_monitor import Action, ActionRecorder
 from src.config_manager import ConfigManager
 from src.ui_analyzer import UIAnalyzer
+from src.frame_hasher import average_hash_hex, hex_hamming_distance
+from src.semantic_analysis_queue import AnalysisProgress, SemanticAnalysisQueue
+from src.screen_state_graph import classify_transition
 
 
 logger = logging.getLogger(__name__)
 
 
+# deferred 모드에서 분석이 끝나기 전 semantic_info의 intent 값
+ANALYSIS_PENDING = "analysis_pending"
+
+
 @dataclass
 class SemanticAction(Action):
     """의미론적 액션 데이터 클래스 (Action 확장)
@@ -138,6 +144,9 @@ class SemanticAction(Action):
             "key": self.key,
             "scroll_dx": self.scroll_dx,
             "scroll_dy": self.scroll_dy,
+            "timestamp_ns": self.timestamp_ns,
+            "path": [list(p) for p in self.path] if self.path else None,
+            "text": self.text,
             "screenshot_before_path": self.screenshot_before_path,
             "screenshot_after_path": self.screenshot_after_path,
             "click_region_crop_path": self.click_region_crop_path,
@@ -227,6 +236,9 @@ class SemanticAction(Action):
             key=data.get("key"),
             scroll_dx=data.get("scroll_dx"),
             scroll_dy=data.get("scroll_dy"),
+            timestamp_ns=data.get("timestamp_ns"),
+            path=[list(p) for p in data["path"]] if data.get("path") else None,
+            text=data.get("text"),
             screenshot_before_path=data.get("screenshot_before_path"),
             screenshot_after_path=data.get("screenshot_after_path"),
             click_region_crop_path=data.get("click_region_crop_path"),
@@ -260,6 +272,8 @@ class SemanticAction(Action):
             self.key == other.key and
             self.scroll_dx == other.scroll_dx and
             self.scroll_dy == other.scroll_dy and
+            self.path == other.path and
+            self.text == other.text and
             self.screenshot_before_path == other.screenshot_before_path and
             self.screenshot_after_path == other.screenshot_after_path and
             self.ui_state_hash_before == other.ui_state_hash_before and
@@ -274,6 +288,7 @@ class SemanticActionRecorder(ActionRecorder):
     
     클릭 전후 스크린샷을 캡처하고, Vision LLM을 사용하여 
     UI 요소의 의미론적 정보를 분석하여 저장한다.
+    automation.deferred_semantic_analysis가 켜져 있으면 분석은 작업 스레드에서 실행한다.
     
     Requirements: 11.1, 11.2, 11.3, 11.4, 11.5, 11.6
     """
@@ -289,6 +304,10 @@ class SemanticActionRecorder(ActionRecorder):
         self.semantic_actions: List[SemanticAction] = []
         self._action_counter = 0
         
+        # 지연 분석 (녹화 중에는 프레임만 기록하고 Vision LLM 분석은 작업 스레드에서)
+        self.deferred_analysis = config.get('automation.deferred_semantic_analysis', False)
+        self.analysis_queue = SemanticAnalysisQueue.from_config(config)
+        
         # 스크린샷 저장 디렉토리
         self.screenshot_dir = config.get('automation.screenshot_dir', 'screenshots')
         os.makedirs(self.screenshot_dir, exist_ok=True)
@@ -314,7 +333,7 @@ class SemanticActionRecorder(ActionRecorder):
             screenshot.save(save_path, format='PNG')
             
             # 이미지 해시 계산
-            image_hash = str(imagehash.average_hash(screenshot))
+            image_hash = average_hash_hex(screenshot)
             
             logger.debug(f"스크린샷 캡처: {save_path}")
             return screenshot, save_path, image_hash
@@ -486,20 +505,11 @@ class SemanticActionRecorder(ActionRecorder):
         try:
             # 해시 차이 계산
             if hash_before and hash_after:
-                hash1 = imagehash.hex_to_hash(hash_before)
-                hash2 = imagehash.hex_to_hash(hash_after)
-                hash_diff = hash1 - hash2
+                hash_diff = hex_hamming_distance(hash_before, hash_after)
                 transition_info["hash_difference"] = hash_diff
                 
                 # 화면 전환 타입 결정
-                if hash_diff == 0:
-                    transition_info["transition_type"] = "none"
-                elif hash_diff < 10:
-                    transition_info["transition_type"] = "minor_change"
-                elif hash_diff < 30:
-                    transition_info["transition_type"] = "partial_change"
-                else:
-                    transition_info["transition_type"] = "full_transition"
+                transition_info["transition_type"] = classify_transition(hash_diff)
             
             # Vision LLM으로 화면 상태 분석 (선택적)
             # 성능을 위해 기본적으로는 해시 기반 분석만 수행
@@ -548,7 +558,7 @@ class SemanticActionRecorder(ActionRecorder):
             return 'click_icon'
         
         # 키보드 입력 의도
-        elif action.action_type == 'key_press':
+        elif action.action_type in ('key_press', 'type_text', 'hotkey'):
             return 'text_input'
         
         # 스크롤 의도
@@ -619,13 +629,14 @@ class SemanticActionRecorder(ActionRecorder):
                     }
         
         # 키보드 입력인 경우
-        elif action.action_type == 'key_press':
+        elif action.action_type in ('key_press', 'type_text', 'hotkey'):
+            typed = action.text if action.action_type == 'type_text' else action.key
             semantic_action.semantic_info = {
                 "intent": "text_input",
                 "target_element": {
                     "type": "input_field",
-                    "text": action.key or "",
-                    "description": f"키 입력: {action.key}",
+                    "text": typed or "",
+                    "description": f"키 입력: {typed}",
                     "visual_features": {}
                 },
                 "context": {
@@ -756,7 +767,8 @@ class SemanticActionRecorder(ActionRecorder):
         y: int, 
         button: str = 'left',
         perform_click: bool = False,
-        click_delay: float = 0.3
+        click_delay: float = 0.3,
+        defer: Optional[bool] = None
     ) -> SemanticAction:
         """클릭 전 의미론적 분석을 수행하여 액션 기록
         
@@ -765,16 +777,23 @@ class SemanticActionRecorder(ActionRecorder):
         이 메서드는 클릭 직전에 스크린샷을 캡처하고, Vision LLM으로 클릭 좌표의
         UI 요소를 분석하여 semantic_info를 구성한다. 분석 실패 시 OCR 폴백을 사용한다.
         
+        deferred 모드에서는 클릭과 전후 프레임만 즉시 기록하고 (semantic_info의 intent는
+        ANALYSIS_PENDING), 분석은 analysis_queue 작업 스레드에서 같은 액션 객체에 채운다.
+        저장 전에 finalize_semantic_analysis()로 분석 완료를 기다려야 한다.
+        
         Args:
             x: 클릭 X 좌표
             y: 클릭 Y 좌표
             button: 마우스 버튼 ('left', 'right', 'middle')
             perform_click: True이면 실제 클릭 수행, False이면 기록만
             click_delay: 클릭 후 스크린샷 캡처 전 대기 시간 (초)
+            defer: 분석 지연 여부 (None이면 automation.deferred_semantic_analysis 설정)
             
         Returns:
-            의미론적 정보가 추가된 SemanticAction
+            의미론적 정보가 추가된 (deferred 모드에서는 분석 대기 중인) SemanticAction
         """
+        if defer is None:
+            defer = self.deferred_analysis
         self._action_counter += 1
         
         # 1. 클릭 직전 스크린샷 캡처 (Requirements: 1.1)
@@ -796,7 +815,9 @@ class SemanticActionRecorder(ActionRecorder):
         )
         
         # 2. Vision LLM으로 클릭 좌표의 UI 요소 분석 (Requirements: 1.2, 1.3)
-        target_element = self._analyze_target_element(image_before, x, y)
+        target_element = None
+        if not defer:
+            target_element = self._analyze_target_element(image_before, x, y)
         
         # 3. 실제 클릭 수행 (선택적)
         if perform_click:
@@ -812,15 +833,7 @@ class SemanticActionRecorder(ActionRecorder):
             semantic_action.screenshot_after_path = path_after
             semantic_action.screenshot_path = path_after  # 기존 호환성
             semantic_action.ui_state_hash_after = hash_after
-            
-            # 화면 전환 분석
-            if image_before:
-                transition = self._analyze_screen_transition(
-                    hash_before, hash_after, image_before, image_after
-                )
-                semantic_action.screen_transition = transition
         
-        # 의도 추론
         action = Action(
             timestamp=timestamp,
             action_type='click',
@@ -829,9 +842,60 @@ class SemanticActionRecorder(ActionRecorder):
             description=f'클릭 ({x}, {y})',
             button=button
         )
-        intent = self._infer_intent(action, target_element)
         
-        # semantic_info 구성 및 저장 (Requirements: 1.4)
+        if defer:
+            semantic_action.semantic_info = {
+                "intent": ANALYSIS_PENDING,
+                "target_element": {},
+                "context": {"screen_state": "before_click", "expected_result": "unknown"}
+            }
+            self.analysis_queue.submit(
+                self._complete_click_analysis, semantic_action, image_before, image_after, target_element
+            )
+        else:
+            self._complete_click_analysis(semantic_action, image_before, image_after, target_element)
+        
+        # 기록
+        self.semantic_actions.append(semantic_action)
+        super().record_action(action)
+        
+        if defer:
+            logger.info(f"의미론적 클릭 기록 (분석 대기): ({x}, {y})")
+        else:
+            logger.info(f"의미론적 클릭 분석 완료: ({x}, {y}), "
+                       f"요소: {target_element.get('type', 'unknown')}, "
+                       f"신뢰도: {target_element.get('confidence', 0.0):.2f}")
+        
+        return semantic_action
+    
+    def _complete_click_analysis(self, semantic_action: SemanticAction,
+                                 image_before: Optional[Image.Image],
+                                 image_after: Optional[Image.Image],
+                                 target_element: Optional[Dict[str, Any]] = None):
+        """클릭 액션의 타겟 요소, 화면 전환, 의도 분석 결과를 semantic_action에 채움
+        
+        deferred 모드에서는 analysis_queue 작업 스레드에서 호출된다.
+        
+        Args:
+            semantic_action: 분석 결과를 채울 액션
+            image_before: 클릭 전 이미지
+            image_after: 클릭 후 이미지
+            target_element: 이미 분석된 타겟 요소 (None이면 여기서 분석)
+        """
+        if target_element is None:
+            target_element = self._analyze_target_element(
+                image_before, semantic_action.x, semantic_action.y
+            )
+        
+        # 화면 전환 분석
+        if image_before and image_after:
+            semantic_action.screen_transition = self._analyze_screen_transition(
+                semantic_action.ui_state_hash_before, semantic_action.ui_state_hash_after,
+                image_before, image_after
+            )
+        
+        # 의도 추론 및 semantic_info 구성 (Requirements: 1.4)
+        intent = self._infer_intent(semantic_action, target_element)
         semantic_action.semantic_info = {
             "intent": intent,
             "target_element": target_element,
@@ -840,17 +904,23 @@ class SemanticActionRecorder(ActionRecorder):
                 "expected_result": semantic_action.screen_transition.get('transition_type', 'unknown')
             }
         }
+    
+    def finalize_semantic_analysis(
+        self,
+        timeout: Optional[float] = None,
+        progress_callback: Optional[Callable[[AnalysisProgress], None]] = None
+    ) -> AnalysisProgress:
+        """지연된 의미론적 분석이 모두 끝날 때까지 대기
         
-        # 기록
-        self.semantic_actions.append(semantic_action)
-        super().record_action(action)
-        
-        logger.info(f"의미론적 클릭 분석 완료: ({x}, {y}), "
-                   f"요소: {target_element.get('type', 'unknown')}, "
-                   f"신뢰도: {target_element.get('confidence', 0.0):.2f}")
-        
-        return semantic_action
-
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 끝날 때까지)
+            progress_callback: 진행률 콜백 (AnalysisProgress)
+            
+        Returns:
+            대기를 마친 시점의 진행 상황
+        """
+        return self.analysis_queue.wait(timeout, progress_callback)
+    
     def _analyze_target_element(
         self, 
         image: Optional[Image.Image], 
@@ -1029,6 +1099,7 @@ class SemanticActionRecorder(ActionRecorder):
     
     def clear_semantic_actions(self):
         """기록된 의미론적 액션 초기화"""
+        self.analysis_queue.reset()
         self.semantic_actions = []
         self._action_counter = 0
         super().clear_actions()
@@ -1039,6 +1110,9 @@ class SemanticActionRecorder(ActionRecorder):
         Returns:
             딕셔너리 리스트 (JSON 직렬화 가능)
         """
+        pending = self.analysis_queue.progress().pending
+        if pending:
+            logger.warning(f"의미론적 분석이 끝나지 않은 액션 {pending}개 포함 (finalize_semantic_analysis 필요)")
         return [action.to_dict() for action in self.semantic_actions]
     
     @classmethod
@@ -6,29 +6,44 @@ Requirements: 12.1, 12.2, 12.3, 12.4, 12.6
 
 import logging
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Callable, Optional, Dict, Any, List, Tuple
 
 import pyautogui
 from PIL import Image
-import imagehash
 
 from src.config_manager import ConfigManager
 from src.ui_analyzer import UIAnalyzer
 from src.semantic_action_recorder import SemanticAction
+from src.input_timeline import replay_pointer_path
+from src.keystroke_coalescer import DEFAULT_TYPE_INTERVAL, key_press_args, parse_hotkey
 from src.window_capture import WindowCapture
+from src.frame_hasher import FrameHashes, average_hash_hex, default_hasher, hex_hamming_distance
+from src.replay_manifest import resolve_frame_path
+from src.screen_state_graph import classify_transition
+from src.text_match_scorer import PreparedText, TextMatchQuery, text_similarity
+from src.template_matcher import (
+    TemplateMatch, TemplateMatcher, click_crop_box, click_crop_origin, click_offset
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_HASH_GATE_DISTANCE = 2  # 녹화된 클릭 전 화면과 같은 화면으로 보는 최대 해시 거리
+DEFAULT_FLAKY_RETRIES = 1  # 불안정 액션이 입력 전 실패했을 때 재시도 횟수
+DEFAULT_FLAKY_WAIT_SCALE = 2.0  # 불안정 액션의 입력 후 대기 시간 배율
+HASH_GATE_SCOPES = ('global', 'region')
+
+
 @dataclass
 class ReplayResult:
     """액션 재실행 결과"""
     action_id: str
     success: bool
-    method: str  # 'direct', 'semantic', 'coordinate', 'failed'
+    method: str  # 'direct', 'template', 'semantic', 'coordinate', 'failed'
     original_coords: Tuple[int, int]
     actual_coords: Optional[Tuple[int, int]] = None
     coordinate_change: Optional[Tuple[int, int]] = None
@@ -38,6 +53,10 @@ class ReplayResult:
     actual_transition: str = ""
     error_message: str = ""
     execution_time: float = 0.0
+    template_score: Optional[float] = None  # 클릭 영역 템플릿 매칭 최고 점수 (시도하지 않았으면 None)
+    template_time_ms: float = 0.0  # 템플릿 매칭 소요 시간 (ms)
+    hash_gated: bool = False  # 녹화된 클릭 전 화면과 해시가 같아 LLM 확인 없이 원래 좌표를 클릭 (direct)
+    retries: int = 0  # 불안정 액션으로 재시도한 횟수
 
 
 class SemanticActionReplayer:
@@ -60,6 +79,37 @@ class SemanticActionReplayer:
         self.results: List[ReplayResult] = []
         self._action_counter = 0
         
+        # 단계별 누적 시간 (capture/gate/template/analyze/input/settle/verify, 초)
+        self.stage_timings: Dict[str, float] = {}
+        # 해시 게이트: 현재 화면이 녹화된 클릭 전 화면과 같으면 LLM 확인 없이 원래 좌표 클릭
+        self.hash_gate_enabled = config.get('automation.hash_gate.enabled', True)
+        self.hash_gate_distance = config.get('automation.hash_gate.distance', DEFAULT_HASH_GATE_DISTANCE)
+        self.hash_gate_scope = config.get('automation.hash_gate.scope', 'region')
+        if self.hash_gate_scope not in HASH_GATE_SCOPES:
+            logger.warning(f"알 수 없는 automation.hash_gate.scope: {self.hash_gate_scope}, 'region' 사용")
+            self.hash_gate_scope = 'region'
+        self._recorded_region_hashes: Dict[Tuple[str, int, int], Optional[FrameHashes]] = {}
+        # 클릭 영역 크롭 템플릿 매칭 (Vision LLM 호출 전 로컬 빠른 경로)
+        self.template_matcher: Optional[TemplateMatcher] = None
+        if config.get('automation.template_match.enabled', True):
+            self.template_matcher = TemplateMatcher.from_config(config)
+        # 입력 직후 호출되는 콜백 (PipelinedReplayEngine이 화면 안정화 감지 시작에 사용)
+        self.on_input: Optional[Callable[[], None]] = None
+        # 불안정 액션 {action_id: flakiness} (AccuracyStore.action_flakiness)
+        # 여기 있는 액션만 입력 후 대기를 늘리고, 입력 전에 실패하면 재시도한다
+        self.flaky_actions: Dict[str, float] = {}
+        self.flaky_retries = config.get('automation.flaky.retries', DEFAULT_FLAKY_RETRIES)
+        self.flaky_wait_scale = config.get('automation.flaky.wait_scale', DEFAULT_FLAKY_WAIT_SCALE)
+        self._settle_scale = 1.0
+        # 마지막 액션에서 캡처한 최신 화면 aHash (클릭 후 화면 전환 검증 등, 캡처하지 않았으면 None)
+        # CheckpointedReplay가 체크포인트 화면 지문으로 재사용한다
+        self.last_screen_hash: Optional[str] = None
+        # 현재 시도에서 입력 단계에 들어갔는지 (입력을 보낸 뒤 실패한 불안정 액션은 재시도하지 않음)
+        self._input_sent = False
+        # 병렬 replay 시 이 재실행기가 구동하는 게임 인스턴스 (ReplayInstance)
+        # 지정하면 화면 캡처/입력/윈도우 오프셋을 해당 인스턴스로 라우팅, None이면 pyautogui 사용
+        self.instance = None
+        
         # 윈도우 캡처 (좌표 변환용)
         window_title = config.get('game.window_title', '')
         self._window_capture = WindowCapture(window_title)
@@ -74,6 +124,9 @@ class SemanticActionReplayer:
         2. 실패 시 의미론적 매칭 시도
         3. 화면 전환 검증
         
+        flaky_actions에 있는 액션은 입력 후 대기를 flaky_wait_scale배로 늘리고,
+        입력을 보내기 전에 실패하면(요소를 찾지 못함 등) flaky_retries번까지 다시 시도한다.
+        
         Args:
             action: 재실행할 의미론적 액션
             
@@ -82,21 +135,47 @@ class SemanticActionReplayer:
         """
         self._action_counter += 1
         start_time = time.time()
+        action_id = f"action_{self._action_counter:04d}"
+        flaky = action_id in self.flaky_actions
+        self._settle_scale = self.flaky_wait_scale if flaky else 1.0
+        self.last_screen_hash = None
         
-        result = ReplayResult(
-            action_id=f"action_{self._action_counter:04d}",
-            success=False,
-            method='failed',
-            original_coords=(action.x, action.y)
-        )
+        retries = 0
+        try:
+            while True:
+                self._input_sent = False
+                result = self._dispatch_action(action, ReplayResult(
+                    action_id=action_id,
+                    success=False,
+                    method='failed',
+                    original_coords=(action.x, action.y)
+                ))
+                # 입력을 보낸 뒤(일부만 보낸 경우 포함) 실패한 경우는 다시 입력하면 안 되므로 재시도하지 않음
+                if (result.success or not flaky or self._input_sent
+                        or action.action_type == 'wait' or retries >= self.flaky_retries):
+                    break
+                retries += 1
+                logger.info(f"불안정 액션 재시도 ({retries}/{self.flaky_retries}): {action_id}")
+                with self._timed('settle'):
+                    time.sleep(self.config.get('automation.action_delay', 0.5) * self._settle_scale)
+        finally:
+            self._settle_scale = 1.0
+        
+        result.retries = retries
+        result.execution_time = time.time() - start_time
+        self.results.append(result)
         
+        return result
+
+    def _dispatch_action(self, action: SemanticAction, result: ReplayResult) -> ReplayResult:
+        """액션 타입별 재실행 (예외는 result.error_message로 기록)"""
         try:
             # 클릭 액션 처리
             if action.action_type == 'click':
                 result = self._replay_click_action(action, result)
             
             # 키보드 입력 처리
-            elif action.action_type == 'key_press':
+            elif action.action_type in ('key_press', 'type_text', 'hotkey'):
                 result = self._replay_key_action(action, result)
             
             # 스크롤 처리
@@ -107,6 +186,10 @@ class SemanticActionReplayer:
             elif action.action_type == 'wait':
                 result = self._replay_wait_action(action, result)
             
+            # 드래그/마우스 이동 처리 (기록된 경로를 좌표 그대로 재생)
+            elif action.action_type in ('drag', 'move'):
+                result = self._replay_path_action(action, result)
+            
             else:
                 result.error_message = f"지원하지 않는 액션 타입: {action.action_type}"
                 logger.warning(result.error_message)
@@ -115,9 +198,6 @@ class SemanticActionReplayer:
             result.error_message = str(e)
             logger.error(f"액션 재실행 실패: {e}")
         
-        result.execution_time = time.time() - start_time
-        self.results.append(result)
-        
         return result
 
     def _replay_click_action(self, action: SemanticAction, 
@@ -139,15 +219,25 @@ class SemanticActionReplayer:
         logger.info(f"원래 좌표로 클릭 시도: ({x}, {y})")
         
         # 클릭 전 스크린샷 캡처
-        screenshot_before = self._capture_screenshot()
-        hash_before = self._calculate_hash(screenshot_before) if screenshot_before else None
+        with self._timed('capture'):
+            screenshot_before = self._capture_screenshot()
+            hash_before = self._calculate_hash(screenshot_before) if screenshot_before else None
+        self.last_screen_hash = hash_before
         
-        # 원래 좌표에서 예상 UI 요소 확인
-        element_found_at_original = self._verify_element_at_position(
-            screenshot_before, x, y, action.semantic_info
-        )
+        with self._timed('gate'):
+            gate_distance = self._hash_gate(action, screenshot_before, hash_before)
         
-        if element_found_at_original:
+        if gate_distance is not None:
+            # 녹화 당시와 같은 화면 - LLM 확인 없이 원래 좌표 클릭
+            self._execute_click(x, y, action.button or 'left')
+            result.method = 'direct'
+            result.hash_gated = True
+            result.actual_coords = (x, y)
+            result.success = True
+            logger.info(f"direct (hash-gated): ({x}, {y}), 해시 거리 {gate_distance} ({self.hash_gate_scope})")
+        elif self._click_template_match(action, screenshot_before, result):
+            pass  # 녹화된 클릭 영역 크롭을 현재 화면에서 찾아 LLM 분석 없이 클릭
+        elif self._verify_element_at_position(screenshot_before, x, y, action.semantic_info):
             # 원래 좌표에서 요소 발견 - 직접 클릭
             self._execute_click(x, y, action.button or 'left')
             result.method = 'direct'
@@ -174,7 +264,8 @@ class SemanticActionReplayer:
         
         # 3. 화면 전환 검증 (Requirements: 12.6)
         if result.success:
-            time.sleep(0.3)  # 화면 전환 대기
+            with self._timed('settle'):
+                time.sleep(0.3 * self._settle_scale)  # 화면 전환 대기
             result = self._verify_screen_transition(action, result, hash_before)
         
         return result
@@ -212,8 +303,9 @@ class SemanticActionReplayer:
         try:
             # 1. 현재 화면 캡처 및 UI 분석 (Requirements: 3.1)
             logger.info(f"의미론적 매칭 클릭 시도: 원래 좌표 ({x}, {y})")
-            screenshot_before = self._capture_screenshot()
-            hash_before = self._calculate_hash(screenshot_before) if screenshot_before else None
+            with self._timed('capture'):
+                screenshot_before = self._capture_screenshot()
+                hash_before = self._calculate_hash(screenshot_before) if screenshot_before else None
             
             if screenshot_before is None:
                 # 스크린샷 실패 시 원래 좌표로 폴백
@@ -223,6 +315,8 @@ class SemanticActionReplayer:
                 result.actual_coords = (x, y)
                 result.success = True
                 result.match_confidence = 0.0
+            elif self._click_template_match(action, screenshot_before, result):
+                pass  # 녹화된 클릭 영역 크롭 매칭으로 클릭 완료
             else:
                 # UI 분석
                 semantic_info = action.semantic_info
@@ -239,7 +333,8 @@ class SemanticActionReplayer:
                 else:
                     # Vision LLM으로 현재 화면 분석
                     try:
-                        ui_data = self.ui_analyzer.analyze_with_retry(screenshot_before)
+                        with self._timed('analyze'):
+                            ui_data = self.ui_analyzer.analyze_with_retry(screenshot_before)
                         
                         # 2. _find_matching_element()로 매칭 시도
                         matched_coords, confidence = self._find_matching_element(ui_data, target_element)
@@ -281,7 +376,8 @@ class SemanticActionReplayer:
             
             # 화면 전환 검증
             if result.success:
-                time.sleep(0.3)
+                with self._timed('settle'):
+                    time.sleep(0.3 * self._settle_scale)
                 result = self._verify_screen_transition(action, result, hash_before)
                 
         except Exception as e:
@@ -304,10 +400,29 @@ class SemanticActionReplayer:
         Returns:
             업데이트된 ReplayResult
         """
+        if action.action_type == 'type_text':
+            try:
+                interval = self.config.get('automation.type_interval', DEFAULT_TYPE_INTERVAL)
+                with self._input_stage() as driver:
+                    driver.write(action.text or "", interval=interval)
+                self._notify_input()
+                result.success = True
+                result.method = 'direct'
+                logger.info(f"텍스트 입력 성공: {action.text}")
+            except Exception as e:
+                result.error_message = f"텍스트 입력 실패: {e}"
+                logger.error(result.error_message)
+            return result
+        
         key = action.key
         if key:
             try:
-                pyautogui.press(key)
+                with self._input_stage() as driver:
+                    if action.action_type == 'hotkey':
+                        driver.hotkey(*parse_hotkey(key))
+                    else:
+                        driver.press(key_press_args(key)[1])
+                self._notify_input()
                 result.success = True
                 result.method = 'direct'
                 logger.info(f"키 입력 성공: {key}")
@@ -334,7 +449,9 @@ class SemanticActionReplayer:
             scroll_amount = action.scroll_dy or 0
             # 윈도우 상대 좌표를 스크린 절대 좌표로 변환
             screen_x, screen_y = self._convert_to_screen_coords(action.x, action.y)
-            pyautogui.scroll(scroll_amount, x=screen_x, y=screen_y)
+            with self._input_stage() as driver:
+                driver.scroll(scroll_amount, x=screen_x, y=screen_y)
+            self._notify_input()
             result.success = True
             result.method = 'direct'
             result.actual_coords = (action.x, action.y)
@@ -345,6 +462,38 @@ class SemanticActionReplayer:
         
         return result
     
+    def _replay_path_action(self, action: SemanticAction,
+                            result: ReplayResult) -> ReplayResult:
+        """드래그/마우스 이동 액션 재실행
+        
+        Args:
+            action: 재실행할 drag 또는 move 액션
+            result: 결과 객체
+            
+        Returns:
+            업데이트된 ReplayResult
+        """
+        if not action.path:
+            result.error_message = f"경로 정보 없음: {action.description}"
+            logger.warning(result.error_message)
+            return result
+        
+        try:
+            button = action.button if action.action_type == 'drag' else None
+            offset = self._get_window_offset()
+            with self._input_stage() as driver:
+                late_ns = replay_pointer_path(action.path, button, offset, driver=driver)
+            self._notify_input()
+            result.success = True
+            result.method = 'direct'
+            result.actual_coords = (action.x, action.y)
+            logger.info(f"{action.action_type} 성공: 점 {len(action.path)}개, 최대 지연 {late_ns / 1e6:.1f}ms")
+        except Exception as e:
+            result.error_message = f"{action.action_type} 실패: {e}"
+            logger.error(result.error_message)
+        
+        return result
+    
     def _replay_wait_action(self, action: SemanticAction, 
                             result: ReplayResult) -> ReplayResult:
         """대기 액션 재실행
@@ -365,7 +514,8 @@ class SemanticActionReplayer:
             else:
                 wait_time = 1.0  # 기본 대기 시간
             
-            time.sleep(wait_time)
+            with self._timed('settle'):
+                time.sleep(wait_time)
             result.success = True
             result.method = 'direct'
             logger.info(f"대기 완료: {wait_time}초")
@@ -375,6 +525,107 @@ class SemanticActionReplayer:
         
         return result
 
+    def _hash_gate(self, action: SemanticAction, screenshot: Optional[Image.Image],
+                   screenshot_hash: Optional[str] = None) -> Optional[int]:
+        """현재 화면이 녹화된 클릭 전 화면과 같은 화면인지 해시로 확인
+        
+        - global: 전체 화면 aHash와 녹화된 ui_state_hash_before 비교
+        - region: 클릭 좌표 주변 영역의 aHash/dHash를 녹화된 클릭 전 스크린샷의 같은 영역과 비교
+          (화면의 다른 부분 변화는 무시, 녹화 스크린샷이 없으면 global로 비교)
+        
+        Args:
+            action: 재실행할 클릭 액션
+            screenshot: 클릭 전 현재 화면
+            screenshot_hash: 현재 화면 aHash (이미 계산했다면)
+            
+        Returns:
+            허용 거리 이내이면 해시 거리, 아니면 None (게이트 통과 실패)
+        """
+        if not self.hash_gate_enabled or screenshot is None:
+            return None
+        
+        distance = None
+        if self.hash_gate_scope == 'region':
+            recorded = self._recorded_region_hash(action)
+            box = click_crop_box(action.x, action.y, screenshot.size)
+            if recorded is not None and box[2] > box[0] and box[3] > box[1]:
+                current = default_hasher.hash_image(screenshot.crop(box))
+                distance = max(hex_hamming_distance(current.ahash_hex, recorded.ahash_hex),
+                               hex_hamming_distance(current.dhash_hex, recorded.dhash_hex))
+        
+        if distance is None:
+            if not action.ui_state_hash_before:
+                return None
+            distance = hex_hamming_distance(
+                screenshot_hash or self._calculate_hash(screenshot), action.ui_state_hash_before
+            )
+        
+        return distance if distance <= self.hash_gate_distance else None
+    
+    def _recorded_region_hash(self, action: SemanticAction) -> Optional[FrameHashes]:
+        """녹화된 클릭 전 스크린샷의 클릭 주변 영역 해시 (스크린샷이 없으면 None)"""
+        if not action.screenshot_before_path:
+            return None
+        key = (action.screenshot_before_path, action.x, action.y)
+        if key not in self._recorded_region_hashes:
+            hashes = None
+            try:
+                with Image.open(resolve_frame_path(action.screenshot_before_path)) as recorded:
+                    box = click_crop_box(action.x, action.y, recorded.size)
+                    if box[2] > box[0] and box[3] > box[1]:
+                        hashes = default_hasher.hash_image(recorded.crop(box))
+            except (OSError, ValueError) as e:
+                logger.debug(f"녹화된 클릭 전 스크린샷 로드 실패: {action.screenshot_before_path} ({e})")
+            self._recorded_region_hashes[key] = hashes
+        return self._recorded_region_hashes[key]
+    
+    def _click_template_match(self, action: SemanticAction, screenshot: Optional[Image.Image],
+                              result: ReplayResult) -> bool:
+        """녹화된 클릭 영역 크롭(click_region_crop_path)을 현재 화면에서 찾아 클릭
+        
+        최고 NCC 점수가 임계값 이상이면 크롭 안의 클릭 위치를 바로 클릭한다.
+        
+        Args:
+            action: 재실행할 클릭 액션
+            screenshot: 클릭 전 화면
+            result: 결과 객체 (template_score/template_time_ms 기록, 성공 시 클릭 결과 기록)
+            
+        Returns:
+            템플릿 매칭으로 클릭했는지 여부
+        """
+        if self.template_matcher is None or screenshot is None or not action.click_region_crop_path:
+            return False
+        template = self.template_matcher.load_template(action.click_region_crop_path)
+        if template is None:
+            return False
+        
+        x, y = action.x, action.y
+        with self._timed('template'):
+            match: Optional[TemplateMatch] = self.template_matcher.match(
+                screenshot, template, click_crop_origin(x, y)
+            )
+        if match is None:
+            return False
+        result.template_score = match.score
+        result.template_time_ms = match.elapsed_ms
+        if match.score < self.template_matcher.threshold:
+            logger.info(f"템플릿 매칭 점수 부족 ({match.score:.3f} < {self.template_matcher.threshold})")
+            return False
+        
+        new_x, new_y = match.point(click_offset(x, y))
+        self._execute_click(new_x, new_y, action.button or 'left')
+        result.method = 'template'
+        result.actual_coords = (new_x, new_y)
+        if (new_x, new_y) != (x, y):
+            result.coordinate_change = (new_x - x, new_y - y)
+        result.match_confidence = match.score
+        result.success = True
+        logger.info(
+            f"템플릿 매칭 성공: 점수 {match.score:.3f}, 배율 {match.scale}, "
+            f"좌표 ({new_x}, {new_y}), {match.elapsed_ms:.1f}ms"
+        )
+        return True
+    
     def _capture_screenshot(self) -> Optional[Image.Image]:
         """현재 화면 캡처
         
@@ -382,7 +633,7 @@ class SemanticActionReplayer:
             PIL Image 객체 또는 None
         """
         try:
-            return pyautogui.screenshot()
+            return (self.instance or pyautogui).screenshot()
         except Exception as e:
             logger.error(f"스크린샷 캡처 실패: {e}")
             return None
@@ -394,9 +645,9 @@ class SemanticActionReplayer:
             image: PIL Image 객체
             
         Returns:
-            해시 문자열
+            aHash 16진수 문자열
         """
-        return str(imagehash.average_hash(image))
+        return average_hash_hex(image)
     
     def _get_window_offset(self) -> Tuple[int, int]:
         """게임 윈도우의 화면상 오프셋 가져오기
@@ -404,6 +655,8 @@ class SemanticActionReplayer:
         Returns:
             (offset_x, offset_y) 윈도우 좌상단의 스크린 좌표
         """
+        if self.instance is not None:
+            return self.instance.window_offset()
         if self._window_capture and self._window_capture._hwnd:
             rect = self._window_capture.get_window_rect()
             if rect:
@@ -435,9 +688,43 @@ class SemanticActionReplayer:
         screen_x, screen_y = self._convert_to_screen_coords(x, y)
         
         action_delay = self.config.get('automation.action_delay', 0.5)
-        pyautogui.click(screen_x, screen_y, button=button)
+        with self._input_stage() as driver:
+            driver.click(screen_x, screen_y, button=button)
+        self._notify_input()
         logger.debug(f"클릭 실행: 윈도우({x}, {y}) -> 스크린({screen_x}, {screen_y})")
-        time.sleep(action_delay)
+        with self._timed('settle'):
+            time.sleep(action_delay * self._settle_scale)
+    
+    @contextmanager
+    def _timed(self, stage: str):
+        """단계 실행 시간을 stage_timings에 누적"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_timings[stage] = self.stage_timings.get(stage, 0.0) + time.perf_counter() - started
+    
+    @contextmanager
+    def _input_stage(self):
+        """입력 단계 (시간 기록 + 입력 장치)
+        
+        인스턴스가 지정되면 그 인스턴스의 입력 구간(exclusive)을 잡고 인스턴스를,
+        아니면 pyautogui를 입력 장치로 넘긴다.
+        입력 도중 예외가 나도 일부 입력이 전달되었을 수 있으므로 들어가는 시점에 입력한 것으로 표시한다.
+        """
+        self._input_sent = True
+        with self._timed('input'):
+            if self.instance is None:
+                yield pyautogui
+            else:
+                with self.instance.exclusive():
+                    yield self.instance
+    
+    def _notify_input(self):
+        """입력 실행 직후 on_input 콜백 호출"""
+        self._input_sent = True
+        if self.on_input is not None:
+            self.on_input()
     
     def _verify_element_at_position(self, image: Optional[Image.Image], 
                                     x: int, y: int,
@@ -463,7 +750,8 @@ class SemanticActionReplayer:
         
         try:
             # Vision LLM으로 현재 화면 분석
-            ui_data = self.ui_analyzer.analyze_with_retry(image)
+            with self._timed('analyze'):
+                ui_data = self.ui_analyzer.analyze_with_retry(image)
             
             # 예상 요소 정보
             target_element = semantic_info.get('target_element', {})
@@ -530,38 +818,32 @@ class SemanticActionReplayer:
         expected_text = target_element.get('text', '')
         expected_description = target_element.get('description', '')
         
-        best_match = None
-        best_score = 0.0
-        
-        # 버튼에서 매칭
+        # 매칭 대상 요소 (버튼 → 아이콘 → 텍스트 필드 순)
+        candidates = []
         if expected_type in ['button', 'unknown', '']:
-            for button in current_ui_data.get('buttons', []):
-                score = self._calculate_match_score(
-                    button, expected_type, expected_text, expected_description
-                )
-                if score > best_score:
-                    best_score = score
-                    best_match = (button.get('x', 0), button.get('y', 0))
-        
-        # 아이콘에서 매칭
+            candidates.extend(current_ui_data.get('buttons', []))
         if expected_type in ['icon', 'unknown', '']:
-            for icon in current_ui_data.get('icons', []):
-                score = self._calculate_match_score(
-                    icon, expected_type, expected_text, expected_description
-                )
-                if score > best_score:
-                    best_score = score
-                    best_match = (icon.get('x', 0), icon.get('y', 0))
-        
-        # 텍스트 필드에서 매칭
+            candidates.extend(current_ui_data.get('icons', []))
         if expected_type in ['text_field', 'input_field', 'unknown', '']:
-            for text_field in current_ui_data.get('text_fields', []):
-                score = self._calculate_match_score(
-                    text_field, expected_type, expected_text, expected_description
-                )
-                if score > best_score:
-                    best_score = score
-                    best_match = (text_field.get('x', 0), text_field.get('y', 0))
+            candidates.extend(current_ui_data.get('text_fields', []))
+        if not candidates:
+            return (None, 0.0)
+        
+        # 찾는 텍스트는 한 번만 준비하고 요소 텍스트 유사도는 한 번에 계산
+        query = TextMatchQuery(expected_text)
+        element_texts = [PreparedText.of(self._element_text(element)) for element in candidates]
+        similarities = query.score_all(element_texts) if expected_text else [0.0] * len(candidates)
+        description_matches = self._description_matches(query, expected_text, expected_description)
+        
+        best_match = None
+        best_score = 0.0
+        for element, element_text, similarity in zip(candidates, element_texts, similarities):
+            score = self._score_element(
+                element, element_text.raw, expected_type, expected_text, similarity, description_matches
+            )
+            if score > best_score:
+                best_score = score
+                best_match = (element.get('x', 0), element.get('y', 0))
         
         return (best_match, best_score)
 
@@ -592,7 +874,8 @@ class SemanticActionReplayer:
         
         try:
             # Vision LLM으로 현재 화면 분석
-            ui_data = self.ui_analyzer.analyze_with_retry(current_screen)
+            with self._timed('analyze'):
+                ui_data = self.ui_analyzer.analyze_with_retry(current_screen)
             
             # _find_matching_element 활용
             best_match, best_score = self._find_matching_element(ui_data, target_element)
@@ -613,7 +896,7 @@ class SemanticActionReplayer:
         
         Requirements: 3.2
         
-        점수 우선순위:
+        점수 우선순위 (TextMatchScorer와 동일):
         1. 완전 일치 → 1.0
         2. 문자 집합 유사도 (Jaccard) → 0.0 ~ 0.85
         3. 부분 문자열 포함 → 0.3 ~ 0.5 (폴백용, 낮은 신뢰도)
@@ -625,67 +908,7 @@ class SemanticActionReplayer:
         Returns:
             유사도 점수 (0.0 ~ 1.0)
         """
-        # None 또는 빈 문자열 처리
-        if not text1 or not text2:
-            return 0.0
-        
-        # 원본 텍스트가 동일하면 1.0 반환 (정규화 전 체크)
-        if text1 == text2:
-            return 1.0
-        
-        # 1. 정규화 (대소문자 무시, 공백 정규화)
-        import re
-        normalized1 = re.sub(r'\s+', ' ', str(text1).lower().strip())
-        normalized2 = re.sub(r'\s+', ' ', str(text2).lower().strip())
-        
-        # 빈 문자열 처리 (정규화 후 둘 다 빈 문자열이면 동등하므로 1.0)
-        if not normalized1 and not normalized2:
-            return 1.0
-        
-        # 한쪽만 빈 문자열이면 0.0
-        if not normalized1 or not normalized2:
-            return 0.0
-        
-        # 2. 완전 일치 → 1.0
-        if normalized1 == normalized2:
-            return 1.0
-        
-        # 3. Jaccard 유사도 계산 (문자 집합 기반)
-        set1 = set(normalized1)
-        set2 = set(normalized2)
-        
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-        
-        if union == 0:
-            return 0.0
-        
-        jaccard = intersection / union
-        
-        # 순서를 고려한 추가 점수 (연속 일치 문자)
-        common_prefix_len = 0
-        for c1, c2 in zip(normalized1, normalized2):
-            if c1 == c2:
-                common_prefix_len += 1
-            else:
-                break
-        
-        prefix_bonus = common_prefix_len / max(len(normalized1), len(normalized2)) * 0.15
-        
-        # Jaccard 점수: 0.0 ~ 0.85 범위
-        jaccard_score = min(jaccard * 0.85 + prefix_bonus, 0.85)
-        
-        # 4. 부분 문자열 매칭 (Jaccard보다 낮은 점수로 폴백)
-        shorter = normalized1 if len(normalized1) <= len(normalized2) else normalized2
-        longer = normalized2 if len(normalized1) <= len(normalized2) else normalized1
-        
-        if shorter in longer:
-            ratio = len(shorter) / len(longer)
-            substring_score = 0.3 + (ratio * 0.2)  # 0.3 ~ 0.5 범위
-            # Jaccard가 더 높으면 Jaccard 사용, 아니면 부분 문자열 점수
-            return max(jaccard_score, substring_score)
-        
-        return jaccard_score
+        return text_similarity(text1, text2)
 
     def _calculate_match_score(self, element: Dict[str, Any],
                                expected_type: str,
@@ -702,23 +925,41 @@ class SemanticActionReplayer:
         Returns:
             매칭 점수 (0.0 ~ 1.0)
         """
+        query = TextMatchQuery(expected_text)
+        element_text = self._element_text(element)
+        similarity = query.score(element_text) if expected_text else 0.0
+        return self._score_element(
+            element, element_text, expected_type, expected_text, similarity,
+            self._description_matches(query, expected_text, expected_description)
+        )
+    
+    @staticmethod
+    def _element_text(element: Dict[str, Any]) -> Any:
+        """매칭에 사용할 요소 텍스트 (text → content → type)"""
+        return element.get('text', element.get('content', element.get('type', '')))
+    
+    @staticmethod
+    def _description_matches(query: TextMatchQuery, expected_text: str, expected_description: str) -> bool:
+        """기록된 설명이 찾는 텍스트와 비슷한지 (요소와 무관하므로 검색마다 한 번 계산)"""
+        return bool(expected_description and expected_text and query.score(expected_description) > 0.5)
+    
+    @staticmethod
+    def _score_element(element: Dict[str, Any], element_text: Any,
+                       expected_type: str, expected_text: str,
+                       text_similarity_score: float, description_matches: bool) -> float:
+        """요소 매칭 점수 계산 (텍스트 유사도는 미리 계산된 값 사용)"""
         score = 0.0
         
-        # 텍스트 매칭 (가장 중요) - _calculate_text_similarity 활용
-        element_text = element.get('text', element.get('content', element.get('type', '')))
-        
+        # 텍스트 매칭 (가장 중요)
         if expected_text:
-            text_similarity = self._calculate_text_similarity(expected_text, element_text)
-            score += text_similarity * 0.5  # 텍스트 유사도에 0.5 가중치
+            score += text_similarity_score * 0.5  # 텍스트 유사도에 0.5 가중치
         
         # 설명 매칭
-        if expected_description and expected_text:
-            desc_similarity = self._calculate_text_similarity(expected_text, expected_description)
-            if desc_similarity > 0.5:
-                element_text_lower = element_text.lower() if element_text else ''
-                expected_text_lower = expected_text.lower() if expected_text else ''
-                if expected_text_lower in element_text_lower:
-                    score += 0.2
+        if description_matches:
+            element_text_lower = element_text.lower() if element_text else ''
+            expected_text_lower = expected_text.lower() if expected_text else ''
+            if expected_text_lower in element_text_lower:
+                score += 0.2
         
         # 타입 매칭
         element_type = element.get('type', '')
@@ -751,29 +992,23 @@ class SemanticActionReplayer:
         
         try:
             # 액션 후 스크린샷 캡처
-            screenshot_after = self._capture_screenshot()
+            with self._timed('capture'):
+                screenshot_after = self._capture_screenshot()
             if screenshot_after is None:
                 result.screen_transition_verified = False
                 result.actual_transition = 'capture_failed'
                 return result
             
-            hash_after = self._calculate_hash(screenshot_after)
+            with self._timed('verify'):
+                hash_after = self._calculate_hash(screenshot_after)
+            self.last_screen_hash = hash_after
             
             # 해시 차이 계산
             if hash_before:
-                hash1 = imagehash.hex_to_hash(hash_before)
-                hash2 = imagehash.hex_to_hash(hash_after)
-                hash_diff = hash1 - hash2
+                hash_diff = hex_hamming_distance(hash_before, hash_after)
                 
                 # 실제 전환 타입 결정
-                if hash_diff == 0:
-                    actual_transition = 'none'
-                elif hash_diff < 10:
-                    actual_transition = 'minor_change'
-                elif hash_diff < 30:
-                    actual_transition = 'partial_change'
-                else:
-                    actual_transition = 'full_transition'
+                actual_transition = classify_transition(hash_diff)
                 
                 result.actual_transition = actual_transition
                 
@@ -801,15 +1036,24 @@ class SemanticActionReplayer:
         
         return result
     
-    def replay_actions(self, actions: List[SemanticAction]) -> List[ReplayResult]:
-        """여러 액션 순차 재실행
+    def replay_actions(self, actions: List[SemanticAction],
+                       pipelined: Optional[bool] = None) -> List[ReplayResult]:
+        """여러 액션 재실행
         
         Args:
             actions: 재실행할 액션 리스트
+            pipelined: 다음 액션 화면 분석을 현재 액션의 전환 대기와 겹쳐 실행
+                       (None이면 automation.pipelined_replay, PipelinedReplayEngine 사용)
             
         Returns:
             ReplayResult 리스트
         """
+        if pipelined is None:
+            pipelined = self.config.get('automation.pipelined_replay', False)
+        if pipelined:
+            from src.pipelined_replay import PipelinedReplayEngine
+            return PipelinedReplayEngine.from_config(self, self.config).replay_actions(actions)
+        
         results = []
         
         for i, action in enumerate(actions):
@@ -834,6 +1078,7 @@ class SemanticActionReplayer:
         """재실행 결과 초기화"""
         self.results = []
         self._action_counter = 0
+        self.stage_timings = {}
     
     def get_statistics(self) -> Dict[str, Any]:
         """재실행 통계 계산
@@ -850,22 +1095,31 @@ class SemanticActionReplayer:
                 "failure_count": 0,
                 "success_rate": 0.0,
                 "direct_match_count": 0,
+                "hash_gated_count": 0,
+                "template_match_count": 0,
                 "semantic_match_count": 0,
                 "coordinate_match_count": 0,
                 "failed_count": 0,
                 "direct_match_rate": 0.0,
+                "hash_gated_rate": 0.0,
+                "template_match_rate": 0.0,
                 "semantic_match_rate": 0.0,
                 "coordinate_match_rate": 0.0,
                 "avg_coordinate_change": 0.0,
                 "max_coordinate_change": 0.0,
                 "avg_match_confidence": 0.0,
                 "transition_verified_count": 0,
-                "transition_mismatch_count": 0
+                "transition_mismatch_count": 0,
+                "template_attempt_count": 0,
+                "template_hit_rate": 0.0,
+                "avg_template_time_ms": 0.0
             }
         
         total = len(self.results)
         success_count = sum(1 for r in self.results if r.success)
         direct_count = sum(1 for r in self.results if r.method == 'direct')
+        template_count = sum(1 for r in self.results if r.method == 'template')
+        hash_gated_count = sum(1 for r in self.results if r.hash_gated)
         semantic_count = sum(1 for r in self.results if r.method == 'semantic')
         coordinate_count = sum(1 for r in self.results if r.method == 'coordinate')
         failed_count = sum(1 for r in self.results if r.method == 'failed')
@@ -883,6 +1137,13 @@ class SemanticActionReplayer:
         confidences = [r.match_confidence for r in self.results if r.match_confidence > 0]
         avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
         
+        # 템플릿 매칭 통계 (크롭이 있는 클릭만 시도)
+        template_attempts = [r for r in self.results if r.template_score is not None]
+        avg_template_time = (
+            sum(r.template_time_ms for r in template_attempts) / len(template_attempts)
+            if template_attempts else 0.0
+        )
+        
         # 화면 전환 검증 통계
         transition_verified = sum(1 for r in self.results if r.screen_transition_verified)
         transition_mismatch = sum(
@@ -896,15 +1157,22 @@ class SemanticActionReplayer:
             "failure_count": total - success_count,
             "success_rate": success_count / total if total > 0 else 0.0,
             "direct_match_count": direct_count,
+            "hash_gated_count": hash_gated_count,
+            "template_match_count": template_count,
             "semantic_match_count": semantic_count,
             "coordinate_match_count": coordinate_count,
             "failed_count": failed_count,
             "direct_match_rate": direct_count / total if total > 0 else 0.0,
+            "hash_gated_rate": hash_gated_count / total if total > 0 else 0.0,
+            "template_match_rate": template_count / total if total > 0 else 0.0,
             "semantic_match_rate": semantic_count / total if total > 0 else 0.0,
             "coordinate_match_rate": coordinate_count / total if total > 0 else 0.0,
             "avg_coordinate_change": avg_coord_change,
             "max_coordinate_change": max_coord_change,
             "avg_match_confidence": avg_confidence,
             "transition_verified_count": transition_verified,
-            "transition_mismatch_count": transition_mismatch
+            "transition_mismatch_count": transition_mismatch,
+            "template_attempt_count": len(template_attempts),
+            "template_hit_rate": template_count / len(template_attempts) if template_attempts else 0.0,
+            "avg_template_time_ms": avg_template_time
         }
@@ -0,0 +1,120 @@
+"""
+SemanticAnalysisQueue - 녹화 중 의미론적 분석 지연 실행
+
+클릭마다 Vision LLM 분석(Bedrock 왕복)이 끝나야 액션이 기록되면 녹화가 끊기고
+액션 간 시간 간격도 분석 시간만큼 왜곡된다.
+
+deferred 모드에서는 클릭 좌표와 전후 프레임만 즉시 기록하고, 타겟 요소/의도/화면 전환
+분석은 작업 스레드 풀에서 실행한다. 녹화를 마친 뒤 wait()로 분석이 모두 끝날 때까지
+진행률을 표시하며 기다린 다음 테스트 케이스를 저장한다.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_WORKERS = 2
+
+
+@dataclass
+class AnalysisProgress:
+    """분석 진행 상황"""
+    total: int = 0
+    completed: int = 0  # 성공/실패 모두 포함
+    failed: int = 0
+
+    @property
+    def pending(self) -> int:
+        return self.total - self.completed
+
+    @property
+    def done(self) -> bool:
+        return self.completed >= self.total
+
+
+class SemanticAnalysisQueue:
+    """의미론적 분석 작업 스레드 풀 (제출 스레드는 결과를 기다리지 않음)"""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        """
+        Args:
+            workers: 분석 작업 스레드 수 (동시에 진행되는 Vision LLM 요청 수)
+        """
+        self.workers = max(1, int(workers))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._progress = AnalysisProgress()
+
+    @classmethod
+    def from_config(cls, config) -> 'SemanticAnalysisQueue':
+        """설정(automation.semantic_analysis_workers)에서 작업 스레드 수 로드"""
+        return cls(config.get('automation.semantic_analysis_workers', DEFAULT_WORKERS))
+
+    def submit(self, fn: Callable[..., Any], *args) -> Future:
+        """분석 작업 추가 (작업 스레드 풀은 첫 작업 때 생성)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix="semantic-analysis")
+            self._progress.total += 1
+            future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future: Future):
+        with self._lock:
+            self._progress.completed += 1
+            if future.cancelled() or future.exception() is not None:
+                self._progress.failed += 1
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"의미론적 분석 실패: {future.exception()}")
+
+    def progress(self) -> AnalysisProgress:
+        """현재 진행 상황 (복사본)"""
+        with self._lock:
+            return AnalysisProgress(self._progress.total, self._progress.completed, self._progress.failed)
+
+    def wait(self, timeout: Optional[float] = None,
+             progress_callback: Optional[Callable[[AnalysisProgress], None]] = None,
+             poll_interval: float = 0.5) -> AnalysisProgress:
+        """제출된 분석이 모두 끝날 때까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초, None이면 끝날 때까지)
+            progress_callback: poll_interval마다 호출되는 진행률 콜백
+            poll_interval: 진행률 확인 간격 (초)
+
+        Returns:
+            대기를 마친 시점의 진행 상황 (timeout이면 pending > 0)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            progress = self.progress()
+            if progress_callback:
+                progress_callback(progress)
+            if progress.done:
+                return progress
+            if deadline is not None and time.monotonic() >= deadline:
+                logger.warning(f"의미론적 분석 대기 시간 초과 (남은 분석 {progress.pending}개)")
+                return progress
+            time.sleep(poll_interval if deadline is None else
+                       max(0.0, min(poll_interval, deadline - time.monotonic())))
+
+    def shutdown(self, wait: bool = True):
+        """작업 스레드 풀 종료 (wait=False면 시작되지 않은 분석은 취소)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def reset(self):
+        """대기 중인 분석을 취소하고 진행 상황 초기화"""
+        self.shutdown(wait=False)
+        with self._lock:
+            self._progress = AnalysisProgress()
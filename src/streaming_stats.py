@@ -0,0 +1,128 @@
+"""
+StreamingStats - 관측값을 저장하지 않는 스트리밍 통계
+
+- RunningMoments: Welford 알고리즘으로 평균/분산을 한 번에 갱신 (수치적으로 안정)
+- P2Quantile: P² 알고리즘(Jain & Chlamtac, 1985)으로 분위수 추정
+  마커 5개만 유지하며 관측마다 O(1)로 갱신한다. 관측이 5개 미만이면 정확한 값.
+"""
+
+import math
+from typing import Dict, List, Sequence
+
+
+class RunningMoments:
+    """Welford 평균/분산"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """표본 분산 (관측 2개 미만이면 0)"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+def _exact_quantile(values: Sequence[float], p: float) -> float:
+    """정렬된 값의 선형 보간 분위수 (numpy 기본 방식)"""
+    if not values:
+        return 0.0
+    position = p * (len(values) - 1)
+    lower = int(math.floor(position))
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class P2Quantile:
+    """P² 분위수 추정기"""
+
+    def __init__(self, p: float):
+        """
+        Args:
+            p: 분위 (0 < p < 1, 예: 0.95)
+        """
+        if not 0.0 < p < 1.0:
+            raise ValueError(f"분위는 0과 1 사이여야 합니다: {p}")
+        self.p = p
+        self.count = 0
+        self._heights: List[float] = []  # 마커 높이 (처음 5개는 관측값 자체)
+        self._positions = [0, 1, 2, 3, 4]
+        self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+
+    def add(self, value: float):
+        self.count += 1
+        heights = self._heights
+        if self.count <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        # 관측값이 들어갈 칸 찾기 (양 끝 마커는 최소/최대 갱신)
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        # 가운데 마커를 원하는 위치 쪽으로 한 칸씩 이동
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or \
+                    (offset <= -1 and positions[i - 1] - positions[i] < -1):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + step * (heights[i + step] - heights[i]) / (positions[i + step] - positions[i])
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> float:
+        """현재 분위수 추정값 (관측 없으면 0)"""
+        if self.count <= 5:
+            return _exact_quantile(self._heights, self.p)
+        return self._heights[2]
+
+
+class StreamingPercentiles:
+    """여러 분위수를 함께 추정"""
+
+    def __init__(self, percentiles: Sequence[float] = (50, 95, 99)):
+        self._estimators = {percentile: P2Quantile(percentile / 100.0) for percentile in percentiles}
+
+    def add(self, value: float):
+        for estimator in self._estimators.values():
+            estimator.add(value)
+
+    def values(self) -> Dict[float, float]:
+        return {percentile: estimator.value for percentile, estimator in self._estimators.items()}
@@ -0,0 +1,275 @@
+"""
+TemplateMatcher - 녹화된 클릭 영역 크롭을 현재 화면에서 찾는 로컬 템플릿 매칭
+
+의미론적 녹화는 클릭 좌표 주변(±CLICK_CROP_RADIUS px)을 click_region_crop_path로 저장한다.
+재현 시 Vision LLM을 호출하기 전에 이 크롭을 현재 화면에서 정규화 상호상관(NCC)으로 찾아
+최고 점수가 임계값 이상이면 그 위치를 바로 클릭한다. 레이아웃이 바뀌지 않은 클릭은
+LLM 왕복 없이 수 ms 안에 처리된다.
+
+NCC는 NumPy FFT로 상관을 계산하고 적분 영상으로 창별 분산을 구한다.
+- 제자리(local) 단계: 녹화 시 크롭 위치 ±local_margin px만 원본 배율로 탐색 (레이아웃 변경 없음)
+- 축소(coarse) 단계: 프레임 폭이 max_coarse_width 이하가 되도록 줄여 전체 화면 탐색
+- 정밀(fine) 단계: 원본 해상도에서 coarse 최고점 주변만 다시 계산
+- 배율: scales 순서대로 크롭 크기를 바꿔 탐색하고 임계값을 넘는 배율에서 멈춤 (UI 스케일 변경 대응)
+"""
+
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from src.replay_manifest import resolve_frame_path
+
+logger = logging.getLogger(__name__)
+
+
+CLICK_CROP_RADIUS = 100  # 녹화 시 클릭 좌표 주변 크롭 반경 (px)
+DEFAULT_THRESHOLD = 0.9
+DEFAULT_SCALES = (1.0, 0.9, 1.1, 0.8, 1.25)
+DEFAULT_MAX_COARSE_WIDTH = 480
+DEFAULT_LOCAL_MARGIN = 24
+MIN_COARSE_TEMPLATE = 12  # coarse 단계 크롭의 최소 변 길이 (px)
+DEFAULT_TEMPLATE_CACHE_SIZE = 64
+_MIN_VARIANCE = 1e-3  # 창 분산이 이보다 작으면(단색 영역) 상관 계산 제외
+
+
+def click_crop_box(x: int, y: int, size: Tuple[int, int],
+                   radius: int = CLICK_CROP_RADIUS) -> Tuple[int, int, int, int]:
+    """클릭 좌표 주변 크롭 영역 (left, top, right, bottom), 화면 경계에서 잘림"""
+    width, height = size
+    left, top = min(width, max(0, x - radius)), min(height, max(0, y - radius))
+    return (left, top, max(left, min(width, x + radius)), max(top, min(height, y + radius)))
+
+
+def crop_click_region(image: Image.Image, x: int, y: int, radius: int = CLICK_CROP_RADIUS) -> Image.Image:
+    """클릭 좌표 주변 영역 크롭 (녹화 시 click_region_crop_path로 저장하는 이미지)"""
+    return image.crop(click_crop_box(x, y, image.size, radius))
+
+
+def click_offset(x: int, y: int, radius: int = CLICK_CROP_RADIUS) -> Tuple[int, int]:
+    """크롭 좌상단 기준 클릭 위치 (화면 왼쪽/위 경계에서 잘린 크롭 반영)"""
+    return (x - max(0, x - radius), y - max(0, y - radius))
+
+
+def click_crop_origin(x: int, y: int, radius: int = CLICK_CROP_RADIUS) -> Tuple[int, int]:
+    """녹화 시 크롭 좌상단 위치"""
+    return (max(0, x - radius), max(0, y - radius))
+
+
+def to_gray(image: Image.Image) -> np.ndarray:
+    """그레이스케일 float64 배열"""
+    return np.asarray(image.convert('L'), dtype=np.float64)
+
+
+def _fft_length(n: int) -> int:
+    """n 이상인 가장 작은 2^a * 3^b * 5^c (FFT가 빠른 길이)"""
+    best = 1 << max(0, (n - 1).bit_length())
+    power5 = 1
+    while power5 < best:
+        power35 = power5
+        while power35 < best:
+            length = power35
+            while length < n:
+                length *= 2
+            best = min(best, length)
+            power35 *= 3
+        power5 *= 5
+    return best
+
+
+def _window_sums(values: np.ndarray, height: int, width: int) -> np.ndarray:
+    """모든 height x width 창의 합 (적분 영상)"""
+    integral = np.zeros((values.shape[0] + 1, values.shape[1] + 1))
+    integral[1:, 1:] = values.cumsum(0).cumsum(1)
+    return (integral[height:, width:] - integral[:-height, width:]
+            - integral[height:, :-width] + integral[:-height, :-width])
+
+
+def ncc_map(image: np.ndarray, template: np.ndarray) -> np.ndarray:
+    """정규화 상호상관 점수 맵 (템플릿이 이미지 안에 완전히 들어가는 위치만, -1 ~ 1)
+
+    Returns:
+        (H - h + 1, W - w + 1) 배열, 템플릿이 더 크면 빈 배열
+    """
+    height, width = template.shape
+    rows, cols = image.shape[0] - height + 1, image.shape[1] - width + 1
+    if rows <= 0 or cols <= 0:
+        return np.empty((0, 0))
+
+    centered = template - template.mean()
+    template_norm = math.sqrt(float((centered * centered).sum()))
+    if template_norm == 0.0:
+        return np.zeros((rows, cols))  # 단색 템플릿은 위치를 특정할 수 없음
+
+    # 순환 상관에서 템플릿이 완전히 들어가는 위치는 감싸지 않으므로 이미지 크기 이상이면 충분
+    shape = (_fft_length(image.shape[0]), _fft_length(image.shape[1]))
+    spectrum = np.fft.rfft2(image, s=shape) * np.conj(np.fft.rfft2(centered, s=shape))
+    correlation = np.fft.irfft2(spectrum, s=shape)[:rows, :cols]
+
+    count = height * width
+    sums = _window_sums(image, height, width)
+    variance = _window_sums(image * image, height, width) - sums * sums / count
+    valid = variance > _MIN_VARIANCE * count
+    scores = np.zeros((rows, cols))
+    scores[valid] = correlation[valid] / (np.sqrt(variance[valid]) * template_norm)
+    return np.clip(scores, -1.0, 1.0)
+
+
+@dataclass
+class TemplateMatch:
+    """템플릿 매칭 결과"""
+    left: int  # 프레임에서 크롭 좌상단 위치
+    top: int
+    width: int  # 매칭된 크롭 크기 (배율 적용)
+    height: int
+    score: float
+    scale: float
+    elapsed_ms: float = 0.0
+
+    def point(self, offset: Tuple[int, int]) -> Tuple[int, int]:
+        """크롭 기준 위치(offset)의 프레임 좌표 (배율 적용)"""
+        return (self.left + int(round(offset[0] * self.scale)), self.top + int(round(offset[1] * self.scale)))
+
+
+class TemplateMatcher:
+    """NCC 기반 다중 배율 템플릿 매칭"""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, scales: Sequence[float] = DEFAULT_SCALES,
+                 max_coarse_width: int = DEFAULT_MAX_COARSE_WIDTH, local_margin: int = DEFAULT_LOCAL_MARGIN):
+        """
+        Args:
+            threshold: 매칭으로 인정하는 최소 NCC 점수
+            scales: 탐색할 크롭 배율 (순서대로 시도, 임계값을 넘으면 중단)
+            max_coarse_width: coarse 단계 프레임 최대 폭 (px)
+            local_margin: 녹화 위치 주변 우선 탐색 범위 (px)
+        """
+        self.threshold = threshold
+        self.scales = tuple(scales) or (1.0,)
+        self.max_coarse_width = max(32, int(max_coarse_width))
+        self.local_margin = max(0, int(local_margin))
+        self._templates: "OrderedDict[str, Image.Image]" = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config) -> 'TemplateMatcher':
+        """설정(automation.template_match.*)으로 생성"""
+        return cls(
+            config.get('automation.template_match.threshold', DEFAULT_THRESHOLD),
+            config.get('automation.template_match.scales', DEFAULT_SCALES),
+            config.get('automation.template_match.max_coarse_width', DEFAULT_MAX_COARSE_WIDTH),
+            config.get('automation.template_match.local_margin', DEFAULT_LOCAL_MARGIN)
+        )
+
+    def load_template(self, path: str) -> Optional[Image.Image]:
+        """크롭 이미지 로드 (최근 사용한 크롭은 메모리에 유지, 없으면 None)"""
+        resolved = resolve_frame_path(path)
+        template = self._templates.get(resolved)
+        if template is not None:
+            self._templates.move_to_end(resolved)
+            return template
+        try:
+            with Image.open(resolved) as image:
+                template = image.convert('L')
+        except (OSError, ValueError) as e:
+            logger.debug(f"클릭 영역 크롭 로드 실패: {resolved} ({e})")
+            return None
+        self._templates[resolved] = template
+        while len(self._templates) > DEFAULT_TEMPLATE_CACHE_SIZE:
+            self._templates.popitem(last=False)
+        return template
+
+    def match(self, frame: Image.Image, template: Image.Image,
+              origin: Optional[Tuple[int, int]] = None) -> Optional[TemplateMatch]:
+        """프레임에서 템플릿과 가장 비슷한 위치
+
+        Args:
+            frame: 현재 화면
+            template: 찾을 크롭
+            origin: 녹화 시 크롭 좌상단 위치 (주어지면 그 주변을 먼저 원본 배율로 탐색)
+
+        Returns:
+            임계값을 넘은 첫 결과, 없으면 가장 높은 점수의 결과 (탐색 불가 시 None)
+        """
+        started = time.perf_counter()
+        template = template.convert('L')
+        if template.width == 0 or template.height == 0:
+            return None
+
+        best = None
+        if origin is not None:
+            best = self._match_local(frame, template, origin)
+
+        if best is None or best.score < self.threshold:
+            frame_gray = None
+            for scale in self.scales:
+                match, frame_gray = self._match_scale(frame, frame_gray, template, scale)
+                if match is not None and (best is None or match.score > best.score):
+                    best = match
+                if best is not None and best.score >= self.threshold:
+                    break
+
+        if best is not None:
+            best.elapsed_ms = (time.perf_counter() - started) * 1000
+        return best
+
+    def _match_region(self, frame: Image.Image, template_gray: np.ndarray, box: Tuple[int, int, int, int],
+                      scale: float) -> Optional[TemplateMatch]:
+        """프레임의 box 영역 안에서 원본 해상도로 탐색"""
+        left, top = int(max(0, box[0])), int(max(0, box[1]))
+        region = to_gray(frame.crop((left, top, min(frame.width, box[2]), min(frame.height, box[3]))))
+        scores = ncc_map(region, template_gray)
+        if scores.size == 0:
+            return None
+        row, col = np.unravel_index(int(np.argmax(scores)), scores.shape)
+        height, width = template_gray.shape
+        return TemplateMatch(left + int(col), top + int(row), width, height, float(scores[row, col]), scale)
+
+    def _match_local(self, frame: Image.Image, template: Image.Image,
+                     origin: Tuple[int, int]) -> Optional[TemplateMatch]:
+        margin = self.local_margin
+        box = (origin[0] - margin, origin[1] - margin,
+               origin[0] + template.width + margin, origin[1] + template.height + margin)
+        return self._match_region(frame, to_gray(template), box, 1.0)
+
+    def _match_scale(self, frame: Image.Image, frame_gray: Optional[np.ndarray], template: Image.Image,
+                     scale: float) -> Tuple[Optional[TemplateMatch], Optional[np.ndarray]]:
+        """한 배율로 전체 화면 탐색 (coarse → fine)
+
+        Returns:
+            (결과, 원본 해상도 그레이스케일 프레임 - 계산했다면 다음 배율에서 재사용)
+        """
+        width = max(1, int(round(template.width * scale)))
+        height = max(1, int(round(template.height * scale)))
+        if width > frame.width or height > frame.height:
+            return None, frame_gray
+        scaled = template if (width, height) == template.size else template.resize((width, height), Image.BILINEAR)
+        template_gray = to_gray(scaled)
+
+        factor = max(1, math.ceil(frame.width / self.max_coarse_width))
+        factor = max(1, min(factor, min(width, height) // MIN_COARSE_TEMPLATE))
+        if factor == 1:
+            if frame_gray is None:
+                frame_gray = to_gray(frame)
+            scores = ncc_map(frame_gray, template_gray)
+            if scores.size == 0:
+                return None, frame_gray
+            row, col = np.unravel_index(int(np.argmax(scores)), scores.shape)
+            return TemplateMatch(int(col), int(row), width, height, float(scores[row, col]), scale), frame_gray
+
+        # coarse: 축소한 전체 프레임에서 후보 위치 탐색
+        small_frame = to_gray(frame.resize((frame.width // factor, frame.height // factor), Image.BOX))
+        small_template = to_gray(scaled.resize((max(1, width // factor), max(1, height // factor)), Image.BOX))
+        coarse = ncc_map(small_frame, small_template)
+        if coarse.size == 0:
+            return None, frame_gray
+        row, col = np.unravel_index(int(np.argmax(coarse)), coarse.shape)
+
+        # fine: 원본 해상도에서 coarse 최고점 주변만 다시 계산
+        margin = 2 * factor
+        left, top = col * factor - margin, row * factor - margin
+        box = (left, top, left + width + 2 * margin, top + height + 2 * margin)
+        return self._match_region(frame, template_gray, box, scale), frame_gray
@@ -0,0 +1,109 @@
+"""
+TextMatchScorer - UI 요소 텍스트 유사도 일괄 계산
+
+SemanticActionReplayer의 요소 매칭은 찾는 텍스트 하나를 화면의 모든 요소 텍스트와 비교한다.
+요소마다 두 텍스트를 모두 정규화하고 문자 집합을 새로 만들면 같은 작업이 반복되므로,
+찾는 텍스트는 TextMatchQuery로 한 번만 정규화/문자 집합을 준비하고
+요소 텍스트는 분석 결과마다 한 번 정규화하여 score_all()로 한 번에 점수를 계산한다.
+
+점수 규칙 (text_similarity와 score/score_all 모두 동일):
+1. 원본 또는 정규화 결과 완전 일치 → 1.0
+2. 문자 집합 유사도 (Jaccard) + 공통 접두사 보너스 → 0.0 ~ 0.85
+3. 부분 문자열 포함 → 0.3 ~ 0.5 (2보다 높을 때만)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Iterable, List
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_text(text: Any) -> str:
+    """대소문자 무시, 공백 정규화"""
+    return _WHITESPACE.sub(' ', str(text).lower().strip())
+
+
+@dataclass(frozen=True)
+class PreparedText:
+    """정규화와 문자 집합 계산을 마친 텍스트"""
+    raw: Any
+    normalized: str
+    chars: FrozenSet[str]
+
+    @classmethod
+    def of(cls, text: Any) -> 'PreparedText':
+        normalized = normalize_text(text) if text else ''
+        return cls(text, normalized, frozenset(normalized))
+
+
+class TextMatchQuery:
+    """찾는 텍스트를 미리 준비해 두고 여러 후보와 유사도를 계산"""
+
+    def __init__(self, text: Any):
+        """
+        Args:
+            text: 찾는 텍스트 (기록된 요소 텍스트)
+        """
+        self.query = PreparedText.of(text)
+
+    def score(self, candidate: Any) -> float:
+        """후보 텍스트와의 유사도 (0.0 ~ 1.0)"""
+        if not isinstance(candidate, PreparedText):
+            candidate = PreparedText.of(candidate)
+        return self._score(candidate)
+
+    def score_all(self, candidates: Iterable[Any]) -> List[float]:
+        """여러 후보 텍스트와의 유사도 (후보 순서대로)"""
+        return [self.score(candidate) for candidate in candidates]
+
+    def _score(self, candidate: PreparedText) -> float:
+        query = self.query
+        # None 또는 빈 문자열 처리
+        if not query.raw or not candidate.raw:
+            return 0.0
+
+        # 원본 텍스트가 동일하면 1.0 반환 (정규화 전 체크)
+        if query.raw == candidate.raw:
+            return 1.0
+
+        normalized1, normalized2 = query.normalized, candidate.normalized
+
+        # 정규화 후 둘 다 빈 문자열이면 동등하므로 1.0, 한쪽만 비었으면 0.0
+        if not normalized1 and not normalized2:
+            return 1.0
+        if not normalized1 or not normalized2:
+            return 0.0
+
+        if normalized1 == normalized2:
+            return 1.0
+
+        # Jaccard 유사도 (문자 집합 기반)
+        union = len(query.chars | candidate.chars)
+        if union == 0:
+            return 0.0
+        jaccard = len(query.chars & candidate.chars) / union
+
+        # 순서를 고려한 추가 점수 (연속 일치 문자)
+        common_prefix_len = 0
+        for c1, c2 in zip(normalized1, normalized2):
+            if c1 != c2:
+                break
+            common_prefix_len += 1
+
+        len1, len2 = len(normalized1), len(normalized2)
+        prefix_bonus = common_prefix_len / max(len1, len2) * 0.15
+        jaccard_score = min(jaccard * 0.85 + prefix_bonus, 0.85)
+
+        # 부분 문자열 매칭 (Jaccard보다 높을 때만 사용)
+        shorter, longer = (normalized1, normalized2) if len1 <= len2 else (normalized2, normalized1)
+        if shorter in longer:
+            substring_score = 0.3 + (len(shorter) / len(longer) * 0.2)
+            return max(jaccard_score, substring_score)
+
+        return jaccard_score
+
+
+def text_similarity(text1: Any, text2: Any) -> float:
+    """두 텍스트의 유사도 (0.0 ~ 1.0)"""
+    return TextMatchQuery(text1).score(text2)
@@ -0,0 +1,193 @@
+"""
+TileComparator - 타일 단위 스크린샷 비교
+
+프레임을 grid x grid 타일로 나누어 타일마다 aHash를 계산하고,
+예상/실제 프레임에서 어떤 타일이 달라졌는지 찾는다.
+
+전체 프레임 pHash는 시계, 파티클, 배너 애니메이션처럼 일부 영역만 바뀌어도
+임계값을 넘기 쉽다. 타일 비교는 변화가 생긴 위치를 알려주므로
+변동 영역 마스크(RegionMaskStore)와 함께 쓰면 마스크 밖 영역이 안정적인 경우를
+일치로 판단할 수 있고, 불일치 시에는 변경 영역을 보고서에 남길 수 있다.
+
+타일 해시는 프레임을 (grid*8) x (grid*8) 그레이스케일로 한 번 축소한 뒤
+8x8 블록별로 계산한다. grid=8이면 replay 매니페스트의 64x64 썸네일을 그대로 사용한다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from PIL import Image
+
+
+DEFAULT_TILE_GRID = 8
+TILE_PIXELS = 8
+
+
+def tile_index_at(x: float, y: float, width: int, height: int,
+                  grid: int = DEFAULT_TILE_GRID) -> int:
+    """프레임 픽셀 좌표가 속한 타일 인덱스 (프레임 밖 좌표는 가장자리 타일)"""
+    col = min(grid - 1, max(0, int(x * grid / width))) if width else 0
+    row = min(grid - 1, max(0, int(y * grid / height))) if height else 0
+    return row * grid + col
+
+
+@dataclass
+class TileSignature:
+    """프레임의 타일별 해시/통계"""
+    grid: int
+    bits: np.ndarray    # (grid*grid, 64) bool - 타일별 aHash 비트
+    means: np.ndarray   # (grid*grid,) 타일 평균 밝기
+    blocks: np.ndarray  # (grid*grid, 64) 타일 픽셀 (밝기 변화량 계산용)
+
+    @classmethod
+    def from_pixels(cls, pixels: np.ndarray, grid: int) -> 'TileSignature':
+        """(grid*8, grid*8) 그레이스케일 배열에서 타일 해시 계산"""
+        size = grid * TILE_PIXELS
+        pixels = np.asarray(pixels, dtype=np.float64)
+        if pixels.shape != (size, size):
+            raise ValueError(f"타일 입력 크기 불일치: {pixels.shape} (필요: {size}x{size})")
+        blocks = pixels.reshape(grid, TILE_PIXELS, grid, TILE_PIXELS).transpose(0, 2, 1, 3)
+        blocks = blocks.reshape(grid * grid, TILE_PIXELS * TILE_PIXELS)
+        means = blocks.mean(axis=1)
+        return cls(grid=grid, bits=blocks > means[:, None], means=means, blocks=blocks)
+
+    @classmethod
+    def from_image(cls, image: Image.Image, grid: int = DEFAULT_TILE_GRID) -> 'TileSignature':
+        """이미지에서 타일 해시 계산 (매니페스트 썸네일과 같은 BILINEAR 축소 사용)"""
+        size = grid * TILE_PIXELS
+        gray = image if image.mode == 'L' else image.convert('L')
+        if gray.size != (size, size):
+            gray = gray.resize((size, size), Image.Resampling.BILINEAR)
+        return cls.from_pixels(np.asarray(gray), grid)
+
+    @property
+    def tile_count(self) -> int:
+        return self.grid * self.grid
+
+    def hashes_hex(self) -> List[str]:
+        """타일별 aHash 16진수 문자열 (행 우선 타일 순서)"""
+        packed = np.packbits(self.bits, axis=1).view('>u8').ravel()
+        return [f"{int(v):016x}" for v in packed]
+
+
+@dataclass
+class TileComparison:
+    """타일 비교 결과"""
+    grid: int
+    tile_diffs: List[int]                                   # 타일별 aHash 해밍 거리
+    changed_tiles: List[int] = field(default_factory=list)  # 달라진 타일 (마스크 포함)
+    masked_tiles: List[int] = field(default_factory=list)   # 달라졌지만 마스크된 타일
+    mask_size: int = 0
+
+    @property
+    def unmasked_changed_tiles(self) -> List[int]:
+        masked = set(self.masked_tiles)
+        return [t for t in self.changed_tiles if t not in masked]
+
+    @property
+    def is_stable(self) -> bool:
+        """마스크 밖 타일이 모두 일치하는지"""
+        return not self.unmasked_changed_tiles
+
+    @property
+    def changed_ratio(self) -> float:
+        """전체 타일 중 달라진 타일 비율"""
+        total = self.grid * self.grid
+        return len(self.changed_tiles) / total if total else 0.0
+
+    @property
+    def tile_similarity(self) -> float:
+        """마스크 밖 타일 중 일치하는 타일 비율"""
+        compared = self.grid * self.grid - self.mask_size
+        if compared <= 0:
+            return 1.0
+        return 1.0 - len(self.unmasked_changed_tiles) / compared
+
+    def tile_box(self, index: int, width: int, height: int) -> Tuple[int, int, int, int]:
+        """타일 인덱스를 프레임 픽셀 영역 (x, y, w, h)으로 변환"""
+        row, col = divmod(index, self.grid)
+        x0, x1 = col * width // self.grid, (col + 1) * width // self.grid
+        y0, y1 = row * height // self.grid, (row + 1) * height // self.grid
+        return x0, y0, x1 - x0, y1 - y0
+
+    def to_dict(self, frame_size: Optional[Tuple[int, int]] = None) -> Dict[str, Any]:
+        """보고서용 딕셔너리
+
+        Args:
+            frame_size: (width, height) - 주어지면 달라진 타일의 픽셀 영역 포함
+        """
+        unmasked = self.unmasked_changed_tiles
+        data = {
+            "grid": self.grid,
+            "changed_tiles": list(self.changed_tiles),
+            "masked_tiles": list(self.masked_tiles),
+            "unmasked_changed_tiles": unmasked,
+            "mask_size": self.mask_size,
+            "tile_similarity": self.tile_similarity,
+            "stable": self.is_stable
+        }
+        if frame_size:
+            width, height = frame_size
+            data["changed_regions"] = [
+                list(self.tile_box(t, width, height)) for t in unmasked
+            ]
+        return data
+
+
+class TileComparator:
+    """타일 단위 프레임 비교기"""
+
+    def __init__(self, grid: int = DEFAULT_TILE_GRID, hash_threshold: int = 8,
+                 mean_threshold: float = 12.0, min_pixel_delta: float = 4.0):
+        """
+        Args:
+            grid: 가로/세로 타일 수
+            hash_threshold: 타일 aHash 해밍 거리 임계값 (초과 시 변경)
+            mean_threshold: 타일 평균 밝기 차이 임계값 (초과 시 변경)
+            min_pixel_delta: 타일 픽셀 평균 변화량이 이 값 이하이면 aHash가 달라도 무시
+                             (단색에 가까운 타일의 aHash 비트는 작은 노이즈에도 뒤집힘)
+        """
+        self.grid = grid
+        self.hash_threshold = hash_threshold
+        self.mean_threshold = mean_threshold
+        self.min_pixel_delta = min_pixel_delta
+
+    def signature(self, image: Image.Image) -> TileSignature:
+        """이미지의 타일 해시 계산"""
+        return TileSignature.from_image(image, self.grid)
+
+    def compare(self, expected: TileSignature, actual: TileSignature,
+                mask: Optional[Iterable[int]] = None) -> TileComparison:
+        """두 프레임의 타일 비교
+
+        Args:
+            expected: 예상 프레임 타일 해시
+            actual: 실제 프레임 타일 해시
+            mask: 변동 영역 타일 인덱스 (달라져도 불일치로 보지 않음)
+
+        Returns:
+            TileComparison 객체
+        """
+        if expected.grid != actual.grid:
+            raise ValueError(f"타일 격자 불일치: {expected.grid} != {actual.grid}")
+
+        diffs = np.count_nonzero(expected.bits != actual.bits, axis=1)
+        pixel_delta = np.abs(expected.blocks - actual.blocks).mean(axis=1)
+        changed = (np.abs(expected.means - actual.means) > self.mean_threshold) | \
+                  ((diffs > self.hash_threshold) & (pixel_delta > self.min_pixel_delta))
+
+        mask_set: Set[int] = {t for t in (mask or []) if 0 <= t < expected.tile_count}
+        changed_tiles = [int(t) for t in np.flatnonzero(changed)]
+        return TileComparison(
+            grid=expected.grid,
+            tile_diffs=[int(d) for d in diffs],
+            changed_tiles=changed_tiles,
+            masked_tiles=[t for t in changed_tiles if t in mask_set],
+            mask_size=len(mask_set)
+        )
+
+    def compare_images(self, expected: Image.Image, actual: Image.Image,
+                       mask: Optional[Iterable[int]] = None) -> TileComparison:
+        """두 이미지의 타일 비교"""
+        return self.compare(self.signature(expected), self.signature(actual), mask)
@@ -0,0 +1,209 @@
+"""
+TimelineScheduler - 녹화 시각 기준 좌표 재실행 스케줄러
+
+액션마다 실행 후 action_delay만큼 sleep하면 입력 시간과 sleep 오차가 누적되어
+재실행이 녹화보다 느려지고 간격도 달라진다. 타임라인 모드에서는 입력 액션을
+첫 입력 기준 녹화 시점(timestamp_ns, 없으면 timestamp)에 맞춰 실행한다.
+
+- 마감 시각은 첫 입력 도착 시각 + 녹화 오프셋 / speed 로 계산하므로 오차가 누적되지 않는다.
+  (speed 2.0이면 2배 빠르게 압축)
+- 대기는 perf_counter_ns 기준으로 sleep한 뒤 마지막 2ms는 대기 루프로 맞춘다 (input_timeline.wait_until).
+- 입력 함수가 반환될 때까지 걸리는 주입 지연을 지수 이동 평균으로 추정하여 그만큼 먼저 시작한다.
+- 검증 등 재실행 외 작업 시간은 paused()로 타임라인에서 제외한다.
+- wait 액션은 다음 입력의 녹화 시각에 이미 반영되어 있으므로 실행하지 않는다.
+
+액션별 스케줄 오차(입력이 도착한 시각 - 목표 시각)는 report()로 확인한다.
+"""
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+from src.input_timeline import wait_until
+
+
+REPLAY_TIMINGS = ('delay', 'timeline')
+DEFAULT_REPLAY_SPEED = 1.0
+DEFAULT_LATENCY_ALPHA = 0.2  # 주입 지연 추정 감쇠 계수
+
+# 입력 함수가 반환될 때 입력이 끝나는 액션 (반환까지 걸린 시간을 주입 지연으로 봄)
+# drag/move/type_text는 입력 자체에 시간이 걸리므로 시작 시각 + 추정 지연을 도착 시각으로 본다
+INSTANT_ACTIONS = ('click', 'key_press', 'hotkey', 'scroll')
+
+
+def _action_field(action: Any, name: str) -> Any:
+    if isinstance(action, dict):
+        return action.get(name)
+    return getattr(action, name, None)
+
+
+def recorded_offsets_ns(actions: Sequence[Any]) -> List[Optional[int]]:
+    """액션별 녹화 시점 (첫 입력 기준 ns)
+
+    모든 입력 액션에 timestamp_ns(녹화 세션 내 단조 시각)가 있으면 그것을, 아니면 timestamp(ISO)를 사용한다.
+    시계 조정 등으로 시각이 거꾸로 가면 직전 시점으로 맞춘다.
+
+    Args:
+        actions: 액션 딕셔너리 또는 Action 목록
+
+    Returns:
+        오프셋 목록 (wait 액션과 시각을 알 수 없는 액션은 None)
+    """
+    inputs = [i for i, action in enumerate(actions) if _action_field(action, 'action_type') != 'wait']
+    times: Dict[int, int] = {}
+    if inputs and all(_action_field(actions[i], 'timestamp_ns') is not None for i in inputs):
+        times = {i: int(_action_field(actions[i], 'timestamp_ns')) for i in inputs}
+    else:
+        for i in inputs:
+            try:
+                recorded = datetime.fromisoformat(_action_field(actions[i], 'timestamp') or '')
+            except ValueError:
+                continue
+            times[i] = int(recorded.timestamp() * 1e9)
+
+    offsets: List[Optional[int]] = [None] * len(actions)
+    base: Optional[int] = None
+    previous = 0
+    for i in inputs:
+        if i not in times:
+            continue
+        if base is None:
+            base = times[i]
+        previous = max(previous, times[i] - base)
+        offsets[i] = previous
+    return offsets
+
+
+@dataclass
+class ScheduleEntry:
+    """액션 하나의 스케줄 결과 (ns, 재실행 시작 기준)"""
+    index: int
+    target_ns: int  # 입력이 도착해야 하는 시각
+    started_ns: int  # 입력 함수 호출 시각
+    landed_ns: int  # 입력이 도착한 것으로 보는 시각
+    latency_ns: int  # 입력 함수 호출부터 반환까지
+
+    @property
+    def error_ns(self) -> int:
+        """스케줄 오차 (양수면 늦음)"""
+        return self.landed_ns - self.target_ns
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "target_ms": self.target_ns / 1e6,
+            "error_ms": self.error_ns / 1e6,
+            "latency_ms": self.latency_ns / 1e6
+        }
+
+
+class TimelineScheduler:
+    """녹화 타임라인 스케줄러"""
+
+    def __init__(self, offsets_ns: Sequence[Optional[int]], speed: float = DEFAULT_REPLAY_SPEED,
+                 latency_alpha: float = DEFAULT_LATENCY_ALPHA,
+                 clock: Callable[[], int] = time.perf_counter_ns,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            offsets_ns: 액션별 녹화 시점 (recorded_offsets_ns, None이면 바로 실행)
+            speed: 재생 배속 (2.0이면 녹화 간격의 절반)
+            latency_alpha: 주입 지연 추정 감쇠 계수
+            clock: 나노초 시계 (테스트용)
+            sleep: 초 단위 sleep 함수 (테스트용)
+
+        Raises:
+            ValueError: speed가 0 이하일 때
+        """
+        if speed <= 0:
+            raise ValueError(f"재생 배속은 0보다 커야 합니다: {speed}")
+        self.offsets_ns = list(offsets_ns)
+        self.speed = speed
+        self.latency_alpha = latency_alpha
+        self.latency_ns = 0.0  # 주입 지연 추정값
+        self.entries: List[ScheduleEntry] = []
+        self._clock = clock
+        self._sleep = sleep
+        self._origin: Optional[int] = None
+        self._latency_samples = 0
+
+    @classmethod
+    def for_actions(cls, actions: Sequence[Any], speed: float = DEFAULT_REPLAY_SPEED, **kwargs) -> 'TimelineScheduler':
+        return cls(recorded_offsets_ns(actions), speed, **kwargs)
+
+    def target_ns(self, index: int) -> Optional[int]:
+        """액션의 목표 시각 (clock 기준, 시작 전이거나 녹화 시점이 없으면 None)"""
+        offset = self.offsets_ns[index] if index < len(self.offsets_ns) else None
+        if offset is None or self._origin is None:
+            return None
+        return self._origin + int(offset / self.speed)
+
+    @contextmanager
+    def inject(self, index: int, instant: bool = True) -> Iterator[None]:
+        """목표 시각(주입 지연만큼 먼저)까지 기다린 뒤 입력 실행
+
+        Args:
+            index: 액션 인덱스
+            instant: 입력 함수가 반환될 때 입력이 끝나는 액션인지 (INSTANT_ACTIONS)
+        """
+        clock = self._clock
+        if self._origin is None:
+            self._origin = clock()
+        target = self.target_ns(index)
+        if target is not None:
+            wait_until(target - int(self.latency_ns), clock, self._sleep)
+        started = clock()
+        yield
+        finished = clock()
+
+        latency = finished - started
+        if instant:
+            if self._latency_samples:
+                self.latency_ns += self.latency_alpha * (latency - self.latency_ns)
+            else:
+                self.latency_ns = float(latency)
+            self._latency_samples += 1
+            landed = finished
+        else:
+            landed = started + int(self.latency_ns)
+        if target is None:
+            target = landed
+        elif not self.entries:
+            # 첫 입력이 도착한 시각을 타임라인 기준으로 삼는다 (첫 입력의 주입 지연은 오차가 아님)
+            self._origin += landed - target
+            target = landed
+        self.entries.append(ScheduleEntry(index, target - self._origin, started - self._origin,
+                                          landed - self._origin, latency))
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """재실행 외 작업(검증 등) 시간을 타임라인에서 제외"""
+        started = self._clock()
+        try:
+            yield
+        finally:
+            if self._origin is not None:
+                self._origin += self._clock() - started
+
+    def report(self) -> Dict[str, Any]:
+        """액션별 스케줄 오차와 요약 (ms)"""
+        errors = sorted(abs(entry.error_ns) for entry in self.entries)
+        count = len(errors)
+        return {
+            "speed": self.speed,
+            "action_count": count,
+            "mean_abs_error_ms": sum(errors) / count / 1e6 if count else 0.0,
+            "p95_abs_error_ms": errors[min(count - 1, int(count * 0.95))] / 1e6 if count else 0.0,
+            "max_late_ms": max((entry.error_ns for entry in self.entries), default=0) / 1e6,
+            "mean_latency_ms": sum(entry.latency_ns for entry in self.entries) / count / 1e6 if count else 0.0,
+            "actions": [entry.to_dict() for entry in self.entries]
+        }
+
+    def summary(self) -> str:
+        """한 줄 요약"""
+        report = self.report()
+        return (f"타임라인 재실행 (배속 {report['speed']:g}): 액션 {report['action_count']}개, "
+                f"스케줄 오차 평균 {report['mean_abs_error_ms']:.1f}ms, p95 {report['p95_abs_error_ms']:.1f}ms, "
+                f"최대 지연 {report['max_late_ms']:.1f}ms")
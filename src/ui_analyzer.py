@@ -5,10 +5,12 @@ Requirements: 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7
 """
 
 import base64
+import hashlib
 import io
 import json
 import logging
 import os
+import threading
 import time
 from typing import Optional, List, Dict, Any
 
@@ -25,6 +27,8 @@ logger = logging.getLogger(__name__)
 
 # PaddleOCR 지연 로딩을 위한 전역 변수
 _paddleocr_instance = None
+# PaddleOCR은 스레드 안전하지 않으므로 생성과 호출을 직렬화 (클릭 분석 작업 스레드 등)
+_paddleocr_lock = threading.Lock()
 
 
 class UIAnalyzer:
@@ -50,7 +54,12 @@ class UIAnalyzer:
         """
         global _paddleocr_instance
         
-        if _paddleocr_instance is None:
+        if _paddleocr_instance is not None:
+            return _paddleocr_instance
+        
+        with _paddleocr_lock:
+            if _paddleocr_instance is not None:
+                return _paddleocr_instance
             try:
                 from paddleocr import PaddleOCR
                 # PaddleOCR 3.x 버전 호환 설정
@@ -163,6 +172,19 @@ class UIAnalyzer:
         8. DO NOT use markdown code blocks
         9. Ensure all strings are properly quoted and escaped"""
 
+    def get_analysis_signature(self) -> Dict[str, str]:
+        """분석 결과의 버전 정보
+        
+        저장해 둔 분석 결과가 현재 모델/프롬프트로 만든 것인지 확인하는 데 사용한다.
+        프롬프트 버전은 프롬프트 내용의 해시이므로 프롬프트를 수정하면 자동으로 바뀐다.
+        
+        Returns:
+            {"model_id": str, "prompt_version": str}
+        """
+        model_id = self.config.get('aws.model_id', 'anthropic.claude-sonnet-4-5-20250929-v1:0')
+        prompt_version = hashlib.sha256(self._build_vision_prompt().encode('utf-8')).hexdigest()[:12]
+        return {"model_id": model_id, "prompt_version": prompt_version}
+
     def analyze_with_vision_llm(self, image: Image.Image) -> dict:
         """Vision LLM으로 UI 분석
         
@@ -526,11 +548,12 @@ class UIAnalyzer:
             
             # OCR 실행 - PaddleOCR 3.x에서는 predict() 사용
             # 하위 호환성을 위해 ocr() 메서드도 지원하지만 deprecated
-            if hasattr(ocr, 'predict'):
-                result = ocr.predict(image_np)
-            else:
-                # 이전 버전 호환
-                result = ocr.ocr(image_np, cls=True)
+            with _paddleocr_lock:
+                if hasattr(ocr, 'predict'):
+                    result = ocr.predict(image_np)
+                else:
+                    # 이전 버전 호환
+                    result = ocr.ocr(image_np, cls=True)
             
             text_results = []
             
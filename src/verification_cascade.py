@@ -0,0 +1,251 @@
+"""
+VerificationCascade - 다단계 스크린샷 검증 구성 요소
+
+ReplayVerifier는 비용이 낮은 단계부터 차례로 검증하고,
+어느 단계에서 통과/실패가 확정되면 이후 단계를 생략한다.
+
+    hash  → 전체 프레임 pHash 거리 (매니페스트 해시 사용 시 예상 PNG 디코딩 없음)
+    tile  → 타일 단위 해시 비교 (변동 영역 마스크 적용)
+    ssim  → 축소 그레이스케일(타일 블록)의 구조적 유사도
+    ocr   → 화면 텍스트만 추출하여 비교
+    vision_llm → 위 단계에서 판단하지 못한 애매한 구간만 Vision LLM으로 검증
+
+각 단계는 소요 시간과 판정(pass/fail/continue/skip)을 StageRecord로 남기며,
+CascadeStatistics가 단계별 처리 건수와 시간을 집계하여 보고서에 포함한다.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from src.tile_comparator import TileSignature
+
+
+STAGE_HASH = "hash"
+STAGE_TILE = "tile"
+STAGE_SSIM = "ssim"
+STAGE_OCR = "ocr"
+STAGE_VISION = "vision_llm"
+
+# 비용 순서 (낮은 비용부터)
+STAGE_ORDER = [STAGE_HASH, STAGE_TILE, STAGE_SSIM, STAGE_OCR, STAGE_VISION]
+
+DECISION_PASS = "pass"
+DECISION_FAIL = "fail"
+DECISION_CONTINUE = "continue"
+DECISION_SKIP = "skip"
+
+# SSIM 안정화 상수 (8비트 밝기 기준)
+_SSIM_C1 = (0.01 * 255) ** 2
+_SSIM_C2 = (0.03 * 255) ** 2
+
+
+@dataclass
+class CascadeThresholds:
+    """단계별 판정 임계값
+
+    fail 임계값을 0으로 두면 해당 단계는 실패를 확정하지 않고 다음 단계로 넘긴다.
+    """
+    stages: List[str] = field(default_factory=lambda: list(STAGE_ORDER))
+    tile_fail_ratio: float = 0.0   # 마스크 밖 타일 중 이 비율 이상이 바뀌면 실패
+    ssim_pass: float = 0.85        # 마스크 밖 모든 타일의 SSIM이 이 값 이상이면 통과
+    ssim_fail: float = 0.25        # 마스크 밖 타일 평균 SSIM이 이 값 미만이면 실패
+    ocr_pass: float = 0.9          # 텍스트 집합 유사도(Jaccard)가 이 값 이상이면 통과
+    ocr_fail: float = 0.2          # 텍스트 집합 유사도가 이 값 이하이면 실패
+    ocr_min_texts: int = 3         # 양쪽 모두 이 개수 이상의 텍스트가 있을 때만 판정
+
+    @classmethod
+    def from_config(cls, config) -> 'CascadeThresholds':
+        """설정(automation.cascade.*)에서 임계값 로드"""
+        defaults = cls()
+        stages = config.get('automation.cascade.stages', defaults.stages)
+        return cls(
+            stages=list(stages) if isinstance(stages, (list, tuple)) else defaults.stages,
+            tile_fail_ratio=config.get('automation.cascade.tile_fail_ratio', defaults.tile_fail_ratio),
+            ssim_pass=config.get('automation.cascade.ssim_pass', defaults.ssim_pass),
+            ssim_fail=config.get('automation.cascade.ssim_fail', defaults.ssim_fail),
+            ocr_pass=config.get('automation.cascade.ocr_pass', defaults.ocr_pass),
+            ocr_fail=config.get('automation.cascade.ocr_fail', defaults.ocr_fail),
+            ocr_min_texts=config.get('automation.cascade.ocr_min_texts', defaults.ocr_min_texts)
+        )
+
+    def is_enabled(self, stage: str) -> bool:
+        return stage in self.stages
+
+
+@dataclass
+class StageRecord:
+    """검증 단계 하나의 실행 기록"""
+    stage: str
+    decision: str
+    elapsed_ms: float = 0.0
+    score: Optional[float] = None
+    note: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "decision": self.decision,
+            "elapsed_ms": round(self.elapsed_ms, 3),
+            "score": self.score,
+            "note": self.note
+        }
+
+
+class CascadeTrace:
+    """액션 하나의 단계별 검증 기록"""
+
+    def __init__(self):
+        self.stages: List[StageRecord] = []
+        self.resolved_by: str = ""
+        self.decision: str = DECISION_CONTINUE
+
+    def record(self, stage: str, decision: str, started: float,
+               score: Optional[float] = None, note: str = "") -> StageRecord:
+        """단계 결과 기록 (started: time.perf_counter() 시작 값)
+
+        pass/fail 판정이면 해당 단계를 최종 판정 단계로 기록한다.
+        """
+        record = StageRecord(
+            stage=stage,
+            decision=decision,
+            elapsed_ms=(time.perf_counter() - started) * 1000.0,
+            score=None if score is None else float(score),
+            note=note
+        )
+        self.stages.append(record)
+        if decision in (DECISION_PASS, DECISION_FAIL) and not self.resolved_by:
+            self.resolved_by = stage
+            self.decision = decision
+        return record
+
+    @property
+    def resolved(self) -> bool:
+        return bool(self.resolved_by)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(s.elapsed_ms for s in self.stages)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "resolved_by": self.resolved_by,
+            "decision": self.decision,
+            "total_ms": round(self.total_ms, 3),
+            "stages": [s.to_dict() for s in self.stages]
+        }
+
+
+def tile_ssim(expected: TileSignature, actual: TileSignature,
+              mask: Optional[Iterable[int]] = None) -> Tuple[float, float]:
+    """타일 블록(8x8 윈도우) 단위 SSIM
+
+    Args:
+        expected: 예상 프레임 타일 해시 (축소 그레이스케일 픽셀 포함)
+        actual: 실제 프레임 타일 해시
+        mask: 제외할 변동 영역 타일
+
+    Returns:
+        (마스크 밖 타일 평균 SSIM, 최저 타일 SSIM) - 비교할 타일이 없으면 (1.0, 1.0)
+    """
+    x, y = expected.blocks, actual.blocks
+    mu_x, mu_y = x.mean(axis=1), y.mean(axis=1)
+    var_x, var_y = x.var(axis=1), y.var(axis=1)
+    cov = ((x - mu_x[:, None]) * (y - mu_y[:, None])).mean(axis=1)
+    ssim = ((2 * mu_x * mu_y + _SSIM_C1) * (2 * cov + _SSIM_C2)) / \
+           ((mu_x ** 2 + mu_y ** 2 + _SSIM_C1) * (var_x + var_y + _SSIM_C2))
+
+    masked: Set[int] = set(mask or [])
+    keep = np.array([i not in masked for i in range(len(ssim))], dtype=bool)
+    if not keep.any():
+        return 1.0, 1.0
+    return float(ssim[keep].mean()), float(ssim[keep].min())
+
+
+_TEXT_NORMALIZE = re.compile(r"\s+")
+
+
+def normalize_texts(ocr_results: Sequence[Dict[str, Any]],
+                    exclude: Optional[Callable[[int, int], bool]] = None) -> List[str]:
+    """OCR 결과에서 비교용 텍스트 목록 추출
+
+    Args:
+        ocr_results: UIAnalyzer.analyze_with_ocr 결과
+        exclude: (x, y) -> bool, True면 해당 위치의 텍스트 제외 (변동 영역 등)
+    """
+    texts = []
+    for item in ocr_results:
+        text = _TEXT_NORMALIZE.sub(" ", str(item.get("text", ""))).strip().lower()
+        if not text:
+            continue
+        if exclude and exclude(item.get("x", 0), item.get("y", 0)):
+            continue
+        texts.append(text)
+    return texts
+
+
+def text_similarity(expected: Sequence[str], actual: Sequence[str]) -> float:
+    """텍스트 집합 Jaccard 유사도 (둘 다 비어 있으면 1.0)"""
+    expected_set, actual_set = set(expected), set(actual)
+    union = expected_set | actual_set
+    if not union:
+        return 1.0
+    return len(expected_set & actual_set) / len(union)
+
+
+class CascadeStatistics:
+    """단계별 검증 처리 통계"""
+
+    def __init__(self):
+        self.resolved: Dict[str, int] = {stage: 0 for stage in STAGE_ORDER}
+        self.unresolved = 0
+        self.runs: Dict[str, int] = {stage: 0 for stage in STAGE_ORDER}
+        self.time_ms: Dict[str, float] = {stage: 0.0 for stage in STAGE_ORDER}
+
+    def add(self, trace: Dict[str, Any]):
+        """CascadeTrace.to_dict() 결과 누적"""
+        for stage in trace.get("stages", []):
+            name = stage.get("stage")
+            self.runs[name] = self.runs.get(name, 0) + 1
+            self.time_ms[name] = self.time_ms.get(name, 0.0) + stage.get("elapsed_ms", 0.0)
+        resolved_by = trace.get("resolved_by")
+        if resolved_by:
+            self.resolved[resolved_by] = self.resolved.get(resolved_by, 0) + 1
+        else:
+            self.unresolved += 1
+
+    @classmethod
+    def from_traces(cls, traces: Iterable[Dict[str, Any]]) -> 'CascadeStatistics':
+        stats = cls()
+        for trace in traces:
+            stats.add(trace)
+        return stats
+
+    @property
+    def total(self) -> int:
+        return sum(self.resolved.values()) + self.unresolved
+
+    def summary_lines(self) -> List[str]:
+        """보고서 요약용 단계별 처리 현황"""
+        lines = []
+        for stage in self.resolved:
+            runs = self.runs.get(stage, 0)
+            if not runs and not self.resolved[stage]:
+                continue
+            avg_ms = self.time_ms[stage] / runs if runs else 0.0
+            lines.append(f"  {stage}: {self.resolved[stage]}건 판정 (실행 {runs}회, 평균 {avg_ms:.1f}ms)")
+        if self.unresolved:
+            lines.append(f"  미판정: {self.unresolved}건")
+        return lines
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "resolved_by": dict(self.resolved),
+            "unresolved": self.unresolved,
+            "stage_runs": dict(self.runs),
+            "stage_time_ms": {k: round(v, 3) for k, v in self.time_ms.items()}
+        }
@@ -108,6 +108,29 @@ class WindowCapture:
             logger.error(f"윈도우 영역 가져오기 실패: {e}")
             return None
     
+    def activate_window(self, hwnd: int = None) -> bool:
+        """윈도우를 전경으로 가져오기 (입력이 이 윈도우로 가도록)
+
+        Args:
+            hwnd: 윈도우 핸들 (None이면 저장된 핸들 사용)
+
+        Returns:
+            성공 여부
+        """
+        if not _load_win32_modules():
+            return False
+
+        hwnd = hwnd or self._hwnd
+        if not hwnd:
+            return False
+
+        try:
+            _win32gui.SetForegroundWindow(hwnd)
+            return True
+        except Exception as e:
+            logger.warning(f"윈도우 활성화 실패: {e}")
+            return False
+
     def capture_window(self, hwnd: int = None) -> Optional[Image.Image]:
         """특정 윈도우만 캡처
         
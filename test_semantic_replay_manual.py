@@ -23,6 +23,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.config_manager import ConfigManager
 from src.input_monitor import InputMonitor, ActionRecorder
 from src.semantic_action_recorder import SemanticActionRecorder, SemanticAction
+from src.semantic_analysis_queue import SemanticAnalysisQueue
 from src.semantic_action_replayer import SemanticActionReplayer, ReplayResult
 from src.ui_analyzer import UIAnalyzer
 from src.script_generator import ScriptGenerator
@@ -76,6 +77,16 @@ class SemanticTestRunner:
         action_recorder = ActionRecorder(self.config)
         input_monitor = InputMonitor(action_recorder)
         
+        # 지연 분석 모드: 녹화 중 기록된 클릭을 바로 작업 스레드에서 분석
+        deferred = self.config.get('automation.deferred_semantic_analysis', False)
+        analysis_queue = SemanticAnalysisQueue.from_config(self.config)
+        analysis_futures = {}  # 액션 인덱스 → Future
+        
+        def submit_new_clicks():
+            for i, action in enumerate(list(action_recorder.actions)):
+                if action.action_type == 'click' and i not in analysis_futures:
+                    analysis_futures[i] = analysis_queue.submit(self._analyze_action_from_screenshot, action, i)
+        
         # 녹화 시작
         input_monitor.start_monitoring()
         
@@ -85,7 +96,12 @@ class SemanticTestRunner:
                 time.sleep(0.5)
                 elapsed = int(time.time() - start_time)
                 action_count = len(action_recorder.get_actions())
-                print(f"\r  경과: {elapsed}초 | 기록된 액션: {action_count}개", end="", flush=True)
+                status = f"\r  경과: {elapsed}초 | 기록된 액션: {action_count}개"
+                if deferred:
+                    submit_new_clicks()
+                    progress = analysis_queue.progress()
+                    status += f" | 분석: {progress.completed}/{progress.total}"
+                print(status, end="", flush=True)
         except KeyboardInterrupt:
             print("\n")
             print("녹화가 중지되었습니다.")
@@ -98,24 +114,40 @@ class SemanticTestRunner:
         print(f"✓ 총 {len(actions)}개의 액션이 기록되었습니다.")
         
         if not actions:
+            analysis_queue.shutdown(wait=False)
             print("❌ 기록된 액션이 없습니다.")
             return
         
         # 의미론적 정보 추가 (클릭 액션에 대해 - 저장된 스크린샷 기반 분석)
         print()
-        print("의미론적 정보를 분석 중...")
-        print("  (저장된 스크린샷을 기반으로 분석합니다)")
+        if deferred:
+            submit_new_clicks()
+            print("녹화 중 시작된 의미론적 분석을 기다리는 중...")
+            analysis_queue.wait(progress_callback=lambda p: print(
+                f"\r  분석 완료: {p.completed}/{p.total}", end="", flush=True))
+            analysis_queue.shutdown()
+        else:
+            print("의미론적 정보를 분석 중...")
+            print("  (저장된 스크린샷을 기반으로 분석합니다)")
         semantic_actions = []
         
         for i, action in enumerate(actions):
-            print(f"\r  분석 중: {i+1}/{len(actions)}", end="", flush=True)
+            if not deferred:
+                print(f"\r  분석 중: {i+1}/{len(actions)}", end="", flush=True)
             
+            semantic_action = None
             if action.action_type == 'click':
                 # 저장된 스크린샷 기반 의미론적 분석 수행
-                semantic_action = self._analyze_action_from_screenshot(action, i)
-                semantic_actions.append(semantic_action)
-            else:
-                # 클릭이 아닌 액션은 그대로 변환
+                if i in analysis_futures:
+                    try:
+                        semantic_action = analysis_futures[i].result()
+                    except Exception as e:
+                        # 한 액션의 분석 실패로 전체 저장이 중단되지 않도록 의미론적 정보 없이 저장
+                        print(f"\n  ⚠ 액션 {i} 의미론적 분석 실패: {e}")
+                else:
+                    semantic_action = self._analyze_action_from_screenshot(action, i)
+            if semantic_action is None:
+                # 클릭이 아닌 액션(또는 분석 실패한 클릭)은 그대로 변환
                 semantic_action = SemanticAction(
                     timestamp=action.timestamp,
                     action_type=action.action_type,
@@ -128,7 +160,7 @@ class SemanticTestRunner:
                     scroll_dy=action.scroll_dy,
                     screenshot_path=action.screenshot_path
                 )
-                semantic_actions.append(semantic_action)
+            semantic_actions.append(semantic_action)
         
         print()
         print()
@@ -0,0 +1,99 @@
+"""
+테스트 공용 픽스처와 헬퍼
+
+재실행(replay) 테스트들이 함께 쓰는 화면 이미지, 설정 파일, 모킹된 SemanticActionReplayer 실행을 모아 둔다.
+헬퍼 함수는 `from tests.conftest import ...`로 가져와 사용한다.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.config_manager import ConfigManager
+from src.semantic_action_recorder import SemanticAction
+
+
+EMPTY_UI = {"buttons": [], "icons": [], "text_fields": []}
+
+
+def block_frame(seed: int = 0, size: Tuple[int, int] = (320, 240), block: int = 16) -> Image.Image:
+    """무작위 블록 패턴 화면 (블록마다 색이 달라 위치가 구분됨)"""
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(0, 256, (size[1] // block, size[0] // block, 3), dtype=np.uint8)
+    return Image.fromarray(blocks.repeat(block, axis=0).repeat(block, axis=1))
+
+
+def start_button_ui(x: int = 100, y: int = 100) -> Dict[str, Any]:
+    """(x, y)에 '시작' 버튼 하나가 있는 UI 분석 결과"""
+    return {
+        "buttons": [{"text": "시작", "type": "button", "x": x, "y": y, "confidence": 0.95}],
+        "icons": [],
+        "text_fields": []
+    }
+
+
+def mock_analyzer(ui_data: Optional[Dict[str, Any]] = None) -> Mock:
+    """analyze_with_retry가 ui_data(기본: 시작 버튼)를 반환하는 UIAnalyzer 모킹"""
+    analyzer = Mock()
+    analyzer.analyze_with_retry.return_value = start_button_ui() if ui_data is None else ui_data
+    return analyzer
+
+
+def semantic_click(x: int = 100, y: int = 100, **fields) -> SemanticAction:
+    """'시작' 버튼 클릭 SemanticAction (fields로 다른 필드 지정)"""
+    values = {
+        "description": '시작 버튼 클릭',
+        "button": 'left',
+        "semantic_info": {"target_element": {"type": "button", "text": "시작"}},
+        "screen_transition": {"transition_type": "unknown"},
+    }
+    values.update(fields)
+    return SemanticAction(timestamp=datetime.now().isoformat(), action_type='click', x=x, y=y, **values)
+
+
+def replay_with_mocks(replay: Callable[[SemanticAction], Any], action: SemanticAction,
+                      screen: Optional[Image.Image]) -> Tuple[Any, Mock, Mock]:
+    """pyautogui와 time.sleep을 모킹하고 재실행 함수 실행
+
+    Args:
+        replay: 재실행 함수 (예: replayer.replay_action)
+        action: 재실행할 액션
+        screen: pyautogui.screenshot()이 반환할 화면
+
+    Returns:
+        (재실행 결과, pyautogui 모킹, time.sleep 모킹)
+    """
+    with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui, \
+            patch('src.semantic_action_replayer.time.sleep') as mock_sleep:
+        mock_pyautogui.screenshot.return_value = screen
+        result = replay(action)
+    return result, mock_pyautogui, mock_sleep
+
+
+@pytest.fixture
+def make_config(tmp_path) -> Callable[..., ConfigManager]:
+    """automation 설정으로 임시 config.json을 만들어 ConfigManager를 여는 팩토리
+
+    test_cases.directory는 tmp_path/test_cases로 지정된다.
+    """
+    def factory(**automation) -> ConfigManager:
+        config_path = tmp_path / "config.json"
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump({"automation": {"action_delay": 0.0, **automation},
+                       "test_cases": {"directory": str(tmp_path / "test_cases")}}, f)
+        config = ConfigManager(str(config_path))
+        config.load_config()
+        return config
+
+    return factory
+
+
+@pytest.fixture
+def config(make_config) -> ConfigManager:
+    """action_delay 0인 기본 설정"""
+    return make_config()
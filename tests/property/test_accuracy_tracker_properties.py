@@ -474,3 +474,63 @@ class TestAccuracyStatistics:
         assert data['semantic_match_count'] == 3
         assert 'failure_reasons' in data
         assert data['failure_reasons']['element_not_found'] == 2
+
+
+def _recompute_statistics(results):
+    """전체 결과를 다시 순회한 통계 (누적 집계 비교용)"""
+    total = len(results)
+    success = sum(1 for r in results if r.success)
+    coord_changes = [(r.coordinate_change[0]**2 + r.coordinate_change[1]**2) ** 0.5
+                     for r in results if r.coordinate_change is not None]
+    execution_times = [r.execution_time for r in results if r.execution_time > 0]
+    failure_reasons = {}
+    for r in results:
+        if not r.success and r.failure_reason:
+            failure_reasons[r.failure_reason] = failure_reasons.get(r.failure_reason, 0) + 1
+    return {
+        "total_actions": total,
+        "success_count": success,
+        "failure_count": total - success,
+        "direct_match_count": sum(1 for r in results if r.method == 'direct'),
+        "semantic_match_count": sum(1 for r in results if r.method == 'semantic'),
+        "manual_match_count": sum(1 for r in results if r.method == 'manual'),
+        "avg_coordinate_change": sum(coord_changes) / len(coord_changes) if coord_changes else 0.0,
+        "avg_execution_time": sum(execution_times) / len(execution_times) if execution_times else 0.0,
+        "failure_reasons": failure_reasons,
+        "transition_match_count": sum(1 for r in results if r.screen_transition_matched),
+    }
+
+
+class TestIncrementalStatistics:
+    """누적 집계 통계가 전체 재계산과 같은지 테스트"""
+    
+    @settings(max_examples=100, deadline=None)
+    @given(records=st.lists(
+        st.tuples(st.booleans(), method_strategy, failure_reason_strategy, coordinate_strategy,
+                  coordinate_strategy, st.one_of(st.just(0.0), execution_time_strategy), st.booleans()),
+        max_size=60
+    ))
+    def test_incremental_counters_match_recomputation(self, records):
+        temp_dir = create_temp_data_dir()
+        
+        try:
+            tracker = AccuracyTracker("test_case", data_dir=temp_dir)
+            for i, (success, method, reason, original, actual, execution_time, matched) in enumerate(records):
+                if success:
+                    tracker.record_success(f"action_{i}", method, original, actual, execution_time, matched)
+                else:
+                    tracker.record_failure(f"action_{i}", reason, original, execution_time)
+            
+            stats = tracker.calculate_statistics().to_dict()
+            expected = _recompute_statistics(tracker.get_results())
+            
+            for key, value in expected.items():
+                assert stats[key] == value, key
+            
+            # 결과 목록 교체(세션 로드 등) 후에도 일치
+            tracker.save_session()
+            reloaded = AccuracyTracker("test_case", data_dir=temp_dir)
+            reloaded.load_session(tracker.session_id)
+            assert reloaded.calculate_statistics().to_dict() == stats
+        finally:
+            cleanup_temp_dir(temp_dir)
@@ -272,11 +272,11 @@ def test_script_structure_validity():
         assert 'def replay_actions' in script_content, \
             "replay_actions 함수가 스크립트에 없습니다"
         
-        # 필수 import 확인
-        assert 'import pyautogui' in script_content, \
-            "pyautogui import가 없습니다"
-        assert 'import time' in script_content, \
-            "time import가 없습니다"
+        # 재실행 엔진 import 확인 (스크립트는 PLAN 데이터와 실행기만 포함)
+        assert 'from src.replay_plan import' in script_content, \
+            "replay_plan import가 없습니다"
+        assert 'PLAN = {' in script_content, \
+            "재실행 계획(PLAN)이 없습니다"
         
     finally:
         if os.path.exists(temp_config_path):
@@ -290,7 +290,7 @@ def test_wait_action_parsing():
     **Feature: game-qa-automation, Property 12: 대기 액션 파싱 정확성**
     
     For any "N초 대기" 형식의 설명을 가진 대기 액션,
-    생성된 스크립트는 time.sleep(N)을 포함해야 한다.
+    생성된 스크립트의 재실행 계획은 wait_time N을 포함해야 한다.
     
     Validates: Requirements 5.5
     """
@@ -328,8 +328,8 @@ def test_wait_action_parsing():
         with open(script_path, 'r', encoding='utf-8') as f:
             script_content = f.read()
         
-        # time.sleep(2.5) 포함 확인
-        assert 'time.sleep(2.5)' in script_content, \
+        # wait_time 2.5 포함 확인
+        assert "'wait_time': 2.5" in script_content, \
             "대기 시간이 올바르게 파싱되지 않았습니다"
         
     finally:
@@ -378,7 +378,7 @@ def test_screen_transition_verification(x, y, expected_transition, actual_hash_d
             actual_transition = 'full_transition'
         
         with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui, \
-             patch('src.semantic_action_replayer.imagehash') as mock_imagehash:
+             patch('src.semantic_action_replayer.hex_hamming_distance') as mock_hash_distance:
             
             from PIL import Image
             mock_image = Image.new('RGB', (100, 100), color='green')
@@ -386,10 +386,7 @@ def test_screen_transition_verification(x, y, expected_transition, actual_hash_d
             mock_pyautogui.click = Mock()
             
             # 해시 계산 Mock
-            mock_hash = Mock()
-            mock_hash.__sub__ = Mock(return_value=actual_hash_diff)
-            mock_imagehash.average_hash.return_value = mock_hash
-            mock_imagehash.hex_to_hash.return_value = mock_hash
+            mock_hash_distance.return_value = actual_hash_diff
             
             result = replayer.replay_action(action)
         
@@ -475,7 +472,7 @@ def test_transition_mismatch_logging(x, y):
         )
         
         with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui, \
-             patch('src.semantic_action_replayer.imagehash') as mock_imagehash, \
+             patch('src.semantic_action_replayer.hex_hamming_distance') as mock_hash_distance, \
              patch('src.semantic_action_replayer.logger') as mock_logger:
             
             from PIL import Image
@@ -484,10 +481,7 @@ def test_transition_mismatch_logging(x, y):
             mock_pyautogui.click = Mock()
             
             # 큰 해시 차이 (full_transition)
-            mock_hash = Mock()
-            mock_hash.__sub__ = Mock(return_value=50)
-            mock_imagehash.average_hash.return_value = mock_hash
-            mock_imagehash.hex_to_hash.return_value = mock_hash
+            mock_hash_distance.return_value = 50
             
             result = replayer.replay_action(action)
         
@@ -0,0 +1,99 @@
+"""
+Property-based tests for TextMatchScorer
+
+**Feature: semantic-test-replay, Property: 일괄 텍스트 유사도 점수 동일성**
+
+TextMatchQuery.score_all()과 SemanticActionReplayer의 요소 매칭 점수가
+기존 요소별 계산(아래 참조 구현)과 완전히 같은지 검증한다.
+
+Validates: Requirements 3.2
+"""
+
+import os
+import re
+import sys
+from hypothesis import given, settings, strategies as st
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.text_match_scorer import PreparedText, TextMatchQuery, normalize_text, text_similarity
+
+
+# ============================================================================
+# 참조 구현 (요소마다 정규화하던 기존 _calculate_text_similarity)
+# ============================================================================
+
+def reference_similarity(text1, text2):
+    if not text1 or not text2:
+        return 0.0
+    if text1 == text2:
+        return 1.0
+    normalized1 = re.sub(r'\s+', ' ', str(text1).lower().strip())
+    normalized2 = re.sub(r'\s+', ' ', str(text2).lower().strip())
+    if not normalized1 and not normalized2:
+        return 1.0
+    if not normalized1 or not normalized2:
+        return 0.0
+    if normalized1 == normalized2:
+        return 1.0
+    set1 = set(normalized1)
+    set2 = set(normalized2)
+    intersection = len(set1 & set2)
+    union = len(set1 | set2)
+    if union == 0:
+        return 0.0
+    jaccard = intersection / union
+    common_prefix_len = 0
+    for c1, c2 in zip(normalized1, normalized2):
+        if c1 == c2:
+            common_prefix_len += 1
+        else:
+            break
+    prefix_bonus = common_prefix_len / max(len(normalized1), len(normalized2)) * 0.15
+    jaccard_score = min(jaccard * 0.85 + prefix_bonus, 0.85)
+    shorter = normalized1 if len(normalized1) <= len(normalized2) else normalized2
+    longer = normalized2 if len(normalized1) <= len(normalized2) else normalized1
+    if shorter in longer:
+        ratio = len(shorter) / len(longer)
+        substring_score = 0.3 + (ratio * 0.2)
+        return max(jaccard_score, substring_score)
+    return jaccard_score
+
+
+# ============================================================================
+# Strategies (전략 정의)
+# ============================================================================
+
+# 비슷한 텍스트가 자주 나오도록 작은 알파벳 사용
+text_strategy = st.text(alphabet="aAbB 시작설정\t\n", min_size=0, max_size=12)
+any_text_strategy = st.one_of(text_strategy, st.text(max_size=30), st.none())
+
+
+@settings(max_examples=300, deadline=None)
+@given(query=any_text_strategy, candidates=st.lists(any_text_strategy, max_size=10))
+def test_score_all_matches_reference(query, candidates):
+    """일괄 계산 점수는 요소별 참조 구현과 비트 단위로 같아야 한다"""
+    expected = [reference_similarity(query, candidate) for candidate in candidates]
+
+    scorer = TextMatchQuery(query)
+    assert scorer.score_all(candidates) == expected
+    assert scorer.score_all([PreparedText.of(c) for c in candidates]) == expected
+
+
+@settings(max_examples=300, deadline=None)
+@given(text1=any_text_strategy, text2=any_text_strategy)
+def test_text_similarity_matches_reference(text1, text2):
+    """단일 비교 함수도 참조 구현과 같아야 한다"""
+    assert text_similarity(text1, text2) == reference_similarity(text1, text2)
+
+
+@settings(max_examples=100, deadline=None)
+@given(text=st.text(max_size=30))
+def test_normalize_text(text):
+    """정규화는 소문자 + 공백 하나로 압축 + 양끝 공백 제거"""
+    assert normalize_text(text) == re.sub(r'\s+', ' ', text.lower().strip())
+
+
+def test_non_string_element_text():
+    """숫자 텍스트도 문자열로 정규화하여 비교"""
+    assert TextMatchQuery("5").score_all([5, "5", None]) == [1.0, 1.0, 0.0]
@@ -0,0 +1,232 @@
+"""
+AccuracyStore 테스트
+
+SQLite 백엔드 AccuracyTracker가 JSON 백엔드와 같은 형식으로 조회 결과를 반환하는지,
+기존 JSON 세션을 한 번 가져오는지 검증한다.
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.accuracy_store import DEFAULT_ACCURACY_BACKEND, AccuracyStore
+from src.accuracy_tracker import AccuracyTracker
+
+
+def _run_session(tracker, outcomes):
+    """outcomes: action별 성공 여부 리스트"""
+    tracker.start_session()
+    for i, success in enumerate(outcomes):
+        if success:
+            tracker.record_success(f"action_{i:04d}", 'direct', (i, i), actual_coords=(i, i), execution_time=0.1)
+        else:
+            tracker.record_failure(f"action_{i:04d}", "요소를 찾을 수 없음", (i, i), execution_time=0.2)
+    tracker.save_session()
+    return tracker.session_id
+
+
+def _fill(tracker):
+    _run_session(tracker, [True, False, True])
+    _run_session(tracker, [True, True, False])
+    _run_session(tracker, [False, True])
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+def test_backends_return_same_shapes(tmp_path, backend):
+    tracker = AccuracyTracker("tc", data_dir=str(tmp_path / backend), backend=backend)
+    _fill(tracker)
+
+    sessions = tracker.list_sessions()
+    assert len(sessions) == 3
+    assert set(sessions[0]) == {"session_id", "timestamp", "total_actions", "success_rate",
+                                "success_count", "failure_count", "semantic_match_rate"}
+    assert [s["timestamp"] for s in sessions] == sorted((s["timestamp"] for s in sessions), reverse=True)
+
+    history = tracker.get_action_history("action_0001")
+    assert sorted(r.success for r in history) == [False, True, True]
+    assert all(r.original_coords == (1, 1) for r in history)
+
+    rates = tracker.get_failure_rate_by_action()
+    assert rates == pytest.approx({"action_0000": 1 / 3, "action_0001": 1 / 3, "action_0002": 1 / 2})
+    tracker.close()
+
+
+def test_sqlite_session_round_trip(tmp_path):
+    tracker = AccuracyTracker("tc", data_dir=str(tmp_path), backend="sqlite")
+    session_id = _run_session(tracker, [True, False])
+    tracker.resume_count = 2
+    tracker.save_session()  # 같은 세션 다시 저장하면 교체
+
+    other = AccuracyTracker("tc", data_dir=str(tmp_path), backend="sqlite")
+    assert other.load_session(session_id)
+    assert other.resume_count == 2
+    assert [r.to_dict() for r in other.get_results()] == [r.to_dict() for r in tracker.get_results()]
+    assert len(other.list_sessions()) == 1
+    assert not other.load_session("missing")
+    assert os.listdir(tmp_path) == ["accuracy.sqlite"]  # 세션별 JSON 파일 없음
+
+
+def test_sqlite_backend_keeps_test_cases_separate(tmp_path):
+    first = AccuracyTracker("a", data_dir=str(tmp_path), backend="sqlite")
+    second = AccuracyTracker("b", data_dir=str(tmp_path), backend="sqlite")
+    _run_session(first, [True])
+    _run_session(second, [False, False])
+
+    assert len(first.list_sessions()) == 1
+    assert second.get_failure_rate_by_action() == {"action_0000": 1.0, "action_0001": 1.0}
+    assert first.get_action_history("action_0001") == []
+
+
+def test_json_sessions_imported_once(tmp_path):
+    legacy = AccuracyTracker("tc", data_dir=str(tmp_path), backend="json")
+    _fill(legacy)
+    expected_sessions = legacy.list_sessions()
+    expected_rates = legacy.get_failure_rate_by_action()
+    # 통계 파일만 남은 세션
+    with open(tmp_path / "tc" / "20240101_000000_000000_stats.json", 'w', encoding='utf-8') as f:
+        json.dump({"session_id": "20240101_000000_000000", "timestamp": "2024-01-01T00:00:00",
+                   "statistics": {"total_actions": 5, "success_count": 5, "success_rate": 1.0}}, f)
+
+    tracker = AccuracyTracker("tc", data_dir=str(tmp_path), backend="sqlite")
+
+    sessions = tracker.list_sessions()
+    assert sessions[:3] == expected_sessions
+    assert sessions[3]["session_id"] == "20240101_000000_000000" and sessions[3]["total_actions"] == 5
+    assert tracker.get_failure_rate_by_action() == pytest.approx(expected_rates)
+    tracker.close()
+
+    # 다시 열 때는 JSON 디렉토리를 다시 훑지 않음 (meta에 기록)
+    _run_session(legacy, [True])
+    with patch.object(AccuracyStore, 'import_json_sessions') as import_json_sessions:
+        reopened = AccuracyTracker("tc", data_dir=str(tmp_path), backend="sqlite")
+    import_json_sessions.assert_not_called()
+    assert len(reopened.list_sessions()) == 4
+    reopened.close()
+
+
+def test_import_json_sessions_picks_up_new_or_changed(tmp_path):
+    legacy = AccuracyTracker("tc", data_dir=str(tmp_path), backend="json")
+    _fill(legacy)
+    store = AccuracyStore.for_data_dir(str(tmp_path))
+
+    # 바뀌지 않은 JSON 세션은 다시 가져오지 않음
+    assert store.import_json_sessions(str(tmp_path)) == 0
+
+    # 이후 JSON 백엔드가 저장한 세션
+    _run_session(legacy, [True])
+    assert store.import_json_sessions(str(tmp_path)) == 1
+    assert len(store.list_sessions("tc")) == 4
+
+    # 같은 세션을 다시 저장(이어서 실행)하면 바뀐 결과로 교체
+    legacy.record_failure("action_extra", "실패", (0, 0))
+    legacy.save_session()
+    results_path = tmp_path / "tc" / f"{legacy.session_id}_results.json"
+    os.utime(results_path, ns=(results_path.stat().st_atime_ns, results_path.stat().st_mtime_ns + 1))
+    assert store.import_json_sessions(str(tmp_path)) == 1
+    latest = next(s for s in store.list_sessions("tc") if s["session_id"] == legacy.session_id)
+    assert len(store.list_sessions("tc")) == 4 and latest["total_actions"] == 2
+    store.close()
+
+
+def test_constructor_defaults_to_json_and_config_to_sqlite(tmp_path):
+    config = Mock()
+    config.get.side_effect = lambda key, default=None: str(tmp_path) if key == 'automation.accuracy_data_dir' else default
+    tracker = AccuracyTracker("tc", data_dir=str(tmp_path))
+    configured = AccuracyTracker.for_config("tc", config)
+
+    assert tracker.backend == "json"
+    assert configured.backend == DEFAULT_ACCURACY_BACKEND == "sqlite"
+    configured.close()
+
+
+def test_unknown_backend_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        AccuracyTracker("tc", data_dir=str(tmp_path), backend="csv")
+
+
+class TestRollups:
+    """테스트 케이스/날짜/액션별 집계 테스트"""
+
+    def _save(self, store, test_case, session_id, timestamp, outcomes, semantic=0):
+        results = [{"action_id": f"action_{i:04d}", "timestamp": timestamp, "success": ok}
+                   for i, ok in enumerate(outcomes)]
+        success = sum(outcomes)
+        statistics = {"total_actions": len(outcomes), "success_count": success,
+                      "failure_count": len(outcomes) - success, "success_rate": success / len(outcomes),
+                      "semantic_match_count": semantic,
+                      "semantic_match_rate": semantic / success if success else 0.0}
+        store.save_session(test_case, session_id, timestamp, results, statistics)
+
+    def test_daily_rollups_across_test_cases(self, tmp_path):
+        store = AccuracyStore(str(tmp_path / "accuracy.sqlite"))
+        self._save(store, "a", "s1", "2026-01-01T10:00:00", [True, True, False, True], semantic=1)
+        self._save(store, "b", "s2", "2026-01-01T12:00:00", [True, False], semantic=1)
+        self._save(store, "a", "s3", "2026-01-02T09:00:00", [True, True, True, True], semantic=4)
+
+        daily = store.daily_rollups()
+        assert [d["day"] for d in daily] == ["2026-01-02", "2026-01-01"]
+        assert daily[1]["sessions"] == 2 and daily[1]["test_cases"] == 2
+        assert daily[1]["total_actions"] == 6 and daily[1]["failure_count"] == 2
+        assert daily[1]["success_rate"] == pytest.approx(4 / 6)
+        assert daily[1]["semantic_match_rate"] == pytest.approx(2 / 4)
+        assert daily[1]["avg_success_rate"] == pytest.approx((0.75 + 0.5) / 2)
+        assert store.daily_rollups("b") == [dict(daily[1], sessions=1, test_cases=1, total_actions=2,
+                                                 success_count=1, failure_count=1, success_rate=0.5,
+                                                 semantic_match_rate=1.0, avg_success_rate=0.5,
+                                                 avg_semantic_match_rate=1.0)]
+        assert store.daily_rollups(days=1) == []  # 달력 기준 최근 1일(오늘)에는 실행 없음
+
+    def test_daily_rollups_calendar_days(self, tmp_path):
+        store = AccuracyStore(str(tmp_path / "accuracy.sqlite"))
+        today = datetime.now()
+        for offset in (0, 3, 10):
+            day = today - timedelta(days=offset)
+            self._save(store, "a", f"s{offset}", day.strftime("%Y-%m-%dT%H:%M:%S"), [True])
+
+        assert [d["day"] for d in store.daily_rollups(days=1)] == [today.strftime("%Y-%m-%d")]
+        assert len(store.daily_rollups(days=4)) == 2  # 실행이 있는 날짜 수가 아니라 달력 기준 4일
+        assert len(store.daily_rollups(days=11)) == 3
+
+    def test_resaving_session_replaces_contribution(self, tmp_path):
+        store = AccuracyStore(str(tmp_path / "accuracy.sqlite"))
+        self._save(store, "a", "s1", "2026-01-01T10:00:00", [True, False])
+        self._save(store, "a", "s1", "2026-01-01T10:05:00", [True, False, True])  # 이어서 실행 후 다시 저장
+
+        summary = store.execution_summary("a")
+        assert summary["total_executions"] == 1 and summary["total_errors"] == 1
+        assert summary["avg_success_rate"] == pytest.approx(2 / 3)
+        assert summary["latest_execution"]["timestamp"] == "2026-01-01T10:05:00"
+        assert store.action_rollups("a")["action_0001"] == {
+            "executions": 1, "failures": 1, "failure_rate": 1.0, "last_timestamp": "2026-01-01T10:05:00"}
+        assert store.daily_rollups("a")[0]["total_actions"] == 3
+
+    def test_summary_matches_json_backend(self, tmp_path):
+        json_tracker = AccuracyTracker("tc", data_dir=str(tmp_path / "json"), backend="json")
+        sqlite_tracker = AccuracyTracker("tc", data_dir=str(tmp_path / "sqlite"), backend="sqlite")
+        for tracker in (json_tracker, sqlite_tracker):
+            _fill(tracker)
+
+        expected = json_tracker.get_execution_summary()
+        summary = sqlite_tracker.get_execution_summary()
+        assert summary["total_executions"] == expected["total_executions"] == 3
+        assert summary["total_errors"] == expected["total_errors"]
+        assert summary["avg_success_rate"] == pytest.approx(expected["avg_success_rate"])
+        assert summary["latest_execution"]["session_id"] == sqlite_tracker.session_id
+        assert AccuracyTracker("empty", data_dir=str(tmp_path / "sqlite"),
+                               backend="sqlite").get_execution_summary()["latest_execution"] is None
+
+    def test_rollups_rebuilt_for_existing_store(self, tmp_path):
+        path = str(tmp_path / "accuracy.sqlite")
+        store = AccuracyStore(path)
+        self._save(store, "a", "s1", "2026-01-01T10:00:00", [True, False])
+        store._conn.execute("DELETE FROM rollup_test_case")
+        store._conn.execute("DELETE FROM meta WHERE key = 'rollup_version'")
+        store._conn.commit()
+        store.close()
+
+        reopened = AccuracyStore(path)
+        assert reopened.execution_summary("a")["total_executions"] == 1
+        assert reopened.failure_rate_by_action("a") == {"action_0000": 0.0, "action_0001": 1.0}
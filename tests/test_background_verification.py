@@ -0,0 +1,191 @@
+"""
+BackgroundVerifier 단위 테스트
+
+replay 중 비차단 검증(background/offline)의 결과 순서 보장,
+조기 중단, ScriptGenerator 통합을 검증한다.
+"""
+
+import os
+import sys
+import time
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config_manager import ConfigManager
+from src.replay_verifier import VerificationResult
+from src.background_verification import (
+    BackgroundVerifier, resolve_mode, MODE_BACKGROUND, MODE_INLINE, MODE_OFFLINE
+)
+from src.script_generator import ScriptGenerator
+
+
+def _result(index: int, final_result: str = "pass") -> VerificationResult:
+    return VerificationResult(
+        action_index=index,
+        action_description=f"액션 {index}",
+        screenshot_match=final_result == "pass",
+        screenshot_similarity=1.0 if final_result == "pass" else 0.1,
+        final_result=final_result
+    )
+
+
+def _mock_verifier(delay=lambda index: 0.0, failing=()):
+    """verify_captured_frame이 지정된 시간만큼 걸리는 가짜 ReplayVerifier"""
+    verifier = Mock()
+    verifier.verification_results = []
+    verifier.verified_threads = set()
+
+    def verify(index, action, image, record=True):
+        verifier.verified_threads.add(threading.current_thread().name)
+        time.sleep(delay(index))
+        return _result(index, "fail" if index in failing else "pass")
+
+    def capture_and_verify(index, action, next_action=None):
+        result = verify(index, action, None)
+        verifier.verification_results.append(result)
+        return result
+
+    verifier.verify_captured_frame.side_effect = verify
+    verifier.capture_and_verify.side_effect = capture_and_verify
+    verifier.record_result.side_effect = lambda index, result: verifier.verification_results.append(result)
+    verifier.capture_frame.return_value = Image.new('RGB', (32, 32))
+    return verifier
+
+
+class TestBackgroundVerifier:
+    """검증 대기열 테스트"""
+
+    def test_results_joined_in_action_order(self):
+        # 앞선 액션일수록 검증이 오래 걸려 완료 순서가 뒤집힘
+        verifier = _mock_verifier(delay=lambda index: 0.05 * (3 - index))
+        background = BackgroundVerifier(verifier, MODE_BACKGROUND, workers=4)
+        for i in range(4):
+            background.submit(i, {"description": f"액션 {i}"}, Image.new('RGB', (8, 8)))
+
+        results = background.join()
+        assert [r.action_index for r in results] == [0, 1, 2, 3]
+        assert [r.action_index for r in verifier.verification_results] == [0, 1, 2, 3]
+        assert all(name.startswith("replay-verify") for name in verifier.verified_threads)
+
+    def test_error_results_keep_position(self):
+        verifier = _mock_verifier()
+        background = BackgroundVerifier(verifier, MODE_BACKGROUND)
+        background.submit(0, {}, Image.new('RGB', (8, 8)))
+        background.add_result(1, _result(1, "fail"))
+        background.submit(2, {}, Image.new('RGB', (8, 8)))
+
+        assert [r.action_index for r in background.join()] == [0, 1, 2]
+
+    def test_worker_exception_becomes_fail(self):
+        verifier = _mock_verifier()
+        verifier.verify_captured_frame.side_effect = RuntimeError("비교 실패")
+        background = BackgroundVerifier(verifier, MODE_BACKGROUND)
+        background.submit(0, {"description": "클릭"}, Image.new('RGB', (8, 8)))
+
+        result = background.join()[0]
+        assert result.final_result == "fail"
+        assert result.details["error"] == "비교 실패"
+
+    def test_first_failure_only_sees_finished_work(self):
+        release = threading.Event()
+        verifier = _mock_verifier(failing={0})
+        verifier.verify_captured_frame.side_effect = lambda i, a, img, record=True: (release.wait(5), _result(i, "fail"))[1]
+        background = BackgroundVerifier(verifier, MODE_BACKGROUND)
+        background.submit(0, {}, Image.new('RGB', (8, 8)))
+
+        assert background.first_failure() is None
+        assert background.pending_count == 1
+        release.set()
+        background.join()
+
+    def test_offline_mode_defers_verification(self):
+        verifier = _mock_verifier()
+        background = BackgroundVerifier(verifier, MODE_OFFLINE)
+        background.submit(0, {}, Image.new('RGB', (8, 8)))
+        background.submit(1, {}, Image.new('RGB', (8, 8)))
+
+        verifier.verify_captured_frame.assert_not_called()
+        assert background.pending_count == 2
+        assert [r.action_index for r in background.join()] == [0, 1]
+        assert verifier.verify_captured_frame.call_count == 2
+
+    def test_resolve_mode(self):
+        assert resolve_mode("Background") == MODE_BACKGROUND
+        assert resolve_mode(None) == MODE_INLINE
+        assert resolve_mode("parallel") == MODE_INLINE
+        with pytest.raises(ValueError):
+            BackgroundVerifier(Mock(), MODE_INLINE)
+
+
+class TestReplayWithBackgroundVerification:
+    """ScriptGenerator 통합 테스트"""
+
+    @pytest.fixture
+    def config(self):
+        settings = {
+            'game.window_title': '',
+            'automation.action_delay': 0,
+            'automation.verification_workers': 4,
+        }
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: settings.get(key, default)
+        config.settings = settings
+        return config
+
+    @pytest.fixture
+    def test_case(self):
+        actions = [{"action_type": "click", "x": 10 * i, "y": 10, "description": f"클릭 {i}"}
+                   for i in range(6)]
+        return {"name": "sample", "actions": actions}
+
+    def _replay(self, config, test_case, verifier, **kwargs):
+        generator = ScriptGenerator(config)
+        with patch('src.replay_verifier.ReplayVerifier', return_value=verifier), \
+             patch('src.script_generator.pyautogui') as mock_gui:
+            started = time.perf_counter()
+            passed, _ = generator.replay_with_verification(test_case, verify=True, report_dir="unused", **kwargs)
+            return passed, time.perf_counter() - started, mock_gui
+
+    def test_background_mode_does_not_wait_for_verification(self, config, test_case):
+        verifier = _mock_verifier(delay=lambda index: 0.1)
+        passed, inline_time, _ = self._replay(config, test_case, verifier, verification_mode="inline")
+        assert passed
+
+        verifier = _mock_verifier(delay=lambda index: 0.1)
+        passed, background_time, _ = self._replay(config, test_case, verifier, verification_mode="background")
+        assert passed
+        assert background_time < inline_time * 0.7
+        assert [r.action_index for r in verifier.verification_results] == list(range(6))
+        verifier.capture_and_verify.assert_not_called()
+
+    def test_mode_from_config(self, config, test_case):
+        config.settings['automation.verification_mode'] = 'offline'
+        verifier = _mock_verifier()
+        passed, _, _ = self._replay(config, test_case, verifier)
+
+        assert passed
+        assert verifier.capture_frame.call_count == 6
+        verifier.capture_and_verify.assert_not_called()
+
+    def test_inline_abort_on_failure(self, config, test_case):
+        verifier = _mock_verifier(failing={1})
+        passed, _, mock_gui = self._replay(config, test_case, verifier,
+                                           verification_mode="inline", abort_on_failure=True)
+
+        assert passed is False
+        assert mock_gui.click.call_count == 2  # 실패한 액션 이후 실행 중단
+
+    def test_background_abort_on_failure(self, config, test_case):
+        verifier = _mock_verifier(failing={0})
+        config.settings['automation.action_delay'] = 0.05  # 검증이 입력보다 먼저 끝나도록
+        passed, _, mock_gui = self._replay(config, test_case, verifier,
+                                           verification_mode="background", abort_on_failure=True)
+
+        assert passed is False
+        assert mock_gui.click.call_count < len(test_case["actions"])
+        assert verifier.verification_results[0].final_result == "fail"
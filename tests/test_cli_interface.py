@@ -572,7 +572,35 @@ class TestCLIInterface:
         
         captured = capsys.readouterr()
         assert 'custom_reports' in captured.out
-    
+
+    def test_handle_command_replay_with_verification_mode(self, cli, mock_controller):
+        """replay --verify --mode background --abort-on-fail 명령어 처리"""
+        mock_controller.current_test_case = {"name": "test_case", "actions": []}
+        mock_controller.script_generator = Mock()
+        mock_controller.script_generator.replay_with_verification = Mock(return_value=(True, None))
+        cli._display_verification_summary = Mock()
+
+        result = cli.handle_command(['replay', '--verify', '--mode', 'background', '--abort-on-fail'])
+
+        assert result is True
+        mock_controller.script_generator.replay_with_verification.assert_called_once_with(
+            mock_controller.current_test_case,
+            verify=True,
+            report_dir='reports',
+            verification_mode='background',
+            abort_on_failure=True
+        )
+
+    def test_handle_command_replay_invalid_verification_mode(self, cli, mock_controller, capsys):
+        """replay --verify --mode 명령어 처리 - 알 수 없는 검증 방식"""
+        mock_controller.script_generator = Mock()
+
+        result = cli.handle_command(['replay', '--verify', '--mode', 'turbo'])
+
+        assert result is True
+        mock_controller.script_generator.replay_with_verification.assert_not_called()
+        assert '--mode' in capsys.readouterr().out
+
     def test_handle_command_replay_verify_no_test_case(self, cli, mock_controller, capsys):
         """replay --verify 명령어 처리 - 로드된 테스트 케이스 없음"""
         mock_controller.current_test_case = None
@@ -662,3 +690,19 @@ class TestCLIInterface:
         captured = capsys.readouterr()
         assert '--verify' in captured.out
         assert '--report-dir' in captured.out
+    
+    def test_handle_command_report_aggregates_streams(self, cli, capsys, tmp_path):
+        """report <디렉토리> 명령어 처리 - 스트리밍 보고서 합산"""
+        from src.report_stream import ReportStreamWriter, get_stream_path
+        
+        writer = ReportStreamWriter(get_stream_path(str(tmp_path), "sample", "20260101_000000"), fsync=False)
+        writer.open("sample", "20260101_000000", "2026-01-01T00:00:00")
+        writer.write_result({"action_index": 0, "final_result": "fail"})
+        writer._file.close()  # 중단된 실행
+        
+        result = cli.handle_command(['report', str(tmp_path)])
+        
+        assert result is True
+        captured = capsys.readouterr()
+        assert '중단 1' in captured.out
+        assert '[0] 1회' in captured.out
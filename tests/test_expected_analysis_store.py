@@ -0,0 +1,225 @@
+"""
+ExpectedAnalysisStore 단위 테스트
+
+예상 프레임 UI 분석 결과의 저장, 재사용, 오래된 결과 감지를 검증한다.
+"""
+
+import os
+import sys
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config_manager import ConfigManager
+from src.expected_analysis_store import ExpectedAnalysisStore, get_analysis_path, frame_key
+from src.replay_verifier import ReplayVerifier
+from src.ui_analyzer import UIAnalyzer
+
+
+VISION_RESULT = {
+    "buttons": [{"text": "Start", "x": 50, "y": 50}],
+    "icons": [],
+    "text_fields": [{"content": "Lobby", "x": 10, "y": 10}],
+    "source": "vision_llm"
+}
+
+
+def _mock_analyzer(model_id: str = "model-a", prompt_version: str = "p1", result=None):
+    analyzer = Mock()
+    analyzer.get_analysis_signature.return_value = {
+        "model_id": model_id, "prompt_version": prompt_version
+    }
+    analyzer.analyze_with_retry.return_value = dict(result or VISION_RESULT)
+    return analyzer
+
+
+@pytest.fixture
+def workspace():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        test_cases_dir = os.path.join(tmpdir, 'test_cases')
+        os.makedirs(test_cases_dir)
+        frames = []
+        for i, color in enumerate(['red', 'blue']):
+            path = os.path.join(tmpdir, f'action_{i:04d}.png')
+            Image.new('RGB', (64, 48), color=color).save(path)
+            frames.append(path)
+
+        test_case = {
+            "name": "sample",
+            "actions": [
+                {"action_type": "click", "description": "클릭 1", "screenshot_path": frames[0]},
+                {"action_type": "wait", "description": "1.0초 대기"},
+                {"action_type": "click", "description": "클릭 2", "screenshot_path": frames[1]},
+                {"action_type": "click", "description": "없는 프레임",
+                 "screenshot_path": os.path.join(tmpdir, 'missing.png')},
+            ]
+        }
+        with open(os.path.join(test_cases_dir, 'sample.json'), 'w', encoding='utf-8') as f:
+            json.dump(test_case, f)
+
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: {
+            'test_cases.directory': test_cases_dir,
+            'automation.hash_threshold': 5,
+            'game.window_title': '',
+            'automation.screenshot_dir': tmpdir,
+            'automation.capture_delay': 0.0,
+        }.get(key, default)
+
+        yield {"config": config, "test_cases_dir": test_cases_dir,
+               "frames": frames, "test_case": test_case}
+
+
+class TestExpectedAnalysisStore:
+    """분석 결과 저장/재사용 테스트"""
+
+    def test_analysis_is_persisted_and_reused(self, workspace):
+        analyzer = _mock_analyzer()
+        store = ExpectedAnalysisStore.for_test_case(workspace["config"], "sample", analyzer)
+
+        first = store.get_or_analyze(workspace["frames"][0])
+        assert first["cached"] is False
+        assert analyzer.analyze_with_retry.call_count == 1
+
+        path = get_analysis_path(workspace["test_cases_dir"], "sample")
+        assert os.path.exists(path)
+
+        # 새 인스턴스에서도 저장된 결과 사용 (Vision LLM 호출 없음)
+        reloaded = ExpectedAnalysisStore.for_test_case(workspace["config"], "sample", analyzer)
+        second = reloaded.get_or_analyze(workspace["frames"][0])
+        assert second["cached"] is True
+        assert second["buttons"] == VISION_RESULT["buttons"]
+        assert analyzer.analyze_with_retry.call_count == 1
+
+    def test_version_stamps_are_recorded(self, workspace):
+        store = ExpectedAnalysisStore.for_test_case(workspace["config"], "sample", _mock_analyzer())
+        store.get_or_analyze(workspace["frames"][0])
+
+        with open(store.path, encoding='utf-8') as f:
+            data = json.load(f)
+        entry = data["frames"][frame_key(workspace["frames"][0])]
+        assert entry["model_id"] == "model-a"
+        assert entry["prompt_version"] == "p1"
+        assert entry["analyzed_at"]
+
+    @pytest.mark.parametrize("model_id,prompt_version", [("model-b", "p1"), ("model-a", "p2")])
+    def test_model_or_prompt_change_triggers_refresh(self, workspace, model_id, prompt_version):
+        ExpectedAnalysisStore.for_test_case(
+            workspace["config"], "sample", _mock_analyzer()
+        ).get_or_analyze(workspace["frames"][0])
+
+        analyzer = _mock_analyzer(model_id, prompt_version)
+        store = ExpectedAnalysisStore.for_test_case(workspace["config"], "sample", analyzer)
+        assert not store.is_fresh(workspace["frames"][0])
+
+        result = store.get_or_analyze(workspace["frames"][0])
+        assert result["cached"] is False
+        assert analyzer.analyze_with_retry.call_count == 1
+        assert store.is_fresh(workspace["frames"][0])
+
+    def test_modified_frame_triggers_refresh(self, workspace):
+        store = ExpectedAnalysisStore.for_test_case(workspace["config"], "sample", _mock_analyzer())
+        store.get_or_analyze(workspace["frames"][0])
+        assert store.is_fresh(workspace["frames"][0])
+
+        Image.new('RGB', (80, 60), color='green').save(workspace["frames"][0])
+        assert not store.is_fresh(workspace["frames"][0])
+
+    def test_fallback_results_are_not_persisted(self, workspace):
+        analyzer = _mock_analyzer(result={"buttons": [], "icons": [], "text_fields": [],
+                                          "source": "ocr_fallback"})
+        store = ExpectedAnalysisStore.for_test_case(workspace["config"], "sample", analyzer)
+
+        result = store.get_or_analyze(workspace["frames"][0])
+        assert result["source"] == "ocr_fallback"
+        assert not store.is_fresh(workspace["frames"][0])
+        assert not os.path.exists(store.path)
+
+    def test_analyze_test_case_counts(self, workspace):
+        analyzer = _mock_analyzer()
+        store = ExpectedAnalysisStore.for_test_case(workspace["config"], "sample", analyzer)
+        progress = []
+
+        counts = store.analyze_test_case(
+            workspace["test_case"], progress_callback=lambda d, t, p: progress.append((d, t))
+        )
+        assert counts == {"total": 3, "analyzed": 2, "cached": 0, "missing": 1, "failed": 0}
+        assert progress[-1] == (3, 3)
+
+        # 두 번째 실행은 모두 저장된 결과 사용
+        counts = store.analyze_test_case(workspace["test_case"])
+        assert counts["cached"] == 2 and counts["analyzed"] == 0
+        assert analyzer.analyze_with_retry.call_count == 2
+
+        # force면 전부 재분석
+        counts = store.analyze_test_case(workspace["test_case"], force=True)
+        assert counts["analyzed"] == 2
+
+    def test_concurrent_analyses_are_all_persisted(self, workspace):
+        # 백그라운드 검증 작업 스레드가 동시에 분석 결과를 저장하는 경우
+        frames = []
+        for i in range(16):
+            path = os.path.join(os.path.dirname(workspace["frames"][0]), f'concurrent_{i:04d}.png')
+            Image.new('RGB', (32, 32), color=(i * 15, 0, 0)).save(path)
+            frames.append(path)
+        store = ExpectedAnalysisStore.for_test_case(workspace["config"], "sample", _mock_analyzer())
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(store.get_or_analyze, frames))
+
+        assert all(result["cached"] is False for result in results)
+        with open(store.path, encoding='utf-8') as f:
+            saved = json.load(f)["frames"]
+        assert set(saved) == {frame_key(path) for path in frames}
+        assert [name for name in os.listdir(os.path.dirname(store.path)) if name.endswith(".tmp")] == []
+
+    def test_frame_key_normalizes_windows_separators(self):
+        assert frame_key("screenshots\\tc/action_0000.png") == "screenshots/tc/action_0000.png"
+
+
+class TestAnalysisSignature:
+    """UIAnalyzer 분석 버전 정보 테스트"""
+
+    def test_prompt_change_changes_signature(self):
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: {'aws.model_id': 'model-x'}.get(key, default)
+        with patch.object(UIAnalyzer, '_initialize_bedrock_client'):
+            analyzer = UIAnalyzer(config)
+
+        signature = analyzer.get_analysis_signature()
+        assert signature["model_id"] == "model-x"
+
+        with patch.object(UIAnalyzer, '_build_vision_prompt', return_value="other prompt"):
+            assert analyzer.get_analysis_signature()["prompt_version"] != signature["prompt_version"]
+
+
+class TestReplayVerifierUsesStoredAnalysis:
+    """검증 시 예상 프레임 분석 재사용 테스트"""
+
+    def test_only_actual_frame_is_analyzed(self, workspace):
+        analyzer = _mock_analyzer()
+        ExpectedAnalysisStore.for_test_case(
+            workspace["config"], "sample", analyzer
+        ).analyze_test_case(workspace["test_case"])
+        analyzer.analyze_with_retry.reset_mock()
+
+        with patch('src.replay_verifier.UIAnalyzer', return_value=analyzer):
+            verifier = ReplayVerifier(workspace["config"])
+        verifier.start_verification_session("sample")
+
+        actual = Image.new('RGB', (64, 48), color='yellow')
+        match, details = verifier._verify_with_vision_llm(
+            workspace["frames"][0], actual, workspace["test_case"]["actions"][0]
+        )
+
+        assert match is True
+        assert details["expected_ui_cached"] is True
+        # 실제 화면 분석 1회만 수행
+        assert analyzer.analyze_with_retry.call_count == 1
+        assert analyzer.analyze_with_retry.call_args[0][0] is actual
@@ -0,0 +1,188 @@
+"""
+불안정 액션 지수 테스트
+
+세션 간 성공/실패 전환이 액션별 불안정성 지수에 누적되는지,
+재실행기가 불안정 액션에만 대기/재시도를 강화하는지 검증한다.
+"""
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tests.conftest import (EMPTY_UI, block_frame, mock_analyzer, replay_with_mocks, semantic_click,
+                            start_button_ui)
+from src.accuracy_store import AccuracyStore
+from src.accuracy_tracker import AccuracyTracker
+from src.semantic_action_recorder import SemanticAction
+from src.semantic_action_replayer import SemanticActionReplayer
+
+
+def _save(store, test_case, session_id, timestamp, outcomes):
+    results = [{"action_id": f"action_{i:04d}", "timestamp": timestamp, "success": ok}
+               for i, ok in enumerate(outcomes)]
+    success = sum(outcomes)
+    store.save_session(test_case, session_id, timestamp, results,
+                       {"total_actions": len(outcomes), "success_count": success,
+                        "failure_count": len(outcomes) - success, "success_rate": success / len(outcomes)})
+
+
+def _fill(store, test_case="a"):
+    """action_0000: 성공/실패 반복, action_0001: 항상 실패, action_0002: 항상 성공"""
+    for day, flaky_ok in enumerate([True, False, True, False]):
+        _save(store, test_case, f"s{day}", f"2026-01-0{day + 1}T10:00:00", [flaky_ok, False, True])
+
+
+class TestFlakyIndex:
+    """AccuracyStore 불안정성 지수 테스트"""
+
+    def test_alternating_action_ranks_first(self, tmp_path):
+        store = AccuracyStore(str(tmp_path / "accuracy.sqlite"), flaky_alpha=0.5)
+        _fill(store)
+
+        ranked = store.flaky_actions()
+        assert [entry["action_id"] for entry in ranked] == ["action_0000"]
+        entry = ranked[0]
+        assert entry["transitions"] == 3 and entry["observations"] == 4 and entry["last_failed"]
+        assert entry["flakiness"] == pytest.approx(0.875)  # 0 → 0.5 → 0.75 → 0.875
+        assert store.action_flakiness("a", 0.5) == {"action_0000": pytest.approx(0.875)}
+        assert store.action_flakiness("a", 0.9) == {}
+        assert store.flaky_actions(min_observations=5) == []
+
+    def test_flaky_test_cases_ranked(self, tmp_path):
+        store = AccuracyStore(str(tmp_path / "accuracy.sqlite"))
+        _fill(store, "a")
+        for day in range(4):
+            _save(store, "b", f"b{day}", f"2026-01-0{day + 1}T11:00:00", [True, True])
+
+        ranked = store.flaky_test_cases()
+        assert [entry["test_case"] for entry in ranked] == ["a"]
+        assert ranked[0]["flaky_actions"] == 1
+        assert store.flaky_actions("b") == []
+
+    def test_resaving_session_is_idempotent(self, tmp_path):
+        store = AccuracyStore(str(tmp_path / "accuracy.sqlite"))
+        _fill(store)
+        expected = store.flaky_actions(min_observations=1)
+
+        _save(store, "a", "s3", "2026-01-04T10:00:00", [False, False, True])  # 마지막 세션 다시 저장
+        assert store.flaky_actions(min_observations=1) == expected
+
+        _save(store, "a", "s3", "2026-01-04T10:00:00", [True])  # 이어서 실행 전 일부만 저장된 상태
+        entry = store.flaky_actions(min_observations=1)[0]
+        assert entry["transitions"] == 2 and not entry["last_failed"]
+
+    def test_resaving_older_session_not_counted_twice(self, tmp_path):
+        store = AccuracyStore(str(tmp_path / "accuracy.sqlite"))
+        _fill(store)
+        expected = store.flaky_actions(min_observations=1)
+
+        # 더 최근 세션이 있는 상태에서 오래된 세션을 다시 저장 (이어서 실행, JSON 다시 가져오기)
+        _save(store, "a", "s1", "2026-01-02T10:00:00", [False, False, True])
+        _save(store, "a", "s0", "2026-01-01T10:00:00", [True, False, True])
+        assert store.flaky_actions(min_observations=1) == expected
+
+        # 오래된 세션의 결과가 바뀌면 시각순으로 다시 계산
+        _save(store, "a", "s1", "2026-01-02T10:00:00", [True, False, True])
+        reference = AccuracyStore(":memory:")
+        for day, flaky_ok in enumerate([True, True, True, False]):
+            _save(reference, "a", f"s{day}", f"2026-01-0{day + 1}T10:00:00", [flaky_ok, False, True])
+        assert store.flaky_actions(min_observations=1) == reference.flaky_actions(min_observations=1)
+
+    def test_out_of_order_sessions_match_in_order(self, tmp_path):
+        store = AccuracyStore(str(tmp_path / "accuracy.sqlite"), flaky_alpha=0.5)
+        for day, flaky_ok in reversed(list(enumerate([True, False, True, False]))):
+            _save(store, "a", f"s{day}", f"2026-01-0{day + 1}T10:00:00", [flaky_ok, False, True])
+
+        entry = store.flaky_actions()[0]
+        assert entry["transitions"] == 3 and entry["observations"] == 4 and entry["last_failed"]
+        assert entry["flakiness"] == pytest.approx(0.875)
+
+    def test_rebuild_matches_incremental(self, tmp_path):
+        path = str(tmp_path / "accuracy.sqlite")
+        store = AccuracyStore(path)
+        _fill(store)
+        expected = store.flaky_actions(min_observations=1)
+        store._conn.execute("DELETE FROM flaky_action")
+        store._conn.execute("DELETE FROM flaky_observation")
+        store._conn.execute("DELETE FROM meta WHERE key = 'rollup_version'")
+        store._conn.commit()
+        store.close()
+
+        assert AccuracyStore(path).flaky_actions(min_observations=1) == expected
+
+    def test_tracker_backends(self, tmp_path):
+        sqlite_tracker = AccuracyTracker("a", data_dir=str(tmp_path), backend="sqlite")
+        _fill(sqlite_tracker._store)
+
+        assert set(sqlite_tracker.get_flaky_actions(0.3)) == {"action_0000"}
+        assert AccuracyTracker("a", data_dir=str(tmp_path / "json"), backend="json").get_flaky_actions() == {}
+        sqlite_tracker.close()
+
+
+@pytest.fixture
+def config(make_config):
+    return make_config(action_delay=0.1, template_match={"enabled": False},
+                       hash_gate={"enabled": False})
+
+
+def _replay(config, analyzer, flaky_actions):
+    replayer = SemanticActionReplayer(config, ui_analyzer=analyzer)
+    replayer.flaky_actions = flaky_actions
+    result, _, mock_sleep = replay_with_mocks(replayer.replay_action, semantic_click(), block_frame())
+    return result, [call.args[0] for call in mock_sleep.call_args_list]
+
+
+class TestFlakyReplay:
+    """불안정 액션 재실행 테스트"""
+
+    def test_stable_action_not_retried(self, config):
+        result, _ = _replay(config, mock_analyzer(EMPTY_UI), {})
+
+        assert not result.success and result.retries == 0
+
+    def test_flaky_action_retried_when_no_input_sent(self, config):
+        probe = mock_analyzer(EMPTY_UI)
+        _replay(config, probe, {})
+        calls_per_attempt = probe.analyze_with_retry.call_count
+
+        analyzer = Mock()
+        analyzer.analyze_with_retry.side_effect = lambda *args, **kwargs: (
+            EMPTY_UI if analyzer.analyze_with_retry.call_count <= calls_per_attempt else start_button_ui())
+
+        result, sleeps = _replay(config, analyzer, {"action_0001": 0.8})
+
+        assert result.success and result.retries == 1
+        assert result.action_id == "action_0001"
+        assert sleeps == pytest.approx([0.2, 0.2, 0.6])  # 재시도 대기, 클릭 후 대기, 화면 전환 대기 × wait_scale
+
+    def test_retry_limit(self, config):
+        config.config['automation']['flaky'] = {"retries": 2}
+
+        result, _ = _replay(config, mock_analyzer(EMPTY_UI), {"action_0001": 0.8})
+
+        assert not result.success and result.retries == 2
+
+    def test_not_retried_when_input_sent_before_failure(self, config):
+        replayer = SemanticActionReplayer(config, ui_analyzer=mock_analyzer())
+        replayer.flaky_actions = {"action_0001": 0.8}
+        replayer.on_input = Mock(side_effect=RuntimeError("콜백 실패"))  # 클릭을 보낸 뒤 실패
+
+        result, mock_pyautogui, _ = replay_with_mocks(replayer.replay_action, semantic_click(), block_frame())
+
+        assert not result.success and result.retries == 0
+        mock_pyautogui.click.assert_called_once()
+
+    def test_partial_text_input_not_retried(self, config):
+        replayer = SemanticActionReplayer(config, ui_analyzer=Mock())
+        replayer.flaky_actions = {"action_0001": 0.8}
+        action = SemanticAction(timestamp=datetime.now().isoformat(), action_type='type_text',
+                                x=0, y=0, description='텍스트 입력', text='hello')
+
+        with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui, \
+                patch('src.semantic_action_replayer.time.sleep'):
+            mock_pyautogui.write.side_effect = RuntimeError("입력 중 실패")
+            result = replayer.replay_action(action)
+
+        assert not result.success and result.retries == 0
+        mock_pyautogui.write.assert_called_once()
@@ -0,0 +1,154 @@
+"""
+FrameHasher 단위 테스트
+
+NumPy 기반 aHash/dHash/pHash 계산과 일괄 API를 검증한다.
+"""
+
+import os
+import sys
+import glob
+
+import numpy as np
+import pytest
+import imagehash
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.frame_hasher import (
+    FrameHasher,
+    FrameHashes,
+    average_hash,
+    average_hash_hex,
+    default_hasher,
+    hamming_distance,
+    hex_hamming_distance,
+    hash_to_hex,
+)
+from src.screenshot_verifier import ScreenshotVerifier
+
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# 저장소에 포함된 녹화 스크린샷만 사용 (다른 테스트가 만드는 임시 파일 제외)
+BUNDLED_SCREENSHOTS = sorted(glob.glob(os.path.join(PROJECT_ROOT, 'screenshots', 'sr-*', '*.png')))
+
+
+def _random_frames(count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    frames = []
+    for _ in range(count):
+        image = Image.new('RGB', (320, 180), tuple(int(c) for c in rng.integers(0, 255, 3)))
+        draw = ImageDraw.Draw(image)
+        for _ in range(6):
+            x0, y0 = int(rng.integers(0, 280)), int(rng.integers(0, 140))
+            draw.rectangle([x0, y0, x0 + int(rng.integers(10, 40)), y0 + int(rng.integers(10, 40))],
+                           fill=tuple(int(c) for c in rng.integers(0, 255, 3)))
+        frames.append(image)
+    return frames
+
+
+class TestHashHelpers:
+    """해시 헬퍼 함수 테스트"""
+
+    def test_hamming_distance(self):
+        assert hamming_distance(0, 0) == 0
+        assert hamming_distance(0b1011, 0b0001) == 2
+        assert hamming_distance(0, (1 << 64) - 1) == 64
+
+    def test_hex_format_matches_imagehash(self):
+        assert hash_to_hex(1) == "0000000000000001"
+        assert hex_hamming_distance("ff00000000000000", "0f00000000000000") == 4
+
+    def test_frame_hashes_to_dict(self):
+        hashes = FrameHashes(ahash=1, dhash=2, phash=3)
+        assert hashes.to_dict() == {
+            "ahash": "0000000000000001",
+            "dhash": "0000000000000002",
+            "phash": "0000000000000003",
+        }
+
+
+class TestFrameHasher:
+    """다중 해시 계산 테스트"""
+
+    def test_phash_matches_imagehash(self):
+        for image in _random_frames(8):
+            assert default_hasher.hash_image(image).phash_hex == str(imagehash.phash(image))
+
+    @pytest.mark.skipif(not BUNDLED_SCREENSHOTS, reason="번들 스크린샷 없음")
+    def test_bundled_screenshots_match_imagehash_phash(self):
+        for path in BUNDLED_SCREENSHOTS[:10]:
+            with Image.open(path) as image:
+                image.load()
+                hashes = default_hasher.hash_image(image)
+                assert hashes.phash_hex == str(imagehash.phash(image))
+                # aHash는 영역 평균 기반이므로 imagehash와 근사
+                assert hex_hamming_distance(hashes.ahash_hex, str(imagehash.average_hash(image))) <= 10
+
+    def test_average_hash_matches_imagehash(self):
+        for image in _random_frames(8, seed=4):
+            assert average_hash_hex(image) == str(imagehash.average_hash(image))
+            assert average_hash(image) == int(str(imagehash.average_hash(image)), 16)
+
+    @pytest.mark.skipif(not BUNDLED_SCREENSHOTS, reason="번들 스크린샷 없음")
+    def test_bundled_screenshots_match_imagehash_average_hash(self):
+        # 녹화에 저장된 ui_state_hash(imagehash.average_hash)와 그대로 비교할 수 있어야 함
+        for path in BUNDLED_SCREENSHOTS[:10]:
+            with Image.open(path) as image:
+                image.load()
+                assert average_hash_hex(image) == str(imagehash.average_hash(image))
+
+    def test_batch_matches_single(self):
+        frames = _random_frames(5, seed=1)
+        batch = default_hasher.hash_batch(frames)
+        assert batch == [default_hasher.hash_image(frame) for frame in frames]
+
+    def test_empty_batch(self):
+        assert default_hasher.hash_batch([]) == []
+
+    def test_identical_frames_have_identical_hashes(self):
+        frame = _random_frames(1, seed=2)[0]
+        assert default_hasher.hash_image(frame) == default_hasher.hash_image(frame.copy())
+
+    def test_different_frames_have_distant_hashes(self):
+        left = Image.new('RGB', (100, 100), 'white')
+        ImageDraw.Draw(left).rectangle([0, 0, 50, 100], fill='black')
+        right = Image.new('RGB', (100, 100), 'white')
+        ImageDraw.Draw(right).rectangle([50, 0, 100, 100], fill='black')
+
+        a, b = default_hasher.hash_image(left), default_hasher.hash_image(right)
+        assert hamming_distance(a.ahash, b.ahash) >= 32
+        assert hamming_distance(a.dhash, b.dhash) > 0
+        assert hamming_distance(a.phash, b.phash) > 0
+
+    def test_hash_pixels_accepts_single_array(self):
+        pixels = default_hasher.prepare(_random_frames(1, seed=3)[0])
+        assert pixels.shape == (32, 32)
+        assert len(default_hasher.hash_pixels(pixels)) == 1
+
+    def test_custom_highfreq_factor(self):
+        hasher = FrameHasher(highfreq_factor=2)
+        image = _random_frames(1, seed=4)[0]
+        assert hasher.prepare(image).shape == (16, 16)
+        assert hasher.hash_image(image).phash_hex == str(imagehash.phash(image, highfreq_factor=2))
+
+
+class TestScreenshotVerifierHashing:
+    """ScreenshotVerifier가 FrameHasher를 사용하는지 확인"""
+
+    def test_compare_images_uses_phash_distance(self):
+        verifier = ScreenshotVerifier(hash_threshold=5)
+        frame1, frame2 = _random_frames(2, seed=5)
+
+        is_match, hash_diff, similarity = verifier.compare_images(frame1, frame2)
+        expected_diff = imagehash.phash(frame1) - imagehash.phash(frame2)
+
+        assert hash_diff == expected_diff
+        assert similarity == pytest.approx(1.0 - expected_diff / 64.0)
+        assert is_match == (expected_diff <= 5)
+
+    def test_compute_hashes_batch(self):
+        verifier = ScreenshotVerifier()
+        frames = _random_frames(3, seed=6)
+        hashes = verifier.compute_hashes_batch(frames)
+        assert [h.phash for h in hashes] == [verifier.compute_hash(f) for f in frames]
@@ -0,0 +1,89 @@
+"""
+해시 게이트 테스트
+
+현재 화면이 녹화된 클릭 전 화면과 같으면(전체 또는 클릭 주변 영역 해시)
+Vision LLM 확인 없이 원래 좌표를 클릭하는지 검증한다.
+"""
+
+from tests.conftest import block_frame, mock_analyzer, replay_with_mocks, semantic_click
+from src.frame_hasher import average_hash_hex
+from src.semantic_action_replayer import SemanticActionReplayer
+
+
+def _frame(seed=0):
+    return block_frame(seed, size=(640, 400))
+
+
+def _action(recorded, tmp_path=None, x=100, y=100):
+    before_path = None
+    if tmp_path is not None:
+        before_path = str(tmp_path / "action_0001_before.png")
+        recorded.save(before_path)
+    return semantic_click(x, y, screenshot_before_path=before_path,
+                          ui_state_hash_before=average_hash_hex(recorded))
+
+
+def _replay(config, action, screen):
+    analyzer = mock_analyzer()
+    replayer = SemanticActionReplayer(config, ui_analyzer=analyzer)
+    result, _, _ = replay_with_mocks(replayer.replay_action, action, screen)
+    return result, replayer, analyzer
+
+
+class TestHashGate:
+    """해시 게이트 테스트"""
+
+    def test_identical_screen_skips_llm(self, config, tmp_path):
+        recorded = _frame()
+
+        result, replayer, analyzer = _replay(config, _action(recorded, tmp_path), recorded.copy())
+
+        assert result.success and result.method == 'direct' and result.hash_gated
+        assert result.actual_coords == (100, 100)
+        analyzer.analyze_with_retry.assert_not_called()
+        stats = replayer.get_statistics()
+        assert stats["hash_gated_count"] == 1 and stats["hash_gated_rate"] == 1.0
+
+    def test_changed_screen_uses_llm(self, config, tmp_path):
+        result, _, analyzer = _replay(config, _action(_frame(seed=0), tmp_path), _frame(seed=1))
+
+        assert result.success and not result.hash_gated
+        analyzer.analyze_with_retry.assert_called()
+
+    def test_region_scope_ignores_changes_away_from_click(self, config, tmp_path):
+        recorded = _frame()
+        live = recorded.copy()
+        live.paste(_frame(seed=3).crop((320, 0, 640, 400)), (320, 0))  # 화면 오른쪽 절반 변경
+
+        result, _, analyzer = _replay(config, _action(recorded, tmp_path), live)
+
+        assert result.hash_gated
+        analyzer.analyze_with_retry.assert_not_called()
+
+    def test_region_scope_detects_change_at_click(self, config, tmp_path):
+        recorded = _frame()
+        live = recorded.copy()
+        live.paste(_frame(seed=4).crop((0, 0, 200, 200)), (0, 0))  # 클릭 주변만 변경
+
+        result, _, analyzer = _replay(config, _action(recorded, tmp_path), live)
+
+        assert not result.hash_gated
+        analyzer.analyze_with_retry.assert_called()
+
+    def test_global_scope_without_recorded_screenshot(self, config):
+        config.config['automation']['hash_gate'] = {"scope": "global"}
+        recorded = _frame()
+
+        result, _, analyzer = _replay(config, _action(recorded), recorded.copy())
+
+        assert result.hash_gated
+        analyzer.analyze_with_retry.assert_not_called()
+
+    def test_disabled_by_config(self, config, tmp_path):
+        config.config['automation']['hash_gate'] = {"enabled": False}
+        recorded = _frame()
+
+        result, _, analyzer = _replay(config, _action(recorded, tmp_path), recorded.copy())
+
+        assert result.method == 'direct' and not result.hash_gated
+        analyzer.analyze_with_retry.assert_called()
@@ -4,8 +4,11 @@ InputMonitor 기본 테스트
 InputMonitor, ActionRecorder, Action 클래스의 기본 기능을 테스트한다.
 """
 
+import threading
+import time
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
+from src.input_event_queue import InputEventQueue, RawInputEvent
 from src.input_monitor import InputMonitor, ActionRecorder, Action
 from src.config_manager import ConfigManager
 
@@ -85,6 +88,25 @@ class TestActionRecorder:
         assert len(recorder.get_actions()) == 0
         assert recorder.last_action_time is None
 
+    def test_remove_trailing_stop_pattern(self):
+        """마지막 stop 입력 패턴 제거 테스트"""
+        config = ConfigManager()
+        config.config = {'automation': {'screenshot_on_action': False}}
+
+        recorder = ActionRecorder(config)
+        now = datetime.now().isoformat()
+        button_click = Action(timestamp=now, action_type='click', x=100, y=200, description='버튼 클릭')
+        actions = [
+            button_click,
+            Action(timestamp=now, action_type='wait', x=0, y=0, description='대기'),
+            Action(timestamp=now, action_type='click', x=10, y=700, description='터미널 클릭'),
+            Action(timestamp=now, action_type='type_text', x=0, y=0, description='입력', text='stop'),
+            Action(timestamp=now, action_type='key_press', x=0, y=0, description='Enter', key='Key.enter'),
+        ]
+
+        assert recorder.remove_trailing_stop_pattern(actions) == [button_click]
+        assert recorder.remove_trailing_stop_pattern(actions[:1]) == [button_click]
+
 
 class TestInputMonitor:
     """InputMonitor 테스트"""
@@ -139,6 +161,8 @@ class TestInputMonitor:
         # 클릭 이벤트 시뮬레이션 (pressed=True)
         test_x, test_y = 640, 480
         monitor._on_mouse_click(test_x, test_y, Button.left, pressed=True)
+        monitor._on_mouse_click(test_x, test_y, Button.left, pressed=False)
+        monitor.flush()
         
         # 액션이 기록되었는지 확인
         actions = recorder.get_actions()
@@ -191,6 +215,7 @@ class TestInputMonitor:
         # 일반 문자 키 입력 시뮬레이션
         test_key = KeyCode.from_char('a')
         monitor._on_key_press(test_key)
+        monitor.flush()
         
         # 액션이 기록되었는지 확인 (키보드 이벤트만 필터링)
         # 테스트 환경에서 실제 마우스 이벤트가 캡처될 수 있으므로 key_press만 확인
@@ -225,6 +250,7 @@ class TestInputMonitor:
         
         # 특수 키 입력 시뮬레이션 (Enter)
         monitor._on_key_press(Key.enter)
+        monitor.flush()
         
         # 액션이 기록되었는지 확인
         actions = recorder.get_actions()
@@ -256,3 +282,211 @@ class TestInputMonitor:
         # 액션이 기록되지 않았는지 확인
         actions = recorder.get_actions()
         assert len(actions) == 0
+    
+    def test_callback_does_not_wait_for_recording(self):
+        """콜백은 큐에 넣기만 하고 capture_delay 대기는 작업 스레드에서 수행"""
+        config = ConfigManager()
+        config.config = {'automation': {'screenshot_on_action': False}}
+        
+        recorder = ActionRecorder(config)
+        monitor = InputMonitor(recorder)
+        release = threading.Event()
+        original_record = recorder.record_action
+        
+        def slow_record(action, event_time=None, end_time=None):
+            release.wait(2)
+            original_record(action, event_time, end_time)
+        
+        recorder.record_action = slow_record
+        monitor.event_queue.start()
+        monitor.is_recording = True
+        
+        started = time.monotonic()
+        for dy in (1, 2, 3):
+            monitor._on_mouse_scroll(100, 100, 0, dy)
+        assert time.monotonic() - started < 0.5
+        assert recorder.get_actions() == []
+        
+        release.set()
+        monitor.stop_monitoring()
+        assert [a.scroll_dy for a in recorder.get_actions()] == [1, 2, 3]
+        assert monitor.get_queue_stats().processed == 4  # 스크롤 3개 + 종료 시 텍스트 입력 확정
+    
+    def test_keystrokes_coalesced_into_type_text(self):
+        """연속 문자 키는 type_text, Ctrl 조합은 hotkey, 특수 키는 key_press로 기록"""
+        from pynput.keyboard import Key, KeyCode
+        
+        config = ConfigManager()
+        config.config = {'automation': {'screenshot_on_action': False}}
+        
+        recorder = ActionRecorder(config)
+        monitor = InputMonitor(recorder)
+        monitor.event_queue.start()
+        monitor.is_recording = True
+        
+        monitor._on_key_press(Key.shift)
+        monitor._on_key_press(KeyCode.from_char('H'))
+        monitor._on_key_release(Key.shift)
+        for char in "i there":
+            monitor._on_key_press(Key.space if char == ' ' else KeyCode.from_char(char))
+        monitor._on_key_press(Key.ctrl_l)
+        monitor._on_key_press(KeyCode.from_char('\x01'))  # Ctrl+A는 제어 문자로 전달됨
+        monitor._on_key_release(Key.ctrl_l)
+        monitor._on_key_press(Key.enter)
+        monitor.flush()
+        
+        actions = recorder.get_actions()
+        assert [(a.action_type, a.text or a.key) for a in actions] == [
+            ('type_text', 'Hi there'), ('hotkey', 'ctrl+a'), ('key_press', 'Key.enter')
+        ]
+        monitor.stop_monitoring()
+    
+    def test_drag_captured_with_simplified_path(self):
+        """버튼을 누른 채 움직이면 단순화된 경로를 가진 drag 액션으로 기록"""
+        from pynput.mouse import Button
+        
+        config = ConfigManager()
+        config.config = {'automation': {'screenshot_on_action': False}}
+        
+        recorder = ActionRecorder(config)
+        monitor = InputMonitor(recorder)
+        monitor.event_queue.start()
+        monitor.is_recording = True
+        
+        monitor._on_mouse_click(100, 100, Button.left, pressed=True)
+        for x in range(101, 201):
+            monitor._on_mouse_move(x, 100)
+        monitor._on_mouse_click(200, 100, Button.left, pressed=False)
+        monitor.stop_monitoring()
+        
+        actions = recorder.get_actions()
+        assert len(actions) == 1
+        drag = actions[0]
+        assert drag.action_type == 'drag'
+        assert drag.button == 'left'
+        assert (drag.x, drag.y) == (100, 100)
+        assert drag.path[0][0] == 0
+        assert drag.path[-1][1:] == [200, 100]
+        assert 2 <= len(drag.path) <= 102
+        assert drag.timestamp_ns is not None
+    
+    def test_small_movement_recorded_as_click(self):
+        """drag_threshold 미만으로 움직이면 click으로 기록"""
+        from pynput.mouse import Button
+        
+        config = ConfigManager()
+        config.config = {'automation': {'screenshot_on_action': False}}
+        
+        recorder = ActionRecorder(config)
+        monitor = InputMonitor(recorder)
+        monitor.event_queue.start()
+        monitor.is_recording = True
+        
+        monitor._on_mouse_click(100, 100, Button.left, pressed=True)
+        monitor._on_mouse_move(102, 101)
+        monitor._on_mouse_click(102, 101, Button.left, pressed=False)
+        monitor.stop_monitoring()
+        
+        actions = recorder.get_actions()
+        assert [a.action_type for a in actions] == ['click']
+        assert actions[0].path is None
+
+
+class TestInputEventQueue:
+    """InputEventQueue 테스트"""
+    
+    def test_events_processed_in_order(self):
+        """여러 스레드에서 넣어도 순서 번호 순으로 처리"""
+        processed = []
+        event_queue = InputEventQueue(lambda e: processed.append(e.seq), maxsize=8)
+        event_queue.start()
+        
+        def produce():
+            for _ in range(50):
+                event_queue.put(RawInputEvent(kind='key_press', time=datetime.now()))
+        
+        threads = [threading.Thread(target=produce) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        event_queue.stop()
+        
+        assert processed == list(range(100))
+        assert event_queue.stats.dropped == 0
+    
+    def test_full_queue_drops_after_timeout(self):
+        """큐가 가득 차면 put_timeout 대기 후 이벤트를 버리고 통계에 기록"""
+        release = threading.Event()
+        event_queue = InputEventQueue(lambda e: release.wait(2), maxsize=1, put_timeout=0.05)
+        event_queue.start()
+        
+        results = [event_queue.put(RawInputEvent(kind='click', time=datetime.now())) for _ in range(4)]
+        release.set()
+        event_queue.stop()
+        
+        assert results[:2] == [True, True]
+        assert results.count(False) >= 1
+        stats = event_queue.stats.to_dict()
+        assert stats["dropped"] == results.count(False)
+        assert stats["blocked"] >= stats["dropped"]
+        assert stats["processed"] == stats["enqueued"] == results.count(True)
+    
+    def test_handler_error_does_not_stop_worker(self):
+        """처리 중 예외가 나도 다음 이벤트는 계속 처리"""
+        processed = []
+        
+        def handler(event):
+            if event.seq == 0:
+                raise RuntimeError("boom")
+            processed.append(event.seq)
+        
+        event_queue = InputEventQueue(handler)
+        event_queue.start()
+        for _ in range(3):
+            event_queue.put(RawInputEvent(kind='click', time=datetime.now()))
+        event_queue.stop()
+        
+        assert processed == [1, 2]
+        assert event_queue.stats.errors == 1
+
+
+    def test_idle_handler_runs_without_new_events(self):
+        """idle_handler가 돌려준 시간이 지나면 새 이벤트 없이도 다시 호출"""
+        calls = []
+        expired = threading.Event()
+        
+        def idle():
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                return 0.05  # 첫 이벤트 처리 후: 0.05초 뒤 다시 호출
+            expired.set()
+            return None
+        
+        event_queue = InputEventQueue(lambda e: None, idle_handler=idle)
+        event_queue.start()
+        event_queue.put(RawInputEvent(kind='key_press', time=datetime.now()))
+        assert expired.wait(2)
+        event_queue.stop()
+        
+        assert len(calls) == 2
+        assert calls[1] - calls[0] >= 0.04
+
+
+class TestEventTimeRecording:
+    """입력 시각 기준 wait 계산 테스트"""
+    
+    def test_wait_uses_event_time(self):
+        """늦게 처리되어도 wait 액션은 입력 시각 간격으로 계산"""
+        config = ConfigManager()
+        config.config = {'automation': {'screenshot_on_action': False}}
+        recorder = ActionRecorder(config)
+        
+        t0 = datetime(2026, 1, 1, 10, 0, 0)
+        for i, offset in enumerate([0, 0.2, 3.2]):
+            action = Action(timestamp="", action_type='click', x=i, y=0, description=f'클릭 {i}')
+            recorder.record_action(action, event_time=t0 + timedelta(seconds=offset))
+        
+        actions = recorder.get_actions()
+        assert [a.action_type for a in actions] == ['click', 'click', 'wait', 'click']
+        assert actions[2].description == '3.0초 대기'
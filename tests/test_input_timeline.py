@@ -0,0 +1,83 @@
+"""
+InputTimeline 단위 테스트
+
+경로 단순화(시간 동기 거리), 보간, 기록 시각 기준 재생을 검증한다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.input_timeline import (
+    interpolate_path, path_distance, play_path, simplify_path, to_relative_path
+)
+
+
+MS = 1_000_000
+
+
+class TestSimplifyPath:
+    """경로 단순화 테스트"""
+
+    def test_straight_constant_speed_line_keeps_endpoints(self):
+        path = [(i * MS, i, 0) for i in range(100)]
+        assert simplify_path(path, 1.0) == [path[0], path[-1]]
+
+    def test_corner_is_kept(self):
+        path = [(i * MS, i, 0) for i in range(50)] + [(50 * MS + i * MS, 49, i) for i in range(1, 50)]
+        simplified = simplify_path(path, 1.0)
+        assert (49 * MS, 49, 0) in simplified
+        assert len(simplified) == 3
+
+    def test_pause_is_kept(self):
+        """제자리에 멈춘 구간은 공간상 직선 위라도 남김 (시각이 다르므로)"""
+        path = [(0, 0, 0), (100 * MS, 0, 0), (110 * MS, 100, 0)]
+        assert simplify_path(path, 2.0) == path
+
+    def test_epsilon_zero_keeps_all(self):
+        path = [(i * MS, i, i % 2) for i in range(10)]
+        assert simplify_path(path, 0) == path
+
+
+class TestPathHelpers:
+    """경로 변환/보간 테스트"""
+
+    def test_to_relative_path(self):
+        path = [(5_000, 110, 220), (9_000, 130, 240)]
+        assert to_relative_path(path, 10, 20) == [[0, 100, 200], [4_000, 120, 220]]
+
+    def test_path_distance(self):
+        assert path_distance([(0, 0, 0), (1, 3, 4), (2, 1, 0)]) == 5.0
+
+    def test_interpolate_path(self):
+        points = interpolate_path([[0, 0, 0], [40 * MS, 40, 0]], step_ns=10 * MS)
+        assert points == [(0, 0, 0), (10 * MS, 10, 0), (20 * MS, 20, 0), (30 * MS, 30, 0), (40 * MS, 40, 0)]
+
+    def test_interpolate_merges_stationary_points(self):
+        points = interpolate_path([[0, 5, 5], [50 * MS, 5, 5]], step_ns=10 * MS)
+        assert points == [(0, 5, 5)]
+
+
+class TestPlayPath:
+    """기록 시각 기준 재생 테스트"""
+
+    def test_moves_happen_at_recorded_offsets(self):
+        clock = [0]
+        moves = []
+
+        def fake_clock():
+            clock[0] += 1_000  # 호출마다 1us 경과
+            return clock[0]
+
+        def fake_sleep(seconds):
+            clock[0] += int(seconds * 1e9)
+
+        late = play_path([[0, 0, 0], [30 * MS, 30, 0]], lambda x, y: moves.append((clock[0], x, y)),
+                         step_ns=10 * MS, clock=fake_clock, sleep=fake_sleep)
+
+        assert [(x, y) for _, x, y in moves] == [(0, 0), (10, 0), (20, 0), (30, 0)]
+        start = moves[0][0]
+        for (t, _, _), offset in zip(moves, [0, 10 * MS, 20 * MS, 30 * MS]):
+            assert abs((t - start) - offset) < 50_000
+        assert late < 50_000
@@ -138,7 +138,7 @@ class TestPhase1IntegrationWorkflow:
         tmp_path = integration_env["tmp_path"]
         
         # 액션 추가
-        # 주의: 마지막 액션이 Key.enter로 끝나면 _remove_trailing_stop_pattern에 의해
+        # 주의: 마지막 액션이 Key.enter로 끝나면 remove_trailing_stop_pattern에 의해
         # 터미널 입력으로 인식되어 제거될 수 있으므로, 다른 키로 끝나도록 함
         test_actions = [
             Action(
@@ -174,12 +174,11 @@ class TestPhase1IntegrationWorkflow:
         with open(script_path, 'r', encoding='utf-8') as f:
             script_content = f.read()
         
-        # 필수 요소 확인
-        assert 'import pyautogui' in script_content
-        assert 'import time' in script_content
+        # 필수 요소 확인 (재실행 계획 + src.replay_plan 실행기)
+        assert 'from src.replay_plan import' in script_content
         assert 'def replay_actions' in script_content
-        assert 'pyautogui.click' in script_content
-        assert 'time.sleep' in script_content
+        assert "'action_type': 'click'" in script_content
+        assert "'wait_time': 2.0" in script_content
         assert "if __name__ == '__main__'" in script_content
     
     def test_script_utf8_encoding(self, integration_env):
@@ -332,12 +331,9 @@ class TestPhase1ComponentIntegration:
         with open(output_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # 스크립트 생성기가 윈도우 좌표 변환 기능을 사용하므로
-        # to_screen_coords 함수 호출 또는 직접 좌표 사용 형식 모두 허용
-        assert ('pyautogui.click(100, 200' in content or 
-                'to_screen_coords(100, 200)' in content or
-                'pyautogui.click(screen_x, screen_y' in content)
-        assert 'pyautogui.scroll' in content
+        # 좌표는 윈도우 기준 상대 좌표로 재실행 계획에 저장 (실행 시 스크린 좌표로 변환)
+        assert "'action_type': 'click', 'timestamp': '2025-01-01T10:00:00', 'x': 100, 'y': 200" in content
+        assert "'scroll_dy': -3" in content
     
     def test_input_monitor_state_management(self, components):
         """InputMonitor 상태 관리 테스트"""
@@ -446,8 +442,8 @@ class TestPhase1WaitActionIntegration:
         with open(script_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        # wait 액션이 time.sleep으로 변환되었는지 확인
-        assert 'time.sleep(3.5)' in content
+        # wait 액션의 대기 시간이 재실행 계획에 포함되었는지 확인
+        assert "'wait_time': 3.5" in content
 
 
 if __name__ == '__main__':
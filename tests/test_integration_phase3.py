@@ -297,16 +297,13 @@ class TestPhase3UIChangeScenarios:
         mock_image = Image.new('RGB', (100, 100), color='red')
         
         with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui, \
-             patch('src.semantic_action_replayer.imagehash') as mock_imagehash:
+             patch('src.semantic_action_replayer.hex_hamming_distance') as mock_hash_distance:
             
             mock_pyautogui.screenshot.return_value = mock_image
             mock_pyautogui.click = Mock()
             
             # 큰 해시 차이 (full_transition)
-            mock_hash = Mock()
-            mock_hash.__sub__ = Mock(return_value=50)
-            mock_imagehash.average_hash.return_value = mock_hash
-            mock_imagehash.hex_to_hash.return_value = mock_hash
+            mock_hash_distance.return_value = 50
             
             result = replayer.replay_action(action)
         
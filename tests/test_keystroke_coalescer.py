@@ -0,0 +1,139 @@
+"""
+KeystrokeCoalescer 단위 테스트
+
+연속 문자 키의 type_text 병합, 단축키/특수 키/보조 키 처리와
+stop 패턴 제거, 단축키 파싱을 검증한다.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+from pynput.keyboard import Key, KeyCode
+
+from src.config_manager import ConfigManager
+from src.input_monitor import Action, ActionRecorder
+from src.keystroke_coalescer import KeystrokeCoalescer, key_press_args, parse_hotkey
+
+
+T0 = datetime(2026, 1, 1, 10, 0, 0)
+
+
+def _feed(coalescer, events):
+    """(press|release, key, 경과 초) 목록을 입력하고 확정된 결과를 모두 반환"""
+    outputs = []
+    for kind, key, seconds in events:
+        handler = coalescer.press if kind == 'press' else coalescer.release
+        outputs += handler(key, T0 + timedelta(seconds=seconds), int(seconds * 1e9))
+    return outputs + coalescer.flush()
+
+
+def _summary(outputs):
+    return [(o.action_type, o.value) for o in outputs]
+
+
+class TestKeystrokeCoalescer:
+    """키 입력 병합 테스트"""
+
+    def test_run_becomes_type_text(self):
+        outputs = _feed(KeystrokeCoalescer(), [
+            ('press', KeyCode.from_char(c), i * 0.1) for i, c in enumerate("nick")
+        ])
+        assert _summary(outputs) == [('type_text', 'nick')]
+        assert outputs[0].time == T0
+        assert outputs[0].end_time == T0 + timedelta(seconds=0.3)
+
+    def test_single_key_stays_key_press(self):
+        assert _summary(_feed(KeystrokeCoalescer(), [('press', KeyCode.from_char('w'), 0)])) == [
+            ('key_press', 'w')
+        ]
+
+    def test_gap_splits_run(self):
+        outputs = _feed(KeystrokeCoalescer(gap=0.5), [
+            ('press', KeyCode.from_char('a'), 0), ('press', KeyCode.from_char('b'), 0.1),
+            ('press', KeyCode.from_char('c'), 1.0), ('press', KeyCode.from_char('d'), 1.1),
+        ])
+        assert _summary(outputs) == [('type_text', 'ab'), ('type_text', 'cd')]
+
+    def test_expire_flushes_run_after_gap(self):
+        coalescer = KeystrokeCoalescer(gap=0.5)
+        for i, c in enumerate("ab"):
+            coalescer.press(KeyCode.from_char(c), T0 + timedelta(seconds=i * 0.1), int(i * 0.1 * 1e9))
+
+        outputs, remaining = coalescer.expire(int(0.3 * 1e9))
+        assert outputs == [] and remaining == pytest.approx(0.3)
+        outputs, remaining = coalescer.expire(int(0.6 * 1e9))
+        assert _summary(outputs) == [('type_text', 'ab')] and remaining is None
+        assert coalescer.expire(int(10 * 1e9)) == ([], None)
+
+    def test_shift_is_part_of_text(self):
+        outputs = _feed(KeystrokeCoalescer(), [
+            ('press', Key.shift, 0), ('press', KeyCode.from_char('A'), 0.1),
+            ('release', Key.shift, 0.2), ('press', KeyCode.from_char('b'), 0.3),
+            ('press', Key.space, 0.4), ('press', KeyCode.from_char('!'), 0.5),
+        ])
+        assert _summary(outputs) == [('type_text', 'Ab !')]
+
+    def test_special_key_breaks_run(self):
+        outputs = _feed(KeystrokeCoalescer(), [
+            ('press', KeyCode.from_char('o'), 0), ('press', KeyCode.from_char('k'), 0.1),
+            ('press', Key.enter, 0.2), ('press', KeyCode.from_char('x'), 0.3),
+        ])
+        assert _summary(outputs) == [('type_text', 'ok'), ('key_press', 'Key.enter'), ('key_press', 'x')]
+
+    def test_hotkeys(self):
+        outputs = _feed(KeystrokeCoalescer(), [
+            ('press', KeyCode.from_char('a'), 0), ('press', KeyCode.from_char('b'), 0.1),
+            ('press', Key.ctrl_l, 0.2), ('press', Key.shift, 0.25),
+            ('press', KeyCode.from_char('\x13'), 0.3),  # Ctrl+Shift+S
+            ('release', Key.shift, 0.35), ('press', Key.page_down, 0.4), ('release', Key.ctrl_l, 0.5),
+            ('press', Key.alt, 0.6), ('press', Key.f4, 0.7), ('release', Key.alt, 0.8),
+        ])
+        assert _summary(outputs) == [
+            ('type_text', 'ab'), ('hotkey', 'ctrl+shift+s'), ('hotkey', 'ctrl+pagedown'), ('hotkey', 'alt+f4')
+        ]
+
+    def test_lone_modifier_becomes_key_press(self):
+        outputs = _feed(KeystrokeCoalescer(), [
+            ('press', KeyCode.from_char('a'), 0), ('press', KeyCode.from_char('b'), 0.1),
+            ('press', Key.alt, 0.2), ('release', Key.alt, 0.3),
+        ])
+        assert _summary(outputs) == [('type_text', 'ab'), ('key_press', 'Key.alt')]
+        assert outputs[1].time == T0 + timedelta(seconds=0.2)
+
+
+class TestKeyHelpers:
+    """단축키/특수 키 변환 테스트"""
+
+    def test_parse_hotkey(self):
+        assert parse_hotkey("ctrl+shift+s") == ['ctrl', 'shift', 's']
+        assert parse_hotkey("ctrl++") == ['ctrl', '+']
+        assert parse_hotkey("alt+f4") == ['alt', 'f4']
+
+    def test_key_press_args(self):
+        assert key_press_args('Key.enter') == ('press', 'enter')
+        assert key_press_args('Key.page_up') == ('press', 'pageup')
+        assert key_press_args('a') == ('write', 'a')
+
+
+class TestStopPattern:
+    """type_text가 포함된 stop 패턴 제거 테스트"""
+
+    def test_trailing_stop_text_removed(self):
+        config = ConfigManager()
+        config.config = {'automation': {'screenshot_on_action': False}}
+        recorder = ActionRecorder(config)
+        recorder.actions = [
+            Action(timestamp="", action_type='type_text', x=0, y=0, description='', text='hello'),
+            Action(timestamp="", action_type='click', x=1, y=1, description=''),
+            Action(timestamp="", action_type='type_text', x=0, y=0, description='', text='stop'),
+            Action(timestamp="", action_type='key_press', x=0, y=0, description='', key='Key.enter'),
+        ]
+        assert [a.text for a in recorder.get_actions()] == ['hello']
+
+        recorder.actions = recorder.actions[:3]
+        recorder.actions[2].text = 'sto'
+        assert len(recorder.get_actions()) == 1
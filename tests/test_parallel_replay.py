@@ -0,0 +1,226 @@
+"""
+ParallelReplayOrchestrator 테스트
+
+가상 창(SimulatedWindowInstance)으로 인스턴스별 입력 라우팅, 작업 큐 분배/가져오기,
+공유 분석기 동시 호출 제한, 통합 보고서, 병렬 실행 시간 단축을 검증한다.
+"""
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from PIL import Image
+
+from tests.conftest import semantic_click, start_button_ui
+from src.parallel_replay import (
+    AnalyzerPool, ParallelReplayOrchestrator, SimulatedWindowInstance, load_test_case_actions
+)
+
+
+UI_DATA = start_button_ui(100, 80)
+
+
+@pytest.fixture
+def config(make_config):
+    return make_config(hash_gate={"enabled": False}, template_match={"enabled": False})
+
+
+def _click(x=100, y=80, before_path=None):
+    return semantic_click(x, y, screenshot_before_path=before_path)
+
+
+def _analyzer(delay=0.0):
+    analyzer = Mock()
+
+    def analyze(image, *args, **kwargs):
+        time.sleep(delay)
+        return UI_DATA
+
+    analyzer.analyze_with_retry.side_effect = analyze
+    return analyzer
+
+
+def _frames(tmp_path, name, count):
+    """테스트 케이스마다 서로 다른 단색 스크린샷"""
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"{name}_{i}.png"
+        Image.new('RGB', (200, 160), (len(name) * 20 % 256, i * 40, 90)).save(path)
+        paths.append(str(path))
+    return paths
+
+
+class TestSimulatedWindowInstance:
+    """가상 창 테스트"""
+
+    def test_routes_input_in_window_coordinates(self, tmp_path):
+        frames = [Image.new('RGB', (64, 64), color) for color in ('red', 'green')]
+        instance = SimulatedWindowInstance("sim", offset=(300, 200), frames=frames)
+        instance.prepare("tc", [])
+
+        assert instance.screenshot() is frames[0]
+        instance.click(310, 220, button='left')
+        assert instance.screenshot() is frames[1]
+        instance.moveTo(305, 205)
+        instance.scroll(-3, x=320, y=240)
+
+        assert instance.events == [('click', 10, 20, 'left'), ('move', 5, 5), ('scroll', 20, 40, -3)]
+        assert instance.screenshot() is frames[1]  # 마지막 화면 유지
+
+    def test_loads_recorded_before_frames(self, tmp_path):
+        paths = _frames(tmp_path, "tc", 2)
+        instance = SimulatedWindowInstance("sim")
+
+        instance.prepare("tc", [_click(before_path=paths[0]), _click(before_path=None),
+                                _click(before_path=paths[1])])
+
+        first = instance.screenshot()
+        assert first.getpixel((0, 0)) == Image.open(paths[0]).convert('RGB').getpixel((0, 0))
+        instance.click(0, 0)
+        assert instance.screenshot() is first  # 스크린샷 없는 액션은 직전 화면 유지
+
+
+class TestAnalyzerPool:
+    """공유 분석기 동시 호출 제한 테스트"""
+
+    def test_limits_concurrent_calls(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def analyze(image):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.02)
+            with lock:
+                active.pop()
+            return UI_DATA
+
+        analyzer = Mock()
+        analyzer.analyze_with_retry.side_effect = analyze
+        pool = AnalyzerPool(analyzer, max_concurrent=2)
+
+        threads = [threading.Thread(target=pool.analyze_with_retry, args=(None,)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert max(peak) == 2
+        assert pool.calls == 6
+
+
+class TestParallelReplayOrchestrator:
+    """병렬 재실행 테스트"""
+
+    def _test_cases(self, tmp_path, count, clicks=2):
+        test_cases = []
+        for i in range(count):
+            name = f"tc{i}"
+            paths = _frames(tmp_path, name, clicks)
+            test_cases.append((name, [_click(before_path=path) for path in paths]))
+        return test_cases
+
+    def test_each_instance_gets_own_input(self, config, tmp_path):
+        instances = [SimulatedWindowInstance(f"sim-{i}", offset=(i * 1000, i * 500)) for i in range(2)]
+        orchestrator = ParallelReplayOrchestrator(config, instances, ui_analyzer=_analyzer())
+
+        report = orchestrator.run(self._test_cases(tmp_path, 4))
+
+        assert [run.name for run in report.runs] == ["tc0", "tc1", "tc2", "tc3"]
+        assert all(run.success for run in report.runs)
+        for instance in instances:
+            handled = [run for run in report.runs if run.instance == instance.name]
+            # 스크린 좌표로 입력되어도 가상 창에는 창 기준 좌표로 도착
+            assert instance.events == [('click', 100, 80, 'left')] * (2 * len(handled))
+        assert {run.instance for run in report.runs} == {"sim-0", "sim-1"}
+
+    def test_distribution_balances_actions(self, config, tmp_path):
+        instances = [SimulatedWindowInstance(f"sim-{i}") for i in range(2)]
+        orchestrator = ParallelReplayOrchestrator(config, instances, ui_analyzer=_analyzer())
+        test_cases = [("a", [_click()] * 4), ("b", [_click()] * 3), ("c", [_click()] * 2), ("d", [_click()] * 1)]
+
+        orchestrator._distribute(test_cases)
+
+        queued = {name: [item[1] for item in queue] for name, queue in orchestrator._queues.items()}
+        assert queued == {"sim-0": ["a", "d"], "sim-1": ["b", "c"]}
+
+    def test_unavailable_instance_work_is_taken_over(self, config, tmp_path):
+        broken = SimulatedWindowInstance("broken")
+        broken.find_window = lambda: False
+        working = SimulatedWindowInstance("working")
+        orchestrator = ParallelReplayOrchestrator(config, [broken, working], ui_analyzer=_analyzer())
+
+        report = orchestrator.run(self._test_cases(tmp_path, 3, clicks=1))
+
+        assert all(run.success and run.instance == "working" for run in report.runs)
+        assert report.summary()["instances"]["broken"]["test_cases"] == 0
+
+    def test_no_available_instance(self, config, tmp_path):
+        broken = SimulatedWindowInstance("broken")
+        broken.find_window = lambda: False
+        orchestrator = ParallelReplayOrchestrator(config, [broken], ui_analyzer=_analyzer())
+
+        report = orchestrator.run(self._test_cases(tmp_path, 2, clicks=1))
+
+        assert [run.success for run in report.runs] == [False, False]
+        assert all(run.error for run in report.runs)
+
+    def test_identical_frames_analyzed_once_across_instances(self, config, tmp_path):
+        shared = _frames(tmp_path, "same", 1)[0]
+        analyzer = _analyzer()
+        instances = [SimulatedWindowInstance(f"sim-{i}") for i in range(2)]
+        orchestrator = ParallelReplayOrchestrator(config, instances, ui_analyzer=analyzer)
+
+        report = orchestrator.run([("a", [_click(before_path=shared)]), ("b", [_click(before_path=shared)])])
+
+        assert all(run.success for run in report.runs)
+        assert analyzer.analyze_with_retry.call_count == 1
+        assert report.analyzer_calls == 1
+
+    def test_parallel_faster_than_single_instance(self, config, tmp_path):
+        test_cases = self._test_cases(tmp_path, 4)
+
+        single = ParallelReplayOrchestrator(
+            config, [SimulatedWindowInstance("sim-0")], ui_analyzer=_analyzer(0.05)).run(test_cases)
+        parallel = ParallelReplayOrchestrator(
+            config, [SimulatedWindowInstance(f"sim-{i}") for i in range(4)], ui_analyzer=_analyzer(0.05)
+        ).run(test_cases)
+
+        assert all(run.success for run in parallel.runs)
+        assert parallel.wall_seconds < single.wall_seconds * 0.5
+        assert parallel.summary()["speedup"] > 2
+
+    def test_report_merged_and_saved(self, config, tmp_path):
+        instances = [SimulatedWindowInstance(f"sim-{i}") for i in range(2)]
+        report = ParallelReplayOrchestrator(config, instances, ui_analyzer=_analyzer()).run(
+            self._test_cases(tmp_path, 3, clicks=1))
+
+        summary = report.summary()
+        assert summary["test_cases"] == 3 and summary["passed"] == 3
+        assert summary["total_actions"] == 3 and summary["success_rate"] == 1.0
+        assert summary["method_counts"] == {"direct": 3}
+
+        path = report.save(str(tmp_path / "reports"))
+        with open(path, encoding='utf-8') as f:
+            saved = json.load(f)
+        assert saved["summary"]["test_cases"] == 3
+        assert [run["name"] for run in saved["runs"]] == ["tc0", "tc1", "tc2"]
+
+    def test_load_test_case_actions(self, tmp_path):
+        path = tmp_path / "sample.json"
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"name": "sample", "actions": [_click().to_dict()]}, f)
+
+        name, actions = load_test_case_actions(str(path))
+
+        assert name == "sample"
+        assert len(actions) == 1 and actions[0].x == 100
+
+    def test_duplicate_instance_names_rejected(self, config):
+        with pytest.raises(ValueError):
+            ParallelReplayOrchestrator(config, [SimulatedWindowInstance("a"), SimulatedWindowInstance("a")],
+                                       ui_analyzer=_analyzer())
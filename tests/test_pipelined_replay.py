@@ -0,0 +1,139 @@
+"""
+PipelinedReplayEngine 테스트
+
+순차 모드와 같은 재실행 결과, 같은 프레임 분석 공유, 화면 안정화 후 선행 분석,
+단계별 시간 기록을 검증한다.
+"""
+
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image
+
+from tests.conftest import mock_analyzer, semantic_click, start_button_ui
+from src.pipelined_replay import FrameAnalysisCache, PipelinedReplayEngine, frame_digest
+from src.semantic_action_recorder import SemanticAction
+from src.semantic_action_replayer import SemanticActionReplayer
+
+
+UI_DATA = start_button_ui(300, 200)
+
+
+@pytest.fixture
+def config(make_config):
+    return make_config(action_delay=0.01, pipeline_poll_interval=0.01)
+
+
+def _click(x=100, y=100):
+    return semantic_click(x, y)
+
+
+def _outcome(result):
+    return (result.action_id, result.success, result.method, result.actual_coords, result.coordinate_change,
+            result.match_confidence, result.screen_transition_verified, result.actual_transition)
+
+
+class TestFrameAnalysisCache:
+    """프레임 분석 공유 테스트"""
+
+    def test_same_frame_analyzed_once(self):
+        analyzer = mock_analyzer(UI_DATA)
+        cache = FrameAnalysisCache(analyzer)
+
+        assert cache.analyze_with_retry(Image.new('RGB', (8, 8), 'gray')) == UI_DATA
+        assert cache.analyze_with_retry(Image.new('RGB', (8, 8), 'gray')) == UI_DATA
+        cache.analyze_with_retry(Image.new('RGB', (8, 8), 'white'))
+
+        assert analyzer.analyze_with_retry.call_count == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_failure_not_shared(self):
+        analyzer = Mock()
+        analyzer.analyze_with_retry.side_effect = [RuntimeError("Bedrock 오류"), UI_DATA]
+        cache = FrameAnalysisCache(analyzer)
+        image = Image.new('RGB', (8, 8), 'gray')
+
+        with pytest.raises(RuntimeError):
+            cache.analyze_with_retry(image)
+        assert cache.analyze_with_retry(image) == UI_DATA
+        assert cache.misses == 2
+
+    def test_digest_distinguishes_pixels(self):
+        image = Image.new('RGB', (8, 8), 'gray')
+        changed = image.copy()
+        changed.putpixel((3, 3), (0, 0, 0))
+
+        assert frame_digest(image) == frame_digest(image.copy())
+        assert frame_digest(image) != frame_digest(changed)
+
+
+class TestPipelinedReplayEngine:
+    """파이프라인 재실행 테스트"""
+
+    def _replay(self, config, actions, screenshot, pipelined):
+        analyzer = mock_analyzer(UI_DATA)
+        replayer = SemanticActionReplayer(config, ui_analyzer=analyzer)
+        engine = PipelinedReplayEngine.from_config(replayer, config)
+        with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui:
+            mock_pyautogui.screenshot.side_effect = screenshot
+            results = engine.replay_actions(actions) if pipelined else replayer.replay_actions(actions)
+        return results, analyzer, engine
+
+    def test_results_match_sequential(self, config):
+        actions = [_click(), _click(), _click()]
+        frame = Image.new('RGB', (64, 64), 'gray')
+
+        sequential, seq_analyzer, _ = self._replay(config, actions, lambda: frame, pipelined=False)
+        pipelined, analyzer, engine = self._replay(config, actions, lambda: frame, pipelined=True)
+
+        assert [_outcome(r) for r in pipelined] == [_outcome(r) for r in sequential]
+        assert pipelined[0].method == 'semantic'
+        # 요소 확인과 의미론적 매칭이 같은 프레임을 분석하므로 한 번만 호출
+        assert seq_analyzer.analyze_with_retry.call_count == 6
+        assert analyzer.analyze_with_retry.call_count == 1
+        assert (engine.stats.analysis_hits, engine.stats.analysis_misses) == (5, 1)
+
+    def test_next_screen_analyzed_after_it_settles(self, config):
+        frames = [Image.new('RGB', (64, 64), color) for color in ('gray', 'white', 'black')]
+        clicks = []
+
+        analyzer = mock_analyzer(UI_DATA)
+        replayer = SemanticActionReplayer(config, ui_analyzer=analyzer)
+        engine = PipelinedReplayEngine.from_config(replayer, config)
+        with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui:
+            # 클릭할 때마다 다음 화면으로 바뀜
+            mock_pyautogui.screenshot.side_effect = lambda: frames[min(len(clicks), 2)]
+            mock_pyautogui.click.side_effect = lambda *args, **kwargs: clicks.append(args)
+            results = engine.replay_actions([_click(), _click()])
+
+        assert all(r.success for r in results)
+        analyzed = [frame_digest(call.args[0]) for call in analyzer.analyze_with_retry.call_args_list]
+        assert analyzed == [frame_digest(frames[0]), frame_digest(frames[1])]
+        # 두 번째 액션 화면은 첫 클릭의 전환 대기 중에 분석됨
+        assert engine.stats.speculative_analyses == 1
+        assert (engine.stats.analysis_hits, engine.stats.analysis_misses) == (3, 2)
+
+    def test_replay_actions_uses_engine_when_configured(self, config):
+        config.config['automation']['pipelined_replay'] = True
+        frame = Image.new('RGB', (64, 64), 'gray')
+
+        results, analyzer, _ = self._replay(config, [_click(), _click()], lambda: frame, pipelined=False)
+
+        assert all(r.success for r in results)
+        assert analyzer.analyze_with_retry.call_count == 1
+
+    def test_stage_timings_per_action(self, config):
+        frame = Image.new('RGB', (64, 64), 'gray')
+        wait = SemanticAction(timestamp=datetime.now().isoformat(), action_type='wait',
+                              x=0, y=0, description='0.01초 대기')
+
+        results, _, engine = self._replay(config, [_click(), wait], lambda: frame, pipelined=True)
+
+        assert len(results) == len(engine.stats.action_timings) == 2
+        assert {'capture', 'analyze', 'input', 'settle', 'verify'} <= set(engine.stats.action_timings[0])
+        assert set(engine.stats.action_timings[1]) == {'settle'}
+        assert engine.stats.stage_seconds['settle'] >= 0.3
+        assert engine.stats.wall_seconds > 0
+        assert engine.replayer.on_input is None
+        assert not isinstance(engine.replayer.ui_analyzer, FrameAnalysisCache)
@@ -147,6 +147,65 @@ class TestQAAutomationControllerRecording:
         assert len(controller.get_actions()) == 0
 
 
+class TestQAAutomationControllerRecordingLog:
+    """녹화 로그 기록/복구 테스트"""
+    
+    @pytest.fixture
+    def controller(self, tmp_path):
+        """임시 디렉토리에서 초기화된 컨트롤러"""
+        original_cwd = os.getcwd()
+        os.chdir(tmp_path)
+        ctrl = QAAutomationController(str(tmp_path / 'config.json'))
+        ctrl.initialize()
+        yield ctrl
+        ctrl.cleanup()
+        os.chdir(original_cwd)
+    
+    def _record_click(self, controller):
+        controller.action_recorder.record_action(Action(
+            timestamp="2025-01-01T00:00:00", action_type="click",
+            x=100, y=200, description="버튼 클릭", button="left"
+        ))
+    
+    def test_recover_interrupted_recording(self, controller):
+        """녹화 도중 종료된 로그를 테스트 케이스로 복구"""
+        controller.start_recording("crashed")
+        self._record_click(controller)
+        controller.input_monitor.stop_monitoring()  # stop_recording 없이 종료된 상황
+        
+        logs = controller.list_recording_logs()
+        assert len(logs) == 1
+        assert logs[0]["name"] == "crashed"
+        assert logs[0]["action_count"] == 1
+        
+        test_case = controller.recover_recording(logs[0]["path"])
+        
+        assert test_case["name"] == "crashed"
+        assert os.path.exists(test_case["json_path"])
+        assert os.path.exists(test_case["script_path"])
+        assert test_case["actions"][0]["button"] == "left"
+    
+    def test_log_removed_after_save(self, controller):
+        """저장된 녹화의 로그는 삭제"""
+        controller.start_recording()
+        self._record_click(controller)
+        controller.stop_recording()
+        assert len(controller.list_recording_logs()) == 1
+        
+        controller.save_test_case("saved")
+        
+        assert controller.list_recording_logs() == []
+    
+    def test_recording_log_disabled(self, controller):
+        """automation.recording_log가 false면 로그를 만들지 않음"""
+        controller.config_manager.config.setdefault('automation', {})['recording_log'] = False
+        controller.start_recording()
+        self._record_click(controller)
+        controller.stop_recording()
+        
+        assert controller.list_recording_logs() == []
+
+
 class TestQAAutomationControllerSaveTestCase:
     """테스트 케이스 저장 테스트"""
     
@@ -221,6 +280,29 @@ class TestQAAutomationControllerSaveTestCase:
         assert 'json_path' in result
         assert len(result['actions']) == 2
     
+    def test_save_test_case_logs_manifest_compile_failure(self, controller_with_actions, caplog):
+        """매니페스트 컴파일이 실패해도 저장은 계속하고 경고를 남김"""
+        controller, tmp_path = controller_with_actions
+
+        with patch.object(controller, 'compile_test_case', side_effect=RuntimeError("디스크 오류")):
+            with caplog.at_level('WARNING', logger='src.qa_automation_controller'):
+                result = controller.save_test_case("test_case_1")
+
+        assert result['name'] == 'test_case_1'
+        assert "디스크 오류" in caplog.text
+
+    def test_save_test_case_logs_expected_frame_analysis_failure(self, controller_with_actions, caplog):
+        """예상 프레임 분석(Vision LLM)이 실패해도 저장은 계속하고 경고를 남김"""
+        controller, tmp_path = controller_with_actions
+        controller.config_manager.config.setdefault('automation', {})['analyze_expected_frames'] = True
+
+        with patch.object(controller, 'analyze_expected_frames', side_effect=RuntimeError("인증 실패")):
+            with caplog.at_level('WARNING', logger='src.qa_automation_controller'):
+                result = controller.save_test_case("test_case_1")
+
+        assert result['name'] == 'test_case_1'
+        assert "인증 실패" in caplog.text
+
     def test_save_test_case_raises_error_when_no_actions(self, tmp_path):
         """액션이 없으면 에러 발생"""
         config_path = tmp_path / 'config.json'
@@ -0,0 +1,165 @@
+"""
+RecordingLog 테스트
+
+액션 레코드 인코딩 왕복, 손상된 끝 레코드 복구, 테스트 케이스 JSON 변환,
+ActionRecorder의 녹화 로그 기록을 검증한다.
+"""
+
+import os
+
+import pytest
+
+from src.recording_log import (
+    RecordingLogWriter, decode_action, encode_action, get_recording_log_path,
+    log_to_test_case, read_recording_log, recover_recording_log, write_test_case_log
+)
+
+
+FULL_ACTION = {
+    "timestamp": "2026-01-01T10:00:00.123456",
+    "action_type": "drag",
+    "x": -20,
+    "y": 480,
+    "description": "드래그 (-20, 480) → (100, 500)",
+    "screenshot_path": "screenshots/t/action_0001.png",
+    "screenshot_before_path": "screenshots/t/action_0001_before.png",
+    "button": "left",
+    "timestamp_ns": 123456789012345,
+    "path": [[0, -20, 480], [16_000_000, 40, 490], [40_000_000, 100, 500]]
+}
+
+
+def _actions(count):
+    return [
+        {"timestamp": f"2026-01-01T10:00:{i:02d}", "action_type": "click", "x": i, "y": i * 2,
+         "description": f"클릭 {i}", "button": "left"}
+        for i in range(count)
+    ]
+
+
+def _write_log(path, actions, meta=None):
+    writer = RecordingLogWriter(str(path), meta or {"name": "sample", "capture_delay": 1.5}, fsync_interval=-1)
+    for action in actions:
+        writer.append(action)
+    writer.close()
+    return writer
+
+
+class TestActionEncoding:
+    """액션 레코드 인코딩 테스트"""
+
+    def test_round_trip_all_fields(self):
+        assert decode_action(memoryview(encode_action(FULL_ACTION))) == FULL_ACTION
+
+    @pytest.mark.parametrize("action", [
+        {"timestamp": "t", "action_type": "type_text", "x": 0, "y": 0, "description": "텍스트 입력: 안녕", "text": "안녕"},
+        {"timestamp": "t", "action_type": "scroll", "x": 5, "y": 6, "description": "", "scroll_dx": 0, "scroll_dy": -3},
+        {"timestamp": "t", "action_type": "custom_action", "x": 1, "y": 2, "description": "d", "key": "Key.f5"},
+    ])
+    def test_round_trip_optional_fields(self, action):
+        assert decode_action(memoryview(encode_action(action))) == action
+
+    def test_absent_fields_not_stored(self):
+        minimal = {"timestamp": "t", "action_type": "wait", "x": 0, "y": 0, "description": "1.0초 대기"}
+        assert decode_action(memoryview(encode_action(minimal))) == minimal
+        assert len(encode_action(minimal)) < 40
+
+
+class TestRecordingLogFile:
+    """녹화 로그 파일 읽기/복구 테스트"""
+
+    def test_write_and_read(self, tmp_path):
+        path = tmp_path / "rec.qarec"
+        _write_log(path, _actions(3) + [FULL_ACTION])
+
+        log = read_recording_log(str(path))
+
+        assert log.meta == {"name": "sample", "capture_delay": 1.5}
+        assert log.actions == _actions(3) + [FULL_ACTION]
+        assert log.truncated is False
+        assert log.valid_size == os.path.getsize(path)
+
+    def test_file_created_on_first_action(self, tmp_path):
+        writer = RecordingLogWriter(str(tmp_path / "sub" / "rec.qarec"))
+        assert not os.path.exists(writer.path)
+        writer.append(_actions(1)[0])
+        assert os.path.exists(writer.path)
+        writer.close()
+
+    def test_truncated_tail_recovered(self, tmp_path):
+        path = tmp_path / "rec.qarec"
+        _write_log(path, _actions(5))
+        size = os.path.getsize(path)
+        with open(path, 'r+b') as f:
+            f.truncate(size - 7)  # 마지막 레코드를 쓰다 만 상태
+
+        log = read_recording_log(str(path))
+        assert log.actions == _actions(4)
+        assert log.truncated is True
+
+        recover_recording_log(str(path))
+        assert os.path.getsize(path) == log.valid_size
+        assert read_recording_log(str(path)).truncated is False
+
+    def test_corrupted_record_stops_reading(self, tmp_path):
+        path = tmp_path / "rec.qarec"
+        _write_log(path, _actions(3))
+        data = bytearray(path.read_bytes())
+        data[-1] ^= 0xFF  # 마지막 레코드 CRC 불일치
+        path.write_bytes(bytes(data))
+
+        log = read_recording_log(str(path))
+        assert log.actions == _actions(2)
+        assert log.truncated is True
+
+    def test_not_a_recording_log(self, tmp_path):
+        path = tmp_path / "rec.qarec"
+        path.write_bytes(b'{"actions": []}')
+        with pytest.raises(ValueError):
+            read_recording_log(str(path))
+
+
+class TestTestCaseConversion:
+    """테스트 케이스 JSON 변환 테스트"""
+
+    def test_test_case_round_trip(self, tmp_path):
+        test_case = {
+            "name": "login", "created_at": "2026-01-01T10:00:00", "capture_delay": 2.0,
+            "actions": _actions(2) + [FULL_ACTION]
+        }
+        path = str(tmp_path / "login.qarec")
+
+        writer = write_test_case_log(test_case, path)
+
+        assert writer.action_count == 3
+        assert log_to_test_case(read_recording_log(path)) == test_case
+
+    def test_name_from_file_when_meta_has_none(self, tmp_path):
+        path = get_recording_log_path(str(tmp_path))
+        _write_log(path, _actions(1), meta={"name": None})
+
+        test_case = log_to_test_case(read_recording_log(path))
+
+        assert test_case["name"].startswith("recording_")
+        assert log_to_test_case(read_recording_log(path), "renamed")["name"] == "renamed"
+
+
+class TestActionRecorderLog:
+    """ActionRecorder 녹화 로그 연동 테스트"""
+
+    def test_recorded_actions_appended_to_log(self, tmp_path):
+        from src.config_manager import ConfigManager
+        from src.input_monitor import Action, ActionRecorder, action_to_dict
+
+        config = ConfigManager()
+        config.config = {'automation': {'screenshot_on_action': False, 'screenshot_dir': str(tmp_path / 'shots')}}
+        recorder = ActionRecorder(config)
+        path = str(tmp_path / "rec.qarec")
+        recorder.start_log(RecordingLogWriter(path, {"name": "t"}))
+
+        recorder.record_action(Action(timestamp="a", action_type='click', x=1, y=2, description='클릭', button='left'))
+        recorder.record_action(Action(timestamp="b", action_type='type_text', x=0, y=0, description='', text='hi'))
+        assert read_recording_log(path).actions == [action_to_dict(a) for a in recorder.actions]
+
+        assert recorder.close_log() == path
+        assert recorder.close_log() is None
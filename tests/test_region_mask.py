@@ -0,0 +1,182 @@
+"""
+RegionMaskStore 단위 테스트
+
+변동 영역 마스크의 수동 지정, 자동 학습, 저장과
+ReplayVerifier의 마스크 적용(Vision LLM 재검증 생략)을 검증한다.
+"""
+
+import os
+import sys
+import json
+import tempfile
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config_manager import ConfigManager
+from src.region_mask import RegionMaskStore, get_masks_path, region_to_tiles
+from src.replay_verifier import ReplayVerifier
+
+
+def _game_frame(clock_color: str = 'white', particles: bool = False) -> Image.Image:
+    image = Image.new('RGB', (320, 240), color=(30, 60, 90))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([20, 180, 120, 220], fill='orange')
+    draw.rectangle([200, 180, 300, 220], fill='green')
+    draw.ellipse([120, 60, 200, 140], fill='purple')
+    draw.rectangle([282, 2, 318, 28], fill=clock_color)
+    if particles:
+        for x in range(0, 160, 8):
+            draw.rectangle([x, 0, x + 3, 28], fill='yellow')
+    return image
+
+
+@pytest.fixture
+def workspace():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        test_cases_dir = os.path.join(tmpdir, 'test_cases')
+        os.makedirs(test_cases_dir)
+        expected_path = os.path.join(tmpdir, 'action_0000.png')
+        _game_frame('white').save(expected_path)
+
+        test_case = {
+            "name": "sample",
+            "actions": [{"action_type": "click", "x": 70, "y": 200,
+                         "description": "클릭", "screenshot_path": expected_path}]
+        }
+        with open(os.path.join(test_cases_dir, 'sample.json'), 'w', encoding='utf-8') as f:
+            json.dump(test_case, f)
+
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: {
+            'test_cases.directory': test_cases_dir,
+            'automation.hash_threshold': 0,
+            'game.window_title': '',
+            'automation.screenshot_dir': tmpdir,
+            'automation.capture_delay': 0.0,
+        }.get(key, default)
+
+        yield {"config": config, "test_cases_dir": test_cases_dir,
+               "action": test_case["actions"][0]}
+
+
+class TestRegionToTiles:
+    """비율 좌표 → 타일 변환 테스트"""
+
+    def test_top_right_corner(self):
+        assert region_to_tiles(0.875, 0.0, 0.125, 0.125) == [7]
+
+    def test_region_spanning_tiles(self):
+        assert region_to_tiles(0.0, 0.0, 0.25, 0.25) == [0, 1, 8, 9]
+
+    def test_out_of_frame_region(self):
+        assert region_to_tiles(1.5, 0.0, 0.2, 0.2) == []
+
+
+class TestRegionMaskStore:
+    """마스크 저장소 테스트"""
+
+    def test_manual_mask_round_trip(self, workspace):
+        store = RegionMaskStore.for_test_case(workspace["config"], "sample")
+        store.add_region(None, 0.875, 0.0, 0.125, 0.125)
+        store.add_tiles(2, [10, 11])
+        store.save()
+
+        assert os.path.exists(get_masks_path(workspace["test_cases_dir"], "sample"))
+        reloaded = RegionMaskStore.for_test_case(workspace["config"], "sample")
+        assert reloaded.get_mask(0) == {7}
+        assert reloaded.get_mask(2) == {7, 10, 11}
+
+    def test_volatile_tiles_are_learned(self, workspace):
+        store = RegionMaskStore.for_test_case(workspace["config"], "sample")
+        store.record_observation(0, [7])
+        store.record_observation(0, [7, 20])
+        assert store.get_mask(0) == set()  # 관측 수 부족
+
+        store.record_observation(0, [7])
+        store.record_observation(0, [])
+        # 타일 7: 3/4, 타일 20: 1/4 (< 0.3)
+        assert store.get_mask(0) == {7}
+        assert store.get_mask(1) == set()
+
+    def test_screen_transition_is_not_learned(self, workspace):
+        store = RegionMaskStore.for_test_case(workspace["config"], "sample")
+        assert store.record_observation(0, range(40)) is False
+        assert not store.dirty
+
+    def test_clear_learned_keeps_manual(self, workspace):
+        store = RegionMaskStore.for_test_case(workspace["config"], "sample")
+        store.add_tiles(0, [3])
+        for _ in range(3):
+            store.record_observation(0, [7])
+        assert store.get_mask(0) == {3, 7}
+
+        store.clear(0, learned_only=True)
+        assert store.get_mask(0) == {3}
+        store.clear()
+        assert store.get_mask(0) == set()
+
+    def test_grid_mismatch_discards_file(self, workspace):
+        path = get_masks_path(workspace["test_cases_dir"], "sample")
+        store = RegionMaskStore(path, grid=8)
+        store.add_tiles(None, [1])
+        store.save()
+
+        assert RegionMaskStore(path, grid=4).get_mask(0) == set()
+
+
+class TestReplayVerifierMasks:
+    """검증 시 마스크 적용 테스트"""
+
+    def _verifier(self, workspace):
+        with patch('src.replay_verifier.UIAnalyzer'):
+            verifier = ReplayVerifier(workspace["config"])
+        verifier.start_verification_session("sample")
+        verifier._verify_with_vision_llm = Mock(return_value=(True, {}))
+        return verifier
+
+    def test_unmasked_change_escalates_and_is_localized(self, workspace):
+        verifier = self._verifier(workspace)
+        result = verifier.verify_coordinate_action(0, workspace["action"], _game_frame('red', particles=True))
+
+        tiles = result.details["screenshot_verification"]["tile_comparison"]
+        assert 7 in tiles["unmasked_changed_tiles"]
+        assert tiles["changed_regions"]
+        assert result.vision_verified is True
+        verifier._verify_with_vision_llm.assert_called_once()
+
+    def test_masked_change_skips_vision_llm(self, workspace):
+        store = RegionMaskStore.for_test_case(workspace["config"], "sample")
+        store.add_region(None, 0.0, 0.0, 1.0, 0.125)  # 상단 한 줄 (시계 + 파티클)
+        store.save()
+
+        verifier = self._verifier(workspace)
+        result = verifier.verify_coordinate_action(0, workspace["action"], _game_frame('red', particles=True))
+
+        assert result.final_result == "pass"
+        assert result.details["screenshot_verification"]["masked_match"] is True
+        assert result.vision_verified is False
+        verifier._verify_with_vision_llm.assert_not_called()
+
+    def test_masks_are_learned_from_accepted_replays(self, workspace):
+        for _ in range(3):
+            verifier = self._verifier(workspace)
+            verifier.verify_coordinate_action(0, workspace["action"], _game_frame('red', particles=True))
+            verifier.generate_report()
+
+        # 세 번의 Vision LLM 일치 관측 후에는 마스크로 통과
+        verifier = self._verifier(workspace)
+        result = verifier.verify_coordinate_action(0, workspace["action"], _game_frame('red', particles=True))
+        assert result.final_result == "pass"
+        verifier._verify_with_vision_llm.assert_not_called()
+
+    def test_rejected_frames_are_not_learned(self, workspace):
+        verifier = self._verifier(workspace)
+        verifier._verify_with_vision_llm = Mock(return_value=(False, {}))
+        verifier.verify_coordinate_action(0, workspace["action"], _game_frame('red'))
+        verifier.generate_report()
+
+        assert not os.path.exists(get_masks_path(workspace["test_cases_dir"], "sample"))
@@ -0,0 +1,213 @@
+"""
+CheckpointedReplay 테스트
+
+저장 간격마다 체크포인트가 저장되는지, 중단된 재실행을 체크포인트부터 이어서 실행할 때
+화면을 확인하고 정확도 기록이 하나의 세션으로 합쳐지는지 검증한다.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tests.conftest import block_frame, mock_analyzer, semantic_click
+from src.accuracy_tracker import AccuracyTracker
+from src.frame_hasher import average_hash_hex
+from src.replay_checkpoint import (
+    CheckpointMismatchError, CheckpointedReplay, ReplayCheckpoint, ReplayCheckpointStore,
+    get_checkpoint_path, result_from_dict, result_to_dict
+)
+from src.screen_state_graph import ScreenStateGraph, get_state_graph_path
+from src.semantic_action_replayer import ReplayResult, SemanticActionReplayer
+
+
+def _actions(screen, count=4):
+    screen_hash = average_hash_hex(screen)
+    return [semantic_click(100 + i, 100, description=f'버튼 {i} 클릭',
+                           ui_state_hash_before=screen_hash, ui_state_hash_after=screen_hash)
+            for i in range(count)]
+
+
+def _replay(config, tmp_path):
+    replayer = SemanticActionReplayer(config, ui_analyzer=mock_analyzer())
+    tracker = AccuracyTracker("tc", data_dir=str(tmp_path / "accuracy"))
+    return CheckpointedReplay.for_test_case(replayer, config, "tc", tracker=tracker), tracker
+
+
+def _crash_after(replay, count):
+    """count개 액션을 실행한 뒤 중단되는 재실행기"""
+    original = replay.replayer.replay_action
+    calls = []
+
+    def replay_action(action):
+        if len(calls) == count:
+            raise KeyboardInterrupt("중단")
+        calls.append(action)
+        return original(action)
+
+    replay.replayer.replay_action = replay_action
+
+
+class TestReplayCheckpointStore:
+    """체크포인트 저장소 테스트"""
+
+    def test_round_trip(self, tmp_path):
+        store = ReplayCheckpointStore(str(tmp_path / "tc" / "replay_checkpoint.json"))
+        result = ReplayResult("action_0001", True, 'direct', (1, 2), actual_coords=(3, 4))
+        checkpoint = ReplayCheckpoint("tc", 3, next_index=1, results=[result_to_dict(result)],
+                                      screen_hash="ff00", expected_hash="00ff", session_id="s1")
+
+        store.save(checkpoint)
+        loaded = store.load()
+
+        assert loaded.next_index == 1 and loaded.session_id == "s1"
+        assert loaded.screen_hash == "ff00" and loaded.updated_at
+        assert loaded.replay_results() == [result]
+        store.clear()
+        assert store.load() is None
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        path = tmp_path / "replay_checkpoint.json"
+        path.write_text("{broken", encoding='utf-8')
+
+        assert ReplayCheckpointStore(str(path)).load() is None
+
+    def test_result_from_dict_restores_tuples(self):
+        result = result_from_dict({"action_id": "a", "success": False, "method": 'failed',
+                                   "original_coords": [5, 6], "unknown_field": 1})
+
+        assert result.original_coords == (5, 6)
+
+
+class TestCheckpointedReplay:
+    """체크포인트 재실행 테스트"""
+
+    def test_checkpoint_saved_per_interval_and_cleared(self, config, tmp_path):
+        screen = block_frame()
+        replay, tracker = _replay(config, tmp_path)
+        replay.save_interval = 2
+        saved = []
+        original_save = replay.store.save
+        replay.store.save = lambda checkpoint: (saved.append((checkpoint.next_index, checkpoint.screen_hash)),
+                                                original_save(checkpoint))
+        tracker.save_session = Mock(wraps=tracker.save_session)
+
+        with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui:
+            mock_pyautogui.screenshot.return_value = screen
+            results = replay.run("tc", _actions(screen, 5))
+
+        assert [result.success for result in results] == [True] * 5
+        assert saved == [(0, None), (2, average_hash_hex(screen)), (4, average_hash_hex(screen))]
+        assert tracker.save_session.call_count == 3  # 체크포인트 2번 + 완료
+        assert not replay.store.exists()
+
+    def test_checkpoint_saved_after_every_action_by_default(self, config, tmp_path):
+        screen = block_frame()
+        replay, _ = _replay(config, tmp_path)
+        saved = []
+        original_save = replay.store.save
+        replay.store.save = lambda checkpoint: (saved.append(checkpoint.next_index), original_save(checkpoint))
+
+        with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui:
+            mock_pyautogui.screenshot.return_value = screen
+            replay.run("tc", _actions(screen, 4))
+
+        assert replay.save_interval == 1
+        assert saved == [0, 1, 2, 3]  # 시작 + 마지막을 제외한 액션마다 (완료 시 삭제)
+
+    def test_checkpoint_reuses_replayerblock_frame(self, config, tmp_path):
+        screen = block_frame()
+        replay, _ = _replay(config, tmp_path)
+        replay.save_interval = 1
+
+        with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui:
+            mock_pyautogui.screenshot.return_value = screen
+            replay.replayer.replay_action(_actions(screen, 1)[0])
+            captures_per_action = mock_pyautogui.screenshot.call_count
+            mock_pyautogui.screenshot.reset_mock()
+            replay.run("tc", _actions(screen, 3))
+
+        assert mock_pyautogui.screenshot.call_count == 3 * captures_per_action
+
+    def test_resume_merges_into_one_session(self, config, tmp_path):
+        screen = block_frame()
+        actions = _actions(screen)
+        first, first_tracker = _replay(config, tmp_path)
+        _crash_after(first, 2)
+
+        with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui:
+            mock_pyautogui.screenshot.return_value = screen
+            with pytest.raises(KeyboardInterrupt):
+                first.run("tc", actions)
+
+            checkpoint = first.store.load()
+            assert checkpoint.next_index == 2 and len(checkpoint.results) == 2
+            assert checkpoint.screen_hash == average_hash_hex(screen)
+
+            second, second_tracker = _replay(config, tmp_path)
+            results = second.run("tc", actions, resume=True)
+
+        assert [result.action_id for result in results] == [f"action_{i:04d}" for i in range(1, 5)]
+        assert [result.original_coords for result in results] == [(100 + i, 100) for i in range(4)]
+        assert second_tracker.session_id == first_tracker.session_id
+        assert second_tracker.resume_count == 1
+        assert len(second_tracker.results) == 4
+        assert len(AccuracyTracker("tc", data_dir=str(tmp_path / "accuracy")).list_sessions()) == 1
+        assert not second.store.exists()
+
+    def test_resume_rejects_different_screen(self, config, tmp_path):
+        screen = block_frame()
+        actions = _actions(screen)
+        first, _ = _replay(config, tmp_path)
+        _crash_after(first, 1)
+
+        with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui:
+            mock_pyautogui.screenshot.return_value = screen
+            with pytest.raises(KeyboardInterrupt):
+                first.run("tc", actions)
+
+            mock_pyautogui.screenshot.return_value = block_frame(seed=7)
+            second, _ = _replay(config, tmp_path)
+            with pytest.raises(CheckpointMismatchError):
+                second.run("tc", actions, resume=True)
+            assert second.store.load().next_index == 1  # 체크포인트 유지
+
+            results = second.run("tc", actions, resume=True, force=True)
+
+        assert len(results) == 4
+
+    def test_resume_accepts_same_state_in_graph(self, config, tmp_path):
+        screen = block_frame()
+        variant = screen.copy()
+        variant.paste(block_frame(seed=9).crop((0, 0, 160, 64)), (0, 0))  # 같은 화면의 일부만 변경
+        actions = _actions(screen)
+        first, _ = _replay(config, tmp_path)
+        _crash_after(first, 1)
+
+        with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui:
+            mock_pyautogui.screenshot.return_value = screen
+            with pytest.raises(KeyboardInterrupt):
+                first.run("tc", actions)
+
+            second, _ = _replay(config, tmp_path)
+            second.match_distance = 2  # 해시 거리만으로는 다른 화면
+            mock_pyautogui.screenshot.return_value = variant
+            assert not second.verify_screen(second.store.load())[0]
+
+            graph = ScreenStateGraph(get_state_graph_path(config.get('test_cases.directory')), 15)
+            with graph._conn:
+                graph.add_observation(ScreenStateGraph.hash_image(screen))
+            graph.close()
+            matched, reason = second.verify_screen(second.store.load())
+
+        assert matched and "상태" in reason
+
+    def test_resume_without_checkpoint_starts_over(self, config, tmp_path):
+        screen = block_frame()
+        replay, tracker = _replay(config, tmp_path)
+
+        with patch('src.semantic_action_replayer.pyautogui') as mock_pyautogui:
+            mock_pyautogui.screenshot.return_value = screen
+            results = replay.run("tc", _actions(screen, 2), resume=True)
+
+        assert len(results) == 2 and tracker.resume_count == 0
+        assert replay.store.path == get_checkpoint_path(config.get('test_cases.directory'), "tc")
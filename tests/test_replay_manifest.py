@@ -0,0 +1,258 @@
+"""
+ReplayManifest 단위 테스트
+
+테스트 케이스 컴파일, 매니페스트 저장/로드, 변경 감지,
+ReplayVerifier의 매니페스트 기반 검증을 확인한다.
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config_manager import ConfigManager
+from src.screenshot_verifier import ScreenshotVerifier
+from src.replay_manifest import (
+    ReplayManifest,
+    ReplayManifestCompiler,
+    resolve_frame_path,
+    get_manifest_path,
+    parse_wait_seconds,
+    MANIFEST_VERSION,
+)
+from src.replay_verifier import ReplayVerifier
+
+
+def _make_frame(path: str, color: str = 'red', box: tuple = (20, 20, 60, 60)):
+    """테스트용 프레임 이미지 생성"""
+    image = Image.new('RGB', (160, 90), color=color)
+    ImageDraw.Draw(image).rectangle(box, fill='white')
+    image.save(path)
+    return image
+
+
+@pytest.fixture
+def workspace():
+    """테스트 케이스 디렉토리와 스크린샷이 있는 임시 작업 공간"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        test_cases_dir = os.path.join(tmpdir, 'test_cases')
+        screenshot_dir = os.path.join(tmpdir, 'screenshots')
+        os.makedirs(test_cases_dir)
+        os.makedirs(screenshot_dir)
+
+        frame0 = os.path.join(screenshot_dir, 'action_0000.png')
+        frame2 = os.path.join(screenshot_dir, 'action_0002.png')
+        _make_frame(frame0, 'red')
+        _make_frame(frame2, 'blue', (80, 10, 150, 80))
+
+        test_case = {
+            "name": "sample",
+            "capture_delay": 1.5,
+            "actions": [
+                {"timestamp": "2026-01-01T10:00:00", "action_type": "click", "x": 10, "y": 20,
+                 "description": "클릭 1", "screenshot_path": frame0},
+                {"timestamp": "2026-01-01T10:00:02.500000", "action_type": "wait", "x": 0, "y": 0,
+                 "description": "2.5초 대기"},
+                {"timestamp": "2026-01-01T10:00:03", "action_type": "click", "x": 30, "y": 40,
+                 "description": "클릭 2", "screenshot_path": frame2},
+            ]
+        }
+        json_path = os.path.join(test_cases_dir, 'sample.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(test_case, f, ensure_ascii=False)
+
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: {
+            'test_cases.directory': test_cases_dir,
+            'automation.hash_threshold': 5,
+            'game.window_title': '',
+            'automation.screenshot_dir': screenshot_dir,
+            'automation.capture_delay': 0.0,
+        }.get(key, default)
+
+        yield {
+            "config": config,
+            "test_cases_dir": test_cases_dir,
+            "json_path": json_path,
+            "frames": [frame0, frame2],
+            "test_case": test_case,
+        }
+
+
+class TestPathHelpers:
+    """경로 헬퍼 테스트"""
+
+    def test_resolve_frame_path_normalizes_separators(self):
+        resolved = resolve_frame_path("screenshots\\tc/action_0000.png")
+        assert os.path.isabs(resolved)
+        assert resolved.endswith(os.path.join("screenshots", "tc", "action_0000.png"))
+
+    def test_resolve_frame_path_empty(self):
+        assert resolve_frame_path(None) == ""
+        assert resolve_frame_path("") == ""
+
+    def test_parse_wait_seconds(self):
+        assert parse_wait_seconds("2.5초 대기") == 2.5
+        assert parse_wait_seconds("대기") == 1.0
+
+
+class TestManifestCompile:
+    """매니페스트 컴파일 테스트"""
+
+    def test_compile_precomputes_hashes_and_thumbnails(self, workspace):
+        compiler = ReplayManifestCompiler(workspace["config"])
+        manifest = compiler.compile(workspace["test_case"], workspace["json_path"])
+
+        assert manifest.test_case_name == "sample"
+        assert manifest.capture_delay == 1.5
+        assert len(manifest.entries) == 3
+
+        frame = manifest.entries[0].expected_frame
+        assert frame is not None
+        assert frame.path == workspace["frames"][0]
+        assert (frame.width, frame.height) == (160, 90)
+        assert len(frame.phash) == 16 and len(frame.ahash) == 16 and len(frame.dhash) == 16
+
+        thumbnail = frame.get_thumbnail()
+        assert thumbnail.mode == 'L'
+        assert thumbnail.size == (compiler.thumbnail_size, compiler.thumbnail_size)
+
+        # wait 액션은 예상 프레임 없음
+        assert manifest.entries[1].expected_frame is None
+
+    def test_compile_records_action_timing(self, workspace):
+        compiler = ReplayManifestCompiler(workspace["config"])
+        manifest = compiler.compile(workspace["test_case"], workspace["json_path"])
+
+        offsets = [entry.offset_seconds for entry in manifest.entries]
+        assert offsets == [0.0, 2.5, 3.0]
+        assert manifest.entries[1].wait_seconds == 2.5
+        assert manifest.entries[0].wait_seconds == 0.0
+
+    def test_compile_skips_missing_frames(self, workspace):
+        test_case = dict(workspace["test_case"])
+        test_case["actions"] = [
+            {"action_type": "click", "description": "없는 프레임",
+             "screenshot_path": "does/not/exist.png"}
+        ]
+        manifest = ReplayManifestCompiler(workspace["config"]).compile(test_case)
+        assert manifest.entries[0].expected_frame is None
+
+    def test_save_and_load_roundtrip(self, workspace):
+        compiler = ReplayManifestCompiler(workspace["config"])
+        manifest = compiler.compile_file(workspace["json_path"])
+
+        manifest_path = get_manifest_path(workspace["test_cases_dir"], "sample")
+        assert os.path.exists(manifest_path)
+
+        loaded = ReplayManifest.load(manifest_path)
+        assert loaded.to_dict() == manifest.to_dict()
+        assert loaded.version == MANIFEST_VERSION
+        assert not loaded.is_stale()
+
+
+class TestManifestStaleness:
+    """매니페스트 변경 감지 테스트"""
+
+    def test_modified_frame_makes_manifest_stale(self, workspace):
+        manifest = ReplayManifestCompiler(workspace["config"]).compile_file(workspace["json_path"])
+
+        # 프레임 파일 변경 (크기가 다른 이미지로 덮어쓰기)
+        Image.new('RGB', (200, 100), color='green').save(workspace["frames"][1])
+        assert manifest.is_stale()
+
+    def test_modified_test_case_makes_manifest_stale(self, workspace):
+        manifest = ReplayManifestCompiler(workspace["config"]).compile_file(workspace["json_path"])
+
+        stat = os.stat(workspace["json_path"])
+        os.utime(workspace["json_path"], (stat.st_atime, stat.st_mtime + 10))
+        assert manifest.is_stale()
+
+    def test_load_or_compile_recompiles_stale_manifest(self, workspace):
+        compiler = ReplayManifestCompiler(workspace["config"])
+        first = compiler.load_or_compile("sample")
+        assert first is not None
+
+        # 변경이 없으면 저장된 매니페스트를 그대로 사용
+        assert compiler.load_or_compile("sample").compiled_at == first.compiled_at
+
+        _make_frame(workspace["frames"][0], 'yellow', (0, 0, 100, 30))
+        stat = os.stat(workspace["frames"][0])
+        os.utime(workspace["frames"][0], (stat.st_atime, stat.st_mtime + 10))
+
+        time.sleep(0.01)
+        refreshed = compiler.load_or_compile("sample")
+        assert refreshed.compiled_at != first.compiled_at
+        assert refreshed.entries[0].expected_frame.phash != first.entries[0].expected_frame.phash
+
+    def test_load_or_compile_without_test_case(self, workspace):
+        compiler = ReplayManifestCompiler(workspace["config"])
+        assert compiler.load_or_compile("missing") is None
+
+
+class TestHashVerification:
+    """사전 계산 해시 기반 비교 테스트"""
+
+    def test_compare_with_hash_matches_compare_images(self, workspace):
+        verifier = ScreenshotVerifier(hash_threshold=5)
+        frame = ReplayManifestCompiler(workspace["config"]).fingerprint_frame(workspace["frames"][0])
+
+        actual = Image.open(workspace["frames"][1])
+        expected = Image.open(workspace["frames"][0])
+
+        assert verifier.compare_with_hash(frame.phash, actual) == verifier.compare_images(expected, actual)
+
+    def test_verify_with_hash_result_format(self, workspace):
+        verifier = ScreenshotVerifier(hash_threshold=5)
+        frame = ReplayManifestCompiler(workspace["config"]).fingerprint_frame(workspace["frames"][0])
+
+        result = verifier.verify_with_hash(frame.phash, Image.open(workspace["frames"][0]), frame.path)
+
+        assert result["match"] is True
+        assert result["hash_diff"] == 0
+        assert result["expected_path"] == frame.path
+
+
+class TestReplayVerifierWithManifest:
+    """ReplayVerifier 매니페스트 연동 테스트"""
+
+    @pytest.fixture
+    def verifier(self, workspace):
+        with patch('src.replay_verifier.UIAnalyzer'):
+            verifier = ReplayVerifier(workspace["config"])
+        verifier.start_verification_session("sample")
+        yield verifier
+
+    def test_session_loads_manifest(self, verifier, workspace):
+        assert verifier._manifest is not None
+        assert os.path.exists(get_manifest_path(workspace["test_cases_dir"], "sample"))
+
+    def test_verify_does_not_decode_expected_png(self, verifier, workspace):
+        action = workspace["test_case"]["actions"][0]
+        actual = Image.open(workspace["frames"][0])
+        actual.load()
+
+        with patch('src.screenshot_verifier.Image.open') as mock_open:
+            result = verifier.verify_coordinate_action(0, action, actual)
+
+        mock_open.assert_not_called()
+        assert result.final_result == "pass"
+        assert result.details["screenshot_verification"]["source"] == "manifest"
+
+    def test_mismatched_entry_falls_back_to_file(self, verifier, workspace):
+        # 매니페스트와 다른 스크린샷 경로를 가진 액션은 파일로 검증
+        action = dict(workspace["test_case"]["actions"][0])
+        action["screenshot_path"] = workspace["frames"][1]
+        actual = Image.open(workspace["frames"][1])
+
+        result = verifier.verify_coordinate_action(0, action, actual)
+
+        assert result.final_result == "pass"
+        assert "source" not in result.details["screenshot_verification"]
@@ -0,0 +1,153 @@
+"""
+ReplayPlan 테스트
+
+생성된 스크립트가 재실행 계획(데이터)만 담은 얇은 실행기인지,
+PlanInterpreter가 계획을 마감 시각 기준으로 정확히 실행하는지 검증한다.
+"""
+
+import importlib.util
+import json
+from unittest.mock import Mock, call, patch
+
+import pytest
+
+from src.config_manager import ConfigManager
+from src.input_monitor import Action
+from src.replay_plan import PLAN_VERSION, PlanInterpreter, build_replay_plan
+from src.script_generator import ScriptGenerator
+
+
+MS = 1_000_000
+
+
+class FakeClock:
+    """sleep하면 그만큼 시간이 흐르고, 호출마다 1us씩 흐르는 시계"""
+
+    def __init__(self):
+        self.now = 0
+
+    def clock(self):
+        self.now += 1_000
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += int(seconds * 1e9)
+
+
+def _plan(steps, capture_delay=0.5):
+    return build_replay_plan(steps, window_title='', capture_delay=capture_delay, type_interval=0.01)
+
+
+def _interpreter(plan, window_offset=(0, 0)):
+    fake = FakeClock()
+    driver = Mock()
+    times = []
+    for name in ('click', 'press', 'write', 'hotkey', 'scroll'):
+        getattr(driver, name).side_effect = lambda *args, _name=name, **kwargs: times.append((_name, fake.now))
+    return PlanInterpreter(plan, window_offset, driver=driver, clock=fake.clock, sleep=fake.sleep), driver, times
+
+
+class TestBuildReplayPlan:
+    """재실행 계획 생성 테스트"""
+
+    def test_keeps_only_replay_fields(self):
+        plan = _plan([{"action_type": "click", "timestamp": "t", "x": 0, "y": 5, "description": "클릭",
+                       "button": "left", "key": None, "path": [], "semantic_info": {"intent": "시작"},
+                       "ui_state_hash_before": "ff00"}])
+
+        assert plan["version"] == PLAN_VERSION
+        assert plan["steps"] == [{"action_type": "click", "timestamp": "t", "x": 0, "y": 5,
+                                  "description": "클릭", "button": "left"}]
+
+    def test_unknown_version_rejected(self):
+        with pytest.raises(ValueError):
+            PlanInterpreter({"version": PLAN_VERSION + 1, "steps": []})
+
+
+class TestPlanInterpreter:
+    """재실행 계획 인터프리터 테스트"""
+
+    def test_inputs_use_window_offset(self):
+        plan = _plan([
+            {"action_type": "click", "x": 10, "y": 20, "button": "right"},
+            {"action_type": "key_press", "key": "Key.enter"},
+            {"action_type": "key_press", "key": "a"},
+            {"action_type": "type_text", "text": "hello"},
+            {"action_type": "hotkey", "key": "ctrl+s"},
+            {"action_type": "scroll", "x": 1, "y": 2, "scroll_dy": -3},
+            {"action_type": "scroll", "x": 1, "y": 2, "scroll_dy": 0},
+        ])
+        interpreter, driver, _ = _interpreter(plan, window_offset=(100, 200))
+
+        assert interpreter.run(action_delay=0) == 7
+
+        driver.click.assert_called_once_with(110, 220, button='right', _pause=False)
+        driver.press.assert_called_once_with('enter', _pause=False)
+        assert driver.write.call_args_list == [call('a', _pause=False),
+                                               call('hello', interval=0.01, _pause=False)]
+        driver.hotkey.assert_called_once_with('ctrl', 's', _pause=False)
+        driver.scroll.assert_called_once_with(-300, 101, 202, _pause=False)
+
+    def test_delays_scheduled_from_input_end(self):
+        plan = _plan([
+            {"action_type": "click", "x": 0, "y": 0},
+            {"action_type": "wait", "description": "1.5초 대기", "wait_time": 1.5},
+            {"action_type": "click", "x": 1, "y": 1},
+        ])
+        interpreter, _, times = _interpreter(plan)
+
+        interpreter.run(action_delay=0.2)
+
+        (_, first), (_, second) = times
+        # 클릭 후 0.2초, 대기 액션 0.2 + 1.5초 (sleep 오차는 대기 루프로 보정)
+        assert 1.9e9 <= second - first < 1.9e9 + 1 * MS
+        assert interpreter.max_late_ns < 1 * MS
+
+    def test_verification_and_skipped_wait(self):
+        plan = _plan([
+            {"action_type": "click", "x": 0, "y": 0, "description": "첫 클릭", "screenshot_path": "a.png"},
+            {"action_type": "wait", "description": "30초 대기", "wait_time": 30.0},
+            {"action_type": "click", "x": 1, "y": 1, "description": "두 번째 클릭"},
+        ])
+        interpreter, _, times = _interpreter(plan)
+        verifier = Mock()
+
+        interpreter.run(action_delay=0.1, verifier=verifier, skip_wait=True)
+
+        verifier.capture_and_verify.assert_called_once_with(0, plan["steps"][0], plan["steps"][1])
+        (_, first), (_, second) = times
+        assert second - first < 1e9  # 30초 대기 건너뜀, capture_delay 0.5초 + action_delay 0.1초
+
+    def test_failed_step_does_not_stop_replay(self, capsys):
+        plan = _plan([{"action_type": "click", "x": 0, "y": 0}, {"action_type": "teleport"},
+                      {"action_type": "hotkey", "key": "ctrl+c"}])
+        interpreter, driver, _ = _interpreter(plan)
+        driver.click.side_effect = RuntimeError("입력 실패")
+
+        interpreter.run(action_delay=0)
+
+        driver.hotkey.assert_called_once()
+        output = capsys.readouterr().out
+        assert "입력 실패" in output and "알 수 없는 액션 타입: teleport" in output
+
+
+def test_generated_script_is_thin_launcher(tmp_path):
+    config_path = tmp_path / "config.json"
+    with open(config_path, 'w', encoding='utf-8') as f:
+        json.dump({"game": {"window_title": ""}}, f)
+    config = ConfigManager(str(config_path))
+    config.load_config()
+    actions = [Action(timestamp=f"2026-01-01T00:00:0{i}", action_type='click', x=10 * i, y=20,
+                      description=f'클릭 {i}', button='left') for i in range(50)]
+
+    script_path = ScriptGenerator(config).generate_replay_script(actions, str(tmp_path / "tc.py"))
+
+    with open(script_path, encoding='utf-8') as f:
+        assert len(f.read().splitlines()) < 50 + 40  # 액션당 한 줄
+    spec = importlib.util.spec_from_file_location("tc_script", script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    with patch('src.replay_plan.pyautogui') as mock_pyautogui:
+        assert module.replay_actions(action_delay=0) is None
+    assert mock_pyautogui.click.call_count == 50
+    mock_pyautogui.click.assert_called_with(490, 20, button='left', _pause=False)
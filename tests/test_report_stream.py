@@ -0,0 +1,166 @@
+"""
+ReportStream 단위 테스트
+
+검증 결과 JSONL 스트리밍 기록, 중단된 실행 복구,
+여러 실행 합산과 ReplayVerifier 연동을 검증한다.
+"""
+
+import os
+import sys
+import json
+import tempfile
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config_manager import ConfigManager
+from src.replay_verifier import ReplayVerifier, VerificationResult
+from src.report_stream import (
+    ReportStreamWriter, aggregate_report_streams, finalize_report_stream,
+    find_report_streams, get_stream_path, read_report_stream
+)
+
+
+def _result(index: int, final_result: str = "pass", **details) -> VerificationResult:
+    return VerificationResult(
+        action_index=index,
+        action_description=f"액션 {index}",
+        screenshot_match=final_result == "pass",
+        screenshot_similarity=0.95,
+        final_result=final_result,
+        details=details
+    )
+
+
+def _write_stream(path: str, results, finished: bool = True, session_id: str = "20260101_000000"):
+    writer = ReportStreamWriter(path, fsync=False)
+    writer.open("sample", session_id, "2026-01-01T00:00:00")
+    for result in results:
+        writer.write_result(result.to_dict())
+    if finished:
+        writer.close("2026-01-01T00:01:00")
+    else:
+        writer._file.close()  # 프로세스 종료 상황 (종료 레코드 없음)
+
+
+@pytest.fixture
+def tmpdir():
+    with tempfile.TemporaryDirectory() as path:
+        yield path
+
+
+class TestReportStream:
+    """JSONL 기록/읽기 테스트"""
+
+    def test_round_trip(self, tmpdir):
+        path = get_stream_path(tmpdir, "sample", "20260101_000000")
+        _write_stream(path, [_result(0), _result(1, "fail")])
+
+        stream = read_report_stream(path)
+        assert stream.finished
+        assert stream.test_case_name == "sample"
+        assert [r["action_index"] for r in stream.results] == [0, 1]
+        assert stream.count("fail") == 1
+
+    def test_interrupted_run_keeps_written_results(self, tmpdir):
+        path = get_stream_path(tmpdir, "sample", "20260101_000000")
+        _write_stream(path, [_result(0), _result(1)], finished=False)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"type": "result", "action_index": 2, "final_')  # 쓰다 만 줄
+
+        stream = read_report_stream(path)
+        assert not stream.finished
+        assert len(stream.results) == 2
+
+    def test_finalize_interrupted_run(self, tmpdir):
+        path = get_stream_path(tmpdir, "sample", "20260101_000000")
+        _write_stream(path, [_result(0), _result(1, "fail")], finished=False)
+
+        report, json_path = finalize_report_stream(path)
+        assert report.total_actions == 2 and report.failed_count == 1
+        assert "중단된 실행" in report.summary
+        with open(json_path, encoding='utf-8') as f:
+            data = json.load(f)
+        assert [r["action_index"] for r in data["verification_results"]] == [0, 1]
+        assert os.path.exists(json_path.replace(".json", ".txt"))
+
+    def test_aggregate_runs(self, tmpdir):
+        _write_stream(get_stream_path(tmpdir, "sample", "20260101_000000"),
+                      [_result(0), _result(1, "fail")])
+        _write_stream(get_stream_path(tmpdir, "sample", "20260102_000000"),
+                      [_result(0), _result(1, "fail"), _result(2, "warning")], finished=False,
+                      session_id="20260102_000000")
+        _write_stream(get_stream_path(tmpdir, "other", "20260101_000000"), [_result(0)])
+
+        streams = find_report_streams(tmpdir, "sample")
+        assert len(streams) == 2
+        aggregate = aggregate_report_streams(streams)
+        assert aggregate["finished_runs"] == 1 and aggregate["interrupted_runs"] == 1
+        assert aggregate["totals"] == {"total": 5, "passed": 2, "failed": 2, "warning": 1}
+        assert aggregate["failed_actions"] == {1: 2}
+
+
+class TestReplayVerifierStreaming:
+    """ReplayVerifier 스트리밍 기록 테스트"""
+
+    @pytest.fixture
+    def verifier(self, tmpdir):
+        settings = {
+            'test_cases.directory': os.path.join(tmpdir, 'test_cases'),
+            'game.window_title': '',
+            'automation.screenshot_dir': tmpdir,
+            'automation.use_replay_manifest': False,
+        }
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: settings.get(key, default)
+        with patch('src.replay_verifier.UIAnalyzer'):
+            verifier = ReplayVerifier(config)
+        verifier.start_verification_session("sample", report_dir=os.path.join(tmpdir, 'reports'))
+        yield verifier
+        verifier.generate_report()
+
+    def test_results_are_written_as_they_complete(self, verifier):
+        verifier.record_result(0, _result(0))
+        verifier.verify_coordinate_action(1, {"description": "스크린샷 없음"}, Image.new('RGB', (8, 8)))
+
+        # 보고서 생성 전에도 결과가 파일에 남아 있음
+        stream = read_report_stream(verifier._report_stream.path)
+        assert [r["action_index"] for r in stream.results] == [0, 1]
+        assert stream.results[1]["final_result"] == "warning"
+        assert not stream.finished
+
+    def test_heavy_details_only_in_files(self, verifier, tmpdir):
+        vision_details = {"comparison_result": "match", "ui_similarity": 0.9,
+                          "expected_ui_elements": {"buttons": ["시작"] * 50}}
+        verifier.record_result(0, _result(0, "warning", vision_details=vision_details))
+
+        assert verifier.verification_results[0].details["vision_details"] == {
+            "comparison_result": "match", "ui_similarity": 0.9
+        }
+
+        report = verifier.generate_report()
+        json_path = verifier.save_report(report, os.path.join(tmpdir, 'reports'))
+        with open(json_path, encoding='utf-8') as f:
+            data = json.load(f)
+        assert data["total_actions"] == 1
+        assert len(data["verification_results"][0]["details"]["vision_details"]["expected_ui_elements"]["buttons"]) == 50
+        assert read_report_stream(verifier._report_stream.path).finished
+
+    def test_streaming_disabled_without_report_dir(self, tmpdir):
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: {
+            'automation.screenshot_dir': tmpdir,
+            'automation.use_replay_manifest': False,
+        }.get(key, default)
+        with patch('src.replay_verifier.UIAnalyzer'):
+            verifier = ReplayVerifier(config)
+        verifier.start_verification_session("sample")
+
+        verifier.record_result(0, _result(0))
+        assert verifier._report_stream is None
+        json_path = verifier.save_report(verifier.generate_report(), os.path.join(tmpdir, 'reports'))
+        with open(json_path, encoding='utf-8') as f:
+            assert len(json.load(f)["verification_results"]) == 1
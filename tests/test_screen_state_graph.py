@@ -0,0 +1,233 @@
+"""
+ScreenStateGraph 테스트
+
+다중 인덱스 해싱 상태 인식, 테스트 케이스 반영(증분 갱신), 최단 경로/복구 경로를 검증한다.
+"""
+
+import json
+import os
+import random
+
+from src.frame_hasher import hamming_distance, hash_to_hex
+from src.screen_state_graph import (
+    ScreenStateGraph, chunk_widths, classify_transition, split_hash
+)
+
+
+MENU = 0x0F0F_0F0F_0F0F_0F0F
+LOBBY = 0xFFFF_0000_FFFF_0000
+SHOP = 0x1234_5678_9ABC_DEF0
+BATTLE = 0xF000_0000_0000_000F
+
+
+def _click(x, y, before, after, **extra):
+    action = {
+        "action_type": "click", "x": x, "y": y, "button": "left", "description": f"클릭 ({x}, {y})",
+        "ui_state_hash_before": hash_to_hex(before), "ui_state_hash_after": hash_to_hex(after),
+    }
+    action.update(extra)
+    return action
+
+
+def _write_test_case(directory, name, actions):
+    path = os.path.join(directory, f"{name}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({"name": name, "actions": actions}, f)
+    return path
+
+
+def _flip(value, bits):
+    for bit in bits:
+        value ^= 1 << bit
+    return value
+
+
+class TestHashChunks:
+    """다중 인덱스 해싱 조각 테스트"""
+
+    def test_widths_cover_hash(self):
+        for distance in range(16):
+            widths = chunk_widths(distance)
+            assert len(widths) == distance + 1
+            assert sum(widths) == 64
+
+    def test_split_roundtrip(self):
+        widths = chunk_widths(6)
+        chunks = split_hash(SHOP, widths)
+        value = 0
+        for width, chunk in zip(widths, chunks):
+            value = (value << width) | chunk
+        assert value == SHOP
+
+    def test_classify_transition(self):
+        assert classify_transition(0) == "none"
+        assert classify_transition(5) == "minor_change"
+        assert classify_transition(20) == "partial_change"
+        assert classify_transition(40) == "full_transition"
+
+
+class TestRecognize:
+    """상태 인식 테스트"""
+
+    def test_near_frames_merge(self):
+        graph = ScreenStateGraph(":memory:", match_distance=6)
+        state = graph.add_observation(MENU)
+
+        assert graph.add_observation(_flip(MENU, [1, 30, 63])) == state
+        assert graph.add_observation(LOBBY) != state
+        assert graph.state_count == 2
+
+        match = graph.recognize(_flip(MENU, [2, 40]))
+        assert match.state_id == state
+        assert match.distance == 2
+        assert graph.recognize(_flip(MENU, range(0, 64, 8))) is None
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        graph = ScreenStateGraph(":memory:", match_distance=4)
+        hashes = {}
+        for _ in range(200):
+            value = rng.getrandbits(64)
+            state = graph.add_observation(value)
+            hashes.setdefault(state, value)
+
+        for value in list(hashes.values())[:50]:
+            for _ in range(3):
+                probe = _flip(value, rng.sample(range(64), rng.randint(0, 6)))
+                expected = min(
+                    ((hamming_distance(probe, h), s) for s, h in hashes.items()), default=None
+                )
+                match = graph.recognize(probe)
+                if expected[0] <= 4:
+                    assert (match.distance, match.state_id) == expected
+                else:
+                    assert match is None
+
+    def test_match_distance_fixed_at_creation(self, tmp_path):
+        path = str(tmp_path / "graph.sqlite")
+        ScreenStateGraph(path, match_distance=3).close()
+
+        graph = ScreenStateGraph(path, match_distance=8)
+        assert graph.match_distance == 3
+        graph.close()
+
+
+class TestIngest:
+    """테스트 케이스 반영 테스트"""
+
+    def test_transitions_and_action_states(self):
+        graph = ScreenStateGraph(":memory:")
+        actions = [
+            _click(10, 10, MENU, LOBBY),
+            {"action_type": "wait", "description": "1초 대기"},
+            _click(20, 20, LOBBY, SHOP),
+            {"action_type": "type_text", "text": "abc", "x": 0, "y": 0,
+             "ui_state_hash_after": hash_to_hex(_flip(SHOP, [5]))},
+        ]
+
+        assert graph.ingest_test_case({"name": "buy", "actions": actions}) == 3
+        menu, lobby = graph.action_states("buy", 0)
+        assert graph.action_states("buy", 1) == (None, None)
+        assert graph.action_states("buy", 2)[0] == lobby
+        shop = graph.action_states("buy", 2)[1]
+        # before 프레임이 없으면 직전 액션 후 상태에서 시작
+        assert graph.action_states("buy", 3) == (shop, shop)
+
+        transition = graph.transitions_from(menu)[0]
+        assert transition.to_state == lobby
+        assert transition.action == {"action_type": "click", "x": 10, "y": 10, "button": "left",
+                                     "description": "클릭 (10, 10)"}
+        assert transition.transition_type == classify_transition(hamming_distance(MENU, LOBBY))
+        # 같은 상태 안의 전환(텍스트 입력)은 경로 탐색에서 제외
+        assert graph.transitions_from(shop) == []
+
+    def test_reingest_replaces_test_case(self):
+        graph = ScreenStateGraph(":memory:")
+        graph.ingest_test_case({"name": "t", "actions": [_click(1, 1, MENU, LOBBY)]})
+        graph.ingest_test_case({"name": "t", "actions": [_click(2, 2, MENU, SHOP)]})
+
+        menu = graph.recognize(MENU).state_id
+        assert [t.action["x"] for t in graph.transitions_from(menu)] == [2]
+
+    def test_reingest_removes_previous_observations(self):
+        graph = ScreenStateGraph(":memory:")
+        graph.ingest_test_case({"name": "other", "actions": [_click(9, 9, MENU, SHOP)]})
+        graph.ingest_test_case({"name": "t", "actions": [_click(1, 1, MENU, LOBBY)]})
+        graph.ingest_test_case({"name": "t", "actions": [_click(1, 1, MENU, LOBBY)]})
+        graph.ingest_test_case({"name": "t", "actions": [_click(2, 2, MENU, BATTLE)]})
+
+        menu = graph.recognize(MENU).state_id
+        observations = graph._conn.execute("SELECT observations FROM states WHERE id = ?", (menu,)).fetchone()[0]
+        assert observations == 2  # other 1회 + t 마지막 반영 1회
+        # 재반영으로 관측이 없어진 상태(LOBBY)는 삭제
+        assert graph.recognize(LOBBY) is None
+        assert graph.state_count == 3
+        assert graph.recognize(SHOP) is not None
+
+    def test_repeated_transition_counted(self):
+        graph = ScreenStateGraph(":memory:")
+        graph.ingest_test_case({"name": "a", "actions": [
+            _click(1, 1, MENU, LOBBY), _click(5, 5, LOBBY, MENU), _click(1, 1, MENU, LOBBY)
+        ]})
+        graph.ingest_test_case({"name": "b", "actions": [_click(1, 1, _flip(MENU, [0]), LOBBY)]})
+
+        transitions = graph.transitions_from(graph.recognize(MENU).state_id)
+        assert len(transitions) == 1
+        assert transitions[0].count == 3
+
+    def test_update_from_directory_is_incremental(self, tmp_path):
+        test_cases_dir = str(tmp_path / "test_cases")
+        os.makedirs(test_cases_dir)
+        _write_test_case(test_cases_dir, "a", [_click(1, 1, MENU, LOBBY)])
+        path_b = _write_test_case(test_cases_dir, "b", [_click(2, 2, LOBBY, SHOP)])
+        with open(os.path.join(test_cases_dir, "broken.json"), 'w') as f:
+            f.write("{")
+
+        graph = ScreenStateGraph(str(tmp_path / "graph.sqlite"))
+        stats = graph.update_from_directory(test_cases_dir)
+        assert (stats["updated"], stats["skipped"], stats["failed"]) == (2, 0, 1)
+        assert (stats["states"], stats["transitions"]) == (3, 2)
+
+        _write_test_case(test_cases_dir, "b", [_click(3, 3, LOBBY, BATTLE)])
+        os.utime(path_b, (os.path.getmtime(path_b) + 10,) * 2)
+        stats = graph.update_from_directory(test_cases_dir)
+        assert (stats["updated"], stats["skipped"]) == (1, 1)
+        assert stats["transitions"] == 2
+
+        assert graph.update_from_directory(test_cases_dir, force=True)["updated"] == 2
+        graph.close()
+
+
+class TestPaths:
+    """최단 경로/복구 경로 테스트"""
+
+    def _graph(self):
+        graph = ScreenStateGraph(":memory:")
+        graph.ingest_test_case({"name": "shop", "actions": [
+            _click(1, 1, MENU, LOBBY), _click(2, 2, LOBBY, SHOP), _click(3, 3, SHOP, LOBBY),
+        ]})
+        graph.ingest_test_case({"name": "battle", "actions": [
+            _click(4, 4, LOBBY, BATTLE), _click(5, 5, BATTLE, MENU),
+        ]})
+        return graph
+
+    def test_shortest_path_across_test_cases(self):
+        graph = self._graph()
+        shop = graph.recognize(SHOP).state_id
+        menu = graph.recognize(MENU).state_id
+
+        path = graph.shortest_path(shop, menu)
+        assert [t.action["x"] for t in path] == [3, 4, 5]
+        assert [t.test_case for t in path] == ["shop", "battle", "battle"]
+        assert graph.shortest_path(menu, menu) == []
+        assert graph.shortest_path(shop, menu, max_length=2) is None
+
+    def test_plan_recovery(self):
+        graph = self._graph()
+
+        # 상점 화면에 남아 있는데 다음 액션은 메뉴에서 시작해야 함
+        path = graph.plan_recovery(_flip(SHOP, [9]), "shop", 0)
+        assert [t.action["x"] for t in path] == [3, 4, 5]
+        assert graph.plan_recovery(MENU, "shop", 0) == []
+        assert graph.plan_recovery(0x5555_5555_5555_5555, "shop", 0) is None
+        assert graph.plan_recovery(MENU, "unknown", 0) is None
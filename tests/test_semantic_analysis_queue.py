@@ -0,0 +1,119 @@
+"""
+SemanticAnalysisQueue 테스트
+
+지연 분석 작업 풀의 진행률/대기와 SemanticActionRecorder의 deferred 모드를 검증한다.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+from PIL import Image
+
+from src.config_manager import ConfigManager
+from src.semantic_action_recorder import ANALYSIS_PENDING, SemanticActionRecorder
+from src.semantic_analysis_queue import AnalysisProgress, SemanticAnalysisQueue
+
+
+class TestSemanticAnalysisQueue:
+    """분석 작업 풀 테스트"""
+
+    def test_submit_does_not_block(self):
+        release = threading.Event()
+        queue = SemanticAnalysisQueue(workers=1)
+
+        queue.submit(release.wait, 5)
+        queue.submit(release.wait, 5)
+
+        assert queue.progress().pending == 2
+        release.set()
+        progress = queue.wait(poll_interval=0.01)
+        assert (progress.total, progress.completed, progress.failed) == (2, 2, 0)
+        queue.shutdown()
+
+    def test_failures_counted(self):
+        queue = SemanticAnalysisQueue()
+
+        def fail():
+            raise RuntimeError("Bedrock 오류")
+
+        future = queue.submit(fail)
+        queue.submit(lambda: None)
+        progress = queue.wait(poll_interval=0.01)
+
+        assert progress.done and progress.failed == 1
+        assert isinstance(future.exception(), RuntimeError)
+        queue.shutdown()
+
+    def test_wait_reports_progress_and_times_out(self):
+        release = threading.Event()
+        queue = SemanticAnalysisQueue(workers=1)
+        queue.submit(release.wait, 5)
+        seen = []
+
+        progress = queue.wait(timeout=0.05, progress_callback=seen.append, poll_interval=0.01)
+
+        assert progress.pending == 1
+        assert seen and all(isinstance(p, AnalysisProgress) for p in seen)
+        release.set()
+        queue.shutdown()
+
+    def test_wait_without_tasks(self):
+        assert SemanticAnalysisQueue().wait().done
+
+
+class TestDeferredSemanticRecording:
+    """SemanticActionRecorder deferred 모드 테스트"""
+
+    def _recorder(self, tmp_path, analyzer):
+        config = ConfigManager()
+        config.config = {'automation': {
+            'screenshot_on_action': False,
+            'screenshot_dir': str(tmp_path),
+            'deferred_semantic_analysis': True
+        }}
+        return SemanticActionRecorder(config, ui_analyzer=analyzer)
+
+    def test_click_recorded_before_analysis(self, tmp_path):
+        release = threading.Event()
+        analyzer = Mock()
+
+        def slow_analysis(image):
+            release.wait(5)
+            return {"buttons": [], "icons": [], "text_fields": [], "source": "vision_llm"}
+
+        analyzer.analyze_with_retry.side_effect = slow_analysis
+        analyzer.find_element_at_position.return_value = {
+            "element_type": "button", "text": "시작", "x": 50, "y": 60,
+            "bounding_box": {"x": 30, "y": 50, "width": 40, "height": 20}, "confidence": 0.9
+        }
+        recorder = self._recorder(tmp_path, analyzer)
+
+        with patch('src.semantic_action_recorder.pyautogui') as mock_pyautogui:
+            mock_pyautogui.screenshot.return_value = Image.new('RGB', (100, 100), color='blue')
+            action = recorder.record_click_with_semantic_analysis(50, 60, click_delay=0)
+
+        # 분석이 끝나기 전에 좌표와 전후 프레임이 기록됨
+        assert action.semantic_info["intent"] == ANALYSIS_PENDING
+        assert action.screenshot_before_path and action.screenshot_after_path
+        assert len(recorder.get_actions()) == 1
+
+        release.set()
+        progress = recorder.finalize_semantic_analysis()
+
+        assert progress.done and progress.failed == 0
+        assert action.semantic_info["intent"] == "start_game"
+        assert action.semantic_info["target_element"]["text"] == "시작"
+        assert action.screen_transition["transition_type"] == "none"
+        recorder.analysis_queue.shutdown()
+
+    def test_inline_override(self, tmp_path):
+        analyzer = Mock()
+        analyzer.analyze_with_retry.return_value = {"source": "failed", "error": "timeout"}
+        recorder = self._recorder(tmp_path, analyzer)
+
+        with patch('src.semantic_action_recorder.pyautogui') as mock_pyautogui:
+            mock_pyautogui.screenshot.return_value = Image.new('RGB', (100, 100))
+            action = recorder.record_click_with_semantic_analysis(10, 10, click_delay=0, defer=False)
+
+        assert action.semantic_info["target_element"]["type"] == "unknown"
+        assert recorder.analysis_queue.progress().total == 0
@@ -0,0 +1,63 @@
+"""
+StreamingStats 테스트
+
+Welford 분산과 P² 분위수 추정이 전체 관측값으로 계산한 값과 맞는지 검증한다.
+"""
+
+import numpy as np
+import pytest
+
+from src.streaming_stats import P2Quantile, RunningMoments, StreamingPercentiles
+
+
+def test_running_moments_match_numpy():
+    values = np.random.default_rng(0).exponential(0.5, 1000)
+    moments = RunningMoments()
+    for value in values:
+        moments.add(value)
+
+    assert moments.count == 1000
+    assert moments.mean == pytest.approx(values.mean())
+    assert moments.variance == pytest.approx(values.var(ddof=1))
+
+
+def test_running_moments_single_value():
+    moments = RunningMoments()
+    moments.add(3.0)
+
+    assert moments.mean == 3.0 and moments.variance == 0.0 and moments.std == 0.0
+
+
+@pytest.mark.parametrize("p", [0.5, 0.95, 0.99])
+def test_p2_quantile_close_to_exact(p):
+    values = np.random.default_rng(1).lognormal(0.0, 0.6, 5000)
+    estimator = P2Quantile(p)
+    for value in values:
+        estimator.add(value)
+
+    exact = np.quantile(values, p)
+    assert estimator.value == pytest.approx(exact, rel=0.05)
+
+
+def test_p2_quantile_exact_for_few_values():
+    estimator = P2Quantile(0.5)
+    assert estimator.value == 0.0
+    for value in (4.0, 1.0, 3.0):
+        estimator.add(value)
+
+    assert estimator.value == 3.0
+
+
+def test_p2_quantile_rejects_invalid_percentile():
+    with pytest.raises(ValueError):
+        P2Quantile(1.0)
+
+
+def test_streaming_percentiles_ordered():
+    percentiles = StreamingPercentiles((50, 95, 99))
+    for value in np.random.default_rng(2).uniform(0, 1, 2000):
+        percentiles.add(value)
+
+    values = percentiles.values()
+    assert values[50] < values[95] < values[99]
+    assert values[95] == pytest.approx(0.95, abs=0.03)
@@ -0,0 +1,181 @@
+"""
+TemplateMatcher 테스트
+
+NCC 점수 계산, 제자리/이동/배율 변경 화면에서의 클릭 위치 탐색,
+SemanticActionReplayer의 LLM 호출 전 템플릿 매칭 빠른 경로를 검증한다.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from tests.conftest import EMPTY_UI, block_frame, mock_analyzer, replay_with_mocks, semantic_click
+from src.semantic_action_replayer import SemanticActionReplayer
+from src.template_matcher import (
+    TemplateMatcher, click_crop_box, click_crop_origin, click_offset, crop_click_region, ncc_map
+)
+
+
+def _frame(seed=0, size=(320, 240)):
+    """8픽셀 블록 패턴 화면 (모든 위치가 구분됨)"""
+    return block_frame(seed, size, block=8)
+
+
+def _shifted(frame, dx, dy):
+    moved = Image.new(frame.mode, frame.size)
+    moved.paste(frame, (dx, dy))
+    return moved
+
+
+class TestNccMap:
+    """정규화 상호상관 테스트"""
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(1)
+        image = rng.random((30, 40)) * 255
+        template = image[5:17, 8:20].copy()
+
+        scores = ncc_map(image, template)
+
+        centered = template - template.mean()
+        expected = np.zeros_like(scores)
+        for row in range(scores.shape[0]):
+            for col in range(scores.shape[1]):
+                window = image[row:row + 12, col:col + 12]
+                window = window - window.mean()
+                expected[row, col] = (window * centered).sum() / np.sqrt((window ** 2).sum() * (centered ** 2).sum())
+        assert np.allclose(scores, expected, atol=1e-9)
+        assert np.unravel_index(np.argmax(scores), scores.shape) == (5, 8)
+
+    def test_flat_template_and_oversized_template(self):
+        image = np.random.default_rng(2).random((20, 20))
+
+        assert not ncc_map(image, np.full((5, 5), 7.0)).any()
+        assert ncc_map(image, np.zeros((30, 5))).size == 0
+
+
+class TestClickCrop:
+    """클릭 영역 크롭 좌표 테스트"""
+
+    def test_crop_clipped_at_edges(self):
+        assert click_crop_box(50, 500, (640, 480)) == (0, 400, 150, 480)
+        assert click_offset(50, 500) == (50, 100)
+        assert click_crop_origin(50, 500) == (0, 400)
+        # 화면 밖 클릭은 빈 크롭
+        left, top, right, bottom = click_crop_box(800, 10, (640, 480))
+        assert right == left
+
+    def test_empty_template_returns_none(self):
+        frame = _frame()
+        assert TemplateMatcher().match(frame, crop_click_region(frame, 500, 10)) is None
+
+
+class TestTemplateMatcher:
+    """화면 변경별 클릭 위치 탐색 테스트"""
+
+    @pytest.mark.parametrize("x, y", [(160, 120), (30, 20), (300, 230)])
+    def test_unchanged_layout_found_in_place(self, x, y):
+        frame = _frame()
+        match = TemplateMatcher().match(frame, crop_click_region(frame, x, y), click_crop_origin(x, y))
+
+        assert match.score == pytest.approx(1.0)
+        assert match.point(click_offset(x, y)) == (x, y)
+        assert match.scale == 1.0
+
+    def test_shifted_layout_found(self):
+        frame = _frame(size=(640, 400))
+        x, y = 200, 150
+        moved = _shifted(frame, 56, 40)
+
+        match = TemplateMatcher().match(moved, crop_click_region(frame, x, y), click_crop_origin(x, y))
+
+        assert match.score >= 0.9
+        assert match.point(click_offset(x, y)) == (x + 56, y + 40)
+
+    def test_scaled_layout_found(self):
+        frame = _frame(size=(640, 400))
+        x, y = 320, 200
+        smaller = frame.resize((576, 360), Image.BILINEAR)
+        canvas = Image.new(frame.mode, frame.size)
+        canvas.paste(smaller, (0, 0))
+
+        match = TemplateMatcher(threshold=0.8).match(canvas, crop_click_region(frame, x, y))
+
+        assert match.scale == 0.9
+        assert match.score >= 0.8
+        found_x, found_y = match.point(click_offset(x, y))
+        assert abs(found_x - 288) <= 2 and abs(found_y - 180) <= 2
+
+    def test_load_template_cached(self, tmp_path):
+        path = tmp_path / "crop_0001.png"
+        _frame().crop((0, 0, 40, 40)).save(path)
+        matcher = TemplateMatcher()
+
+        template = matcher.load_template(str(path))
+
+        assert template.mode == 'L' and template.size == (40, 40)
+        assert matcher.load_template(str(path)) is template
+        assert matcher.load_template(str(tmp_path / "missing.png")) is None
+
+
+class TestReplayerTemplateFastPath:
+    """SemanticActionReplayer 템플릿 매칭 빠른 경로 테스트"""
+
+    def _action(self, crop_path, x=160, y=120):
+        return semantic_click(x, y, description=f'클릭 ({x}, {y})',
+                              semantic_info={"target_element": {"type": "unknown", "text": ""}},
+                              click_region_crop_path=crop_path)
+
+    def _replay(self, config, action, screen, semantic_first=False):
+        analyzer = mock_analyzer(EMPTY_UI)
+        replayer = SemanticActionReplayer(config, ui_analyzer=analyzer)
+        replay = replayer.replay_click_with_semantic_matching if semantic_first else replayer.replay_action
+        result, mock_pyautogui, _ = replay_with_mocks(replay, action, screen)
+        clicks = [call.args for call in mock_pyautogui.click.call_args_list]
+        return result, replayer, analyzer, clicks
+
+    @pytest.mark.parametrize("semantic_first", [False, True])
+    def test_template_hit_skips_llm(self, config, tmp_path, semantic_first):
+        frame = _frame(size=(640, 400))
+        crop_path = tmp_path / "crop_0001.png"
+        crop_click_region(frame, 160, 120).save(crop_path)
+
+        result, replayer, analyzer, clicks = self._replay(
+            config, self._action(str(crop_path)), _shifted(frame, 24, 16), semantic_first)
+
+        assert result.success and result.method == 'template'
+        assert result.actual_coords == (184, 136) and result.coordinate_change == (24, 16)
+        assert result.template_score >= 0.9
+        assert clicks == [(184, 136)]
+        analyzer.analyze_with_retry.assert_not_called()
+
+        stats = replayer.get_statistics()
+        assert stats["template_match_count"] == 1
+        assert stats["template_attempt_count"] == 1
+        assert stats["template_hit_rate"] == 1.0
+        assert stats["avg_template_time_ms"] > 0
+        assert replayer.stage_timings['template'] > 0
+
+    def test_template_miss_falls_back(self, config, tmp_path):
+        crop_path = tmp_path / "crop_0001.png"
+        crop_click_region(_frame(seed=1), 160, 120).save(crop_path)
+
+        result, replayer, analyzer, _ = self._replay(
+            config, self._action(str(crop_path)), _frame(seed=2), semantic_first=True)
+
+        assert result.method == 'coordinate'
+        assert result.template_score is not None and result.template_score < 0.9
+        analyzer.analyze_with_retry.assert_called_once()
+        assert replayer.get_statistics()["template_hit_rate"] == 0.0
+
+    def test_disabled_by_config(self, config, tmp_path):
+        config.config['automation']['template_match'] = {"enabled": False}
+        frame = _frame()
+        crop_path = tmp_path / "crop_0001.png"
+        crop_click_region(frame, 160, 120).save(crop_path)
+
+        result, replayer, analyzer, _ = self._replay(config, self._action(str(crop_path)), frame, semantic_first=True)
+
+        assert replayer.template_matcher is None
+        assert result.method != 'template' and result.template_score is None
+        analyzer.analyze_with_retry.assert_called_once()
@@ -0,0 +1,114 @@
+"""
+TileComparator 단위 테스트
+
+타일 단위 해시 비교와 변경 영역 위치 계산을 검증한다.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.tile_comparator import TileComparator, TileSignature, TileComparison
+
+
+def _game_frame(clock_color: str = 'white', size=(320, 240)) -> Image.Image:
+    """버튼 몇 개와 우상단 시계 영역이 있는 가짜 게임 화면"""
+    image = Image.new('RGB', size, color=(30, 60, 90))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([20, 180, 120, 220], fill='orange')
+    draw.rectangle([200, 180, 300, 220], fill='green')
+    draw.ellipse([120, 60, 200, 140], fill='purple')
+    # 시계 영역: 우상단 타일 (x 280~320, y 0~30)
+    draw.rectangle([282, 2, 318, 28], fill=clock_color)
+    return image
+
+
+class TestTileSignature:
+    """타일 해시 계산 테스트"""
+
+    def test_signature_shape(self):
+        signature = TileSignature.from_image(_game_frame(), grid=8)
+        assert signature.tile_count == 64
+        assert signature.bits.shape == (64, 64)
+        assert len(signature.hashes_hex()) == 64
+        assert all(len(h) == 16 for h in signature.hashes_hex())
+
+    def test_thumbnail_input_is_used_directly(self):
+        thumbnail = _game_frame().convert('L').resize((64, 64), Image.Resampling.BILINEAR)
+        from_thumb = TileSignature.from_image(thumbnail, grid=8)
+        from_frame = TileSignature.from_image(_game_frame(), grid=8)
+        assert np.array_equal(from_thumb.bits, from_frame.bits)
+
+    def test_invalid_pixel_shape(self):
+        with pytest.raises(ValueError):
+            TileSignature.from_pixels(np.zeros((32, 32)), grid=8)
+
+
+class TestTileComparator:
+    """타일 비교 테스트"""
+
+    def test_identical_frames_have_no_changed_tiles(self):
+        comparison = TileComparator().compare_images(_game_frame(), _game_frame())
+        assert comparison.changed_tiles == []
+        assert comparison.is_stable
+        assert comparison.tile_similarity == 1.0
+
+    def test_clock_change_is_localized(self):
+        comparison = TileComparator().compare_images(_game_frame('white'), _game_frame('red'))
+        # 우상단 타일(행 0, 열 7)만 바뀜
+        assert comparison.changed_tiles == [7]
+        assert not comparison.is_stable
+
+    def test_masked_change_is_stable(self):
+        comparison = TileComparator().compare_images(
+            _game_frame('white'), _game_frame('red'), mask=[7]
+        )
+        assert comparison.masked_tiles == [7]
+        assert comparison.unmasked_changed_tiles == []
+        assert comparison.is_stable
+
+    def test_change_outside_mask_is_reported(self):
+        actual = _game_frame('red')
+        ImageDraw.Draw(actual).rectangle([20, 180, 120, 220], fill='black')
+
+        comparison = TileComparator().compare_images(_game_frame('white'), actual, mask=[7])
+        assert 7 in comparison.masked_tiles
+        assert comparison.unmasked_changed_tiles
+        assert all(t >= 48 for t in comparison.unmasked_changed_tiles)  # 하단 버튼 영역 (행 6~7)
+
+    def test_flat_tile_noise_is_ignored(self):
+        rng = np.random.default_rng(0)
+        flat = np.full((240, 320), 128, dtype=np.uint8)
+        noisy = np.clip(flat + rng.integers(-2, 3, flat.shape), 0, 255).astype(np.uint8)
+
+        comparison = TileComparator().compare_images(Image.fromarray(flat), Image.fromarray(noisy))
+        assert comparison.changed_tiles == []
+
+    def test_grid_mismatch_raises(self):
+        comparator = TileComparator()
+        with pytest.raises(ValueError):
+            comparator.compare(TileSignature.from_image(_game_frame(), 8),
+                               TileSignature.from_image(_game_frame(), 4))
+
+
+class TestTileComparison:
+    """비교 결과 변환 테스트"""
+
+    def test_tile_box(self):
+        comparison = TileComparison(grid=8, tile_diffs=[0] * 64)
+        assert comparison.tile_box(0, 320, 240) == (0, 0, 40, 30)
+        assert comparison.tile_box(63, 320, 240) == (280, 210, 40, 30)
+
+    def test_to_dict_contains_regions(self):
+        comparison = TileComparison(grid=8, tile_diffs=[0] * 64, changed_tiles=[7, 9],
+                                    masked_tiles=[7], mask_size=1)
+        data = comparison.to_dict((320, 240))
+        assert data["unmasked_changed_tiles"] == [9]
+        assert data["changed_regions"] == [[40, 30, 40, 30]]
+        assert data["stable"] is False
+        assert data["tile_similarity"] == pytest.approx(1 - 1 / 63)
@@ -0,0 +1,168 @@
+"""
+TimelineScheduler 테스트
+
+타임라인 재실행이 녹화 시각(배속 적용)에 맞춰 입력하고 오차가 누적되지 않는지,
+주입 지연 보정과 검증 시간 제외가 동작하는지 검증한다.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.config_manager import ConfigManager
+from src.replay_plan import PlanInterpreter, build_replay_plan
+from src.script_generator import ScriptGenerator
+from src.timeline_scheduler import TimelineScheduler, recorded_offsets_ns
+
+
+MS = 1_000_000
+
+
+class FakeClock:
+    """sleep하면 그만큼 시간이 흐르고, 호출마다 1us씩 흐르는 시계"""
+
+    def __init__(self):
+        self.now = 0
+
+    def clock(self):
+        self.now += 1_000
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += int(seconds * 1e9)
+
+
+def _scheduler(offsets, speed=1.0):
+    fake = FakeClock()
+    return TimelineScheduler(offsets, speed, clock=fake.clock, sleep=fake.sleep), fake
+
+
+class TestRecordedOffsets:
+    """녹화 시점 계산 테스트"""
+
+    def test_prefers_timestamp_ns(self):
+        actions = [
+            {"action_type": "click", "timestamp": "2026-01-01T00:00:00", "timestamp_ns": 5_000 * MS},
+            {"action_type": "wait", "timestamp": "2026-01-01T00:00:01"},
+            {"action_type": "click", "timestamp": "2026-01-01T00:00:09", "timestamp_ns": 5_250 * MS},
+        ]
+
+        assert recorded_offsets_ns(actions) == [0, None, 250 * MS]
+
+    def test_iso_fallback_and_clock_step_back(self):
+        actions = [
+            {"action_type": "click", "timestamp": "2026-01-01T00:00:00.000000", "timestamp_ns": 1},
+            {"action_type": "click", "timestamp": "2026-01-01T00:00:00.500000"},
+            {"action_type": "click", "timestamp": "2026-01-01T00:00:00.200000"},  # 시계가 거꾸로 감
+            {"action_type": "click", "timestamp": "잘못된 시각"},
+        ]
+
+        assert recorded_offsets_ns(actions) == [0, 500 * MS, 500 * MS, None]
+
+
+class TestTimelineScheduler:
+    """타임라인 스케줄러 테스트"""
+
+    def test_targets_scaled_by_speed_without_drift(self):
+        offsets = [i * 100 * MS for i in range(50)]
+        scheduler, fake = _scheduler(offsets, speed=2.0)
+
+        for index in range(50):
+            with scheduler.inject(index):
+                fake.now += 3 * MS  # 입력마다 3ms 걸림
+
+        report = scheduler.report()
+        # 마지막 입력도 녹화 4.9초의 절반 근처 (입력 시간이 누적되지 않음)
+        assert abs(scheduler.entries[-1].landed_ns - scheduler.entries[0].landed_ns - 2450 * MS) < 1 * MS
+        assert report["action_count"] == 50
+        assert report["max_late_ms"] < 1.0
+        assert report["mean_latency_ms"] == pytest.approx(3.0, abs=0.01)
+
+    def test_latency_compensation_starts_early(self):
+        scheduler, fake = _scheduler([0, 100 * MS, 200 * MS])
+
+        for index in range(3):
+            with scheduler.inject(index):
+                fake.now += 10 * MS
+
+        last = scheduler.entries[-1]
+        assert last.started_ns < last.target_ns  # 추정 지연만큼 먼저 시작
+        assert abs(last.error_ns) < 1 * MS
+
+    def test_paused_time_excluded(self):
+        scheduler, fake = _scheduler([0, 100 * MS])
+
+        with scheduler.inject(0):
+            pass
+        with scheduler.paused():
+            fake.now += 5_000 * MS  # 검증에 5초
+        with scheduler.inject(1):
+            pass
+
+        assert abs(scheduler.entries[1].error_ns) < 1 * MS
+        assert scheduler.entries[1].target_ns == 100 * MS
+
+    def test_late_input_reported(self):
+        scheduler, fake = _scheduler([0, 10 * MS])
+
+        with scheduler.inject(0):
+            pass
+        with scheduler.inject(1):
+            fake.now += 50 * MS  # 입력이 늦게 도착
+
+        assert scheduler.report()["max_late_ms"] == pytest.approx(50.0, abs=0.1)
+        assert "배속 1" in scheduler.summary()
+
+    def test_invalid_speed(self):
+        with pytest.raises(ValueError):
+            TimelineScheduler([0], speed=0)
+
+
+def test_plan_interpreter_timeline():
+    plan = build_replay_plan([
+        {"action_type": "click", "x": 0, "y": 0, "timestamp_ns": 0, "screenshot_path": "a.png"},
+        {"action_type": "wait", "description": "30초 대기", "wait_time": 30.0},
+        {"action_type": "click", "x": 1, "y": 1, "timestamp_ns": 3_000 * MS},
+    ], capture_delay=0.5)
+    fake = FakeClock()
+    driver = Mock()
+    times = []
+    driver.click.side_effect = lambda *args, **kwargs: times.append(fake.now)
+    verifier = Mock()
+    verifier.capture_and_verify.side_effect = lambda *args: fake.sleep(2.0)
+    interpreter = PlanInterpreter(plan, driver=driver, clock=fake.clock, sleep=fake.sleep)
+
+    interpreter.run(action_delay=10.0, verifier=verifier, timeline_speed=1.5)
+
+    # 녹화 3초 / 1.5배속 = 2초, 검증 2초는 제외하고 wait 액션과 action_delay는 쓰지 않음
+    first, second = times
+    assert abs((second - first) - 4_000 * MS) < 1 * MS
+    assert interpreter.timeline.report()["action_count"] == 2
+
+
+def test_replay_with_verification_timeline(tmp_path):
+    config_path = tmp_path / "config.json"
+    with open(config_path, 'w', encoding='utf-8') as f:
+        json.dump({"game": {"window_title": ""},
+                   "automation": {"action_delay": 5.0, "replay_timing": "timeline", "replay_speed": 100.0}}, f)
+    config = ConfigManager(str(config_path))
+    config.load_config()
+    test_case = {"name": "timeline", "actions": [
+        {"action_type": "click", "x": 0, "y": 0, "timestamp": "2026-01-01T00:00:00", "description": "클릭"},
+        {"action_type": "wait", "timestamp": "2026-01-01T00:00:01", "description": "10초 대기"},
+        {"action_type": "click", "x": 1, "y": 1, "timestamp": "2026-01-01T00:00:10", "description": "클릭"},
+    ]}
+    generator = ScriptGenerator(config)
+
+    with patch('src.script_generator.pyautogui') as mock_pyautogui, \
+            patch('src.script_generator.time.sleep') as mock_sleep:
+        generator.replay_with_verification(test_case)
+
+    assert mock_pyautogui.click.call_count == 2
+    mock_pyautogui.click.assert_called_with(1, 1, button='left', _pause=False)
+    assert all(call.args[0] < 1.0 for call in mock_sleep.call_args_list)  # action_delay/wait 액션 대기 없음
+    assert generator.timeline_report["action_count"] == 2
+
+    with pytest.raises(ValueError):
+        generator.replay_with_verification(test_case, timing="fast")
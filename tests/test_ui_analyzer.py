@@ -579,6 +579,52 @@ class TestOCRFallback:
                 # 원래 상태로 복원
                 ui_module._paddleocr_instance = original_instance
     
+    def test_ocr_engine_concurrent_access_serialized(self, tmp_path):
+        """여러 스레드가 동시에 OCR을 호출해도 엔진은 한 번만 만들고 호출은 직렬화되는지 테스트"""
+        import threading
+        import time as time_module
+        import src.ui_analyzer as ui_module
+
+        config_path = tmp_path / "config.json"
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump({"aws": {"region": "ap-northeast-2"}}, f)
+        config = ConfigManager(str(config_path))
+        config.load_config()
+        with patch('boto3.client'):
+            analyzer = UIAnalyzer(config)
+
+        active = []
+        overlaps = []
+
+        def predict(image_np):
+            active.append(1)
+            overlaps.append(len(active))
+            time_module.sleep(0.01)
+            active.pop()
+            return []
+
+        def create_engine(**kwargs):
+            time_module.sleep(0.02)  # 느린 초기화 중 다른 스레드가 진입
+            return Mock(predict=predict)
+
+        mock_paddleocr_module = Mock()
+        mock_paddleocr_module.PaddleOCR.side_effect = create_engine
+        original_instance = ui_module._paddleocr_instance
+        ui_module._paddleocr_instance = None
+        try:
+            with patch.dict('sys.modules', {'paddleocr': mock_paddleocr_module}):
+                image = Image.new('RGB', (10, 10), color='white')
+                threads = [threading.Thread(target=analyzer.analyze_with_ocr, args=(image,)) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+            mock_paddleocr_module.PaddleOCR.assert_called_once()
+            assert len(overlaps) == 4 and max(overlaps) == 1
+        finally:
+            ui_module._paddleocr_instance = original_instance
+
     def test_ocr_fallback_returns_text_fields(self, tmp_path):
         """OCR 폴백이 text_fields를 반환하는지 테스트"""
         config_path = tmp_path / "config.json"
@@ -0,0 +1,226 @@
+"""
+VerificationCascade 단위 테스트
+
+다단계 검증(hash → tile → ssim → ocr → vision_llm)의 단계별 판정,
+소요 시간 기록, 보고서 집계를 검증한다.
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+from unittest.mock import Mock, patch
+
+import pytest
+from PIL import Image, ImageDraw, ImageEnhance
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config_manager import ConfigManager
+from src.replay_verifier import ReplayVerifier
+from src.tile_comparator import TileComparator
+from src.verification_cascade import (
+    CascadeStatistics, CascadeThresholds, CascadeTrace,
+    normalize_texts, text_similarity, tile_ssim,
+    DECISION_CONTINUE, DECISION_FAIL, DECISION_PASS, DECISION_SKIP, STAGE_ORDER
+)
+
+
+def _game_frame(clock_color: str = 'white') -> Image.Image:
+    image = Image.new('RGB', (320, 240), color=(30, 60, 90))
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([20, 180, 120, 220], fill='orange')
+    draw.rectangle([200, 180, 300, 220], fill='green')
+    draw.ellipse([120, 60, 200, 140], fill='purple')
+    draw.rectangle([282, 2, 318, 28], fill=clock_color)
+    return image
+
+
+def _black_frame() -> Image.Image:
+    """로딩/크래시 등으로 화면이 비어 있는 경우"""
+    return Image.new('RGB', (320, 240), color='black')
+
+
+def _ocr(*texts):
+    return [{"text": text, "confidence": 0.9, "x": 40 + i * 30, "y": 200} for i, text in enumerate(texts)]
+
+
+class TestCascadeHelpers:
+    """단계별 비교 함수 테스트"""
+
+    def test_tile_ssim_identical(self):
+        signature = TileComparator().signature(_game_frame())
+        mean_ssim, worst_ssim = tile_ssim(signature, signature)
+        assert mean_ssim == pytest.approx(1.0)
+        assert worst_ssim == pytest.approx(1.0)
+
+    def test_tile_ssim_excludes_masked_tiles(self):
+        comparator = TileComparator()
+        expected, actual = comparator.signature(_game_frame('white')), comparator.signature(_game_frame('red'))
+
+        _, worst = tile_ssim(expected, actual)
+        _, worst_masked = tile_ssim(expected, actual, mask=[7])
+        assert worst < 0.5
+        assert worst_masked > 0.9
+
+    def test_tile_ssim_black_screen_is_low(self):
+        comparator = TileComparator()
+        mean_ssim, _ = tile_ssim(comparator.signature(_game_frame()),
+                                 comparator.signature(_black_frame()))
+        assert mean_ssim < 0.25
+
+    def test_normalize_texts_and_similarity(self):
+        texts = normalize_texts(_ocr(" Start ", "OPTIONS", "12:30"), exclude=lambda x, y: x >= 100)
+        assert texts == ["start", "options"]
+        assert text_similarity(["a", "b"], ["a", "b"]) == 1.0
+        assert text_similarity(["a", "b"], ["b", "c"]) == pytest.approx(1 / 3)
+        assert text_similarity([], []) == 1.0
+
+    def test_trace_keeps_first_resolution(self):
+        trace = CascadeTrace()
+        trace.record("hash", DECISION_CONTINUE, time.perf_counter())
+        trace.record("tile", DECISION_PASS, time.perf_counter(), score=1.0)
+        trace.record("ssim", DECISION_FAIL, time.perf_counter())
+
+        data = trace.to_dict()
+        assert data["resolved_by"] == "tile"
+        assert data["decision"] == DECISION_PASS
+        assert [s["stage"] for s in data["stages"]] == ["hash", "tile", "ssim"]
+        assert all(s["elapsed_ms"] >= 0 for s in data["stages"])
+
+    def test_thresholds_from_config(self):
+        config = Mock(spec=ConfigManager)
+        config.get.side_effect = lambda key, default=None: {
+            'automation.cascade.ssim_pass': 0.9,
+            'automation.cascade.stages': ["hash", "tile"],
+        }.get(key, default)
+
+        thresholds = CascadeThresholds.from_config(config)
+        assert thresholds.ssim_pass == 0.9
+        assert thresholds.ocr_pass == CascadeThresholds().ocr_pass
+        assert thresholds.is_enabled("tile") and not thresholds.is_enabled("vision_llm")
+
+    def test_statistics(self):
+        traces = [
+            {"resolved_by": "hash", "stages": [{"stage": "hash", "decision": "pass", "elapsed_ms": 1.0}]},
+            {"resolved_by": "ssim", "stages": [{"stage": "hash", "decision": "continue", "elapsed_ms": 1.0},
+                                               {"stage": "tile", "decision": "continue", "elapsed_ms": 2.0},
+                                               {"stage": "ssim", "decision": "pass", "elapsed_ms": 3.0}]},
+            {"resolved_by": "", "stages": [{"stage": "hash", "decision": "continue", "elapsed_ms": 1.0}]},
+        ]
+        stats = CascadeStatistics.from_traces(traces).to_dict()
+        assert stats["total"] == 3
+        assert stats["resolved_by"]["hash"] == 1 and stats["resolved_by"]["ssim"] == 1
+        assert stats["unresolved"] == 1
+        assert stats["stage_runs"]["hash"] == 3
+        assert stats["stage_time_ms"]["tile"] == 2.0
+
+
+class TestReplayVerifierCascade:
+    """ReplayVerifier 단계별 검증 테스트"""
+
+    @pytest.fixture
+    def workspace(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            test_cases_dir = os.path.join(tmpdir, 'test_cases')
+            os.makedirs(test_cases_dir)
+            expected_path = os.path.join(tmpdir, 'action_0000.png')
+            _game_frame().save(expected_path)
+            action = {"action_type": "click", "x": 70, "y": 200,
+                      "description": "클릭", "screenshot_path": expected_path}
+            with open(os.path.join(test_cases_dir, 'sample.json'), 'w', encoding='utf-8') as f:
+                json.dump({"name": "sample", "actions": [action]}, f)
+
+            settings = {
+                'test_cases.directory': test_cases_dir,
+                'automation.hash_threshold': 0,
+                'game.window_title': '',
+                'automation.screenshot_dir': tmpdir,
+                'automation.capture_delay': 0.0,
+            }
+            config = Mock(spec=ConfigManager)
+            config.get.side_effect = lambda key, default=None: settings.get(key, default)
+            yield {"config": config, "settings": settings, "action": action}
+
+    def _verifier(self, workspace, ocr_results=None):
+        analyzer = Mock()
+        analyzer.analyze_with_ocr.side_effect = ocr_results or (lambda image: [])
+        with patch('src.replay_verifier.UIAnalyzer', return_value=analyzer):
+            verifier = ReplayVerifier(workspace["config"])
+        verifier.start_verification_session("sample")
+        verifier._verify_with_vision_llm = Mock(return_value=(True, {}))
+        return verifier
+
+    def test_hash_match_resolves_first(self, workspace):
+        verifier = self._verifier(workspace)
+        result = verifier.verify_coordinate_action(0, workspace["action"], _game_frame())
+
+        cascade = result.details["cascade"]
+        assert result.final_result == "pass"
+        assert cascade["resolved_by"] == "hash"
+        assert [s["stage"] for s in cascade["stages"]] == ["hash"]
+
+    def test_contrast_change_resolved_by_ssim(self, workspace):
+        verifier = self._verifier(workspace)
+        actual = ImageEnhance.Contrast(_game_frame()).enhance(0.7)
+        result = verifier.verify_coordinate_action(0, workspace["action"], actual)
+
+        cascade = result.details["cascade"]
+        assert cascade["resolved_by"] == "ssim"
+        assert [s["decision"] for s in cascade["stages"]] == ["continue", "continue", "pass"]
+        assert result.final_result == "pass"
+        verifier._verify_with_vision_llm.assert_not_called()
+
+    def test_black_screen_fails_without_vision_llm(self, workspace):
+        verifier = self._verifier(workspace)
+        result = verifier.verify_coordinate_action(0, workspace["action"], _black_frame())
+
+        assert result.details["cascade"]["resolved_by"] == "ssim"
+        assert result.final_result == "fail"
+        assert result.vision_verified is False
+
+    def test_matching_text_resolved_by_ocr(self, workspace):
+        workspace["settings"]['automation.cascade.ssim_pass'] = 1.01  # SSIM 통과 비활성
+        verifier = self._verifier(workspace, ocr_results=lambda image: _ocr("start", "options", "quit"))
+        result = verifier.verify_coordinate_action(0, workspace["action"], _game_frame('red'))
+
+        cascade = result.details["cascade"]
+        assert cascade["resolved_by"] == "ocr"
+        assert result.final_result == "warning"
+        verifier._verify_with_vision_llm.assert_not_called()
+
+    def test_ambiguous_band_goes_to_vision_llm(self, workspace):
+        workspace["settings"]['automation.cascade.ssim_pass'] = 1.01
+        verifier = self._verifier(workspace)
+        result = verifier.verify_coordinate_action(0, workspace["action"], _game_frame('red'))
+
+        decisions = {s["stage"]: s["decision"] for s in result.details["cascade"]["stages"]}
+        assert decisions["ocr"] == DECISION_SKIP  # 텍스트 없음
+        assert decisions["vision_llm"] == DECISION_PASS
+        assert result.final_result == "warning"
+        verifier._verify_with_vision_llm.assert_called_once()
+
+    def test_disabled_vision_stage_falls_back_to_similarity(self, workspace):
+        workspace["settings"]['automation.cascade.ssim_pass'] = 1.01
+        workspace["settings"]['automation.cascade.stages'] = ["hash", "tile", "ssim"]
+        verifier = self._verifier(workspace)
+        result = verifier.verify_coordinate_action(0, workspace["action"], _game_frame('red'))
+
+        assert result.details["cascade"]["resolved_by"] == ""
+        assert result.final_result == "warning"
+        verifier._verify_with_vision_llm.assert_not_called()
+
+    def test_report_counts_actions_per_tier(self, workspace):
+        verifier = self._verifier(workspace)
+        verifier.verify_coordinate_action(0, workspace["action"], _game_frame())
+        verifier.verify_coordinate_action(0, workspace["action"], ImageEnhance.Contrast(_game_frame()).enhance(0.7))
+        verifier.verify_coordinate_action(0, workspace["action"], _black_frame())
+
+        report = verifier.generate_report()
+        stats = report.to_dict()["cascade_statistics"]
+        assert stats["resolved_by"]["hash"] == 1
+        assert stats["resolved_by"]["ssim"] == 2
+        assert stats["total"] == 3
+        assert set(stats["stage_time_ms"]) == set(STAGE_ORDER)
+        assert "검증 단계별 판정" in report.summary